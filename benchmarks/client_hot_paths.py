@@ -0,0 +1,471 @@
+"""Measures the hot paths of the clients against a local stand-in server.
+
+Each benchmark runs an operation, such as reading a tag or a page of table rows,
+repeatedly against a :class:`StandInServer` in a child process, so that the server
+doesn't compete with the client for the GIL or show up in its allocations. For each
+benchmark it reports:
+
+* operations per second and the 50th and 99th percentile latency, and
+* the peak memory allocated during one operation and the memory retained after each
+  operation, measured with ``tracemalloc`` in a separate pass.
+
+Results are written to a JSON file, which can be compared with the results of another
+version to catch regressions::
+
+    poetry run python benchmarks/client_hot_paths.py --output 1.8.0.json
+    poetry run python benchmarks/client_hot_paths.py --compare 1.8.0.json
+
+Comparing exits with status 1 if any benchmark is slower by more than ``--threshold``
+percent. Use ``--latency`` to add network latency to each response.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import pathlib
+import platform
+import queue
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from importlib import metadata
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
+
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core.helpers import Paginator
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnType,
+    CreateTableRequest,
+    DataFrame,
+    DataType,
+    ExportFormat,
+    ExportTableDataRequest,
+)
+from nisystemlink.clients.file import FileClient
+from nisystemlink.clients.product import ProductClient
+from nisystemlink.clients.product.models import Product, QueryProductsRequest
+from nisystemlink.clients.spec import SpecClient
+from nisystemlink.clients.spec.models import (
+    CreateSpecificationsRequest,
+    QuerySpecificationsRequest,
+    SpecificationDefinition,
+    SpecificationType,
+)
+from nisystemlink.clients.tag import DataType as TagDataType, TagManager
+from nisystemlink.clients.tag._http._multiplexed_http_tag_subscription import (
+    MultiplexedHttpTagSubscription,
+)
+
+_WARMUP_ITERATIONS = 3
+_ALLOCATION_ITERATIONS = 10
+_TAGS = 100
+_ROWS = 10000
+_RECORDS = 1000
+_FILE_BYTES = 1 << 20
+
+_SERVER_PROGRAM = """
+import sys
+from nisystemlink.clients.testing import StandInServer
+with StandInServer(latency_milliseconds=float(sys.argv[1]), seed=0) as server:
+    print(server.uri, flush=True)
+    sys.stdin.read()
+"""
+
+
+class _Case:
+    """An operation to measure, and a step to run before each one that isn't."""
+
+    def __init__(
+        self, operation: Callable[[], Any], prepare: Optional[Callable[[], Any]] = None
+    ) -> None:
+        self.operation = operation
+        self.prepare = prepare or (lambda: None)
+
+
+_Factory = Callable[[HttpConfiguration, contextlib.ExitStack], _Case]
+
+
+def _tag_read(configuration: HttpConfiguration, stack: contextlib.ExitStack) -> _Case:
+    manager = TagManager(configuration)
+    with manager.create_writer(buffer_size=1) as writer:
+        writer.write("bench.read", TagDataType.DOUBLE, 1.5)
+    return _Case(lambda: manager.read("bench.read"))
+
+
+def _tag_write(configuration: HttpConfiguration, stack: contextlib.ExitStack) -> _Case:
+    writer = TagManager(configuration).create_writer(buffer_size=_TAGS + 1)
+
+    def write() -> None:
+        for i in range(_TAGS):
+            writer.write("bench.write{}".format(i), TagDataType.DOUBLE, i * 0.5)
+        writer.send_buffered_writes()
+
+    return _Case(write)
+
+
+def _tag_subscription(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    manager = TagManager(configuration)
+    writer = manager.create_writer(buffer_size=_TAGS + 1)
+    # Overlapping subscribers share the multiplexer's server subscription, which only
+    # polls when the benchmark asks it to
+    subscriber_paths = [
+        ["bench.subscribed*"],
+        ["bench.subscribed{}".format(i) for i in range(0, _TAGS, 2)],
+    ]
+    changes = queue.Queue()  # type: queue.Queue[Any]
+    for paths in subscriber_paths:
+        subscription = stack.enter_context(
+            MultiplexedHttpTagSubscription.create(
+                manager._http_client, paths, datetime.timedelta(hours=1)
+            )
+        )
+        subscription.tag_changed += lambda tag, reader: changes.put(reader.read())
+    multiplexer = subscription._multiplexer
+    assert multiplexer is not None
+    routed = _TAGS + len(subscriber_paths[1])
+
+    def write() -> None:
+        for i in range(_TAGS):
+            writer.write("bench.subscribed{}".format(i), TagDataType.DOUBLE, i * 0.5)
+        writer.send_buffered_writes()
+
+    def update() -> None:
+        multiplexer._update_timer_elapsed()
+        for _ in range(routed):
+            changes.get(timeout=10)
+
+    return _Case(update, prepare=write)
+
+
+def _tag_selection(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    manager = TagManager(configuration)
+    with manager.create_writer(buffer_size=_TAGS + 1) as writer:
+        for i in range(_TAGS):
+            writer.write("bench.selected{}".format(i), TagDataType.DOUBLE, i * 0.5)
+    selection = stack.enter_context(manager.open_selection(["bench.selected*"]))
+    return _Case(selection.refresh)
+
+
+def _create_table(client: DataFrameClient) -> str:
+    return client.create_table(
+        CreateTableRequest(
+            columns=[
+                Column(
+                    name="index", data_type=DataType.Int32, column_type=ColumnType.Index
+                ),
+                Column(name="value", data_type=DataType.Float64),
+                Column(name="status", data_type=DataType.String),
+            ]
+        )
+    )
+
+
+def _create_rows(count: int) -> AppendTableDataRequest:
+    return AppendTableDataRequest(
+        frame=DataFrame(
+            columns=["index", "value", "status"],
+            data=[[str(i), str(i * 0.5), "PASSED"] for i in range(count)],
+        )
+    )
+
+
+def _dataframe_append(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = DataFrameClient(configuration)
+    id = _create_table(client)
+    rows = _create_rows(_RECORDS)
+    return _Case(lambda: client.append_table_data(id, rows))
+
+
+def _create_filled_table(client: DataFrameClient) -> str:
+    id = _create_table(client)
+    client.append_table_data(id, _create_rows(_ROWS))
+    return id
+
+
+def _dataframe_read(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = DataFrameClient(configuration)
+    id = _create_filled_table(client)
+
+    def read() -> None:
+        rows = Paginator(
+            lambda token: client.get_table_data(
+                id, take=_RECORDS, continuation_token=token
+            ),
+            attrgetter("frame.data"),
+        )
+        assert sum(1 for _ in rows) == _ROWS
+
+    return _Case(read)
+
+
+def _dataframe_export(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = DataFrameClient(configuration)
+    id = _create_filled_table(client)
+    request = ExportTableDataRequest(response_format=ExportFormat.CSV)
+    return _Case(lambda: client.export_table_data(id, request).read())
+
+
+def _file_upload(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = FileClient(configuration)
+    data = bytes(_FILE_BYTES)
+    return _Case(lambda: client.upload_file(io.BytesIO(data)))
+
+
+def _file_download(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = FileClient(configuration)
+    id = client.upload_file(io.BytesIO(bytes(_FILE_BYTES)))
+    return _Case(lambda: client.download_file(id).read())
+
+
+def _spec_query(configuration: HttpConfiguration, stack: contextlib.ExitStack) -> _Case:
+    client = SpecClient(configuration)
+    client.create_specs(
+        CreateSpecificationsRequest(
+            specs=[
+                SpecificationDefinition(
+                    product_id="bench",
+                    spec_id="spec{}".format(i),
+                    type=SpecificationType.PARAMETRIC,
+                )
+                for i in range(_RECORDS)
+            ]
+        )
+    )
+
+    def query(token: Optional[str]) -> Any:
+        return client.query_specs(
+            QuerySpecificationsRequest(
+                product_ids=["bench"], take=100, continuation_token=token
+            )
+        )
+
+    return _Case(lambda: list(Paginator(query, attrgetter("specs"))))
+
+
+def _product_query(
+    configuration: HttpConfiguration, stack: contextlib.ExitStack
+) -> _Case:
+    client = ProductClient(configuration)
+    client.create_products(
+        [Product(part_number="part{}".format(i)) for i in range(_RECORDS)]
+    )
+
+    def query(token: Optional[str]) -> Any:
+        return client.query_products_paged(
+            QueryProductsRequest(take=100, continuation_token=token)
+        )
+
+    return _Case(lambda: list(Paginator(query, attrgetter("products"))))
+
+
+_BENCHMARKS = {
+    "tag.read": (_tag_read, 500),
+    "tag.buffered_write_flush": (_tag_write, 200),
+    "tag.multiplexed_poll_route": (_tag_subscription, 200),
+    "tag.selection_refresh": (_tag_selection, 200),
+    "dataframe.append": (_dataframe_append, 100),
+    "dataframe.read": (_dataframe_read, 30),
+    "dataframe.export": (_dataframe_export, 30),
+    "file.upload": (_file_upload, 50),
+    "file.download": (_file_download, 50),
+    "spec.query_paging": (_spec_query, 30),
+    "product.query_paging": (_product_query, 30),
+}  # type: Dict[str, tuple]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Get a percentile of some values, using the nearest-rank method."""
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _measure(case: _Case, iterations: int) -> Dict[str, float]:
+    for _ in range(_WARMUP_ITERATIONS):
+        case.prepare()
+        case.operation()
+
+    latencies = []
+    for _ in range(iterations):
+        case.prepare()
+        start = time.perf_counter()
+        case.operation()
+        latencies.append(time.perf_counter() - start)
+
+    peaks = []
+    tracemalloc.start()
+    initial, _ = tracemalloc.get_traced_memory()
+    for _ in range(_ALLOCATION_ITERATIONS):
+        case.prepare()
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        case.operation()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    final, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "ops_per_second": iterations / sum(latencies),
+        "p50_milliseconds": statistics.median(latencies) * 1000,
+        "p99_milliseconds": _percentile(latencies, 99) * 1000,
+        "peak_allocated_kib": statistics.median(peaks) / 1024,
+        "retained_bytes_per_op": (final - initial) / _ALLOCATION_ITERATIONS,
+    }
+
+
+@contextlib.contextmanager
+def _run_server(latency_milliseconds: float) -> Any:
+    """Run a stand-in server in a child process, and get its URI."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", _SERVER_PROGRAM, str(latency_milliseconds)],
+        cwd=pathlib.Path(__file__).parents[1],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert process.stdout is not None
+        yield process.stdout.readline().strip()
+    finally:
+        assert process.stdin is not None
+        process.stdin.close()
+        process.wait()
+
+
+def _get_version() -> Optional[str]:
+    try:
+        return metadata.version("nisystemlink-clients")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _compare(
+    results: Dict[str, Dict[str, float]], baseline_path: str, threshold: float
+) -> bool:
+    """Print the change in throughput from a baseline, and whether any regressed."""
+    baseline = json.loads(pathlib.Path(baseline_path).read_text())["benchmarks"]
+    print()
+    print(
+        "{:<28}{:>14}{:>14}{:>10}".format("Benchmark", "Baseline/s", "Now/s", "Change")
+    )
+    regressed = False
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ops_per_second"]
+        change = (result["ops_per_second"] - before) / before * 100
+        slower = change < -threshold
+        regressed = regressed or slower
+        print(
+            "{:<28}{:>14.1f}{:>14.1f}{:>9.1f}%{}".format(
+                name,
+                before,
+                result["ops_per_second"],
+                change,
+                "  REGRESSED" if slower else "",
+            )
+        )
+    return regressed
+
+
+def main() -> None:
+    """Run the benchmarks, print their results, and save them as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks whose name contains this",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="milliseconds of latency the server adds to each response",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiplier for the number of iterations of each benchmark",
+    )
+    parser.add_argument(
+        "--output", help="file to write the results to, as JSON", default=None
+    )
+    parser.add_argument(
+        "--compare", help="results file of a baseline to compare with", default=None
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="percent drop in throughput that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    results = {}  # type: Dict[str, Dict[str, float]]
+    print(
+        "{:<28}{:>10}{:>10}{:>10}{:>12}{:>12}".format(
+            "Benchmark", "Ops/sec", "p50 ms", "p99 ms", "Peak KiB", "Retained B"
+        )
+    )
+    with _run_server(args.latency) as uri:
+        for name, (factory, iterations) in _BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+            with contextlib.ExitStack() as stack:
+                configuration = HttpConfiguration(uri, "key")
+                case = factory(configuration, stack)
+                result = _measure(case, max(int(iterations * args.scale), 1))
+            results[name] = result
+            print(
+                "{:<28}{:>10.1f}{:>10.2f}{:>10.2f}{:>12.1f}{:>12.0f}".format(
+                    name,
+                    result["ops_per_second"],
+                    result["p50_milliseconds"],
+                    result["p99_milliseconds"],
+                    result["peak_allocated_kib"],
+                    result["retained_bytes_per_op"],
+                )
+            )
+
+    if args.output:
+        document = {
+            "version": _get_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "latency_milliseconds": args.latency,
+            "benchmarks": results,
+        }
+        pathlib.Path(args.output).write_text(json.dumps(document, indent=2) + "\n")
+
+    if args.compare and _compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
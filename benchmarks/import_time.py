@@ -0,0 +1,119 @@
+"""Measures how long it takes to import the packages and clients.
+
+Each import runs in a new interpreter with ``python -X importtime``, and the time the
+import statement took is reported, with the third-party libraries it pulled in and the
+cumulative time spent importing each of them. Packages export their names lazily, so
+importing one costs little until a client or model is used. Each package's own
+import is then checked against a budget, and the script exits with status 1 if any
+package goes over it.
+
+Run with ``poetry run python benchmarks/import_time.py``.
+"""
+
+import pathlib
+import statistics
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+_REPEATS = 5
+
+_IMPORTS = [
+    "import nisystemlink.clients.core",
+    "import nisystemlink.clients.tag",
+    "import nisystemlink.clients.dataframe",
+    "from nisystemlink.clients.tag import TagManager",
+    "from nisystemlink.clients.dataframe import DataFrameClient",
+    "from nisystemlink.clients.dataframe.models import QueryTablesRequest",
+]
+
+_PACKAGES = [
+    "nisystemlink.clients.core",
+    "nisystemlink.clients.core.helpers",
+    "nisystemlink.clients.artifact",
+    "nisystemlink.clients.artifact.models",
+    "nisystemlink.clients.dataframe",
+    "nisystemlink.clients.dataframe.models",
+    "nisystemlink.clients.file",
+    "nisystemlink.clients.file.models",
+    "nisystemlink.clients.product",
+    "nisystemlink.clients.product.models",
+    "nisystemlink.clients.product.utilities",
+    "nisystemlink.clients.spec",
+    "nisystemlink.clients.spec.models",
+    "nisystemlink.clients.tag",
+    "nisystemlink.clients.testing",
+    "nisystemlink.clients.testmonitor",
+    "nisystemlink.clients.testmonitor.models",
+]
+
+# Cumulative import time allowed for a package that imports nothing until it's used
+_PACKAGE_IMPORT_BUDGET_MILLISECONDS = 50
+
+_LIBRARIES = ["aenum", "events", "httpx", "pydantic", "requests", "uplink"]
+
+
+def _run_import(statement: str) -> Tuple[float, Dict[str, float]]:
+    """Run an import statement in a new interpreter.
+
+    Returns:
+        The milliseconds the statement took, and the cumulative milliseconds taken to
+        import each module it imported.
+    """
+    program = "import time; start = time.perf_counter(); {}; print(time.perf_counter() - start)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", program.format(statement)],
+        cwd=pathlib.Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        times[module.strip()] = int(cumulative) / 1000
+    return float(result.stdout) * 1000, times
+
+
+def main() -> None:
+    """Print the median time of each import statement, and of each package's import
+    against the budget.
+    """
+    print("{:<72}{:>8}  {}".format("Import", "ms", "Libraries (ms)"))
+    for statement in _IMPORTS:
+        runs = [_run_import(statement) for _ in range(_REPEATS)]
+        libraries = ", ".join(
+            "{} ({:.0f})".format(lib, statistics.median(run[1][lib] for run in runs))
+            for lib in _LIBRARIES
+            if lib in runs[0][1]
+        )
+        print(
+            "{:<72}{:>8.1f}  {}".format(
+                statement,
+                statistics.median(milliseconds for milliseconds, _ in runs),
+                libraries or "-",
+            )
+        )
+
+    print()
+    print("{:<72}{:>8}".format("Package", "ms"))
+    over_budget = False
+    for package in _PACKAGES:
+        milliseconds = statistics.median(
+            _run_import("import " + package)[1][package] for _ in range(_REPEATS)
+        )
+        over = milliseconds >= _PACKAGE_IMPORT_BUDGET_MILLISECONDS
+        over_budget = over_budget or over
+        print(
+            "{:<72}{:>8.1f}{}".format(
+                package, milliseconds, "  over budget" if over else ""
+            )
+        )
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
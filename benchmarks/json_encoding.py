@@ -0,0 +1,120 @@
+"""Measures the cost of encoding request bodies, in milliseconds per MB of JSON.
+
+Compares the previous encoding (``model.json()``, parsed back into dictionaries, then
+encoded again by the HTTP client) with the single-pass encoding used by the clients,
+with both the standard library ``json`` module and orjson (if installed).
+
+Run with ``poetry run python benchmarks/json_encoding.py``.
+"""
+
+import json
+import time
+from typing import Any, Callable, List, Tuple
+
+from nisystemlink.clients.core._uplink import _json_body
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+from nisystemlink.clients.spec.models import (
+    Condition,
+    ConditionRange,
+    ConditionType,
+    CreateSpecificationsRequest,
+    NumericConditionValue,
+    SpecificationDefinition,
+    SpecificationLimit,
+    SpecificationType,
+)
+
+
+def _append_request(rows: int) -> AppendTableDataRequest:
+    return AppendTableDataRequest(
+        frame=DataFrame(
+            columns=["index", "value", "status"],
+            # Leave 1% of the values empty, as sparse tables do
+            data=[
+                [str(i), str(i * 0.5) if i % 100 else None, "PASSED"]
+                for i in range(rows)
+            ],
+        ),
+        end_of_data=True,
+    )
+
+
+def _create_specs_request(count: int) -> CreateSpecificationsRequest:
+    return CreateSpecificationsRequest(
+        specs=[
+            SpecificationDefinition(
+                product_id="Amplifier",
+                spec_id="spec{}".format(i),
+                type=SpecificationType.PARAMETRIC,
+                name="output voltage",
+                limit=SpecificationLimit(min=1.2, max=1.5),
+                unit="mV",
+                conditions=[
+                    Condition(
+                        name="Temperature",
+                        value=NumericConditionValue(
+                            condition_type=ConditionType.NUMERIC,
+                            range=[ConditionRange(min=-25, step=20, max=85)],
+                            unit="C",
+                        ),
+                    )
+                ],
+                keywords=["benchmark"],
+                properties={"index": str(i)},
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def _encode_twice(model: Any) -> bytes:
+    # What the clients did before: serialize, parse, and let the HTTP client serialize
+    return json.dumps(
+        json.loads(model.json(by_alias=True, exclude_unset=True))
+    ).encode()
+
+
+def _encode_stdlib(model: Any) -> bytes:
+    orjson = _json_body.orjson
+    _json_body.orjson = None  # type: ignore
+    try:
+        return _json_body.dumps(model)
+    finally:
+        _json_body.orjson = orjson
+
+
+def _measure(encode: Callable[[Any], bytes], model: Any, repeat: int) -> float:
+    """Get the best time, in ms per MB of output, to encode ``model``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(encode(model))
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / (size / 1e6)
+
+
+def main() -> None:
+    """Print the encoding cost of each payload with each encoder."""
+    payloads = [
+        ("DataFrame append (100k rows)", _append_request(100000)),
+        ("Spec creation (1k specs)", _create_specs_request(1000)),
+    ]
+    encoders = [
+        ("model.json + loads + dumps", _encode_twice),
+        ("single pass (json)", _encode_stdlib),
+    ]  # type: List[Tuple[str, Callable[[Any], bytes]]]
+    if _json_body.orjson is not None:
+        encoders.append(("single pass (orjson)", _json_body.dumps))
+
+    print("{:<32}{:<30}{:>12}".format("Payload", "Encoder", "ms/MB"))
+    for payload_name, model in payloads:
+        for encoder_name, encode in encoders:
+            print(
+                "{:<32}{:<30}{:>12.2f}".format(
+                    payload_name, encoder_name, _measure(encode, model, repeat=5)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
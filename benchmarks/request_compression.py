@@ -0,0 +1,81 @@
+"""Measures how much gzip request compression saves, and what it costs in CPU time.
+
+Compresses typical DataFrame append and tag write bodies, as sent when
+``HttpConfiguration.request_compression_threshold_bytes`` is set, and reports the
+compression ratio, the CPU time per MB of JSON, and how long the saved bytes would take
+to send over a 10 Mbit/s link.
+
+Run with ``poetry run python benchmarks/request_compression.py``.
+"""
+
+import json
+from typing import List, Tuple
+
+from nisystemlink.clients.core._request_compression import _compress_body
+from nisystemlink.clients.core._uplink._json_body import dumps
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+
+_LINK_BYTES_PER_SECOND = 10e6 / 8
+
+
+def _append_body(rows: int) -> bytes:
+    return dumps(
+        AppendTableDataRequest(
+            frame=DataFrame(
+                columns=["index", "value", "status"],
+                data=[[str(i), str(i * 0.5), "PASSED"] for i in range(rows)],
+            )
+        )
+    )
+
+
+def _tag_write_body(tags: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "path": "station{}.measurement{}".format(i % 8, i),
+                "updates": [
+                    {
+                        "value": {"type": "DOUBLE", "value": str(i * 0.25)},
+                        "timestamp": "2024-01-02T03:04:05.{:06d}Z".format(i),
+                    }
+                ],
+            }
+            for i in range(tags)
+        ]
+    ).encode()
+
+
+def main() -> None:
+    """Print the savings and cost of compressing each payload."""
+    payloads = [
+        ("DataFrame append (10k rows)", _append_body(10000)),
+        ("DataFrame append (100k rows)", _append_body(100000)),
+        ("Tag writes (1k tags)", _tag_write_body(1000)),
+    ]  # type: List[Tuple[str, bytes]]
+
+    print(
+        "{:<30}{:>12}{:>8}{:>10}{:>16}".format(
+            "Payload", "KB", "Ratio", "CPU ms", "Link ms saved"
+        )
+    )
+    for name, body in payloads:
+        compressed = min(
+            (_compress_body(body, 0) for _ in range(5)),
+            key=lambda c: c.milliseconds if c else 0,
+        )
+        assert compressed is not None
+        saved = len(body) - len(compressed.data)
+        print(
+            "{:<30}{:>12.0f}{:>8.1f}{:>10.2f}{:>16.1f}".format(
+                name,
+                len(body) / 1000,
+                len(body) / len(compressed.data),
+                compressed.milliseconds,
+                saved / _LINK_BYTES_PER_SECOND * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Measures the latency of concurrent ``TagManager.read_async`` calls over HTTP/1.1 and
+HTTP/2.
+
+The calls are made against a local stand-in server that answers each request after a
+fixed service time. Over HTTP/1.1, each request in flight needs its own connection,
+so requests beyond ``max_connections_per_host`` wait for one to be free; over HTTP/2,
+they share a connection.
+
+Requires the ``h2`` package. Run with ``poetry run python benchmarks/tag_http2.py``.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Optional, Set
+
+from nisystemlink.clients.core import HttpConfiguration, LatencyHistogram
+from nisystemlink.clients.tag import TagManager
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.settings
+except ImportError:  # pragma: no cover
+    h2 = None  # type: ignore
+
+_BODY = b'{"type": "DOUBLE", "value": "1.5"}'
+_SERVICE_TIME_SECONDS = 0.005
+
+
+class _StandInServer:
+    """Serves tag values over HTTP/1.1 and cleartext HTTP/2 on a background thread."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = None  # type: Optional[asyncio.AbstractServer]
+        self._tasks = set()  # type: Set[asyncio.Future]
+
+    def start(self) -> str:
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0)
+        )
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return "http://127.0.0.1:{}".format(self._server.sockets[0].getsockname()[1])
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            start = await reader.readexactly(3)
+            if start == b"PRI":
+                await self._serve_http2(start, reader, writer)
+            else:
+                await self._serve_http1(start, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http1(
+        self, start: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        while True:
+            await reader.readuntil(b"\r\n\r\n")
+            await asyncio.sleep(_SERVICE_TIME_SECONDS)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+            )
+            await writer.drain()
+
+    async def _serve_http2(
+        self, start: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False)
+        )  # type: Any
+        connection.initiate_connection()
+        connection.update_settings(
+            {h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 1000}
+        )
+        data = start
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    task = asyncio.ensure_future(
+                        self._respond_http2(connection, writer, event.stream_id)
+                    )
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            writer.write(connection.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+    async def _respond_http2(
+        self, connection: Any, writer: asyncio.StreamWriter, stream_id: int
+    ) -> None:
+        await asyncio.sleep(_SERVICE_TIME_SECONDS)
+        connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(_BODY))),
+            ],
+        )
+        connection.send_data(stream_id, _BODY, end_stream=True)
+        writer.write(connection.data_to_send())
+
+
+async def _measure(
+    manager: TagManager, concurrency: int, requests: int
+) -> LatencyHistogram:
+    latencies = LatencyHistogram(3)
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            start = time.perf_counter()
+            await manager.read_async("tag")
+            latencies.record((time.perf_counter() - start) * 1000)
+
+    await manager.read_async("tag")  # warm up
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    await manager.aclose()
+    return latencies
+
+
+def main() -> None:
+    """Print the latency percentiles for each protocol and concurrency."""
+    if h2 is None:
+        print("The h2 package is required: pip install httpx[http2]")
+        return
+    server = _StandInServer()
+    uri = server.start()
+
+    print(
+        "{:<10}{:>13}{:>10}{:>10}{:>14}".format(
+            "Protocol", "Concurrency", "p50 ms", "p99 ms", "Connections"
+        )
+    )
+    for http2 in (False, True):
+        for concurrency in (1, 32, 256):
+            configuration = HttpConfiguration(uri, "key")
+            configuration.http2 = http2
+            manager = TagManager(configuration)
+            if http2:
+                # The stand-in server doesn't use TLS, so HTTP/2 can't be negotiated
+                manager._http_client._kwargs["http1"] = False
+            connections = server.connections
+            latencies = asyncio.run(
+                _measure(manager, concurrency, max(concurrency * 10, 200))
+            )
+            p50, p99 = latencies.percentiles([50, 99])
+            assert p50 is not None and p99 is not None
+            print(
+                "{:<10}{:>13}{:>10.2f}{:>10.2f}{:>14}".format(
+                    "HTTP/2" if http2 else "HTTP/1.1",
+                    concurrency,
+                    p50,
+                    p99,
+                    server.connections - connections,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
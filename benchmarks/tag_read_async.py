@@ -0,0 +1,95 @@
+"""Measures the throughput of ``TagManager.read_async`` against a local HTTP server.
+
+Compares the per-event-loop async client used by ``HttpClient`` with the previous
+behavior, where every async request created a new ``httpx.AsyncClient`` (and so a new
+connection pool) that was never closed.
+
+Run with ``poetry run python benchmarks/tag_read_async.py``.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Awaitable, Callable
+
+from httpx import AsyncClient
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.tag import TagManager
+
+_BODY = b'{"type": "DOUBLE", "value": "1.5"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _use_new_client_per_request(manager: TagManager) -> None:
+    http_client = manager._http_client
+
+    async def get_async_client() -> AsyncClient:
+        return AsyncClient(**http_client._kwargs)
+
+    http_client._get_async_client = get_async_client  # type: ignore
+
+
+async def _measure(
+    read: Callable[[], Awaitable[Any]], requests: int, concurrency: int
+) -> float:
+    """Get the number of requests per second made by ``concurrency`` tasks."""
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            await read()
+
+    await read()  # warm up
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print the requests per second for each client behavior and concurrency."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configuration = HttpConfiguration(
+        "http://127.0.0.1:{}".format(server.server_address[1]), "key"
+    )
+
+    print("{:<36}{:>12}{:>16}".format("Client", "Concurrency", "Requests/sec"))
+    for name, per_request in [
+        ("new AsyncClient per request", True),
+        ("AsyncClient per event loop", False),
+    ]:
+        for concurrency in (1, 10):
+            manager = TagManager(configuration)
+            if per_request:
+                _use_new_client_per_request(manager)
+
+            async def run() -> float:
+                rate = await _measure(
+                    lambda: manager.read_async("tag"), 500, concurrency
+                )
+                await manager.aclose()
+                return rate
+
+            rate = asyncio.run(run())
+            print("{:<36}{:>12}{:>16.0f}".format(name, concurrency, rate))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core.helpers import Paginator
 from nisystemlink.clients.product import ProductClient
 from nisystemlink.clients.product.models import (
+    PagedProducts,
     Product,
     ProductField,
     QueryProductsRequest,
@@ -40,14 +42,14 @@ server_configuration = HttpConfiguration(
 )
 client = ProductClient(configuration=server_configuration)
 
-# Get all the products using the continuation token in batches of 100 at a time.
-response = client.get_products_paged(take=100, return_count=True)
-all_products = response.products
-while response.continuation_token:
-    response = client.get_products_paged(
-        take=100, continuation_token=response.continuation_token, return_count=True
+# Get all the products using the continuation token in batches of 100 at a time,
+# fetching each batch while the one before is processed.
+all_products = list(
+    Paginator[PagedProducts, Product](
+        lambda token: client.get_products_paged(take=100, continuation_token=token),
+        lambda page: page.products,
     )
-    all_products.extend(response.products)
+)
 
 create_response = create_some_products()
 
@@ -1,3 +1,20 @@
-from ._artifact_client import ArtifactClient
-
-# flake8: noqa
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._artifact_client import ArtifactClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._artifact_client": ["ArtifactClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
+
+# flake8: noqa
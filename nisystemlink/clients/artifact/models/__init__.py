@@ -1,3 +1,20 @@
-from ._upload_artifact_response import UploadArtifactResponse
-
-# flake8: noqa
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._upload_artifact_response import UploadArtifactResponse
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._upload_artifact_response": ["UploadArtifactResponse"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
+
+# flake8: noqa
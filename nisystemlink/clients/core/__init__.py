@@ -1,10 +1,54 @@
 # -*- coding: utf-8 -*-
 
-from ._api_error import ApiError
-from ._api_exception import ApiException
-from ._http_configuration import HttpConfiguration
-from ._cloud_http_configuration import CloudHttpConfiguration
-from ._jupyter_http_configuration import JupyterHttpConfiguration
-from ._http_configuration_manager import HttpConfigurationManager
+from typing import TYPE_CHECKING
+
+from ._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._api_error import ApiError
+    from ._api_exception import ApiException
+    from ._retry_policy import RetryPolicy
+    from ._rate_limiter import RateLimiter
+    from ._request_observer import CompletedRequest, RequestObserver
+    from ._response_cache import ResponseCache
+    from ._request_coalescer import RequestCoalescer
+    from ._http_configuration import HttpConfiguration
+    from ._cloud_http_configuration import CloudHttpConfiguration
+    from ._jupyter_http_configuration import JupyterHttpConfiguration
+    from ._http_configuration_manager import HttpConfigurationManager
+    from ._deadline import Deadline
+    from ._trusted_decode import TrustedDecode
+    from ._latency_histogram import LatencyHistogram
+    from ._request_metrics import RequestMetrics, RouteMetrics
+    from ._connection_pool import ConnectionPool, ConnectionPoolStats
+    from ._batch_executor import BatchExecutor, BatchResult, BatchResults
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._api_error": ["ApiError"],
+        "._api_exception": ["ApiException"],
+        "._retry_policy": ["RetryPolicy"],
+        "._rate_limiter": ["RateLimiter"],
+        "._request_observer": ["CompletedRequest", "RequestObserver"],
+        "._response_cache": ["ResponseCache"],
+        "._request_coalescer": ["RequestCoalescer"],
+        "._http_configuration": ["HttpConfiguration"],
+        "._cloud_http_configuration": ["CloudHttpConfiguration"],
+        "._jupyter_http_configuration": ["JupyterHttpConfiguration"],
+        "._http_configuration_manager": ["HttpConfigurationManager"],
+        "._deadline": ["Deadline"],
+        "._trusted_decode": ["TrustedDecode"],
+        "._latency_histogram": ["LatencyHistogram"],
+        "._request_metrics": ["RequestMetrics", "RouteMetrics"],
+        "._connection_pool": ["ConnectionPool", "ConnectionPoolStats"],
+        "._batch_executor": ["BatchExecutor", "BatchResult", "BatchResults"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of BatchExecutor."""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from nisystemlink.clients.core._latency_histogram import LatencyHistogram
+from nisystemlink.clients.core._uplink._base_client import AsyncBaseClient, BaseClient
+
+T = TypeVar("T")
+TArg = TypeVar("TArg")
+
+
+class BatchResult(Generic[T]):
+    """The outcome of one call made by a :class:`BatchExecutor`."""
+
+    def __init__(
+        self,
+        value: Optional[T],
+        error: Optional[Exception],
+        duration_milliseconds: float,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            value: The value returned by the call, or None if it raised an exception.
+            error: The exception raised by the call, if any.
+            duration_milliseconds: The time taken by the call, not including the time
+                it waited to start.
+        """
+        self._value = value
+        self._error = error
+        self._duration_ms = duration_milliseconds
+
+    @property
+    def value(self) -> Optional[T]:  # noqa: D401
+        """The value returned by the call, or None if it raised an exception."""
+        return self._value
+
+    @property
+    def error(self) -> Optional[Exception]:  # noqa: D401
+        """The exception raised by the call, if any."""
+        return self._error
+
+    @property
+    def duration_milliseconds(self) -> float:  # noqa: D401
+        """The time taken by the call, not including the time it waited to start."""
+        return self._duration_ms
+
+    def result(self) -> T:
+        """Get the value returned by the call.
+
+        Raises:
+            Exception: the exception raised by the call, if any.
+        """
+        if self._error is not None:
+            raise self._error
+        return self._value  # type: ignore
+
+    def __repr__(self) -> str:
+        if self._error is not None:
+            return "BatchResult(error={!r})".format(self._error)
+        return "BatchResult(value={!r})".format(self._value)
+
+
+class BatchResults(List[BatchResult[T]]):
+    """The outcomes of the calls made by :meth:`BatchExecutor.run()`, in the order the
+    calls were given, with timing for the batch as a whole.
+    """
+
+    def __init__(
+        self,
+        results: List[BatchResult[T]],
+        duration_milliseconds: float,
+        concurrency: int,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            results: The outcome of each call.
+            duration_milliseconds: The time taken to make every call.
+            concurrency: The maximum number of calls that were made at once.
+        """
+        super().__init__(results)
+        self._duration_ms = duration_milliseconds
+        self._concurrency = concurrency
+        self._latency = LatencyHistogram()
+        for result in results:
+            self._latency.record(result.duration_milliseconds)
+
+    @property
+    def duration_milliseconds(self) -> float:  # noqa: D401
+        """The time taken to make every call."""
+        return self._duration_ms
+
+    @property
+    def concurrency(self) -> int:  # noqa: D401
+        """The maximum number of calls that were made at once."""
+        return self._concurrency
+
+    @property
+    def latency(self) -> LatencyHistogram:  # noqa: D401
+        """The histogram of the durations of the individual calls."""
+        return self._latency
+
+    @property
+    def errors(self) -> List[Exception]:  # noqa: D401
+        """The exceptions raised by the calls that failed, in order."""
+        return [r.error for r in self if r.error is not None]
+
+    def values(self) -> List[T]:
+        """Get the value returned by each call.
+
+        Raises:
+            Exception: the exception raised by the first call that failed, if any.
+        """
+        return [result.result() for result in self]
+
+    def __repr__(self) -> str:
+        return "BatchResults(count={}, errors={}, duration_milliseconds={:.3f})".format(
+            len(self), len(self.errors), self._duration_ms
+        )
+
+
+class BatchExecutor:
+    """Makes many independent API calls through a client at once, with no more in
+    flight than the client has connections.
+
+    Calls made through a synchronous client run on a pool of threads, and calls made
+    through an asyncio client run as tasks. Concurrency is capped at the client's
+    :attr:`HttpConfiguration.max_connections_per_host`, so calls never wait inside the
+    connection pool, and each call still goes through the client's retry policy and
+    rate limiters. A failed call doesn't stop the others; its exception is returned
+    in its :class:`BatchResult`.
+
+    Example::
+
+        executor = BatchExecutor(client)
+        results = executor.map(client.get_table_metadata, table_ids)
+        tables = results.values()
+        print(results.duration_milliseconds, results.latency.percentile(99))
+    """
+
+    def __init__(
+        self,
+        client: Union[BaseClient, AsyncBaseClient],
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Initialize an executor.
+
+        Args:
+            client: The client through which the calls are made.
+            max_concurrency: The maximum number of calls to make at once, or None to
+                make as many as the client has connections. Larger values are reduced
+                to the number of connections.
+
+        Raises:
+            ValueError: if ``max_concurrency`` is less than one.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._is_async = not isinstance(client, BaseClient)
+        if isinstance(client, BaseClient):
+            connections = client.connection_pool.max_connections_per_host
+        else:
+            connections = client.max_connections_per_host
+        self._max_concurrency = min(max_concurrency or connections, connections)
+
+    @property
+    def max_concurrency(self) -> int:  # noqa: D401
+        """The maximum number of calls made at once."""
+        return self._max_concurrency
+
+    def run(self, calls: Iterable[Callable[[], T]]) -> BatchResults[T]:
+        """Make calls through a synchronous client.
+
+        Each call runs in a copy of the caller's context, so :class:`Deadline` and
+        :class:`TrustedDecode` blocks apply to it.
+
+        Args:
+            calls: Functions that each make one call, such as
+                ``lambda: client.get_table_metadata(id)``.
+
+        Returns:
+            The outcome of each call, in the order of ``calls``.
+
+        Raises:
+            TypeError: if the executor was created for an asyncio client.
+        """
+        if self._is_async:
+            raise TypeError(
+                "BatchExecutor was created for an asyncio client; use run_async()"
+            )
+        calls = list(calls)
+        concurrency = max(min(self._max_concurrency, len(calls)), 1)
+        start = time.monotonic()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="BatchExecutor"
+        ) as pool:
+            futures = [
+                pool.submit(_call_in_context, contextvars.copy_context(), call)
+                for call in calls
+            ]
+            results = [future.result() for future in futures]
+        return BatchResults(results, (time.monotonic() - start) * 1000, concurrency)
+
+    def map(
+        self, function: Callable[[TArg], T], arguments: Iterable[TArg]
+    ) -> BatchResults[T]:
+        """Make a call for each argument through a synchronous client.
+
+        Args:
+            function: The client method to call, such as
+                ``client.get_table_metadata``.
+            arguments: The argument of each call.
+
+        Returns:
+            The outcome of each call, in the order of ``arguments``.
+
+        Raises:
+            TypeError: if the executor was created for an asyncio client.
+        """
+        return self.run([_bind(function, argument) for argument in arguments])
+
+    async def run_async(
+        self, calls: Iterable[Callable[[], Awaitable[T]]]
+    ) -> BatchResults[T]:
+        """Make calls through an asyncio client.
+
+        Args:
+            calls: Coroutine functions that each make one call, such as
+                ``lambda: client.get_table_metadata(id)``.
+
+        Returns:
+            The outcome of each call, in the order of ``calls``.
+
+        Raises:
+            TypeError: if the executor was created for a synchronous client.
+        """
+        if not self._is_async:
+            raise TypeError(
+                "BatchExecutor was created for a synchronous client; use run()"
+            )
+        calls = list(calls)
+        concurrency = max(min(self._max_concurrency, len(calls)), 1)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call_when_ready(call: Callable[[], Awaitable[T]]) -> BatchResult[T]:
+            async with semaphore:
+                return await _call_async(call)
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(call_when_ready(call) for call in calls))
+        return BatchResults(
+            list(results), (time.monotonic() - start) * 1000, concurrency
+        )
+
+    async def map_async(
+        self, function: Callable[[TArg], Awaitable[T]], arguments: Iterable[TArg]
+    ) -> BatchResults[T]:
+        """Make a call for each argument through an asyncio client.
+
+        Args:
+            function: The client method to call, such as
+                ``client.get_table_metadata``.
+            arguments: The argument of each call.
+
+        Returns:
+            The outcome of each call, in the order of ``arguments``.
+
+        Raises:
+            TypeError: if the executor was created for a synchronous client.
+        """
+        return await self.run_async(
+            [_bind(function, argument) for argument in arguments]
+        )
+
+
+def _bind(function: Callable[[TArg], Any], argument: TArg) -> Callable[[], Any]:
+    return lambda: function(argument)
+
+
+def _call_in_context(
+    context: contextvars.Context, call: Callable[[], T]
+) -> BatchResult[T]:
+    return context.run(_call, call)
+
+
+def _call(call: Callable[[], T]) -> BatchResult[T]:
+    start = time.monotonic()
+    try:
+        value = call()
+    except Exception as ex:
+        return BatchResult(None, ex, (time.monotonic() - start) * 1000)
+    return BatchResult(value, None, (time.monotonic() - start) * 1000)
+
+
+async def _call_async(call: Callable[[], Awaitable[T]]) -> BatchResult[T]:
+    start = time.monotonic()
+    try:
+        value = await call()
+    except Exception as ex:
+        return BatchResult(None, ex, (time.monotonic() - start) * 1000)
+    return BatchResult(value, None, (time.monotonic() - start) * 1000)
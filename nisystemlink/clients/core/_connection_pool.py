@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of ConnectionPool."""
+
+import threading
+import time
+import weakref
+from typing import Any, Optional, Tuple, Type
+
+import requests
+from nisystemlink.clients import core
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import is_connection_dropped
+
+
+class ConnectionPoolStats:
+    """A snapshot of the connections held by a :class:`ConnectionPool`."""
+
+    def __init__(self, in_use: int, idle: int, created: int, reused: int) -> None:
+        """Initialize an instance.
+
+        Args:
+            in_use: The number of connections currently checked out for a request.
+            idle: The number of open connections waiting to be reused.
+            created: The total number of connections opened by the pool.
+            reused: The total number of requests sent over an existing connection.
+        """
+        self._in_use = in_use
+        self._idle = idle
+        self._created = created
+        self._reused = reused
+
+    @property
+    def in_use(self) -> int:  # noqa: D401
+        """The number of connections currently checked out for a request."""
+        return self._in_use
+
+    @property
+    def idle(self) -> int:  # noqa: D401
+        """The number of open connections waiting to be reused."""
+        return self._idle
+
+    @property
+    def created(self) -> int:  # noqa: D401
+        """The total number of connections opened by the pool."""
+        return self._created
+
+    @property
+    def reused(self) -> int:  # noqa: D401
+        """The total number of requests sent over an existing connection."""
+        return self._reused
+
+    def __repr__(self) -> str:
+        return "ConnectionPoolStats(in_use={}, idle={}, created={}, reused={})".format(
+            self._in_use, self._idle, self._created, self._reused
+        )
+
+
+def _counting_pool_class(
+    base: Type[HTTPConnectionPool], adapter: "_PoolingHTTPAdapter"
+) -> Type[HTTPConnectionPool]:
+    class _CountingConnectionPool(base):  # type: ignore
+        def _get_conn(self, *args: Any, **kwargs: Any) -> Any:
+            conn = super()._get_conn(*args, **kwargs)
+            # Stale connections are closed when they are checked out, so an open socket
+            # here means the request will reuse an existing connection.
+            adapter._record_checkout(reused=getattr(conn, "sock", None) is not None)
+            return conn
+
+    return _CountingConnectionPool
+
+
+def _close_queued_connections(queue: Any) -> None:
+    # Swap each idle connection for the None placeholder that urllib3 uses for a
+    # connection that hasn't been opened yet. Holding the queue's mutex keeps a thread
+    # from taking a connection out of the queue while it's being closed.
+    with queue.mutex:
+        connections = queue.queue
+        for index, connection in enumerate(connections):
+            if connection is not None:
+                connections[index] = None
+                connection.close()
+
+
+class _PoolingHTTPAdapter(HTTPAdapter):
+    """An :class:`HTTPAdapter` with a bounded pool that closes connections left idle too long."""
+
+    def __init__(self, max_connections: int, idle_timeout: Optional[float]) -> None:
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self._created = 0
+        self._reused = 0
+        # Block when every connection is in use, rather than opening extra connections
+        # that are thrown away because they don't fit back into the pool.
+        super().__init__(pool_maxsize=max_connections, pool_block=True)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self),
+            "https": _counting_pool_class(HTTPSConnectionPool, self),
+        }
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        self.evict_idle_connections()
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._last_used = time.monotonic()
+
+    def evict_idle_connections(self) -> None:
+        """Close the pooled connections that are waiting to be reused, if none have been
+        used within the idle timeout.
+
+        Connections checked out for a request are left alone, so that a request sent
+        concurrently by another thread is never cut off.
+        """
+        if self._idle_timeout is None:
+            return
+        with self._lock:
+            if time.monotonic() - self._last_used < self._idle_timeout:
+                return
+            for key in self.poolmanager.pools.keys():
+                queue = self.poolmanager.pools[key].pool
+                if queue is not None:
+                    _close_queued_connections(queue)
+
+    def stats(self) -> ConnectionPoolStats:
+        self.evict_idle_connections()
+        with self._lock:
+            in_use, idle = self._count_connections()
+            return ConnectionPoolStats(in_use, idle, self._created, self._reused)
+
+    def _record_checkout(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self._reused += 1
+            else:
+                self._created += 1
+
+    def _count_connections(self) -> Tuple[int, int]:
+        in_use = idle = 0
+        for key in self.poolmanager.pools.keys():
+            queue = self.poolmanager.pools[key].pool
+            if queue is not None:
+                queued = list(queue.queue)
+                in_use += queue.maxsize - len(queued)
+                idle += sum(
+                    1 for c in queued if c is not None and not is_connection_dropped(c)
+                )
+        return in_use, idle
+
+
+class ConnectionPool:
+    """A bounded pool of HTTP connections to a SystemLink server.
+
+    Clients created from equivalent :class:`HttpConfiguration` objects share a single
+    pool (see :meth:`for_configuration()`), so they reuse open connections rather than
+    each performing their own TCP and TLS handshakes. A shared pool is closed once the
+    last client using it is gone.
+    """
+
+    _pools = (
+        weakref.WeakValueDictionary()
+    )  # type: weakref.WeakValueDictionary[Tuple[Any, ...], ConnectionPool]
+    _pools_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_connections_per_host: int = core.HttpConfiguration.DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        idle_timeout_milliseconds: Optional[
+            int
+        ] = core.HttpConfiguration.DEFAULT_CONNECTION_IDLE_TIMEOUT_MILLISECONDS,
+        keep_alive: bool = True,
+    ) -> None:
+        """Initialize a pool.
+
+        Args:
+            max_connections_per_host: The maximum number of connections to open to a
+                single host. Requests wait for a connection to become available once
+                this many are in use.
+            idle_timeout_milliseconds: How long connections may remain unused before
+                they are closed, or None to keep them open indefinitely.
+            keep_alive: Whether to keep connections open between requests.
+
+        Raises:
+            ValueError: if ``max_connections_per_host`` is less than one.
+        """
+        if max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+
+        self._max_connections_per_host = max_connections_per_host
+        self._adapter = _PoolingHTTPAdapter(
+            max_connections_per_host,
+            (
+                idle_timeout_milliseconds / 1000
+                if idle_timeout_milliseconds is not None
+                else None
+            ),
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+        self._closed = False
+        # Close the sockets as soon as the pool is unreachable, rather than whenever the
+        # garbage collector gets to the adapter's reference cycles
+        weakref.finalize(self, self._session.close)
+
+    @classmethod
+    def for_configuration(
+        cls, configuration: core.HttpConfiguration
+    ) -> "ConnectionPool":
+        """Get the pool shared by all clients using equivalent configurations.
+
+        Configurations are equivalent if they have the same server, credentials, and
+        connection pool settings.
+
+        Args:
+            configuration: The configuration of the client that will use the pool.
+
+        Returns:
+            The shared pool.
+        """
+        key = (
+            configuration.server_uri,
+            tuple(sorted((configuration.api_keys or {}).items())),
+            configuration.username,
+            configuration.password,
+            configuration.max_connections_per_host,
+            configuration.connection_idle_timeout_milliseconds,
+            configuration.keep_alive,
+        )
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None or pool._closed:
+                pool = ConnectionPool(
+                    configuration.max_connections_per_host,
+                    configuration.connection_idle_timeout_milliseconds,
+                    configuration.keep_alive,
+                )
+                cls._pools[key] = pool
+            return pool
+
+    @property
+    def session(self) -> requests.Session:  # noqa: D401
+        """The :class:`requests.Session` that sends requests using the pool."""
+        return self._session
+
+    @property
+    def max_connections_per_host(self) -> int:  # noqa: D401
+        """The maximum number of connections the pool opens to a single host."""
+        return self._max_connections_per_host
+
+    @property
+    def stats(self) -> ConnectionPoolStats:  # noqa: D401
+        """A snapshot of the pool's current and cumulative connection counts."""
+        return self._adapter.stats()
+
+    def evict_idle_connections(self) -> None:
+        """Close the pool's connections if they have been idle longer than the idle timeout.
+
+        Idle connections are also evicted automatically before each request.
+        """
+        self._adapter.evict_idle_connections()
+
+    def close(self) -> None:
+        """Close all connections in the pool.
+
+        Clients that use the pool can no longer send requests. Subsequent calls to
+        :meth:`for_configuration()` create a new pool.
+        """
+        self._closed = True
+        self._session.close()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of Deadline."""
+
+import contextvars
+import time
+from types import TracebackType
+from typing import Optional, Tuple, Type
+
+from typing_extensions import Literal
+
+_current_deadline = contextvars.ContextVar(
+    "_current_deadline", default=None
+)  # type: contextvars.ContextVar[Optional[Deadline]]
+
+
+class Deadline:
+    """A time budget shared by every API call made within a ``with`` block.
+
+    Each request made inside the block waits no longer than the time remaining in the
+    budget, and once the budget is spent, further requests (including retries and
+    follow-up page requests) raise :class:`TimeoutError` without being sent. Deadlines
+    follow the current thread or asyncio task. A nested deadline can shorten the budget
+    of the one it is nested in, but not extend it.
+
+    Example::
+
+        with Deadline(timeout_milliseconds=5000):
+            table = client.get_table_metadata(table_id)
+            data = client.get_table_data(table_id)
+    """
+
+    def __init__(self, timeout_milliseconds: int) -> None:
+        """Initialize a deadline.
+
+        Args:
+            timeout_milliseconds: The number of milliseconds, starting from when the
+                ``with`` block is entered, that API calls within the block may take.
+        """
+        self._timeout_ms = timeout_milliseconds
+        self._expires_at = None  # type: Optional[float]
+        self._token = None  # type: Optional[contextvars.Token[Optional[Deadline]]]
+
+    @staticmethod
+    def current() -> Optional["Deadline"]:
+        """Get the innermost deadline in effect, or None if there is none."""
+        return _current_deadline.get()
+
+    @property
+    def remaining_milliseconds(self) -> float:  # noqa: D401
+        """The number of milliseconds left in the budget, or zero if it's spent.
+
+        Raises:
+            RuntimeError: if the deadline has not been entered.
+        """
+        if self._expires_at is None:
+            raise RuntimeError("Deadline must be entered with a 'with' statement")
+        return max(self._expires_at - time.monotonic(), 0.0) * 1000
+
+    @property
+    def expired(self) -> bool:  # noqa: D401
+        """Whether the budget has been spent."""
+        return self.remaining_milliseconds <= 0
+
+    def __enter__(self) -> "Deadline":
+        self._expires_at = time.monotonic() + self._timeout_ms / 1000
+        outer = _current_deadline.get()
+        if outer is not None and outer._expires_at is not None:
+            self._expires_at = min(self._expires_at, outer._expires_at)
+        self._token = _current_deadline.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        if self._token is not None:
+            _current_deadline.reset(self._token)
+            self._token = None
+        return False
+
+
+def _get_request_timeout(
+    connect_timeout_ms: int, read_timeout_ms: int
+) -> Tuple[float, float]:
+    """Get the (connect, read) timeouts in seconds for a request about to be sent.
+
+    The configured timeouts are shortened to fit within the current :class:`Deadline`.
+
+    Raises:
+        TimeoutError: if the current deadline has expired.
+    """
+    connect = float(min(connect_timeout_ms, read_timeout_ms))
+    read = float(read_timeout_ms)
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        remaining = deadline.remaining_milliseconds
+        if remaining <= 0:
+            raise TimeoutError(
+                "The deadline of {} ms for the API call expired".format(
+                    deadline._timeout_ms
+                )
+            )
+        connect = min(connect, remaining)
+        read = min(read, remaining)
+    return connect / 1000, read / 1000
@@ -4,7 +4,13 @@
 
 import pathlib
 import urllib.parse
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+from nisystemlink.clients.core._rate_limiter import RateLimiter
+from nisystemlink.clients.core._request_coalescer import RequestCoalescer
+from nisystemlink.clients.core._request_observer import RequestObserver
+from nisystemlink.clients.core._response_cache import ResponseCache
+from nisystemlink.clients.core._retry_policy import RetryPolicy
 
 
 class HttpConfiguration:
@@ -13,6 +19,15 @@ class HttpConfiguration:
     DEFAULT_TIMEOUT_MILLISECONDS = 60000
     """The default value of :attr:`timeout_milliseconds` to use when making API calls."""
 
+    DEFAULT_CONNECT_TIMEOUT_MILLISECONDS = 10000
+    """The default value of :attr:`connect_timeout_milliseconds`."""
+
+    DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+    """The default value of :attr:`max_connections_per_host`."""
+
+    DEFAULT_CONNECTION_IDLE_TIMEOUT_MILLISECONDS = 60000
+    """The default value of :attr:`connection_idle_timeout_milliseconds`."""
+
     _SYSTEM_LINK_API_KEY_HEADER = "x-ni-api-key"
 
     def __init__(
@@ -57,6 +72,8 @@ class HttpConfiguration:
         self._server_uri = urllib.parse.urlunsplit(uri[:2] + ("", "", ""))
 
         self._api_keys = None  # type: Optional[Dict[str, str]]
+        self._username = None  # type: Optional[str]
+        self._password = None  # type: Optional[str]
         if api_key:
             self._api_keys = {self._SYSTEM_LINK_API_KEY_HEADER: api_key}
         elif username or password:
@@ -70,6 +87,23 @@ class HttpConfiguration:
         self._user_agent = ""  # type: Optional[str]
 
         self._timeout_ms = self.DEFAULT_TIMEOUT_MILLISECONDS
+        self._connect_timeout_ms = self.DEFAULT_CONNECT_TIMEOUT_MILLISECONDS
+
+        self._max_connections_per_host = self.DEFAULT_MAX_CONNECTIONS_PER_HOST
+        self._connection_idle_timeout_ms = (
+            self.DEFAULT_CONNECTION_IDLE_TIMEOUT_MILLISECONDS
+        )  # type: Optional[int]
+        self._keep_alive = True
+        self._http2 = False
+        self._request_compression_threshold_bytes = None  # type: Optional[int]
+
+        self._retry_policy = RetryPolicy()
+        self._rate_limiters = {}  # type: Dict[str, RateLimiter]
+
+        self._response_cache = None  # type: Optional[ResponseCache]
+        self._request_coalescer = None  # type: Optional[RequestCoalescer]
+        self._trusted_decode = False
+        self._request_observers = []  # type: List[RequestObserver]
 
         self._workspace = workspace
 
@@ -77,6 +111,9 @@ class HttpConfiguration:
     def timeout_milliseconds(self) -> int:  # noqa: D401
         """The number of milliseconds before a request times out with an error.
 
+        This bounds how long a request waits for the server to send or accept data. To
+        bound the total duration of an API call, use a :class:`Deadline`.
+
         Changing the timeout will not affect APIs that have already read the
         configuration.
         """
@@ -86,6 +123,213 @@ class HttpConfiguration:
     def timeout_milliseconds(self, value: int) -> None:
         self._timeout_ms = value
 
+    @property
+    def connect_timeout_milliseconds(self) -> int:  # noqa: D401
+        """The number of milliseconds to wait for a connection to the server to be
+        established before timing out with an error.
+
+        The connect timeout never exceeds :attr:`timeout_milliseconds`. Changing the
+        timeout will not affect APIs that have already read the configuration.
+        """
+        return self._connect_timeout_ms
+
+    @connect_timeout_milliseconds.setter
+    def connect_timeout_milliseconds(self, value: int) -> None:
+        self._connect_timeout_ms = value
+
+    @property
+    def max_connections_per_host(self) -> int:  # noqa: D401
+        """The maximum number of connections to open to the server at once.
+
+        Clients created from equivalent configurations share a pool of this many
+        connections; once all of them are in use, further requests wait for one to be
+        returned to the pool. Changing the limit will not affect APIs that have already
+        read the configuration.
+        """
+        return self._max_connections_per_host
+
+    @max_connections_per_host.setter
+    def max_connections_per_host(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("max_connections_per_host must be at least 1")
+        self._max_connections_per_host = value
+
+    @property
+    def connection_idle_timeout_milliseconds(self) -> Optional[int]:  # noqa: D401
+        """The number of milliseconds a pooled connection may remain unused before it is
+        closed, or None to keep idle connections open indefinitely.
+
+        Changing the timeout will not affect APIs that have already read the
+        configuration.
+        """
+        return self._connection_idle_timeout_ms
+
+    @connection_idle_timeout_milliseconds.setter
+    def connection_idle_timeout_milliseconds(self, value: Optional[int]) -> None:
+        self._connection_idle_timeout_ms = value
+
+    @property
+    def keep_alive(self) -> bool:  # noqa: D401
+        """Whether to keep connections open so that later requests can reuse them.
+
+        Changing this setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._keep_alive
+
+    @keep_alive.setter
+    def keep_alive(self, value: bool) -> None:
+        self._keep_alive = value
+
+    @property
+    def http2(self) -> bool:  # noqa: D401
+        """Whether to use HTTP/2 when the server supports it, so that concurrent requests
+        share a connection rather than each needing its own.
+
+        HTTP/2 is used by the tag clients and the asyncio clients, and requires the
+        ``h2`` package (``pip install httpx[http2]``). Other clients always use
+        HTTP/1.1. Changing this setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._http2
+
+    @http2.setter
+    def http2(self, value: bool) -> None:
+        self._http2 = value
+
+    @property
+    def request_compression_threshold_bytes(self) -> Optional[int]:  # noqa: D401
+        """The size, in bytes, from which JSON request bodies are sent gzip-compressed
+        with ``Content-Encoding: gzip``, or None (the default) to never compress them.
+
+        Compression saves bandwidth on slow links, at the cost of CPU time on the client,
+        and requires a server that accepts compressed requests. Bodies that don't get
+        smaller are sent uncompressed. Responses are always requested with
+        ``Accept-Encoding: gzip, deflate`` and decompressed, whatever this setting.
+        Changing this setting will not affect APIs that have already read the
+        configuration.
+        """
+        return self._request_compression_threshold_bytes
+
+    @request_compression_threshold_bytes.setter
+    def request_compression_threshold_bytes(self, value: Optional[int]) -> None:
+        self._request_compression_threshold_bytes = value
+
+    @property
+    def retry_policy(self) -> RetryPolicy:  # noqa: D401
+        """The policy that determines when failed requests are retried.
+
+        Use :meth:`RetryPolicy.no_retries()` to disable retries. Changing the policy
+        will not affect APIs that have already read the configuration.
+        """
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: RetryPolicy) -> None:
+        self._retry_policy = value
+
+    @property
+    def rate_limiters(self) -> Dict[str, RateLimiter]:  # noqa: D401
+        """The rate limiters to apply to requests, keyed by the base path of the URLs
+        they apply to.
+        """
+        return dict(self._rate_limiters)
+
+    def set_rate_limiter(
+        self, base_path: str, rate_limiter: Optional[RateLimiter]
+    ) -> None:
+        """Limit the rate of requests to URLs whose path starts with ``base_path``.
+
+        Requests are limited by the limiter with the longest matching base path, such as
+        ``"/nitag/v2/update-current-values"`` over ``"/nitag/v2"``. All clients created
+        from this configuration share the limiter. Changing the rate limiters will not
+        affect APIs that have already read the configuration.
+
+        Args:
+            base_path: The path of the service or endpoint to limit, such as
+                ``"/nidataframe/v1"``.
+            rate_limiter: The limiter to apply, or None to remove the limiter for
+                ``base_path``.
+        """
+        if rate_limiter is None:
+            self._rate_limiters.pop(base_path, None)
+        else:
+            self._rate_limiters[base_path] = rate_limiter
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:  # noqa: D401
+        """The cache of GET responses shared by clients created from this
+        configuration, or None (the default) to not cache responses.
+
+        Changing the cache will not affect APIs that have already read the
+        configuration.
+        """
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: Optional[ResponseCache]) -> None:
+        self._response_cache = value
+
+    @property
+    def request_coalescer(self) -> Optional[RequestCoalescer]:  # noqa: D401
+        """The coalescer that merges identical GET requests in flight at the same time,
+        shared by clients created from this configuration, or None (the default) to
+        send every request.
+
+        Changing the coalescer will not affect APIs that have already read the
+        configuration.
+        """
+        return self._request_coalescer
+
+    @request_coalescer.setter
+    def request_coalescer(self, value: Optional[RequestCoalescer]) -> None:
+        self._request_coalescer = value
+
+    @property
+    def trusted_decode(self) -> bool:  # noqa: D401
+        """Whether responses are decoded into models without validating them.
+
+        Trusted decoding is faster for large responses, but doesn't report data that
+        doesn't match the models. Use :class:`TrustedDecode` to turn it on or off for
+        individual API calls. Changing this setting will not affect APIs that have
+        already read the configuration.
+        """
+        return self._trusted_decode
+
+    @trusted_decode.setter
+    def trusted_decode(self, value: bool) -> None:
+        self._trusted_decode = value
+
+    @property
+    def request_observers(self) -> List[RequestObserver]:  # noqa: D401
+        """The observers notified of every API call made by clients created from this
+        configuration.
+        """
+        return list(self._request_observers)
+
+    def add_request_observer(self, observer: RequestObserver) -> None:
+        """Notify ``observer`` of every API call made by clients created from this
+        configuration.
+
+        Use :meth:`RequestObserver.add_global()` to observe every client instead.
+        Changing the observers will not affect APIs that have already read the
+        configuration.
+
+        Args:
+            observer: The observer to add, such as a :class:`RequestMetrics`.
+        """
+        self._request_observers.append(observer)
+
+    def remove_request_observer(self, observer: RequestObserver) -> None:
+        """Stop notifying an observer added with :meth:`add_request_observer()`.
+
+        Args:
+            observer: The observer to remove.
+        """
+        self._request_observers = [
+            o for o in self._request_observers if o is not observer
+        ]
+
     @property
     def user_agent(self) -> Optional[str]:  # noqa: D401
         """The string to pass the web server as the product name or names making the
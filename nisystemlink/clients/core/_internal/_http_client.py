@@ -2,17 +2,44 @@
 
 """Implementation of HttpClient."""
 
+import asyncio
+import json
 import json.decoder
 import sys
 import threading
+import time
 import typing
 import urllib.parse
-from typing import Any, Awaitable, Dict, Iterable, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from nisystemlink.clients import core
+from nisystemlink.clients.core._deadline import _get_request_timeout
+from nisystemlink.clients.core._rate_limiter import _find_rate_limiter
+from nisystemlink.clients.core._request_coalescer import _get_key
+from nisystemlink.clients.core._request_compression import (
+    _compress_body,
+    _CompressedBody,
+)
+from nisystemlink.clients.core._request_observer import (
+    _has_observers,
+    _notify_observers,
+)
+from nisystemlink.clients.core._response_cache import _CacheLookup
+from nisystemlink.clients.core._retry_policy import _RetryState
+from nisystemlink.clients.core.helpers import AsyncJsonArrayStream, JsonArrayStream
 
 if sys.version_info >= (3, 6):
-    from httpx import AsyncClient, Client, Response as HttpResponse
+    from httpx import AsyncClient, Client, Limits, Response as HttpResponse, Timeout
 else:
     from requests import Session as Client, Response as HttpResponse
 
@@ -36,12 +63,135 @@ class HttpClient:
             self._kwargs["auth"] = (configuration.username, configuration.password)
         if configuration.cert_path:
             self._kwargs["verify"] = str(configuration.cert_path)
+        if sys.version_info >= (3, 6):
+            max_connections = configuration.max_connections_per_host
+            idle_timeout = configuration.connection_idle_timeout_milliseconds
+            self._kwargs["limits"] = Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=(
+                    max_connections if configuration.keep_alive else 0
+                ),
+                keepalive_expiry=(
+                    idle_timeout / 1000 if idle_timeout is not None else None
+                ),
+            )
+            self._kwargs["http2"] = configuration.http2
+        self._connect_timeout_ms = configuration.connect_timeout_milliseconds
+        self._read_timeout_ms = configuration.timeout_milliseconds
+        self._retry_policy = configuration.retry_policy
+        self._rate_limiters = configuration.rate_limiters
+        self._request_observers = configuration.request_observers
+        self._compression_threshold = configuration.request_compression_threshold_bytes
+        self._response_cache = configuration.response_cache
+        self._request_coalescer = configuration.request_coalescer
+
+        # httpx clients are thread-safe, so one client (and connection pool) is shared
+        # by every thread
+        self._sync_client = None  # type: Optional[Client]
+        self._sync_client_lock = threading.Lock()
+
+        # Keep an async client per event loop, as they can't be shared between loops
+        self._aclients = {}  # type: Dict[asyncio.AbstractEventLoop, AsyncClient]
+        self._aclient_closers = (
+            {}
+        )  # type: Dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]
+        self._aclients_lock = threading.Lock()
+
+    def _get_timeout(self) -> Any:
+        """Get the timeout for a request about to be sent, shortened to fit the current deadline."""
+        connect, read = _get_request_timeout(
+            self._connect_timeout_ms, self._read_timeout_ms
+        )
+        if sys.version_info >= (3, 6):
+            return Timeout(read, connect=connect)
+        return connect, read
+
+    def _get_rate_limiter(self, uri: str) -> Optional[core.RateLimiter]:
+        return _find_rate_limiter(self._rate_limiters, urllib.parse.urlsplit(uri).path)
+
+    def _encode_body(
+        self, data: Any
+    ) -> Tuple[Dict[str, Any], int, Optional[_CompressedBody]]:
+        """Get the arguments with which to send ``data`` as the body of a request,
+        compressing it if it's large enough.
+
+        The body is encoded once, and the bytes are sent with every attempt of the
+        request.
+
+        Returns:
+            The arguments, the size of the body to send in bytes, and the compressed
+            body, or None if compression is disabled or the body is too small.
+        """
+        if data is None:
+            return {}, 0, None
+        body = json.dumps(data).encode()
+        compressed = _compress_body(body, self._compression_threshold)
+        if compressed is None or not compressed.is_compressed:
+            return {"content": body}, len(body), compressed
+        return (
+            {"content": compressed.data, "headers": {"Content-Encoding": "gzip"}},
+            len(compressed.data),
+            compressed,
+        )
 
-        # Keep a client per thread
-        # - https://toolbelt.readthedocs.io/en/latest/threading.html
-        # - "there are still a couple corner cases where it isn't perfectly threadsafe"
-        self._clients = {}  # type: Dict[int, Client]
-        self._aclients = {}  # type: Dict[int, AsyncClient]
+    def _cache_response(
+        self,
+        method: str,
+        uri: str,
+        lookup: Optional[_CacheLookup],
+        response: HttpResponse,
+    ) -> HttpResponse:
+        """Store a response in the response cache, or discard the cached responses the
+        request may have modified.
+
+        Returns:
+            The response to use, which is the cached response if the server responded
+            that it's still valid.
+        """
+        if lookup is not None:
+            return lookup.cache._complete(lookup, response)
+        if self._response_cache is not None:
+            self._response_cache._request_sent(method, uri)
+        return response
+
+    def _report(
+        self,
+        method: str,
+        route: str,
+        uri: str,
+        bytes_sent: int,
+        response: Optional[HttpResponse],
+        timing: "_RequestTiming",
+        error: Optional[BaseException] = None,
+        compressed: Optional[_CompressedBody] = None,
+    ) -> None:
+        """Report a finished request to the request observers."""
+        if not _has_observers(self._request_observers):
+            return
+        end = time.monotonic()
+        _notify_observers(
+            self._request_observers,
+            core.CompletedRequest(
+                method=method,
+                route=urllib.parse.urlsplit(route).path,
+                url=uri,
+                status_code=response.status_code if response is not None else None,
+                bytes_sent=bytes_sent,
+                bytes_received=(
+                    response.num_bytes_downloaded
+                    if response is not None and response.is_stream_consumed
+                    else None
+                ),
+                retries=max(timing.attempts - 1, 0),
+                duration_milliseconds=(end - timing.start) * 1000,
+                last_attempt_milliseconds=(end - timing.attempt_start) * 1000,
+                error=error,
+                uncompressed_bytes_sent=(
+                    compressed.uncompressed_size if compressed else None
+                ),
+                compression_milliseconds=compressed.milliseconds if compressed else 0.0,
+            ),
+        )
 
     def at_uri(self, uri: str) -> "_HttpClientAtUri":
         """Get a client interface for which all queries are relative to ``uri``."""
@@ -49,25 +199,75 @@ class HttpClient:
 
     @property
     def _client(self) -> Client:
-        thread_id = threading.get_ident()
-        if thread_id not in self._clients:
-            if sys.version_info >= (3, 6):
-                client = Client(**self._kwargs)
-            else:
-                client = Client()
-                for k, v in self._kwargs.items():
-                    setattr(client, k, v)
-            self._clients[thread_id] = client
-        return self._clients[thread_id]
-
-    @property
-    def _async_client(self) -> AsyncClient:
-        thread_id = threading.get_ident()
-        if thread_id not in self._clients:
-            if sys.version_info < (3, 6):
-                raise RuntimeError("async support is only available for python 3.6+")
-            self._aclients[thread_id] = AsyncClient(**self._kwargs)
-        return self._aclients[thread_id]
+        client = self._sync_client
+        if client is not None:
+            return client
+        with self._sync_client_lock:
+            if self._sync_client is None:
+                if sys.version_info >= (3, 6):
+                    self._sync_client = Client(**self._kwargs)
+                else:
+                    self._sync_client = Client()
+                    for k, v in self._kwargs.items():
+                        setattr(self._sync_client, k, v)
+            return self._sync_client
+
+    def close(self) -> None:
+        """Close the connections used by requests made without async.
+
+        Connections used by async requests are closed by :meth:`aclose()`, or when
+        their event loop is shut down. Later requests open new connections.
+        """
+        with self._sync_client_lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
+    async def _get_async_client(self) -> AsyncClient:
+        """Get the async client for the running event loop, creating it if necessary."""
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is not None:
+            return client
+        if sys.version_info < (3, 6):
+            raise RuntimeError("async support is only available for python 3.6+")
+        client = AsyncClient(**self._kwargs)
+        closer = self._close_at_shutdown(loop, client)
+        with self._aclients_lock:
+            # Forget the clients of loops that were closed without being shut down;
+            # their connections can no longer be closed gracefully
+            for closed_loop in [lp for lp in self._aclients if lp.is_closed()]:
+                del self._aclients[closed_loop]
+                del self._aclient_closers[closed_loop]
+            self._aclients[loop] = client
+            self._aclient_closers[loop] = closer
+        # Starting the generator registers it with the loop, which closes it (and so the
+        # client) when the loop is shut down by asyncio.run() or shutdown_asyncgens()
+        await closer.__anext__()
+        return client
+
+    async def _close_at_shutdown(
+        self, loop: asyncio.AbstractEventLoop, client: AsyncClient
+    ) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            with self._aclients_lock:
+                if self._aclients.get(loop) is client:
+                    del self._aclients[loop]
+                    del self._aclient_closers[loop]
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections used by async requests made on the running event loop.
+
+        Connections used on other event loops are closed when those loops are shut
+        down. Later async requests on the running loop open new connections.
+        """
+        with self._aclients_lock:
+            closer = self._aclient_closers.get(asyncio.get_running_loop())
+        if closer is not None:
+            await closer.aclose()
 
 
 class _HttpClientAtUri:
@@ -92,17 +292,115 @@ class _HttpClientAtUri:
         params: Optional[Dict[str, Optional[str]]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
-        client = self._client._client
+        route = uri
         uri, params2 = _expand_uri_params(uri, params)
-        response = client.request(method, uri, json=data, params=params2)
+        coalescer = self._client._request_coalescer
+        if coalescer is None:
+            response = self._send(method, route, uri, params2, data)
+        else:
+            # Each caller decodes the shared response, so they don't share the result
+            response = coalescer._run(
+                _get_key(method, uri, params2, None),
+                lambda: self._send(method, route, uri, params2, data),
+            )
         return _handle_response(response, method, uri), response
 
+    def _stream(
+        self,
+        method: str,
+        uri: str,
+        *,
+        params: Optional[Dict[str, Optional[str]]] = None,
+        path: Sequence[str] = ()
+    ) -> Tuple[JsonArrayStream, HttpResponse]:
+        route = uri
+        uri, params2 = _expand_uri_params(uri, params)
+        # A streamed response can only be read once, so it's neither cached nor shared
+        response = self._send(method, route, uri, params2, None, stream=True)
+        if not 200 <= response.status_code < 300:
+            try:
+                response.read()
+                _handle_response(response, method, uri)
+            finally:
+                response.close()
+        return JsonArrayStream(response.iter_bytes(), path, response.close), response
+
+    def _send(
+        self,
+        method: str,
+        route: str,
+        uri: str,
+        params2: Optional[Dict[str, str]],
+        data: Optional[Union[Dict[str, Any], Iterable[Any]]],
+        stream: bool = False,
+    ) -> HttpResponse:
+        client = self._client._client
+        retry = self._client._retry_policy._start()
+        limiter = self._client._get_rate_limiter(uri)
+        body, body_size, compressed = self._client._encode_body(data)
+        cache = self._client._response_cache
+        lookup = (
+            cache._lookup(method, uri, params2)
+            if cache is not None and not stream
+            else None
+        )
+        if lookup is not None:
+            cached_response = lookup.cached_response
+            if cached_response is not None:
+                return cached_response
+            body["headers"] = lookup.get_conditional_headers()
+        timing = _RequestTiming()
+        while True:
+            if limiter:
+                limiter.acquire(body_size if limiter.limits_bytes else 0)
+            timing.start_attempt()
+            try:
+                request = client.build_request(
+                    method,
+                    uri,
+                    params=params2,
+                    timeout=self._client._get_timeout(),
+                    **body,
+                )
+                response = client.send(request, stream=stream)
+            except Exception as ex:
+                delay = retry.get_delay_after_error(method, None, ex)
+                if delay is None:
+                    self._client._report(
+                        method, route, uri, body_size, None, timing, ex, compressed
+                    )
+                    raise
+            else:
+                delay = _get_retry_delay(retry, method, response)
+                if delay is None:
+                    break
+                response.close()
+            time.sleep(delay)
+        self._client._report(
+            method, route, uri, body_size, response, timing, compressed=compressed
+        )
+        return self._client._cache_response(method, uri, lookup, response)
+
     def get(
         self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
     ) -> Tuple[Any, HttpResponse]:
         """Perform a GET request."""
         return self._request("GET", self._base_uri + uri, params=params)
 
+    def stream_get(
+        self,
+        uri: str,
+        *,
+        params: Optional[Dict[str, Optional[str]]] = None,
+        path: Sequence[str] = ()
+    ) -> Tuple[JsonArrayStream, HttpResponse]:
+        """Perform a GET request, and stream the items of an array in the response
+        as they're received.
+
+        ``path`` is the keys of the nested objects that contain the array.
+        """
+        return self._stream("GET", self._base_uri + uri, params=params, path=path)
+
     def head(
         self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
     ) -> Tuple[Any, HttpResponse]:
@@ -165,17 +463,118 @@ class _AsyncHttpClientAtUri:
         params: Optional[Dict[str, Optional[str]]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
-        client = self._client._async_client
+        route = uri
         uri, params2 = _expand_uri_params(uri, params)
-        response = await client.request(method, uri, json=data, params=params2)
+        coalescer = self._client._request_coalescer
+        if coalescer is None:
+            response = await self._send(method, route, uri, params2, data)
+        else:
+            # Each caller decodes the shared response, so they don't share the result
+            response = await coalescer._run_async(
+                _get_key(method, uri, params2, None),
+                lambda: self._send(method, route, uri, params2, data),
+            )
         return _handle_response(response, method, uri), response
 
+    async def _stream(
+        self,
+        method: str,
+        uri: str,
+        *,
+        params: Optional[Dict[str, Optional[str]]] = None,
+        path: Sequence[str] = ()
+    ) -> Tuple[AsyncJsonArrayStream, HttpResponse]:
+        route = uri
+        uri, params2 = _expand_uri_params(uri, params)
+        # A streamed response can only be read once, so it's neither cached nor shared
+        response = await self._send(method, route, uri, params2, None, stream=True)
+        if not 200 <= response.status_code < 300:
+            try:
+                await response.aread()
+                _handle_response(response, method, uri)
+            finally:
+                await response.aclose()
+        return (
+            AsyncJsonArrayStream(response.aiter_bytes(), path, response.aclose),
+            response,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        route: str,
+        uri: str,
+        params2: Optional[Dict[str, str]],
+        data: Optional[Union[Dict[str, Any], Iterable[Any]]],
+        stream: bool = False,
+    ) -> HttpResponse:
+        client = await self._client._get_async_client()
+        retry = self._client._retry_policy._start()
+        limiter = self._client._get_rate_limiter(uri)
+        body, body_size, compressed = self._client._encode_body(data)
+        cache = self._client._response_cache
+        lookup = (
+            cache._lookup(method, uri, params2)
+            if cache is not None and not stream
+            else None
+        )
+        if lookup is not None:
+            cached_response = lookup.cached_response
+            if cached_response is not None:
+                return cached_response
+            body["headers"] = lookup.get_conditional_headers()
+        timing = _RequestTiming()
+        while True:
+            if limiter:
+                await limiter.acquire_async(body_size if limiter.limits_bytes else 0)
+            timing.start_attempt()
+            try:
+                request = client.build_request(
+                    method,
+                    uri,
+                    params=params2,
+                    timeout=self._client._get_timeout(),
+                    **body,
+                )
+                response = await client.send(request, stream=stream)
+            except Exception as ex:
+                delay = retry.get_delay_after_error(method, None, ex)
+                if delay is None:
+                    self._client._report(
+                        method, route, uri, body_size, None, timing, ex, compressed
+                    )
+                    raise
+            else:
+                delay = _get_retry_delay(retry, method, response)
+                if delay is None:
+                    break
+                await response.aclose()
+            await asyncio.sleep(delay)
+        self._client._report(
+            method, route, uri, body_size, response, timing, compressed=compressed
+        )
+        return self._client._cache_response(method, uri, lookup, response)
+
     def get(
         self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a GET request."""
         return self._request("GET", self._base_uri + uri, params=params)
 
+    def stream_get(
+        self,
+        uri: str,
+        *,
+        params: Optional[Dict[str, Optional[str]]] = None,
+        path: Sequence[str] = ()
+    ) -> Awaitable[Tuple[AsyncJsonArrayStream, HttpResponse]]:
+        """Perform a GET request, and stream the items of an array in the response
+        as they're received.
+
+        ``path`` is the keys of the nested objects that contain the array.
+        """
+        return self._stream("GET", self._base_uri + uri, params=params, path=path)
+
     def head(
         self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
@@ -223,6 +622,19 @@ class _AsyncHttpClientAtUri:
         return self._base_uri
 
 
+class _RequestTiming:
+    """Times the attempts made to send a request."""
+
+    def __init__(self) -> None:
+        self.start = time.monotonic()
+        self.attempt_start = self.start
+        self.attempts = 0
+
+    def start_attempt(self) -> None:
+        self.attempts += 1
+        self.attempt_start = time.monotonic()
+
+
 def _expand_uri_params(
     uri: str, params: Optional[Dict[str, Optional[str]]]
 ) -> Tuple[str, Optional[Dict[str, str]]]:
@@ -247,6 +659,17 @@ def _expand_uri_params(
     return uri, params2
 
 
+def _get_retry_delay(
+    retry: _RetryState, method: str, response: HttpResponse
+) -> Optional[float]:
+    """Get the number of seconds to wait before retrying a request, or None if it
+    shouldn't be retried.
+    """
+    return retry.get_delay_after_response(
+        method, None, response.status_code, response.headers.get("Retry-After")
+    )
+
+
 def _handle_response(response: HttpResponse, method: str, uri: str) -> Any:
     try:
         data = response.json() if len(response.text) > 0 else None
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of LatencyHistogram."""
+
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class LatencyHistogram:
+    """A thread-safe histogram of durations, in the style of an HDR histogram.
+
+    Durations are recorded in microseconds into buckets whose width grows with the
+    value, so that every recorded value is represented to within the requested number
+    of significant figures, whether it is a fraction of a millisecond or several
+    minutes. Memory use depends only on the range of the values recorded, not on how
+    many are recorded.
+    """
+
+    def __init__(self, significant_figures: int = 2) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            significant_figures: The number of significant figures to which recorded
+                values are preserved, from 1 to 5.
+
+        Raises:
+            ValueError: if ``significant_figures`` is out of range.
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be from 1 to 5")
+        self._significant_figures = significant_figures
+        # Each bucket covers a power of two, split into enough sub-buckets to resolve
+        # the requested number of significant figures
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self._sub_bucket_half_count = 1 << (self._sub_bucket_bits - 1)
+        self._lock = threading.Lock()
+        self._counts = {}  # type: Dict[int, int]
+        self._count = 0
+        self._total = 0
+        self._min = None  # type: Optional[int]
+        self._max = None  # type: Optional[int]
+
+    @property
+    def significant_figures(self) -> int:  # noqa: D401
+        """The number of significant figures to which recorded values are preserved."""
+        return self._significant_figures
+
+    @property
+    def count(self) -> int:  # noqa: D401
+        """The number of values recorded."""
+        return self._count
+
+    @property
+    def min_milliseconds(self) -> Optional[float]:  # noqa: D401
+        """The smallest value recorded, or None if none have been."""
+        return None if self._min is None else self._min / 1000
+
+    @property
+    def max_milliseconds(self) -> Optional[float]:  # noqa: D401
+        """The largest value recorded, or None if none have been."""
+        return None if self._max is None else self._max / 1000
+
+    @property
+    def mean_milliseconds(self) -> Optional[float]:  # noqa: D401
+        """The mean of the values recorded, or None if none have been."""
+        with self._lock:
+            return self._total / self._count / 1000 if self._count else None
+
+    def record(self, milliseconds: float) -> None:
+        """Record a duration.
+
+        Args:
+            milliseconds: The duration to record. Negative values are recorded as zero.
+        """
+        value = max(int(round(milliseconds * 1000)), 0)
+        index = self._get_index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self._count += 1
+            self._total += value
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Get the value, in milliseconds, at or below which ``percentile`` percent of
+        the recorded values fall.
+
+        Args:
+            percentile: The percentile to get, from 0 to 100.
+
+        Returns:
+            The value, or None if no values have been recorded.
+
+        Raises:
+            ValueError: if ``percentile`` is out of range.
+        """
+        return self.percentiles([percentile])[0]
+
+    def percentiles(self, percentiles: List[float]) -> List[Optional[float]]:
+        """Get several percentiles at once. See :meth:`percentile()`.
+
+        Args:
+            percentiles: The percentiles to get, each from 0 to 100.
+
+        Returns:
+            The value of each percentile, in milliseconds, or None for each if no values
+            have been recorded.
+
+        Raises:
+            ValueError: if any percentile is out of range.
+        """
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError("percentiles must be from 0 to 100")
+        with self._lock:
+            if not self._count or self._max is None or self._min is None:
+                return [None] * len(percentiles)
+            counts = sorted(self._counts.items())
+            total = self._count
+            max_value = self._max
+            min_value = self._min
+        results = []  # type: List[Optional[float]]
+        for p in percentiles:
+            target = max(math.ceil(total * p / 100), 1)
+            seen = 0
+            for index, count in counts:
+                seen += count
+                if seen >= target:
+                    value = min(
+                        max(self._get_highest_value(index), min_value), max_value
+                    )
+                    results.append(value / 1000)
+                    break
+        return results
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Get the number of values recorded in each non-empty bucket.
+
+        Returns:
+            A list of ``(upper bound in milliseconds, count)`` pairs, ordered by upper
+            bound, suitable for exporting to monitoring systems.
+        """
+        with self._lock:
+            counts = sorted(self._counts.items())
+        return [
+            (self._get_highest_value(index) / 1000, count) for index, count in counts
+        ]
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the values recorded in another histogram to this one.
+
+        Args:
+            other: A histogram with the same number of significant figures.
+
+        Raises:
+            ValueError: if ``other`` has a different number of significant figures.
+        """
+        if other._significant_figures != self._significant_figures:
+            raise ValueError("Histograms must have the same significant_figures")
+        with other._lock:
+            counts = dict(other._counts)
+            count, total = other._count, other._total
+            min_value, max_value = other._min, other._max
+        if not count or min_value is None or max_value is None:
+            return
+        with self._lock:
+            for index, bucket_count in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + bucket_count
+            self._count += count
+            self._total += total
+            if self._min is None or min_value < self._min:
+                self._min = min_value
+            if self._max is None or max_value > self._max:
+                self._max = max_value
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        with self._lock:
+            self._counts = {}
+            self._count = 0
+            self._total = 0
+            self._min = None
+            self._max = None
+
+    def _get_index(self, value: int) -> int:
+        bucket = max(value.bit_length() - self._sub_bucket_bits, 0)
+        return bucket * self._sub_bucket_half_count + (value >> bucket)
+
+    def _get_highest_value(self, index: int) -> int:
+        """Get the largest value, in microseconds, that is recorded at ``index``."""
+        half = self._sub_bucket_half_count
+        bucket = max(index // half - 1, 0)
+        sub_bucket = index - bucket * half
+        return ((sub_bucket + 1) << bucket) - 1
+
+    def __repr__(self) -> str:
+        return "LatencyHistogram(count={}, p50={}, p99={}, max={})".format(
+            self._count,
+            self.percentile(50),
+            self.percentile(99),
+            self.max_milliseconds,
+        )
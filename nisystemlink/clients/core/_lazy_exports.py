@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+"""Exports the public names of a package lazily, importing each module on first use."""
+
+import importlib
+import sys
+from typing import Any, Dict, List, Optional
+
+
+class _LazyExports:
+    """The public names of a package, and the modules that define them.
+
+    A package's ``__init__`` exposes the names through module-level ``__getattr__`` and
+    ``__dir__`` functions, so that importing the package doesn't import the clients,
+    models and third-party libraries it doesn't use. The same names are imported under
+    ``TYPE_CHECKING`` for type checkers and IDEs.
+    """
+
+    def __init__(
+        self,
+        package: str,
+        modules: Dict[str, List[str]],
+        aliases: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            package: The name of the package, ``__name__``.
+            modules: The names exported from each module, by module name relative to
+                the package.
+            aliases: Other names for exported names, such as deprecated names kept
+                for backwards compatibility.
+        """
+        self._package = package
+        self._modules = {
+            name: module for module, names in modules.items() for name in names
+        }
+        self._aliases = aliases or {}
+        self.names = list(self._modules) + list(self._aliases)
+
+    def getattr(self, name: str) -> Any:
+        """Import an exported name, for the package's ``__getattr__``."""
+        module = self._modules.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(module, self._package), name)
+        elif name in self._aliases:
+            value = self.getattr(self._aliases[name])
+        else:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(self._package, name)
+            )
+        # Later lookups find the name without calling __getattr__
+        setattr(sys.modules[self._package], name, value)
+        return value
+
+    def dir(self) -> List[str]:
+        """List the package's attributes, for the package's ``__dir__``."""
+        return sorted(set(vars(sys.modules[self._package])) | set(self.names))
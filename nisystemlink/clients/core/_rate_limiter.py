@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of RateLimiter."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from nisystemlink.clients.core._deadline import _current_deadline
+
+
+class _TokenBucket:
+    """A token bucket whose balance can go negative, so callers queue up behind earlier
+    reservations.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    def get_wait_time(self, now: float, amount: float) -> float:
+        self._refill(now)
+        # Requests larger than the burst size only wait for a full bucket, and leave it
+        # in debt for the ones that follow.
+        needed = min(amount, self._burst)
+        return max(needed - self._tokens, 0.0) / self._rate
+
+    def take(self, amount: float) -> None:
+        self._tokens -= amount
+
+
+class RateLimiter:
+    """Limits the rate of requests, and of bytes sent, to a SystemLink service.
+
+    Callers are delayed in the order they arrive, until the request fits within the
+    limits. Short bursts above the limits are allowed, up to the burst sizes.
+
+    A rate limiter is shared by every client created from the
+    :class:`HttpConfiguration` it's attached to; see
+    :meth:`HttpConfiguration.set_rate_limiter()`. Limiters are thread-safe and can be
+    used from both synchronous and asyncio clients.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        bytes_per_second: Optional[float] = None,
+        burst_requests: Optional[float] = None,
+        burst_bytes: Optional[float] = None,
+    ) -> None:
+        """Initialize a rate limiter.
+
+        Args:
+            requests_per_second: The maximum average rate of requests, or None to not
+                limit the number of requests.
+            bytes_per_second: The maximum average rate of request body bytes, or None to
+                not limit the number of bytes.
+            burst_requests: The number of requests that can be sent at once after a
+                period of inactivity. Defaults to ``requests_per_second``.
+            burst_bytes: The number of bytes that can be sent at once after a period of
+                inactivity. Defaults to ``bytes_per_second``.
+
+        Raises:
+            ValueError: if a rate or burst size is not positive.
+        """
+        for value in (
+            requests_per_second,
+            bytes_per_second,
+            burst_requests,
+            burst_bytes,
+        ):
+            if value is not None and value <= 0:
+                raise ValueError("Rates and burst sizes must be positive")
+
+        self._lock = threading.Lock()
+        self._request_bucket = (
+            _TokenBucket(requests_per_second, burst_requests or requests_per_second)
+            if requests_per_second
+            else None
+        )
+        self._byte_bucket = (
+            _TokenBucket(bytes_per_second, burst_bytes or bytes_per_second)
+            if bytes_per_second
+            else None
+        )
+
+    @property
+    def limits_bytes(self) -> bool:  # noqa: D401
+        """Whether the limiter limits the rate of bytes sent."""
+        return self._byte_bucket is not None
+
+    @property
+    def wait_time_milliseconds(self) -> float:  # noqa: D401
+        """The number of milliseconds that a request without a body would currently
+        wait before being sent.
+        """
+        with self._lock:
+            return self._get_wait_time(time.monotonic(), 0) * 1000
+
+    def acquire(self, size: int = 0) -> None:
+        """Wait until a request can be sent.
+
+        Args:
+            size: The number of bytes in the request body.
+
+        Raises:
+            TimeoutError: if the wait would exceed the current :class:`Deadline`.
+        """
+        wait_time = self._reserve(size)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, size: int = 0) -> None:
+        """Wait asynchronously until a request can be sent.
+
+        Args:
+            size: The number of bytes in the request body.
+
+        Raises:
+            TimeoutError: if the wait would exceed the current :class:`Deadline`.
+        """
+        wait_time = self._reserve(size)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def _reserve(self, size: int) -> float:
+        """Reserve capacity for a request, and get the number of seconds to wait before
+        sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._get_wait_time(now, size)
+            deadline = _current_deadline.get()
+            if (
+                wait_time > 0
+                and deadline is not None
+                and wait_time * 1000 >= deadline.remaining_milliseconds
+            ):
+                raise TimeoutError(
+                    "The rate limit would delay the request past its deadline"
+                )
+            if self._request_bucket:
+                self._request_bucket.take(1)
+            if self._byte_bucket:
+                self._byte_bucket.take(size)
+            return wait_time
+
+    def _get_wait_time(self, now: float, size: int) -> float:
+        wait_time = 0.0
+        if self._request_bucket:
+            wait_time = self._request_bucket.get_wait_time(now, 1)
+        if self._byte_bucket:
+            wait_time = max(wait_time, self._byte_bucket.get_wait_time(now, size))
+        return wait_time
+
+
+def _find_rate_limiter(
+    rate_limiters: Dict[str, RateLimiter], path: str
+) -> Optional[RateLimiter]:
+    """Get the limiter with the longest base path that contains ``path``."""
+    best_match = None  # type: Optional[Tuple[int, RateLimiter]]
+    for base_path, limiter in rate_limiters.items():
+        prefix = base_path.rstrip("/")
+        if path == prefix or path.startswith(prefix + "/"):
+            if best_match is None or len(prefix) > best_match[0]:
+                best_match = (len(prefix), limiter)
+    return best_match[1] if best_match else None
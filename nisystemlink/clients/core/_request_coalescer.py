@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of RequestCoalescer."""
+
+import asyncio
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """A request in flight, which the threads that coalesce with it wait for."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None  # type: Any
+        self.error = None  # type: Optional[BaseException]
+
+    def get_result(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class RequestCoalescer:
+    """Merges identical GET requests that are in flight at the same time into one
+    request, shared by every client created from the :class:`HttpConfiguration` it's
+    attached to.
+
+    A GET request is identical to one in flight if it has the same URL, query
+    parameters and headers. Instead of being sent, it waits for the request in flight
+    and gets the same response, or the same exception. Threads coalesce with other
+    threads, and asyncio tasks with other tasks on the same event loop. The request in
+    flight is retried and rate limited as usual, and a coalesced request waits for it
+    even if its own :class:`Deadline` would end sooner.
+
+    Example::
+
+        configuration.request_coalescer = RequestCoalescer()
+        client = DataFrameClient(configuration)
+        # Called by many threads at once, sends one request
+        client.get_table_metadata(table_id)
+    """
+
+    def __init__(self) -> None:
+        """Initialize a coalescer with no requests in flight."""
+        self._lock = threading.Lock()
+        self._flights = {}  # type: Dict[Hashable, _Flight]
+        self._tasks = (
+            {}
+        )  # type: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future]
+        self._sent = 0
+        self._coalesced = 0
+
+    @property
+    def sent(self) -> int:  # noqa: D401
+        """The number of GET requests that were sent."""
+        return self._sent
+
+    @property
+    def coalesced(self) -> int:  # noqa: D401
+        """The number of GET requests that waited for an identical request instead of
+        being sent.
+        """
+        return self._coalesced
+
+    def _run(self, key: Optional[Hashable], send: Callable[[], T]) -> T:
+        """Call ``send``, or wait for the result of an identical call in flight.
+
+        Args:
+            key: The key of the request from :func:`_get_key()`, or None to always
+                call ``send``.
+            send: A function that sends the request.
+        """
+        if key is None:
+            return send()
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if flight is None:
+                self._sent += 1
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+        if not is_leader:
+            return flight.get_result()
+        try:
+            flight.result = send()
+        except BaseException as ex:
+            flight.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def _run_async(
+        self, key: Optional[Hashable], send: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await ``send()``, or the result of an identical call in flight on the
+        running event loop.
+
+        The request is sent by a separate task, so cancelling the caller that started
+        it doesn't cancel it for the callers that coalesced with it.
+        """
+        if key is None:
+            return await send()
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is not None:
+                self._coalesced += 1
+            else:
+                self._sent += 1
+                task = self._tasks[task_key] = asyncio.ensure_future(send())
+                task.add_done_callback(lambda t: self._task_done(task_key, t))
+        return await asyncio.shield(task)
+
+    def _task_done(
+        self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: Any
+    ) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every caller has been cancelled
+            task.exception()
+
+    def __repr__(self) -> str:
+        return "RequestCoalescer(sent={}, coalesced={})".format(
+            self._sent, self._coalesced
+        )
+
+
+def _get_key(
+    method: str,
+    url: str,
+    params: Optional[Mapping[str, Any]],
+    headers: Optional[Mapping[str, Any]],
+) -> Optional[Hashable]:
+    """Get the key under which a request is coalesced, or None if it can't be."""
+    if method != "GET":
+        return None
+    return (
+        url,
+        tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)),
+        tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items())),
+    )
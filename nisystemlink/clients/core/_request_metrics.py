@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of RequestMetrics."""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from nisystemlink.clients.core._latency_histogram import LatencyHistogram
+from nisystemlink.clients.core._request_observer import (
+    CompletedRequest,
+    RequestObserver,
+)
+
+
+class RouteMetrics:
+    """Totals for the API calls with the same method, route, and status."""
+
+    def __init__(
+        self,
+        method: str,
+        route: str,
+        status_code: Optional[int],
+        significant_figures: int,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            method: The HTTP method of the calls.
+            route: The path template of the calls.
+            status_code: The status code of the calls, or None.
+            significant_figures: The number of significant figures of the latencies.
+        """
+        self._method = method
+        self._route = route
+        self._status_code = status_code
+        self._lock = threading.Lock()
+        self._errors = 0
+        self._retries = 0
+        self._bytes_sent = 0
+        self._uncompressed_bytes_sent = 0
+        self._compression_ms = 0.0
+        self._bytes_received = 0
+        self._latency = LatencyHistogram(significant_figures)
+
+    @property
+    def method(self) -> str:  # noqa: D401
+        """The HTTP method of the calls."""
+        return self._method
+
+    @property
+    def route(self) -> str:  # noqa: D401
+        """The path template of the calls, such as ``"/nidataframe/v1/tables/{id}"``."""
+        return self._route
+
+    @property
+    def status_code(self) -> Optional[int]:  # noqa: D401
+        """The status code of the calls, or None for calls that received no response."""
+        return self._status_code
+
+    @property
+    def count(self) -> int:  # noqa: D401
+        """The number of calls."""
+        return self._latency.count
+
+    @property
+    def errors(self) -> int:  # noqa: D401
+        """The number of calls that raised an error while sending the request."""
+        return self._errors
+
+    @property
+    def retries(self) -> int:  # noqa: D401
+        """The total number of retries made by the calls."""
+        return self._retries
+
+    @property
+    def bytes_sent(self) -> int:  # noqa: D401
+        """The total number of bytes sent in request bodies."""
+        return self._bytes_sent
+
+    @property
+    def bytes_saved_by_compression(self) -> int:  # noqa: D401
+        """The total number of bytes that compressing request bodies saved sending."""
+        return self._uncompressed_bytes_sent - self._bytes_sent
+
+    @property
+    def compression_milliseconds(self) -> float:  # noqa: D401
+        """The total CPU time spent compressing request bodies."""
+        return self._compression_ms
+
+    @property
+    def bytes_received(self) -> int:  # noqa: D401
+        """The total number of bytes received in response bodies, where known."""
+        return self._bytes_received
+
+    @property
+    def latency(self) -> LatencyHistogram:  # noqa: D401
+        """The histogram of the durations of the calls."""
+        return self._latency
+
+    def _record(self, request: CompletedRequest) -> None:
+        with self._lock:
+            if request.error is not None:
+                self._errors += 1
+            self._retries += request.retries
+            self._bytes_sent += request.bytes_sent
+            self._uncompressed_bytes_sent += request.uncompressed_bytes_sent
+            self._compression_ms += request.compression_milliseconds
+            self._bytes_received += request.bytes_received or 0
+        self._latency.record(request.duration_milliseconds)
+
+    def __repr__(self) -> str:
+        return "RouteMetrics(method={!r}, route={!r}, status_code={}, count={})".format(
+            self._method, self._route, self._status_code, self.count
+        )
+
+
+class RequestMetrics(RequestObserver):
+    """A :class:`RequestObserver` that keeps latency histograms and byte counts in memory.
+
+    Calls are grouped by method, route, and status code, so that the metrics can be
+    scraped into a monitoring system without recording the IDs in each URL.
+
+    Example::
+
+        metrics = RequestMetrics()
+        configuration.add_request_observer(metrics)
+        ...
+        for route in metrics.get_metrics():
+            print(route.method, route.route, route.count, route.latency.percentile(99))
+    """
+
+    def __init__(self, significant_figures: int = 2) -> None:
+        """Initialize an instance.
+
+        Args:
+            significant_figures: The number of significant figures to which latencies
+                are preserved. See :class:`LatencyHistogram`.
+        """
+        # Validate before any calls are recorded
+        LatencyHistogram(significant_figures)
+        self._significant_figures = significant_figures
+        self._lock = threading.Lock()
+        self._routes = {}  # type: Dict[Tuple[str, str, Optional[int]], RouteMetrics]
+
+    def request_completed(self, request: CompletedRequest) -> None:
+        """Record a completed call."""
+        key = (request.method, request.route, request.status_code)
+        route = self._routes.get(key)
+        if route is None:
+            with self._lock:
+                route = self._routes.get(key)
+                if route is None:
+                    route = RouteMetrics(*key, self._significant_figures)
+                    self._routes[key] = route
+        route._record(request)
+
+    def get_metrics(self) -> List[RouteMetrics]:
+        """Get the metrics for each method, route, and status code called so far."""
+        with self._lock:
+            return list(self._routes.values())
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._routes = {}
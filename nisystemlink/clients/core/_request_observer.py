@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of RequestObserver."""
+
+import threading
+from typing import Iterable, List, Optional, Sequence
+
+
+class CompletedRequest:
+    """Describes an API call that has finished, successfully or not."""
+
+    def __init__(
+        self,
+        method: str,
+        route: str,
+        url: str,
+        status_code: Optional[int],
+        bytes_sent: int,
+        bytes_received: Optional[int],
+        retries: int,
+        duration_milliseconds: float,
+        last_attempt_milliseconds: float,
+        error: Optional[BaseException] = None,
+        uncompressed_bytes_sent: Optional[int] = None,
+        compression_milliseconds: float = 0.0,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            method: The HTTP method of the request, such as ``"GET"``.
+            route: The path template of the request, such as
+                ``"/nidataframe/v1/tables/{id}/data"``.
+            url: The URL the request was sent to.
+            status_code: The status code of the final response, or None if no response
+                was received.
+            bytes_sent: The number of bytes in the body of the final request.
+            bytes_received: The number of bytes in the body of the final response, or
+                None if it isn't known.
+            retries: The number of times the request was sent again after a failure.
+            duration_milliseconds: The time taken by the whole call, including time
+                spent waiting for rate limits and between retries.
+            last_attempt_milliseconds: The time from sending the final request until
+                its response (or error) was received.
+            error: The exception raised while sending the final request, if any.
+            uncompressed_bytes_sent: The number of bytes in the body of the final
+                request before it was compressed, or None if it wasn't compressed.
+            compression_milliseconds: The CPU time spent compressing the request body.
+        """
+        self._method = method
+        self._route = route
+        self._url = url
+        self._status_code = status_code
+        self._bytes_sent = bytes_sent
+        self._bytes_received = bytes_received
+        self._retries = retries
+        self._duration_ms = duration_milliseconds
+        self._last_attempt_ms = last_attempt_milliseconds
+        self._error = error
+        self._uncompressed_bytes_sent = (
+            uncompressed_bytes_sent
+            if uncompressed_bytes_sent is not None
+            else bytes_sent
+        )
+        self._compression_ms = compression_milliseconds
+
+    @property
+    def method(self) -> str:  # noqa: D401
+        """The HTTP method of the request, such as ``"GET"``."""
+        return self._method
+
+    @property
+    def route(self) -> str:  # noqa: D401
+        """The path template of the request, such as
+        ``"/nidataframe/v1/tables/{id}/data"``.
+        """
+        return self._route
+
+    @property
+    def url(self) -> str:  # noqa: D401
+        """The URL the request was sent to."""
+        return self._url
+
+    @property
+    def status_code(self) -> Optional[int]:  # noqa: D401
+        """The status code of the final response, or None if no response was received."""
+        return self._status_code
+
+    @property
+    def bytes_sent(self) -> int:  # noqa: D401
+        """The number of bytes in the body of the final request."""
+        return self._bytes_sent
+
+    @property
+    def uncompressed_bytes_sent(self) -> int:  # noqa: D401
+        """The number of bytes in the body of the final request before it was
+        compressed, which is :attr:`bytes_sent` if it wasn't compressed.
+
+        See :attr:`HttpConfiguration.request_compression_threshold_bytes`.
+        """
+        return self._uncompressed_bytes_sent
+
+    @property
+    def compression_milliseconds(self) -> float:  # noqa: D401
+        """The CPU time spent compressing the request body, or zero if it wasn't."""
+        return self._compression_ms
+
+    @property
+    def bytes_received(self) -> Optional[int]:  # noqa: D401
+        """The number of bytes in the body of the final response, or None if it isn't
+        known, such as for a streamed response that hasn't been read.
+        """
+        return self._bytes_received
+
+    @property
+    def retries(self) -> int:  # noqa: D401
+        """The number of times the request was sent again after a failure."""
+        return self._retries
+
+    @property
+    def duration_milliseconds(self) -> float:  # noqa: D401
+        """The time taken by the whole call, including time spent waiting for rate
+        limits and between retries.
+        """
+        return self._duration_ms
+
+    @property
+    def last_attempt_milliseconds(self) -> float:  # noqa: D401
+        """The time from sending the final request until its response (or error) was
+        received.
+        """
+        return self._last_attempt_ms
+
+    @property
+    def wait_milliseconds(self) -> float:  # noqa: D401
+        """The time spent before the final request was sent, such as waiting for rate
+        limits, earlier attempts, and delays between retries.
+        """
+        return max(self._duration_ms - self._last_attempt_ms, 0.0)
+
+    @property
+    def error(self) -> Optional[BaseException]:  # noqa: D401
+        """The exception raised while sending the final request, if any."""
+        return self._error
+
+    def __repr__(self) -> str:
+        return (
+            "CompletedRequest(method={!r}, route={!r}, status_code={}, "
+            "duration_milliseconds={:.3f})"
+        ).format(self._method, self._route, self._status_code, self._duration_ms)
+
+
+class RequestObserver:
+    """Base class for objects notified of every API call made by the clients.
+
+    Register observers with :meth:`HttpConfiguration.add_request_observer()` to observe
+    clients created from a configuration, or with :meth:`add_global()` to observe all
+    clients. Observers are called on the thread (or asyncio task) that made the call,
+    so they should return quickly. Exceptions raised by observers are raised to the
+    caller of the API.
+    """
+
+    def request_completed(self, request: CompletedRequest) -> None:
+        """Called when an API call finishes, successfully or not.
+
+        Args:
+            request: Describes the call.
+        """
+
+    @classmethod
+    def add_global(cls, observer: "RequestObserver") -> None:
+        """Notify ``observer`` of API calls made by every client.
+
+        Args:
+            observer: The observer to add.
+        """
+        global _global_observers
+        with _global_observers_lock:
+            _global_observers = _global_observers + [observer]
+
+    @classmethod
+    def remove_global(cls, observer: "RequestObserver") -> None:
+        """Stop notifying an observer added with :meth:`add_global()`.
+
+        Args:
+            observer: The observer to remove.
+        """
+        global _global_observers
+        with _global_observers_lock:
+            _global_observers = [o for o in _global_observers if o is not observer]
+
+
+# Replaced rather than modified, so that it can be read without taking the lock
+_global_observers = []  # type: List[RequestObserver]
+_global_observers_lock = threading.Lock()
+
+
+def _has_observers(observers: Sequence[RequestObserver]) -> bool:
+    return bool(observers) or bool(_global_observers)
+
+
+def _notify_observers(
+    observers: Iterable[RequestObserver], request: CompletedRequest
+) -> None:
+    """Notify the given observers, then the global observers, of a completed request."""
+    for observer in observers:
+        observer.request_completed(request)
+    for observer in _global_observers:
+        observer.request_completed(request)
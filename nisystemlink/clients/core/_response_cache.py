@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of ResponseCache."""
+
+import collections
+import re
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, Mapping, Optional, Pattern, Tuple
+
+_SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class _CacheEntry:
+    def __init__(self, path: str, response: Any, ttl: float) -> None:
+        self.path = path
+        self.response = response
+        self.expires_at = time.monotonic() + ttl
+        self.etag = response.headers.get("ETag")  # type: Optional[str]
+        self.last_modified = response.headers.get(
+            "Last-Modified"
+        )  # type: Optional[str]
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class _CacheLookup:
+    """The state of a cacheable request between looking it up and storing its response."""
+
+    def __init__(
+        self,
+        cache: "ResponseCache",
+        key: Tuple[str, str],
+        path: str,
+        ttl: float,
+        entry: Optional[_CacheEntry],
+        generation: int,
+    ) -> None:
+        self.cache = cache
+        self.key = key
+        self.path = path
+        self.ttl = ttl
+        self.entry = entry
+        self.generation = generation
+
+    @property
+    def cached_response(self) -> Optional[Any]:
+        """The cached response, if it can be used without asking the server."""
+        if self.entry is not None and self.entry.is_fresh:
+            return self.entry.response
+        return None
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """Get the headers that ask the server whether a stale response is still valid."""
+        headers = {}
+        if self.entry is not None:
+            if self.entry.etag is not None:
+                headers["If-None-Match"] = self.entry.etag
+            if self.entry.last_modified is not None:
+                headers["If-Modified-Since"] = self.entry.last_modified
+        return headers
+
+
+class ResponseCache:
+    """A cache of the responses to GET requests, shared by every client created from
+    the :class:`HttpConfiguration` it's attached to.
+
+    Only routes given a time to live with :meth:`set_ttl()` are cached. Within that
+    time, requests are answered from the cache without being sent. After it, if the
+    server gave the response an ``ETag`` or ``Last-Modified`` header, the request is
+    sent with ``If-None-Match`` or ``If-Modified-Since``, and a ``304 Not Modified``
+    response renews the cached response without transferring it again.
+
+    Cached responses are discarded when a client using the cache makes a request that
+    may modify them: any request other than GET, HEAD, OPTIONS, or a query, to the
+    same path, a path below it, or a path above it other than the service's base path
+    (such as ``/nidataframe/v1``). For example, modifying
+    ``/nidataframe/v1/tables/abc`` discards the cached metadata of that table, its
+    data, and the cached lists of tables, but not the service's API information. An
+    action directly below the service's base path, such as
+    ``/nidataframe/v1/delete-tables``, names the resources it modifies in its body, so
+    it discards every cached response below the base path other than the API
+    information.
+    Changes made by other processes are seen once the time to live expires.
+
+    Example::
+
+        cache = ResponseCache(max_entries=500)
+        cache.set_ttl("/nidataframe/v1/tables/{id}", 30000)
+        configuration.response_cache = cache
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: The maximum number of responses to keep. The least recently
+                used responses are discarded first.
+
+        Raises:
+            ValueError: if ``max_entries`` is less than one.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict[Tuple[str, str], _CacheEntry]
+        self._ttls = {}  # type: Dict[str, Tuple[Pattern[str], int, float]]
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        # Incremented by invalidation, so that responses to requests sent before it
+        # aren't stored after it
+        self._generation = 0
+
+    @property
+    def max_entries(self) -> int:  # noqa: D401
+        """The maximum number of responses kept."""
+        return self._max_entries
+
+    @property
+    def hits(self) -> int:  # noqa: D401
+        """The number of requests answered from the cache without being sent."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:  # noqa: D401
+        """The number of requests to cached routes that weren't answered from the cache."""
+        return self._misses
+
+    @property
+    def revalidations(self) -> int:  # noqa: D401
+        """The number of stale responses that the server confirmed were still valid."""
+        return self._revalidations
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_ttl(self, route: str, ttl_milliseconds: Optional[int]) -> None:
+        """Cache the responses of a route for a time.
+
+        When several routes match a request, the one with the most literal path segments
+        applies.
+
+        Args:
+            route: The path of the route, in which ``{name}`` matches any single path
+                segment, such as ``"/nidataframe/v1/tables/{id}"``. This is the same
+                form as :attr:`CompletedRequest.route`.
+            ttl_milliseconds: How long responses are used without asking the server,
+                which may be zero to always revalidate them, or None to stop caching
+                the route.
+        """
+        with self._lock:
+            if ttl_milliseconds is None:
+                self._ttls.pop(route, None)
+                return
+            segments = route.strip("/").split("/")
+            literals = sum(1 for s in segments if not _is_parameter(s))
+            pattern = re.compile(
+                "/"
+                + "/".join(
+                    "[^/]+" if _is_parameter(s) else re.escape(s) for s in segments
+                )
+                + "/?"
+            )
+            self._ttls[route] = (pattern, literals, ttl_milliseconds / 1000)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Discard cached responses.
+
+        Args:
+            path: The path of a resource, such as ``"/nidataframe/v1/tables/abc"``,
+                whose responses and those of the paths above and below it are discarded,
+                or None to discard every response.
+        """
+        with self._lock:
+            if path is None:
+                self._generation += 1
+                self._entries.clear()
+            else:
+                self._invalidate_related(path)
+
+    def _get_ttl(self, path: str) -> Optional[float]:
+        best = None  # type: Optional[Tuple[int, float]]
+        for pattern, literals, ttl in self._ttls.values():
+            if pattern.fullmatch(path) and (best is None or literals > best[0]):
+                best = (literals, ttl)
+        return best[1] if best else None
+
+    def _lookup(
+        self, method: str, url: str, params: Optional[Mapping[str, Any]]
+    ) -> Optional[_CacheLookup]:
+        """Look up a request, or return None if its response isn't cached."""
+        if method != "GET" or not self._ttls:
+            return None
+        split = urllib.parse.urlsplit(url)
+        ttl = self._get_ttl(split.path)
+        if ttl is None:
+            return None
+        query = urllib.parse.urlencode(
+            sorted((k, v) for k, v in (params or {}).items() if v is not None),
+            doseq=True,
+        )
+        key = (
+            split._replace(query="").geturl(),
+            "&".join(filter(None, [split.query, query])),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.is_fresh:
+                    self._hits += 1
+                else:
+                    self._misses += 1
+                    if not entry.can_revalidate:
+                        entry = None
+            else:
+                self._misses += 1
+            generation = self._generation
+        return _CacheLookup(self, key, split.path, ttl, entry, generation)
+
+    def _complete(self, lookup: _CacheLookup, response: Any) -> Any:
+        """Store the response to a request looked up with :meth:`_lookup()`.
+
+        Returns:
+            The response to use: the cached one if the server responded that it's
+            still valid, otherwise ``response``.
+        """
+        if response.status_code == 304 and lookup.entry is not None:
+            with self._lock:
+                lookup.entry.expires_at = time.monotonic() + lookup.ttl
+                self._revalidations += 1
+            return lookup.entry.response
+        if response.status_code != 200 or "no-store" in response.headers.get(
+            "Cache-Control", ""
+        ):
+            return response
+        entry = _CacheEntry(lookup.path, response, lookup.ttl)
+        with self._lock:
+            if lookup.generation != self._generation:
+                return response
+            self._entries[lookup.key] = entry
+            self._entries.move_to_end(lookup.key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def _request_sent(self, method: str, url: str) -> None:
+        """Discard the responses that a request may have modified."""
+        if method in _SAFE_METHODS:
+            return
+        with self._lock:
+            self._invalidate_related(urllib.parse.urlsplit(url).path)
+
+    def _invalidate_related(self, path: str) -> None:
+        self._generation += 1
+        path = path.rstrip("/")
+        if _is_batch_action(path):
+            # The resources it modifies are named in the body rather than the path
+            base = path.rsplit("/", 1)[0] + "/"
+            keys = [
+                k
+                for k, e in self._entries.items()
+                if e.path.rstrip("/").startswith(base)
+            ]
+        else:
+            keys = [k for k, e in self._entries.items() if _is_related(e.path, path)]
+        for key in keys:
+            del self._entries[key]
+
+    def __repr__(self) -> str:
+        return "ResponseCache(entries={}, hits={}, misses={})".format(
+            len(self._entries), self._hits, self._misses
+        )
+
+
+def _is_parameter(segment: str) -> bool:
+    return segment.startswith("{") and segment.endswith("}")
+
+
+def _is_batch_action(path: str) -> bool:
+    """Whether ``path`` is an action directly below a service's base path that may
+    modify any of the service's resources, such as ``/nidataframe/v1/delete-tables``.
+    """
+    return path.count("/") == 3 and "-" in path.rsplit("/", 1)[1]
+
+
+def _is_related(cached_path: str, path: str) -> bool:
+    """Whether ``cached_path`` is ``path``, a path below it, or a path above it that is
+    deeper than a service's base path, such as ``/nidataframe/v1``.
+    """
+    cached_path = cached_path.rstrip("/")
+    return (
+        cached_path == path
+        or cached_path.startswith(path + "/")
+        or (path.startswith(cached_path + "/") and cached_path.count("/") > 2)
+    )
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of RetryPolicy."""
+
+import datetime
+import email.utils
+import random
+import sys
+import time
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from nisystemlink.clients.core._deadline import _current_deadline
+
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+# The server rejected these requests without processing them, so any request can be
+# retried after receiving one.
+_UNPROCESSED_STATUS_CODES = frozenset([429, 503])
+
+# Errors raised before a request is sent. Errors are named rather than imported, so
+# that clients only import the HTTP library they use.
+_UNSENT_ERRORS = (
+    "httpx.ConnectError",
+    "httpx.ConnectTimeout",
+    "httpx.PoolTimeout",
+    "requests.exceptions.ConnectTimeout",
+)
+
+# Errors raised when a connection fails after a request may have been sent
+_CONNECTION_ERRORS = (
+    "httpx.NetworkError",
+    "httpx.RemoteProtocolError",
+    "httpx.TimeoutException",
+    "requests.exceptions.ConnectionError",
+    "requests.exceptions.ChunkedEncodingError",
+    "requests.exceptions.Timeout",
+)
+
+
+class RetryPolicy:
+    """Determines when and how long to wait before failed API calls are retried.
+
+    Requests are retried when the server responds with one of
+    :attr:`retry_status_codes` or the connection fails. Requests that may have changed
+    state on the server are only retried if they're idempotent: ``GET``, ``HEAD``,
+    ``OPTIONS``, ``PUT``, and ``DELETE`` requests, and other requests that the API
+    declares to be idempotent (such as ``POST`` queries). Any request is retried after
+    a 429 or 503 response or a failure to connect, because the server hasn't processed
+    it.
+
+    Delays grow exponentially with decorrelated jitter, so that clients throttled at
+    the same time don't all retry at the same time. A ``Retry-After`` header sent by
+    the server is treated as the minimum delay. Retries stop after
+    :attr:`max_attempts`, once the next delay would exceed
+    :attr:`max_retry_time_milliseconds` since the first attempt, or when it would
+    exceed the current :class:`Deadline`.
+    """
+
+    DEFAULT_RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+    """The default value of :attr:`retry_status_codes`."""
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        initial_delay_milliseconds: int = 100,
+        max_delay_milliseconds: int = 20000,
+        max_retry_time_milliseconds: int = 60000,
+        retry_status_codes: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Initialize a policy.
+
+        Args:
+            max_attempts: The maximum number of times to send a request, including the
+                first attempt. Use 1 to disable retries.
+            initial_delay_milliseconds: The shortest delay before a retry.
+            max_delay_milliseconds: The longest delay before a retry, unless the server
+                requests a longer one with a ``Retry-After`` header.
+            max_retry_time_milliseconds: The longest time from the first attempt to the
+                start of the last retry.
+            retry_status_codes: The HTTP status codes that should be retried, or None to
+                use :attr:`DEFAULT_RETRY_STATUS_CODES`.
+
+        Raises:
+            ValueError: if ``max_attempts`` is less than one.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self._max_attempts = max_attempts
+        self._initial_delay_ms = initial_delay_milliseconds
+        self._max_delay_ms = max_delay_milliseconds
+        self._max_retry_time_ms = max_retry_time_milliseconds
+        self._retry_status_codes = (
+            frozenset(retry_status_codes)
+            if retry_status_codes is not None
+            else self.DEFAULT_RETRY_STATUS_CODES
+        )
+
+    @classmethod
+    def no_retries(cls) -> "RetryPolicy":
+        """Get a policy that never retries requests."""
+        return cls(max_attempts=1)
+
+    @property
+    def max_attempts(self) -> int:  # noqa: D401
+        """The maximum number of times to send a request, including the first attempt."""
+        return self._max_attempts
+
+    @property
+    def initial_delay_milliseconds(self) -> int:  # noqa: D401
+        """The shortest delay before a retry."""
+        return self._initial_delay_ms
+
+    @property
+    def max_delay_milliseconds(self) -> int:  # noqa: D401
+        """The longest delay before a retry, unless the server requests a longer one."""
+        return self._max_delay_ms
+
+    @property
+    def max_retry_time_milliseconds(self) -> int:  # noqa: D401
+        """The longest time from the first attempt to the start of the last retry."""
+        return self._max_retry_time_ms
+
+    @property
+    def retry_status_codes(self) -> FrozenSet[int]:  # noqa: D401
+        """The HTTP status codes that should be retried."""
+        return self._retry_status_codes
+
+    def _start(self) -> "_RetryState":
+        return _RetryState(self)
+
+
+class _RetryState:
+    """Tracks the attempts made for a single API call under a :class:`RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+        self._started_at = time.monotonic()
+        self._attempts = 1
+        self._delay_ms = float(policy.initial_delay_milliseconds)
+
+    def get_delay_after_response(
+        self,
+        method: str,
+        idempotent: Optional[bool],
+        status_code: int,
+        retry_after: Optional[str],
+    ) -> Optional[float]:
+        """Get the number of seconds to wait before retrying a request that received a
+        response, or None if it shouldn't be retried.
+        """
+        if status_code not in self._policy.retry_status_codes:
+            return None
+        if status_code not in _UNPROCESSED_STATUS_CODES and not _is_idempotent(
+            method, idempotent
+        ):
+            return None
+        return self._next_delay(_parse_retry_after(retry_after))
+
+    def get_delay_after_error(
+        self, method: str, idempotent: Optional[bool], error: BaseException
+    ) -> Optional[float]:
+        """Get the number of seconds to wait before retrying a request that raised
+        ``error``, or None if it shouldn't be retried.
+        """
+        if _is_unsent_error(error) or (
+            _is_instance(error, _CONNECTION_ERRORS)
+            and _is_idempotent(method, idempotent)
+        ):
+            return self._next_delay(None)
+        return None
+
+    def _next_delay(self, retry_after: Optional[float]) -> Optional[float]:
+        if self._attempts >= self._policy.max_attempts:
+            return None
+
+        # Decorrelated jitter: https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+        self._delay_ms = min(
+            float(self._policy.max_delay_milliseconds),
+            random.uniform(self._policy.initial_delay_milliseconds, self._delay_ms * 3),
+        )
+        delay = self._delay_ms / 1000
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        elapsed = time.monotonic() - self._started_at
+        if (elapsed + delay) * 1000 > self._policy.max_retry_time_milliseconds:
+            return None
+        deadline = _current_deadline.get()
+        if deadline is not None and delay * 1000 >= deadline.remaining_milliseconds:
+            return None
+
+        self._attempts += 1
+        return delay
+
+
+def _is_idempotent(method: str, idempotent: Optional[bool]) -> bool:
+    if idempotent is not None:
+        return idempotent
+    return method.upper() in _IDEMPOTENT_METHODS
+
+
+def _is_unsent_error(error: BaseException) -> bool:
+    """Whether ``error`` was raised before the request reached the server."""
+    if _is_instance(error, _UNSENT_ERRORS):
+        return True
+    # requests raises ConnectionError for both failures to connect and dropped connections
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return _is_instance(
+        error, ("requests.exceptions.ConnectionError",)
+    ) and _is_instance(reason, ("urllib3.exceptions.NewConnectionError",))
+
+
+def _is_instance(error: object, names: Tuple[str, ...]) -> bool:
+    """Whether ``error`` is an instance of one of the named exception types.
+
+    The modules that define the types aren't imported, as a library that hasn't been
+    imported can't have raised the error.
+    """
+    for name in names:
+        module_name, _, type_name = name.rpartition(".")
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(error, getattr(module, type_name)):
+            return True
+    return False
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header, which is either a number of seconds or a date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
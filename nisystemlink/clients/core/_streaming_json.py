@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""Incremental decoding of a JSON array within a document received in chunks."""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List, Sequence
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_INCOMPLETE = object()
+
+# What the parser expects next
+_VALUE = 0  # the value of an object on the path, or of the array
+_FIRST_KEY = 1  # a key, or the end of an object
+_KEY = 2  # a key
+_MEMBER_VALUE = 3  # the value of a key that isn't on the path
+_AFTER_MEMBER = 4  # a comma, or the end of an object
+_FIRST_ITEM = 5  # an item, or the end of the array
+_ITEM = 6  # an item
+_AFTER_ITEM = 7  # a comma, or the end of the array
+_END = 8  # nothing but whitespace
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    match = _WHITESPACE.match(text, position)
+    return match.end() if match else position
+
+
+class _JsonArrayParser:
+    """Parses a JSON document that's fed to it in chunks, returning each item of an
+    array within it as soon as the item is complete.
+
+    The array is found by following ``path``, the keys of the nested objects that
+    contain it; an empty path means the document is the array. Only the item being
+    received is buffered. The rest of the document is kept, with the array emptied of
+    its items, and returned by :meth:`close()`.
+    """
+
+    def __init__(self, path: Sequence[str] = ()) -> None:
+        self._path = tuple(path)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._final = False
+        self._state = _VALUE
+        self._objects = []  # type: List[Dict[str, Any]]
+        self._key = ""
+        self._document = None  # type: Any
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Parse the next chunk of the document.
+
+        Returns:
+            The items of the array completed by the chunk.
+
+        Raises:
+            json.JSONDecodeError: if the document isn't valid JSON.
+        """
+        self._buffer = self._buffer[self._position :] + self._text_decoder.decode(data)
+        self._position = 0
+        return self._parse()
+
+    def close(self) -> Any:
+        """Finish parsing the document.
+
+        Returns:
+            The document, with the array emptied of its items. If the value at the path
+            isn't an array, such as when it's ``null``, it's returned as it was.
+
+        Raises:
+            json.JSONDecodeError: if the document isn't valid JSON, or is incomplete.
+        """
+        self._buffer = self._buffer[self._position :] + self._text_decoder.decode(
+            b"", final=True
+        )
+        self._position = 0
+        self._final = True
+        self._parse()
+        if self._state != _END:
+            raise json.JSONDecodeError(
+                "Unexpected end of document", self._buffer, self._position
+            )
+        return self._document
+
+    def _parse(self) -> List[Any]:
+        items = []  # type: List[Any]
+        buffer = self._buffer
+        while True:
+            self._position = _skip_whitespace(buffer, self._position)
+            if self._position == len(buffer):
+                return items
+            char = buffer[self._position]
+            state = self._state
+
+            if state == _ITEM or (state == _FIRST_ITEM and char != "]"):
+                item = self._decode()
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif state == _FIRST_ITEM or state == _AFTER_ITEM:
+                if char == "]":
+                    self._store([])
+                elif char == "," and state == _AFTER_ITEM:
+                    self._state = _ITEM
+                else:
+                    raise self._error("Expecting ',' delimiter")
+                self._position += 1
+            elif state == _VALUE:
+                depth = len(self._objects)
+                if depth < len(self._path) and char == "{":
+                    self._position += 1
+                    self._objects.append({})
+                    self._state = _FIRST_KEY
+                elif depth == len(self._path) and char == "[":
+                    self._position += 1
+                    self._state = _FIRST_ITEM
+                else:
+                    value = self._decode()
+                    if value is _INCOMPLETE:
+                        return items
+                    self._store(value)
+            elif state == _KEY or (state == _FIRST_KEY and char != "}"):
+                if not self._parse_key():
+                    return items
+            elif state == _MEMBER_VALUE:
+                value = self._decode()
+                if value is _INCOMPLETE:
+                    return items
+                self._objects[-1][self._key] = value
+                self._state = _AFTER_MEMBER
+            elif state == _FIRST_KEY or state == _AFTER_MEMBER:
+                if char == "}":
+                    self._store(self._objects.pop())
+                elif char == "," and state == _AFTER_MEMBER:
+                    self._state = _KEY
+                else:
+                    raise self._error("Expecting ',' delimiter")
+                self._position += 1
+            else:
+                raise self._error("Extra data")
+
+    def _parse_key(self) -> bool:
+        """Parse a key and the colon after it, or return False if they haven't been
+        received yet.
+        """
+        if self._buffer[self._position] != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        start = self._position
+        key = self._decode()
+        if key is _INCOMPLETE:
+            return False
+        colon = _skip_whitespace(self._buffer, self._position)
+        if colon == len(self._buffer):
+            # Parse the key again once the colon has been received
+            self._position = start
+            return False
+        if self._buffer[colon] != ":":
+            self._position = colon
+            raise self._error("Expecting ':' delimiter")
+        self._position = colon + 1
+        self._key = key
+        depth = len(self._objects)
+        self._state = _VALUE if key == self._path[depth - 1] else _MEMBER_VALUE
+        return True
+
+    def _decode(self) -> Any:
+        """Decode the value at the current position, or return ``_INCOMPLETE`` if all
+        of it hasn't been received yet.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return _INCOMPLETE
+        if end == len(self._buffer) and not self._final:
+            # More digits of a number may be on their way
+            return _INCOMPLETE
+        self._position = end
+        return value
+
+    def _store(self, value: Any) -> None:
+        """Store the value at the end of the path within the objects that contain it."""
+        if self._objects:
+            self._objects[-1][self._path[len(self._objects) - 1]] = value
+            self._state = _AFTER_MEMBER
+        else:
+            self._document = value
+            self._state = _END
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of TrustedDecode."""
+
+import contextvars
+from types import TracebackType
+from typing import Optional, Type
+
+from typing_extensions import Literal
+
+_trusted_decode = contextvars.ContextVar(
+    "_trusted_decode", default=None
+)  # type: contextvars.ContextVar[Optional[bool]]
+
+
+class TrustedDecode:
+    """Turns trusted decoding of responses on or off for API calls made within a
+    ``with`` block, overriding :attr:`HttpConfiguration.trusted_decode`.
+
+    Trusted decoding builds response models from the JSON sent by the server without
+    validating it, which makes decoding large responses, such as pages of table rows
+    or queries returning thousands of specifications, much cheaper. Lists and
+    dictionaries of plain values (for example, the rows of a
+    :class:`~nisystemlink.clients.dataframe.models.DataFrame`) are used as they were
+    received rather than being checked item by item. Enumerations and dates are still
+    converted, so the models can be used as usual, but values the server sends with an
+    unexpected type or missing required fields are not reported.
+
+    Example::
+
+        with TrustedDecode():
+            rows = client.get_table_data(table_id, take=10000)
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize an instance.
+
+        Args:
+            enabled: Whether responses are decoded without validation within the block.
+        """
+        self._enabled = enabled
+        self._token = None  # type: Optional[contextvars.Token[Optional[bool]]]
+
+    @property
+    def enabled(self) -> bool:  # noqa: D401
+        """Whether responses are decoded without validation within the block."""
+        return self._enabled
+
+    def __enter__(self) -> "TrustedDecode":
+        self._token = _trusted_decode.set(self._enabled)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        if self._token is not None:
+            _trusted_decode.reset(self._token)
+            self._token = None
+        return False
+
+
+def _is_trusted_decode(default: bool) -> bool:
+    """Get whether responses should be decoded without validation.
+
+    Args:
+        default: The value to use outside of any :class:`TrustedDecode` block.
+    """
+    enabled = _trusted_decode.get()
+    return default if enabled is None else enabled
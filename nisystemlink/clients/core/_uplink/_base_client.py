@@ -1,14 +1,34 @@
 # mypy: disable-error-code = misc
 
-from json import loads
-from typing import Any, Callable, Dict, get_origin, Optional, Type, Union
+import json
+from types import TracebackType
+from typing import Any, Callable, get_origin, Optional, Type, Union
 
+import httpx
+import requests
 from nisystemlink.clients import core
+from nisystemlink.clients.core._trusted_decode import _is_trusted_decode
 from pydantic import parse_obj_as
-from requests import JSONDecodeError, Response
+from requests import Response
+from typing_extensions import Literal
 from uplink import commands, Consumer, converters, response_handler, utils
-
+from uplink.clients import get_client
+
+from ._coalescing import AsyncCoalescingClientAdapter, CoalescingClientAdapter
+from ._compression import CompressionHook
+from ._construct import construct_obj_as
+from ._httpx_client import HttpxAsyncClientAdapter
+from ._instrumentation import InstrumentationHook
+from ._json_body import JsonBodyHook
 from ._json_model import JsonModel
+from ._rate_limit import RateLimitHook
+from ._response_cache import (
+    AsyncCachingClientAdapter,
+    CachingClientAdapter,
+    ResponseCacheHook,
+)
+from ._retry import RetryHook
+from ._timeout import TimeoutHook
 
 
 @response_handler
@@ -21,7 +41,9 @@ def _handle_http_status(response: Response) -> Optional[Response]:
         return response
 
     msg = "Server responded with <{} {}> ({}).".format(
-        response.status_code, response.reason, response.url
+        response.status_code,
+        getattr(response, "reason_phrase", None) or getattr(response, "reason"),
+        response.url,
     )
 
     try:
@@ -34,18 +56,22 @@ def _handle_http_status(response: Response) -> Optional[Response]:
         raise core.ApiException(
             msg, error=err_obj, http_status_code=response.status_code
         )
-    except JSONDecodeError:
+    except (json.JSONDecodeError, requests.JSONDecodeError):
         if response.text:
             msg += ":\n\n" + response.text
         raise core.ApiException(msg, http_status_code=response.status_code)
 
 
 class _JsonModelConverter(converters.Factory):
+    def __init__(self, trusted_decode: bool = False) -> None:
+        self._trusted_decode = trusted_decode
+
     def create_request_body_converter(
         self, _class: Type, _: commands.RequestDefinition
-    ) -> Optional[Callable[[JsonModel], Dict]]:
-        def encoder(model: JsonModel) -> Dict:
-            return loads(model.json(by_alias=True, exclude_unset=True))
+    ) -> Optional[Callable[[JsonModel], JsonModel]]:
+        def encoder(model: JsonModel) -> JsonModel:
+            # Models are encoded straight to bytes by JsonBodyHook
+            return model
 
         if utils.is_subclass(_class, JsonModel):
             return encoder
@@ -61,6 +87,8 @@ class _JsonModelConverter(converters.Factory):
             except AttributeError:
                 data = response
 
+            if _is_trusted_decode(self._trusted_decode):
+                return construct_obj_as(_class, data)
             return parse_obj_as(_class, data)
 
         if get_origin(_class) is Union or utils.is_subclass(_class, JsonModel):
@@ -79,10 +107,118 @@ class BaseClient(Consumer):
             configuration: Defines the web server to connect to and information about how to connect.
             base_path: The base path for all API calls.
         """
+        self._connection_pool = core.ConnectionPool.for_configuration(configuration)
+        client = get_client(self._connection_pool.session)
+        if configuration.request_coalescer is not None:
+            client = CoalescingClientAdapter(client, configuration.request_coalescer)
+        if configuration.response_cache is not None:
+            client = CachingClientAdapter(client)
         super().__init__(
             base_url=configuration.server_uri + base_path,
-            converter=_JsonModelConverter(),
-            hooks=[_handle_http_status],
+            client=client,
+            converter=_JsonModelConverter(configuration.trusted_decode),
+            hooks=[
+                JsonBodyHook(),
+                CompressionHook(configuration),
+                ResponseCacheHook(configuration),
+                TimeoutHook(configuration),
+                RetryHook(configuration),
+                RateLimitHook(configuration),
+                InstrumentationHook(configuration),
+                _handle_http_status,
+            ],
         )
         if configuration.api_keys:
             self.session.headers.update(configuration.api_keys)
+
+    @property
+    def connection_pool(self) -> core.ConnectionPool:  # noqa: D401
+        """The pool of connections shared with other clients of the same server."""
+        return self._connection_pool
+
+
+class AsyncBaseClient(Consumer):
+    """Base class for asyncio SystemLink clients, built on top of `Uplink <https://github.com/prkumar/uplink>`_
+    and an `httpx <https://www.python-httpx.org>`_ ``AsyncClient``.
+
+    Methods of derived clients return awaitables, and share the models and response
+    handling of their synchronous counterparts. Call :meth:`aclose()` (or use the
+    client in an ``async with`` statement) to release the underlying connections.
+    """
+
+    def __init__(self, configuration: core.HttpConfiguration, base_path: str = ""):
+        """Initialize an instance.
+
+        Args:
+            configuration: Defines the web server to connect to and information about how to connect.
+            base_path: The base path for all API calls.
+        """
+        verify = (
+            str(configuration.cert_path) if configuration.cert_path else True
+        )  # type: Union[str, bool]
+        max_connections = configuration.max_connections_per_host
+        idle_timeout = configuration.connection_idle_timeout_milliseconds
+        self._max_connections_per_host = max_connections
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=(
+                max_connections if configuration.keep_alive else 0
+            ),
+            keepalive_expiry=idle_timeout / 1000 if idle_timeout is not None else None,
+        )
+        timeout = httpx.Timeout(
+            configuration.timeout_milliseconds / 1000,
+            connect=min(
+                configuration.connect_timeout_milliseconds,
+                configuration.timeout_milliseconds,
+            )
+            / 1000,
+        )
+        self._http_client = httpx.AsyncClient(
+            verify=verify, limits=limits, timeout=timeout, http2=configuration.http2
+        )
+        client = HttpxAsyncClientAdapter(self._http_client)
+        if configuration.request_coalescer is not None:
+            client = AsyncCoalescingClientAdapter(
+                client, configuration.request_coalescer
+            )
+        if configuration.response_cache is not None:
+            client = AsyncCachingClientAdapter(client)
+        super().__init__(
+            base_url=configuration.server_uri + base_path,
+            client=client,
+            converter=_JsonModelConverter(configuration.trusted_decode),
+            hooks=[
+                JsonBodyHook(),
+                CompressionHook(configuration),
+                ResponseCacheHook(configuration),
+                TimeoutHook(configuration),
+                RetryHook(configuration),
+                RateLimitHook(configuration),
+                InstrumentationHook(configuration),
+                _handle_http_status,
+            ],
+        )
+        if configuration.api_keys:
+            self.session.headers.update(configuration.api_keys)
+
+    @property
+    def max_connections_per_host(self) -> int:  # noqa: D401
+        """The maximum number of connections the client opens to the server."""
+        return self._max_connections_per_host
+
+    async def aclose(self) -> None:
+        """Close the connections held by the client."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncBaseClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        await self.aclose()
+        return False
@@ -0,0 +1,58 @@
+"""Merges identical uplink GET requests through the :class:`RequestCoalescer` of an
+:class:`HttpConfiguration`.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._request_coalescer import _get_key
+from uplink.clients import interfaces
+
+
+class CoalescingClientAdapter(interfaces.HttpClientAdapter):
+    """Wraps an uplink client adapter to send identical GET requests that are in
+    flight at the same time once.
+    """
+
+    def __init__(
+        self, client: interfaces.HttpClientAdapter, coalescer: core.RequestCoalescer
+    ) -> None:
+        self._client = client
+        self._coalescer = coalescer
+
+    @property
+    def exceptions(self) -> Any:
+        return self._client.exceptions
+
+    def io(self) -> Any:
+        return self._client.io()
+
+    def apply_callback(self, callback: Callable[[Any], Any], response: Any) -> Any:
+        return self._client.apply_callback(callback, response)
+
+    def send(self, request: Tuple[str, str, Dict[str, Any]]) -> Any:
+        return self._coalescer._run(
+            _get_request_key(request), lambda: self._client.send(request)
+        )
+
+
+class AsyncCoalescingClientAdapter(CoalescingClientAdapter):
+    """A :class:`CoalescingClientAdapter` for adapters whose ``send`` is a coroutine."""
+
+    async def send(self, request: Tuple[str, str, Dict[str, Any]]) -> Any:
+        return await self._coalescer._run_async(
+            _get_request_key(request), lambda: self._client.send(request)
+        )
+
+    async def apply_callback(
+        self, callback: Callable[[Any], Any], response: Any
+    ) -> Any:
+        return await self._client.apply_callback(callback, response)
+
+
+def _get_request_key(request: Tuple[str, str, Dict[str, Any]]) -> Optional[Hashable]:
+    method, url, extras = request
+    if extras.get("stream"):
+        # A streamed response can only be read once
+        return None
+    return _get_key(method, url, extras.get("params"), extras.get("headers"))
@@ -0,0 +1,46 @@
+"""Compresses uplink request bodies according to an :class:`HttpConfiguration`."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._request_compression import _compress_body
+from uplink.clients.io import RequestTemplate
+from uplink.hooks import TransactionHook
+
+_COMPRESSION_CONTEXT_KEY = "nisystemlink.compression"
+
+
+class _CompressionTemplate(RequestTemplate):
+    def __init__(self, threshold: int, request_builder: Any) -> None:
+        self._threshold = threshold
+        self._context = request_builder.context  # type: Dict[str, Any]
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> Optional[Any]:
+        extras = request[2]
+        data = extras.get("data")
+        # Retries send the same request again, which is already compressed
+        if _COMPRESSION_CONTEXT_KEY in self._context or not isinstance(data, bytes):
+            return None
+        compressed = _compress_body(data, self._threshold)
+        if compressed is None:
+            return None
+        self._context[_COMPRESSION_CONTEXT_KEY] = compressed
+        if compressed.is_compressed:
+            extras["data"] = compressed.data
+            extras["headers"]["Content-Encoding"] = "gzip"
+        return None
+
+
+class CompressionHook(TransactionHook):
+    """Gzips request bodies encoded by :class:`JsonBodyHook` that are at least
+    :attr:`HttpConfiguration.request_compression_threshold_bytes` long.
+    """
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._threshold = configuration.request_compression_threshold_bytes
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        if self._threshold is not None:
+            request_builder.add_request_template(
+                _CompressionTemplate(self._threshold, request_builder)
+            )
@@ -0,0 +1,214 @@
+"""Builds models from trusted JSON data without validating it."""
+
+import datetime
+import enum
+import functools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    get_args,
+    get_origin,
+    get_type_hints,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, parse_obj_as
+from pydantic.datetime_parse import parse_date, parse_datetime
+from pydantic.fields import ModelField
+from typing_extensions import Literal
+
+_Converter = Callable[[Any], Any]
+_Field = Tuple[str, str, Optional[_Converter], ModelField]
+
+# Types whose JSON values are used as they are
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+_MISSING = object()
+
+
+def construct_obj_as(type_: Any, data: Any) -> Any:
+    """Build an object of ``type_`` from JSON data without validating it.
+
+    Models are built with ``construct()`` and only the parts of ``data`` that need
+    converting, such as nested models, enumerations, and dates, are walked. Lists and
+    dictionaries of plain values are used as they are. Types that can't be built
+    without validation, such as unions of several models, are parsed as
+    ``parse_obj_as`` would parse them.
+    """
+    converter = _get_converter(type_)
+    if converter is None or data is None:
+        return data
+    return converter(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_converter(type_: Any) -> Optional[_Converter]:
+    """Get a function that converts JSON data to ``type_``, or None if none is needed."""
+    if type_ is Any or type_ is object or type_ in _PLAIN_TYPES:
+        return None
+    origin = get_origin(type_)
+    if origin is Literal:
+        return None
+    if origin is Union:
+        return _get_union_converter(type_)
+    if origin in (list, List):
+        return _get_list_converter(get_args(type_))
+    if origin in (dict, Dict):
+        return _get_dict_converter(get_args(type_))
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return _ModelConverter(type_)
+        if issubclass(type_, enum.Enum):
+            return type_
+        if issubclass(type_, datetime.datetime):
+            return _parse_datetime
+        if issubclass(type_, datetime.date):
+            return parse_date
+        if issubclass(type_, _PLAIN_TYPES):
+            # Constrained and strict types, such as StrictInt
+            return None
+    return functools.partial(parse_obj_as, type_)
+
+
+def _parse_datetime(value: Any) -> datetime.datetime:
+    # fromisoformat is much faster, and reads the ISO 8601 timestamps sent by services
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse_datetime(value)
+
+
+def _get_union_converter(type_: Any) -> Optional[_Converter]:
+    args = [arg for arg in get_args(type_) if arg is not type(None)]  # noqa: E721
+    converters = [_get_converter(arg) for arg in args]
+    if all(converter is None for converter in converters):
+        return None
+    if len(args) == 1:
+        return converters[0]
+    if all(isinstance(converter, _ModelConverter) for converter in converters):
+        return _ModelUnionConverter(type_, converters)  # type: ignore
+    # Which member the data is meant for is only known by validating it
+    return functools.partial(parse_obj_as, type_)
+
+
+def _get_list_converter(args: Tuple[Any, ...]) -> Optional[_Converter]:
+    item_converter = _get_converter(args[0]) if args else None
+    if item_converter is None:
+        return None
+    return functools.partial(_convert_list, item_converter)
+
+
+def _convert_list(item_converter: _Converter, data: Any) -> Any:
+    return [None if item is None else item_converter(item) for item in data]
+
+
+def _get_dict_converter(args: Tuple[Any, ...]) -> Optional[_Converter]:
+    value_converter = _get_converter(args[1]) if len(args) == 2 else None
+    if value_converter is None:
+        return None
+    return functools.partial(_convert_dict, value_converter)
+
+
+def _convert_dict(value_converter: _Converter, data: Any) -> Any:
+    return {
+        key: None if value is None else value_converter(value)
+        for key, value in data.items()
+    }
+
+
+class _ModelConverter:
+    """Builds a model from a dictionary keyed by field alias (or name).
+
+    This is equivalent to ``construct()``, without copying default values that can't be
+    modified.
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self._model = model
+        # Fields are resolved on first use, as models may refer to themselves
+        self._fields = None  # type: Optional[List[_Field]]
+        self._keys = frozenset()  # type: FrozenSet[str]
+
+    def __call__(self, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return parse_obj_as(self._model, data)
+        fields = self._fields if self._fields is not None else self._resolve_fields()
+        values = {}
+        fields_set = set()
+        for name, alias, converter, field in fields:
+            value = data.get(alias, _MISSING)
+            if value is _MISSING:
+                value = data.get(name, _MISSING)
+                if value is _MISSING:
+                    if not field.required:
+                        default = field.default
+                        values[name] = (
+                            default
+                            if isinstance(default, _PLAIN_TYPES)
+                            else field.get_default()
+                        )
+                    continue
+            if converter is not None and value is not None:
+                value = converter(value)
+            values[name] = value
+            fields_set.add(name)
+        model = self._model.__new__(self._model)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__fields_set__", fields_set)
+        model._init_private_attributes()
+        return model
+
+    def _fits(self, data: Dict[str, Any]) -> bool:
+        """Get whether every key in ``data`` is a field of the model, and every required
+        field is in ``data``.
+        """
+        fields = self._fields if self._fields is not None else self._resolve_fields()
+        if not self._keys.issuperset(data):
+            return False
+        return all(
+            name in data or alias in data
+            for name, alias, _, field in fields
+            if field.required
+        )
+
+    def _resolve_fields(self) -> List[_Field]:
+        hints = get_type_hints(self._model)
+        self._fields = [
+            (
+                name,
+                field.alias,
+                _get_converter(hints.get(name, field.outer_type_)),
+                field,
+            )
+            for name, field in self._model.__fields__.items()
+        ]
+        self._keys = frozenset(
+            key for name, alias, _, _ in self._fields for key in (name, alias)
+        )
+        return self._fields
+
+
+class _ModelUnionConverter:
+    """Builds the member of a union of models that the data is meant for.
+
+    If exactly one member has a field for every key in the data and all of its required
+    fields are present, that member is built. Otherwise, the data is validated against
+    the union to find out which member it's meant for.
+    """
+
+    def __init__(self, union: Any, members: List[_ModelConverter]) -> None:
+        self._union = union
+        self._members = members
+
+    def __call__(self, data: Any) -> Any:
+        if isinstance(data, dict):
+            candidates = [member for member in self._members if member._fits(data)]
+            if len(candidates) == 1:
+                return candidates[0](data)
+        return parse_obj_as(self._union, data)
@@ -1,7 +1,20 @@
+from typing import Iterator, Union
+
+import httpx
 from nisystemlink.clients.core.helpers import IteratorFileLike
 from requests.models import Response
 
 
-def file_like_response_handler(response: Response) -> IteratorFileLike:
+def file_like_response_handler(
+    response: Union[Response, httpx.Response]
+) -> IteratorFileLike:
     """Response handler for File-Like content."""
-    return IteratorFileLike(response.iter_content(chunk_size=4096))
+    return IteratorFileLike(_iter_response_content(response))
+
+
+def _iter_response_content(
+    response: Union[Response, httpx.Response], chunk_size: int = 4096
+) -> Iterator[bytes]:
+    if isinstance(response, httpx.Response):
+        return response.iter_bytes(chunk_size=chunk_size)
+    return response.iter_content(chunk_size=chunk_size)
@@ -0,0 +1,74 @@
+"""An uplink client adapter backed by an httpx AsyncClient."""
+
+from typing import Any, Callable, Dict, Tuple
+
+import httpx
+from uplink.clients import exceptions, interfaces, io
+
+
+class HttpxAsyncClientAdapter(interfaces.HttpClientAdapter):
+    """Sends uplink requests using an :class:`httpx.AsyncClient`, producing awaitable responses.
+
+    Response bodies are read before response handlers run, so handlers written for
+    ``requests`` responses (``json()``, ``text``, ``status_code``) work unchanged. The
+    exception is the successful responses of requests sent with ``stream=True``, which
+    handlers read as they're received.
+    """
+
+    exceptions = exceptions.Exceptions()
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The underlying httpx client."""
+        return self._client
+
+    async def send(self, request: Tuple[str, str, Dict[str, Any]]) -> httpx.Response:
+        method, url, extras = request
+        kwargs = _to_httpx_kwargs(extras)
+        if not kwargs.pop("stream", False):
+            return await self._client.request(method, url, **kwargs)
+        auth = kwargs.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        response = await self._client.send(
+            self._client.build_request(method, url, **kwargs), auth=auth, stream=True
+        )
+        if not 200 <= response.status_code < 300:
+            # Errors are decoded from the whole body before it reaches handlers
+            await response.aread()
+        return response
+
+    async def apply_callback(
+        self, callback: Callable[[httpx.Response], Any], response: httpx.Response
+    ) -> Any:
+        return callback(response)
+
+    @staticmethod
+    def io() -> io.AsyncioStrategy:
+        return io.AsyncioStrategy()
+
+
+def _to_httpx_kwargs(extras: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate the keyword arguments uplink builds for ``requests`` into httpx ones."""
+    kwargs = {k: v for k, v in extras.items() if v is not None}
+    # uplink builds these as defaultdicts, so they may be present but empty.
+    for key in ("data", "files", "headers", "params"):
+        if key in kwargs and not kwargs[key]:
+            del kwargs[key]
+    if isinstance(kwargs.get("data"), bytes):
+        kwargs["content"] = kwargs.pop("data")
+    if isinstance(kwargs.get("timeout"), tuple):
+        # requests takes a (connect, read) tuple; httpx a Timeout with more phases.
+        connect, read = kwargs["timeout"]
+        kwargs["timeout"] = httpx.Timeout(read, connect=connect)
+    if "files" in kwargs:
+        kwargs["files"] = {k: v for k, v in kwargs["files"].items() if v is not None}
+    return kwargs
+
+
+HttpxAsyncClientAdapter.exceptions.BaseClientException = httpx.HTTPError
+HttpxAsyncClientAdapter.exceptions.ConnectionError = httpx.ConnectError
+HttpxAsyncClientAdapter.exceptions.ConnectionTimeout = httpx.ConnectTimeout
+HttpxAsyncClientAdapter.exceptions.ServerTimeout = httpx.ReadTimeout
+HttpxAsyncClientAdapter.exceptions.InvalidURL = httpx.InvalidURL
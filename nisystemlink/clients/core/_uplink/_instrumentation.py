@@ -0,0 +1,137 @@
+"""Reports uplink requests to the :class:`RequestObserver` objects of an :class:`HttpConfiguration`."""
+
+import time
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._request_observer import (
+    _has_observers,
+    _notify_observers,
+)
+from uplink.clients.io import RequestTemplate
+from uplink.decorators import MethodAnnotation
+from uplink.hooks import TransactionHook
+
+from ._compression import _COMPRESSION_CONTEXT_KEY
+from ._rate_limit import _get_body_size
+
+_ROUTE_CONTEXT_KEY = "nisystemlink.route"
+
+
+class Route(MethodAnnotation):
+    """Records the path template of a request, such as ``"tables/{id}"``, so that
+    requests to the same endpoint can be grouped when they're reported.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def modify_request(self, request_builder: Any) -> None:
+        request_builder.context[_ROUTE_CONTEXT_KEY] = self._path
+
+
+class _InstrumentationTemplate(RequestTemplate):
+    """Times a request and reports it once it's finished.
+
+    This template is placed after those that retry or delay requests, so it's only
+    called for requests that are sent, and for the final response or error.
+    """
+
+    def __init__(self, observers: Any, request_builder: Any) -> None:
+        self._observers = observers
+        self._base_url = request_builder.base_url
+        # Populated by Route annotations after this template is created
+        self._context = request_builder.context  # type: Dict[str, Any]
+        self._start = time.monotonic()
+        self._attempt_start = self._start
+        self._attempts = 0
+        self._bytes_sent = 0
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> None:
+        self._attempts += 1
+        self._bytes_sent = _get_body_size(request[2])
+        self._attempt_start = time.monotonic()
+
+    def after_response(
+        self, request: Tuple[str, str, Dict[str, Any]], response: Any
+    ) -> None:
+        self._notify(request, response.status_code, _get_response_size(response))
+
+    def after_exception(
+        self,
+        request: Tuple[str, str, Dict[str, Any]],
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any,
+    ) -> None:
+        self._notify(request, None, None, exc_val)
+
+    def _notify(
+        self,
+        request: Tuple[str, str, Dict[str, Any]],
+        status_code: Optional[int],
+        bytes_received: Optional[int],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        end = time.monotonic()
+        method, url, _ = request
+        compressed = self._context.get(_COMPRESSION_CONTEXT_KEY)
+        route = self._context.get(_ROUTE_CONTEXT_KEY)
+        if route is None:
+            route = urllib.parse.urlsplit(url).path
+        else:
+            route = urllib.parse.urljoin(
+                urllib.parse.urlsplit(self._base_url).path, route
+            )
+        _notify_observers(
+            self._observers,
+            core.CompletedRequest(
+                method=method,
+                route=route,
+                url=url,
+                status_code=status_code,
+                bytes_sent=self._bytes_sent,
+                bytes_received=bytes_received,
+                retries=max(self._attempts - 1, 0),
+                duration_milliseconds=(end - self._start) * 1000,
+                last_attempt_milliseconds=(end - self._attempt_start) * 1000,
+                error=error,
+                uncompressed_bytes_sent=(
+                    compressed.uncompressed_size if compressed else None
+                ),
+                compression_milliseconds=compressed.milliseconds if compressed else 0.0,
+            ),
+        )
+
+
+def _get_response_size(response: Any) -> Optional[int]:
+    """Get the number of bytes in the body of a response, if it's known without reading
+    a streamed body.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+    if hasattr(response, "num_bytes_downloaded"):
+        # httpx
+        if response.is_stream_consumed:
+            return response.num_bytes_downloaded
+        return None
+    # requests, which sets _content once the body has been read
+    content = getattr(response, "_content", False)
+    return len(content) if isinstance(content, bytes) else None
+
+
+class InstrumentationHook(TransactionHook):
+    """Reports requests to the :class:`RequestObserver` objects of an
+    :class:`HttpConfiguration`, and to the global observers.
+    """
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._observers = configuration.request_observers
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        if _has_observers(self._observers):
+            request_builder.add_request_template(
+                _InstrumentationTemplate(self._observers, request_builder)
+            )
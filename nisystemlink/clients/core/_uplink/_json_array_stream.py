@@ -0,0 +1,27 @@
+from typing import Any, Callable, Union
+
+import httpx
+from nisystemlink.clients.core.helpers import AsyncJsonArrayStream, JsonArrayStream
+from requests.models import Response
+
+_CHUNK_SIZE = 65536
+
+
+def json_array_stream_handler(
+    *path: str,
+) -> Callable[[Union[Response, httpx.Response]], Any]:
+    """Get a response handler that streams the items of the array at ``path`` in a JSON
+    response, as a :class:`JsonArrayStream`, or an :class:`AsyncJsonArrayStream` for
+    asyncio clients.
+    """
+
+    def handler(response: Union[Response, httpx.Response]) -> Any:
+        if isinstance(response, httpx.Response):
+            return AsyncJsonArrayStream(
+                response.aiter_bytes(_CHUNK_SIZE), path, response.aclose
+            )
+        return JsonArrayStream(
+            response.iter_content(chunk_size=_CHUNK_SIZE), path, response.close
+        )
+
+    return handler
@@ -0,0 +1,143 @@
+"""Encodes JSON request bodies to bytes in a single pass."""
+
+import datetime
+import enum
+import functools
+import json
+import math
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from typing_extensions import get_args, get_origin, Literal
+from uplink.clients.io import RequestTemplate
+from uplink.hooks import TransactionHook
+
+from ._json_model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, JsonModel):
+        # Equivalent to obj.dict(by_alias=True, exclude_unset=True), but without copying
+        # every nested list and dictionary; nested models come back through here.
+        fields = obj.__fields__
+        fields_set = obj.__fields_set__
+        return {
+            fields[name].alias: value
+            for name, value in obj.__dict__.items()
+            if name in fields_set
+        }
+    return pydantic_encoder(obj)
+
+
+# Types whose values are never encoded as a float
+_NON_FLOAT_TYPES = (
+    str,
+    bytes,
+    bool,
+    int,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+
+def _may_hold_float(annotation: Any) -> bool:
+    """Whether a value of a type annotation could be, or contain, a float."""
+    args = get_args(annotation)
+    if get_origin(annotation) is Literal:
+        return any(isinstance(arg, float) for arg in args)
+    if args:
+        return any(_may_hold_float(arg) for arg in args)
+    if isinstance(annotation, type):
+        if issubclass(annotation, enum.Enum):
+            return issubclass(annotation, float)
+        # Nested models are checked with their own fields
+        return not issubclass(annotation, _NON_FLOAT_TYPES)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _float_fields(model: Type[BaseModel]) -> List[str]:
+    """Get the names of the fields of a model that could hold a float."""
+    return [
+        name
+        for name, field in model.__fields__.items()
+        if _may_hold_float(field.annotation)
+    ]
+
+
+def _contains_non_finite_float(obj: Any) -> bool:
+    """Whether an object, or any list, tuple, dictionary or :class:`JsonModel` nested
+    in it, contains NaN or an infinite float.
+
+    Only the fields of a model whose types allow a float are checked, so that large
+    lists of strings, such as the rows of a data frame, are skipped.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, JsonModel):
+        values = obj.__dict__
+        return any(
+            _contains_non_finite_float(values[name])
+            for name in _float_fields(type(obj))
+            if name in values
+        )
+    if isinstance(obj, dict):
+        return any(map(_contains_non_finite_float, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_contains_non_finite_float, obj))
+    return False
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode an object, which may be or contain :class:`JsonModel` instances, as JSON.
+
+    Models are encoded as ``model.json(by_alias=True, exclude_unset=True)`` would
+    encode them. `orjson <https://github.com/ijl/orjson>`_ is used if it's installed.
+
+    Raises:
+        ValueError: if the object contains NaN or an infinite float, which JSON can't
+            represent.
+    """
+    if orjson is None:
+        return json.dumps(
+            obj, default=_default, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    encoded = orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    # orjson encodes NaN and infinities as null rather than rejecting them, so output
+    # with a null may hide one
+    if b"null" in encoded and _contains_non_finite_float(obj):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return encoded
+
+
+class _JsonBodyTemplate(RequestTemplate):
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> Optional[Any]:
+        extras = request[2]
+        # Multipart requests ignore the JSON body, as the HTTP clients do
+        if extras.get("json") is not None and not extras.get("files"):
+            extras["data"] = dumps(extras.pop("json"))
+            extras["headers"]["Content-Type"] = "application/json"
+        return None
+
+
+class JsonBodyHook(TransactionHook):
+    """Sends JSON request bodies as bytes encoded by :func:`dumps`.
+
+    Request body converters pass models through unchanged, so that they are encoded
+    straight to bytes rather than first being converted to dictionaries and then
+    encoded by the HTTP client.
+    """
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        request_builder.add_request_template(_JsonBodyTemplate())
@@ -9,6 +9,10 @@ from uplink import (
     response_handler as uplink_response_handler,
     returns,
 )
+from uplink.decorators import MethodAnnotation
+
+from ._instrumentation import Route
+from ._retry import Idempotent
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -17,7 +21,7 @@ def get(path: str, args: Optional[Sequence[Any]] = None) -> Callable[[F], F]:
     """Annotation for a GET request."""
 
     def decorator(func: F) -> F:
-        return commands.get(path, args=args)(func)  # type: ignore
+        return Route(path)(commands.get(path, args=args)(func))  # type: ignore
 
     return decorator
 
@@ -26,15 +30,19 @@ def post(
     path: str,
     args: Optional[Sequence[Any]] = None,
     return_key: Optional[Union[str, Tuple[str, ...]]] = None,
+    idempotent: bool = False,
 ) -> Callable[[F], F]:
     """Annotation for a POST request with a JSON request body. If args is not
     specified, defaults to a single argument that represents the request body.
+    Set ``idempotent`` for requests, such as queries, that are safe to retry.
     """
 
     def decorator(func: F) -> F:
-        result = json(commands.post(path, args=args or (Body,))(func))
+        result = Route(path)(json(commands.post(path, args=args or (Body,))(func)))
         if return_key:
             result = returns.json(key=return_key)(result)
+        if idempotent:
+            result = Idempotent()(result)
         return result  # type: ignore
 
     return decorator
@@ -44,7 +52,7 @@ def patch(path: str, args: Optional[Sequence[Any]] = None) -> Callable[[F], F]:
     """Annotation for a PATCH request with a JSON request body."""
 
     def decorator(func: F) -> F:
-        return json(commands.patch(path, args=args)(func))  # type: ignore
+        return Route(path)(json(commands.patch(path, args=args)(func)))  # type: ignore
 
     return decorator
 
@@ -53,7 +61,7 @@ def delete(path: str, args: Optional[Sequence[Any]] = None) -> Callable[[F], F]:
     """Annotation for a DELETE request."""
 
     def decorator(func: F) -> F:
-        return commands.delete(path, args=args)(func)  # type: ignore
+        return Route(path)(commands.delete(path, args=args)(func))  # type: ignore
 
     return decorator
 
@@ -67,3 +75,19 @@ def response_handler(
         return uplink_response_handler(handler, requires_consumer)(func)  # type: ignore
 
     return decorator
+
+
+class _Stream(MethodAnnotation):
+    def modify_request(self, request_builder: Any) -> None:
+        request_builder.info["stream"] = True
+
+
+def stream() -> Callable[[F], F]:
+    """Annotation for a request whose response body is read by its response handler as
+    it's received, rather than being read before the response is handled.
+    """
+
+    def decorator(func: F) -> F:
+        return _Stream()(func)  # type: ignore
+
+    return decorator
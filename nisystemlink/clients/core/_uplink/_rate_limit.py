@@ -0,0 +1,71 @@
+"""Delays uplink requests according to the rate limiters of an :class:`HttpConfiguration`."""
+
+import json
+import os
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._rate_limiter import _find_rate_limiter
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.hooks import TransactionHook
+
+
+class _RateLimitTemplate(RequestTemplate):
+    def __init__(self, rate_limiters: Dict[str, core.RateLimiter]) -> None:
+        self._rate_limiters = rate_limiters
+        self._waited = False
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> Optional[Any]:
+        if self._waited:
+            # Called again after sleeping for the reservation made below
+            self._waited = False
+            return None
+        _, url, extras = request
+        limiter = _find_rate_limiter(
+            self._rate_limiters, urllib.parse.urlsplit(url).path
+        )
+        if limiter is None:
+            return None
+        wait_time = limiter._reserve(
+            _get_body_size(extras) if limiter.limits_bytes else 0
+        )
+        if wait_time <= 0:
+            return None
+        # Sleeping through the execution lets asyncio clients wait without blocking
+        self._waited = True
+        return transitions.sleep(wait_time)
+
+
+def _get_body_size(extras: Dict[str, Any]) -> int:
+    """Estimate the number of bytes in the body of a request."""
+    if extras.get("json") is not None:
+        return len(json.dumps(extras["json"]).encode())
+    size = 0
+    data = extras.get("data")
+    if isinstance(data, (bytes, str)):
+        size += len(data)
+    for file in (extras.get("files") or {}).values():
+        if isinstance(file, (bytes, str)):
+            size += len(file)
+        elif hasattr(file, "getbuffer"):
+            size += max(len(file.getbuffer()) - file.tell(), 0)
+        elif hasattr(file, "fileno"):
+            try:
+                size += max(os.fstat(file.fileno()).st_size - file.tell(), 0)
+            except (OSError, ValueError):
+                pass
+    return size
+
+
+class RateLimitHook(TransactionHook):
+    """Delays requests according to the rate limiters of an :class:`HttpConfiguration`."""
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._rate_limiters = configuration.rate_limiters
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        if self._rate_limiters:
+            request_builder.add_request_template(
+                _RateLimitTemplate(self._rate_limiters)
+            )
@@ -0,0 +1,132 @@
+"""Answers uplink GET requests from the :class:`ResponseCache` of an :class:`HttpConfiguration`."""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._response_cache import _CacheLookup
+from uplink.clients import interfaces
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.hooks import TransactionHook
+
+from ._retry import _IDEMPOTENT_CONTEXT_KEY
+
+# Passes the lookup made by the template to the client adapter, which removes it
+_LOOKUP_KEY = "_nisystemlink_cache_lookup"
+
+
+class _ResponseCacheTemplate(RequestTemplate):
+    def __init__(self, cache: core.ResponseCache, request_builder: Any) -> None:
+        self._cache = cache
+        # Populated by Idempotent annotations after this template is created
+        self._context = request_builder.context  # type: Dict[str, Any]
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> Optional[Any]:
+        method, url, extras = request
+        if extras.get("stream"):
+            return None
+        lookup = self._cache._lookup(method, url, extras.get("params"))
+        if lookup is None:
+            return None
+        extras[_LOOKUP_KEY] = lookup
+        if lookup.cached_response is not None:
+            # Skip the templates that would delay or time a request that isn't sent
+            return transitions.send(request)
+        return None
+
+    def after_response(
+        self, request: Tuple[str, str, Dict[str, Any]], response: Any
+    ) -> None:
+        self._request_sent(request)
+
+    def after_exception(
+        self,
+        request: Tuple[str, str, Dict[str, Any]],
+        exc_type: Any,
+        exc_val: Any,
+        exc_tb: Any,
+    ) -> None:
+        self._request_sent(request)
+
+    def _request_sent(self, request: Tuple[str, str, Dict[str, Any]]) -> None:
+        if not self._context.get(_IDEMPOTENT_CONTEXT_KEY):
+            self._cache._request_sent(request[0], request[1])
+
+
+class CachingClientAdapter(interfaces.HttpClientAdapter):
+    """Wraps an uplink client adapter to answer requests looked up by
+    :class:`ResponseCacheHook` from the cache, or to revalidate them.
+    """
+
+    def __init__(self, client: interfaces.HttpClientAdapter) -> None:
+        self._client = client
+
+    @property
+    def exceptions(self) -> Any:
+        return self._client.exceptions
+
+    def io(self) -> Any:
+        return self._client.io()
+
+    def apply_callback(self, callback: Callable[[Any], Any], response: Any) -> Any:
+        return self._client.apply_callback(callback, response)
+
+    def send(self, request: Tuple[str, str, Dict[str, Any]]) -> Any:
+        lookup, request = _prepare(request)
+        if lookup is None:
+            return self._client.send(request)
+        if lookup.cached_response is not None:
+            return lookup.cached_response
+        return lookup.cache._complete(lookup, self._client.send(request))
+
+
+class AsyncCachingClientAdapter(CachingClientAdapter):
+    """A :class:`CachingClientAdapter` for adapters whose ``send`` is a coroutine."""
+
+    async def send(self, request: Tuple[str, str, Dict[str, Any]]) -> Any:
+        lookup, request = _prepare(request)
+        if lookup is None:
+            return await self._client.send(request)
+        if lookup.cached_response is not None:
+            return lookup.cached_response
+        return lookup.cache._complete(lookup, await self._client.send(request))
+
+    async def apply_callback(
+        self, callback: Callable[[Any], Any], response: Any
+    ) -> Any:
+        return await self._client.apply_callback(callback, response)
+
+
+def _prepare(
+    request: Tuple[str, str, Dict[str, Any]]
+) -> Tuple[Optional[_CacheLookup], Tuple[str, str, Dict[str, Any]]]:
+    """Remove the cache lookup from a request, and add the headers that revalidate a
+    stale response.
+    """
+    method, url, extras = request
+    lookup = extras.get(_LOOKUP_KEY)
+    if lookup is None:
+        return None, request
+    extras = {k: v for k, v in extras.items() if k != _LOOKUP_KEY}
+    conditional_headers = lookup.get_conditional_headers()
+    if conditional_headers:
+        extras["headers"] = dict(extras.get("headers") or {}, **conditional_headers)
+    return lookup, (method, url, extras)
+
+
+class ResponseCacheHook(TransactionHook):
+    """Answers GET requests from the :class:`ResponseCache` of an
+    :class:`HttpConfiguration`, and discards cached responses that other requests may
+    modify.
+
+    Requests are answered by a :class:`CachingClientAdapter`, which the client must
+    send its requests through.
+    """
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._cache = configuration.response_cache
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        if self._cache is not None:
+            request_builder.add_request_template(
+                _ResponseCacheTemplate(self._cache, request_builder)
+            )
@@ -0,0 +1,88 @@
+"""Retries uplink requests according to the :class:`RetryPolicy` of an :class:`HttpConfiguration`."""
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+from nisystemlink.clients import core
+from requests import Response
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.decorators import MethodAnnotation
+from uplink.hooks import TransactionHook
+
+_IDEMPOTENT_CONTEXT_KEY = "nisystemlink.idempotent"
+
+
+class Idempotent(MethodAnnotation):
+    """Declares that sending a request more than once has the same effect as sending it once.
+
+    Such requests are retried after failures that may have occurred after the server
+    started processing them.
+    """
+
+    def modify_request(self, request_builder: Any) -> None:
+        request_builder.context[_IDEMPOTENT_CONTEXT_KEY] = True
+
+
+class _RetryTemplate(RequestTemplate):
+    def __init__(self, policy: core.RetryPolicy, request_builder: Any) -> None:
+        self._state = policy._start()
+        # Populated by Idempotent annotations after this template is created
+        self._context = request_builder.context  # type: Dict[str, Any]
+        self._file_positions = None  # type: Optional[Dict[str, int]]
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> None:
+        files = request[2].get("files")
+        if not files:
+            return
+        # Rewind uploaded files so that retries send the whole file again
+        if self._file_positions is None:
+            self._file_positions = {
+                name: file.tell()
+                for name, file in files.items()
+                if hasattr(file, "seek") and hasattr(file, "tell")
+            }
+        else:
+            for name, position in self._file_positions.items():
+                files[name].seek(position)
+
+    def after_response(
+        self, request: Tuple[str, str, Dict[str, Any]], response: Any
+    ) -> Optional[Any]:
+        delay = self._state.get_delay_after_response(
+            request[0],
+            self._context.get(_IDEMPOTENT_CONTEXT_KEY),
+            response.status_code,
+            response.headers.get("Retry-After"),
+        )
+        if delay is None:
+            return None
+        if isinstance(response, Response):
+            # Release the connection while waiting
+            response.close()
+        return transitions.sleep(delay)
+
+    def after_exception(
+        self,
+        request: Tuple[str, str, Dict[str, Any]],
+        exc_type: Type[BaseException],
+        exc_val: BaseException,
+        exc_tb: Any,
+    ) -> Optional[Any]:
+        delay = self._state.get_delay_after_error(
+            request[0], self._context.get(_IDEMPOTENT_CONTEXT_KEY), exc_val
+        )
+        if delay is None:
+            return None
+        return transitions.sleep(delay)
+
+
+class RetryHook(TransactionHook):
+    """Retries failed requests according to the :class:`RetryPolicy` of an :class:`HttpConfiguration`."""
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._policy = configuration.retry_policy
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        if self._policy.max_attempts > 1:
+            request_builder.add_request_template(
+                _RetryTemplate(self._policy, request_builder)
+            )
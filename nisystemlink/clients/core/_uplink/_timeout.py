@@ -0,0 +1,39 @@
+"""Applies the configured timeouts and the current deadline to uplink requests."""
+
+from typing import Any, Dict, Optional, Tuple
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._deadline import _get_request_timeout
+from uplink.clients.io import RequestTemplate
+from uplink.hooks import TransactionHook
+
+
+class _TimeoutTemplate(RequestTemplate):
+    def __init__(self, connect_timeout_ms: int, read_timeout_ms: int) -> None:
+        self._connect_timeout_ms = connect_timeout_ms
+        self._read_timeout_ms = read_timeout_ms
+
+    def before_request(self, request: Tuple[str, str, Dict[str, Any]]) -> Optional[Any]:
+        # Runs before every attempt, so retries only get the time that's left
+        _, _, extras = request
+        extras["timeout"] = _get_request_timeout(
+            self._connect_timeout_ms, self._read_timeout_ms
+        )
+        return None
+
+
+class TimeoutHook(TransactionHook):
+    """Sets the connect and read timeouts of each request from an :class:`HttpConfiguration`.
+
+    The timeouts are shortened to fit within the current :class:`Deadline`, and
+    requests raise :class:`TimeoutError` without being sent once it has expired.
+    """
+
+    def __init__(self, configuration: core.HttpConfiguration) -> None:
+        self._connect_timeout_ms = configuration.connect_timeout_milliseconds
+        self._read_timeout_ms = configuration.timeout_milliseconds
+
+    def audit_request(self, consumer: Any, request_builder: Any) -> None:
+        request_builder.add_request_template(
+            _TimeoutTemplate(self._connect_timeout_ms, self._read_timeout_ms)
+        )
@@ -1,3 +1,24 @@
-from ._iterator_file_like import IteratorFileLike
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._iterator_file_like import IteratorFileLike
+    from ._json_array_stream import AsyncJsonArrayStream, JsonArrayStream
+    from ._paginator import AsyncPaginator, Paginator
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._iterator_file_like": ["IteratorFileLike"],
+        "._json_array_stream": ["AsyncJsonArrayStream", "JsonArrayStream"],
+        "._paginator": ["AsyncPaginator", "Paginator"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
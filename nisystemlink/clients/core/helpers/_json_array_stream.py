@@ -0,0 +1,185 @@
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Type,
+)
+
+from nisystemlink.clients.core._streaming_json import _JsonArrayParser
+from typing_extensions import Literal
+
+_NOT_FINISHED = object()
+
+
+class JsonArrayStream:
+    """An iterator over the items of an array in a JSON response, which decodes each
+    item as soon as it has been received rather than after receiving the whole response.
+
+    Only the item being received is kept in memory, so the memory used by a response
+    with many items, such as a large page of table rows, doesn't grow with its size.
+    The rest of the response is available from :attr:`remainder` once every item has
+    been read. Close the stream (or use it in a ``with`` statement) to release the
+    connection if the items aren't all read.
+
+    Example::
+
+        with client.stream_table_data(table_id, query) as rows:
+            for row in rows:
+                ...
+            continuation_token = rows.remainder["continuationToken"]
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        path: Sequence[str] = (),
+        close: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            chunks: The chunks of the JSON document, as they're received.
+            path: The keys of the nested objects that contain the array, or an empty
+                sequence if the document is the array.
+            close: A function to call to release the source of ``chunks`` once they've
+                all been read, or the stream is closed.
+        """
+        self._chunks = iter(chunks)
+        self._parser = _JsonArrayParser(path)
+        self._items = iter(())  # type: Iterator[Any]
+        self._remainder = _NOT_FINISHED  # type: Any
+        self._close = close
+
+    @property
+    def remainder(self) -> Any:  # noqa: D401
+        """The JSON document without the items of the array, which is left empty. If
+        the value at the path isn't an array, such as when it's ``null``, it's left as
+        it was.
+
+        Raises:
+            RuntimeError: if the items haven't all been read.
+        """
+        if self._remainder is _NOT_FINISHED:
+            raise RuntimeError("The items of the array haven't all been read.")
+        return self._remainder
+
+    def close(self) -> None:
+        """Release the source of the stream, without reading the rest of the items."""
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+    def __iter__(self) -> "JsonArrayStream":
+        return self
+
+    def __next__(self) -> Any:
+        for item in self._items:
+            return item
+        for chunk in self._chunks:
+            self._items = iter(self._parser.feed(chunk))
+            for item in self._items:
+                return item
+        if self._remainder is _NOT_FINISHED:
+            try:
+                self._remainder = self._parser.close()
+            finally:
+                self.close()
+        raise StopIteration
+
+    def __enter__(self) -> "JsonArrayStream":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
+
+
+class AsyncJsonArrayStream:
+    """An asynchronous iterator over the items of an array in a JSON response, which
+    decodes each item as soon as it has been received rather than after receiving the
+    whole response.
+
+    This is the asyncio counterpart of :class:`JsonArrayStream`. Close it with
+    :meth:`aclose()`, or use it in an ``async with`` statement.
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterable[bytes],
+        path: Sequence[str] = (),
+        close: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            chunks: The chunks of the JSON document, as they're received.
+            path: The keys of the nested objects that contain the array, or an empty
+                sequence if the document is the array.
+            close: A coroutine function to call to release the source of ``chunks``
+                once they've all been read, or the stream is closed.
+        """
+        self._chunks = chunks.__aiter__()
+        self._parser = _JsonArrayParser(path)
+        self._items = iter(())  # type: Iterator[Any]
+        self._remainder = _NOT_FINISHED  # type: Any
+        self._close = close
+
+    @property
+    def remainder(self) -> Any:  # noqa: D401
+        """The JSON document without the items of the array, which is left empty. If
+        the value at the path isn't an array, such as when it's ``null``, it's left as
+        it was.
+
+        Raises:
+            RuntimeError: if the items haven't all been read.
+        """
+        if self._remainder is _NOT_FINISHED:
+            raise RuntimeError("The items of the array haven't all been read.")
+        return self._remainder
+
+    async def aclose(self) -> None:
+        """Release the source of the stream, without reading the rest of the items."""
+        close, self._close = self._close, None
+        if close is not None:
+            await close()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        for item in self._items:
+            return item
+        async for chunk in self._chunks:
+            self._items = iter(self._parser.feed(chunk))
+            for item in self._items:
+                return item
+        if self._remainder is _NOT_FINISHED:
+            try:
+                self._remainder = self._parser.close()
+            finally:
+                await self.aclose()
+        raise StopAsyncIteration
+
+    async def __aenter__(self) -> "AsyncJsonArrayStream":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        await self.aclose()
+        return False
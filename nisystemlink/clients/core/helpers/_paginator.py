@@ -0,0 +1,318 @@
+import asyncio
+import collections
+import contextvars
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+
+TPage = TypeVar("TPage", bound=WithPaging)
+TItem = TypeVar("TItem")
+
+# Kinds of the entries passed from the prefetching worker to the caller
+_PAGE = "page"
+_ERROR = "error"
+_DONE = "done"
+
+
+class _PageFetcher(Generic[TPage]):
+    """Decides which page to fetch next, and when to stop."""
+
+    def __init__(
+        self,
+        get_items: Callable[[TPage], Sequence[Any]],
+        continuation_token: Optional[str],
+        max_items: Optional[int],
+    ) -> None:
+        self._get_items = get_items
+        self._max_items = max_items
+        self.continuation_token = continuation_token
+        self.items_fetched = 0
+        self.done = max_items is not None and max_items <= 0
+
+    def page_fetched(self, page: TPage) -> None:
+        self.items_fetched += len(self._get_items(page))
+        self.continuation_token = page.continuation_token
+        if not self.continuation_token or (
+            self._max_items is not None and self.items_fetched >= self._max_items
+        ):
+            self.done = True
+
+
+class Paginator(Generic[TPage, TItem]):
+    """Iterates over the items or pages of an API that returns results in pages with a
+    continuation token, fetching each page while the caller processes the one before.
+
+    Pages are fetched on a background thread, up to ``prefetch`` pages ahead of the
+    caller, so that the caller doesn't wait for a round trip to the server between
+    pages. The thread runs in a copy of the caller's context, so :class:`Deadline` and
+    :class:`TrustedDecode` blocks apply to the requests it makes. Stopping iteration
+    early, by reaching ``max_items`` or by leaving a ``for`` loop, stops fetching pages.
+
+    Example::
+
+        rows = Paginator(
+            lambda token: client.get_table_data(
+                table_id, take=10000, continuation_token=token
+            ),
+            lambda page: page.frame.data,
+        )
+        for row in rows:
+            ...
+
+    For APIs that take a request body, set the token on the request::
+
+        def query(token):
+            request.continuation_token = token
+            return client.query_tables(request)
+
+        for table in Paginator(query, lambda page: page.tables, max_items=5000):
+            ...
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[str]], TPage],
+        get_items: Callable[[TPage], Sequence[TItem]],
+        *,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        continuation_token: Optional[str] = None
+    ) -> None:
+        """Initialize a paginator. No pages are fetched until iteration starts.
+
+        Args:
+            fetch_page: A function that fetches the page for a continuation token, or
+                the first page for None.
+            get_items: A function that gets the items in a page.
+            prefetch: The maximum number of pages to fetch ahead of the caller, which
+                bounds the memory used by pages that haven't been processed. Zero
+                fetches each page on the calling thread when it's needed.
+            max_items: The maximum number of items to iterate over, or None to iterate
+                over all of them.
+            continuation_token: The token from which to resume a previous query, or
+                None to start from the first page.
+
+        Raises:
+            ValueError: if ``prefetch`` is negative.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        self._fetch_page = fetch_page
+        self._get_items = get_items
+        self._prefetch = prefetch
+        self._max_items = max_items
+        self._continuation_token = continuation_token
+
+    def __iter__(self) -> Iterator[TItem]:
+        """Iterate over the items of every page, up to ``max_items`` of them."""
+        remaining = self._max_items
+        for page in self.pages():
+            items = self._get_items(page)
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            yield from items
+
+    def pages(self) -> Iterator[TPage]:
+        """Iterate over the pages, stopping after the page that contains the last of
+        ``max_items`` items.
+        """
+        fetcher = _PageFetcher(
+            self._get_items, self._continuation_token, self._max_items
+        )  # type: _PageFetcher[TPage]
+        if self._prefetch == 0:
+            while not fetcher.done:
+                page = self._fetch_page(fetcher.continuation_token)
+                fetcher.page_fetched(page)
+                yield page
+            return
+
+        worker = _PrefetchWorker(self._fetch_page, fetcher, self._prefetch)
+        worker.start()
+        try:
+            while True:
+                kind, value = worker.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise value
+                yield value
+        finally:
+            worker.stop()
+
+
+class _PrefetchWorker(Generic[TPage]):
+    """Fetches pages on a background thread into a bounded buffer."""
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[str]], TPage],
+        fetcher: _PageFetcher[TPage],
+        depth: int,
+    ) -> None:
+        self._fetch_page = fetch_page
+        self._fetcher = fetcher
+        self._depth = depth
+        self._entries = collections.deque()  # type: Deque[Tuple[str, Any]]
+        self._condition = threading.Condition()
+        self._stopped = False
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=context.run, args=(self._run,), daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._entries.clear()
+            self._condition.notify_all()
+
+    def get(self) -> Tuple[str, Any]:
+        with self._condition:
+            while not self._entries:
+                self._condition.wait()
+            entry = self._entries.popleft()
+            self._condition.notify_all()
+            return entry
+
+    def _put(self, kind: str, value: Any) -> bool:
+        with self._condition:
+            while len(self._entries) >= self._depth and not self._stopped:
+                self._condition.wait()
+            if self._stopped:
+                return False
+            self._entries.append((kind, value))
+            self._condition.notify_all()
+            return True
+
+    def _run(self) -> None:
+        fetcher = self._fetcher
+        try:
+            while not fetcher.done:
+                page = self._fetch_page(fetcher.continuation_token)
+                fetcher.page_fetched(page)
+                if not self._put(_PAGE, page):
+                    return
+        except BaseException as ex:
+            self._put(_ERROR, ex)
+        else:
+            self._put(_DONE, None)
+
+
+class AsyncPaginator(Generic[TPage, TItem]):
+    """Iterates over the items or pages of an asyncio API that returns results in pages
+    with a continuation token, fetching each page while the caller processes the one
+    before.
+
+    Pages are fetched by a task on the running event loop, up to ``prefetch`` pages
+    ahead of the caller. See :class:`Paginator`.
+
+    Example::
+
+        async for table in AsyncPaginator(
+            lambda token: client.list_tables(take=1000, continuation_token=token),
+            lambda page: page.tables,
+        ):
+            ...
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[Optional[str]], Awaitable[TPage]],
+        get_items: Callable[[TPage], Sequence[TItem]],
+        *,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        continuation_token: Optional[str] = None
+    ) -> None:
+        """Initialize a paginator. No pages are fetched until iteration starts.
+
+        Args:
+            fetch_page: A coroutine function that fetches the page for a continuation
+                token, or the first page for None.
+            get_items: A function that gets the items in a page.
+            prefetch: The maximum number of pages to fetch ahead of the caller. Zero
+                fetches each page when it's needed.
+            max_items: The maximum number of items to iterate over, or None to iterate
+                over all of them.
+            continuation_token: The token from which to resume a previous query, or
+                None to start from the first page.
+
+        Raises:
+            ValueError: if ``prefetch`` is negative.
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        self._fetch_page = fetch_page
+        self._get_items = get_items
+        self._prefetch = prefetch
+        self._max_items = max_items
+        self._continuation_token = continuation_token
+
+    async def __aiter__(self) -> AsyncIterator[TItem]:
+        """Iterate over the items of every page, up to ``max_items`` of them."""
+        remaining = self._max_items
+        async for page in self.pages():
+            items = self._get_items(page)
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            for item in items:
+                yield item
+
+    async def pages(self) -> AsyncIterator[TPage]:
+        """Iterate over the pages, stopping after the page that contains the last of
+        ``max_items`` items.
+        """
+        fetcher = _PageFetcher(
+            self._get_items, self._continuation_token, self._max_items
+        )  # type: _PageFetcher[TPage]
+        if self._prefetch == 0:
+            while not fetcher.done:
+                page = await self._fetch_page(fetcher.continuation_token)
+                fetcher.page_fetched(page)
+                yield page
+            return
+
+        queue = asyncio.Queue(
+            maxsize=self._prefetch
+        )  # type: asyncio.Queue[Tuple[str, Any]]
+
+        async def prefetch() -> None:
+            try:
+                while not fetcher.done:
+                    page = await self._fetch_page(fetcher.continuation_token)
+                    fetcher.page_fetched(page)
+                    await queue.put((_PAGE, page))
+            except Exception as ex:
+                await queue.put((_ERROR, ex))
+            else:
+                await queue.put((_DONE, None))
+
+        task = asyncio.ensure_future(prefetch())
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise value
+                yield value
+        finally:
+            task.cancel()
@@ -1,3 +1,22 @@
-from ._data_frame_client import DataFrameClient
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+    from ._async_data_frame_client import AsyncDataFrameClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._data_frame_client": ["DataFrameClient"],
+        "._async_data_frame_client": ["AsyncDataFrameClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -4,14 +4,18 @@ from typing import List, Optional
 
 from nisystemlink.clients import core
 from nisystemlink.clients.core._uplink._base_client import BaseClient
+from nisystemlink.clients.core._uplink._json_array_stream import (
+    json_array_stream_handler,
+)
 from nisystemlink.clients.core._uplink._methods import (
     delete,
     get,
     patch,
     post,
     response_handler,
+    stream,
 )
-from nisystemlink.clients.core.helpers import IteratorFileLike
+from nisystemlink.clients.core.helpers import IteratorFileLike, JsonArrayStream
 from requests.models import Response
 from uplink import Body, Field, Path, Query
 
@@ -103,7 +107,7 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @post("query-tables")
+    @post("query-tables", idempotent=True)
     def query_tables(self, query: models.QueryTablesRequest) -> models.PagedTables:
         """Queries available tables on the SystemLink DataFrame service and returns their metadata.
 
@@ -257,7 +261,7 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @post("tables/{id}/query-data", args=[Path, Body])
+    @post("tables/{id}/query-data", args=[Path, Body], idempotent=True)
     def query_table_data(
         self, id: str, query: models.QueryTableDataRequest
     ) -> models.PagedTableRows:
@@ -276,7 +280,35 @@ class DataFrameClient(BaseClient):
         """
         ...
 
-    @post("tables/{id}/query-decimated-data", args=[Path, Body])
+    @stream()
+    @response_handler(json_array_stream_handler("frame", "data"))
+    @post("tables/{id}/query-data", args=[Path, Body], idempotent=True)
+    def stream_table_data(
+        self, id: str, query: models.QueryTableDataRequest
+    ) -> JsonArrayStream:
+        """Reads rows of data that match a filter from the table identified by its ID,
+        decoding each row as soon as it has been received.
+
+        Unlike :meth:`query_table_data`, the rows of a page aren't all held in memory
+        at once, which suits pages of many rows or large values.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+
+        Returns:
+            An iterator over the rows. Once every row has been read, its ``remainder``
+            holds the rest of the response, including the columns of the frame,
+            ``totalRowCount`` and ``continuationToken``. Close it, or use it in a
+            ``with`` statement, to stop reading the rows early.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        ...
+
+    @post("tables/{id}/query-decimated-data", args=[Path, Body], idempotent=True)
     def query_decimated_data(
         self, id: str, query: models.QueryDecimatedDataRequest
     ) -> models.TableRows:
@@ -299,7 +331,7 @@ class DataFrameClient(BaseClient):
         return IteratorFileLike(response.iter_content(chunk_size=4096))
 
     @response_handler(_iter_content_filelike_wrapper)
-    @post("tables/{id}/export-data", args=[Path, Body])
+    @post("tables/{id}/export-data", args=[Path, Body], idempotent=True)
     def export_table_data(
         self, id: str, query: models.ExportTableDataRequest
     ) -> IteratorFileLike:
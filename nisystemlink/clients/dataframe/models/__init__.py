@@ -1,31 +1,74 @@
-from ._append_table_data_request import AppendTableDataRequest
-from ._api_info import ApiInfo, Operation, OperationsV1
-from ._create_table_request import CreateTableRequest
-from ._column import Column
-from ._column_filter import FilterOperation, ColumnFilter
-from ._column_order_by import ColumnOrderBy
-from ._column_type import ColumnType
-from ._data_frame import DataFrame
-from ._data_type import DataType
-from ._delete_tables_partial_success import DeleteTablesPartialSuccess
-from ._export_table_data_request import ExportTableDataRequest, ExportFormat
-from ._modify_tables_partial_success import ModifyTablesPartialSuccess
-from ._modify_table_request import ColumnMetadataPatch, ModifyTableRequest
-from ._modify_tables_request import ModifyTablesRequest, TableMetadataModification
-from ._order_by import OrderBy
-from ._paged_tables import PagedTables
-from ._paged_table_rows import PagedTableRows
-from ._query_decimated_data_request import (
-    DecimationMethod,
-    DecimationOptions,
-    QueryDecimatedDataRequest,
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._append_table_data_request import AppendTableDataRequest
+    from ._api_info import ApiInfo, Operation, OperationsV1
+    from ._create_table_request import CreateTableRequest
+    from ._column import Column
+    from ._column_filter import FilterOperation, ColumnFilter
+    from ._column_order_by import ColumnOrderBy
+    from ._column_type import ColumnType
+    from ._data_frame import DataFrame
+    from ._data_type import DataType
+    from ._delete_tables_partial_success import DeleteTablesPartialSuccess
+    from ._export_table_data_request import ExportTableDataRequest, ExportFormat
+    from ._modify_tables_partial_success import ModifyTablesPartialSuccess
+    from ._modify_table_request import ColumnMetadataPatch, ModifyTableRequest
+    from ._modify_tables_request import ModifyTablesRequest, TableMetadataModification
+    from ._order_by import OrderBy
+    from ._paged_tables import PagedTables
+    from ._paged_table_rows import PagedTableRows
+    from ._query_decimated_data_request import (
+        DecimationMethod,
+        DecimationOptions,
+        QueryDecimatedDataRequest,
+    )
+    from ._query_table_data_request import QueryTableDataRequest
+    from ._query_tables_request import QueryTablesRequest
+    from ._table_metadata import TableMetadata
+    from ._table_rows import TableRows
+
+    # Alias to provide backwards compatibility for misnamed class, fixed in 1.0.2
+    TableMetdataModification = TableMetadataModification
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._append_table_data_request": ["AppendTableDataRequest"],
+        "._api_info": ["ApiInfo", "Operation", "OperationsV1"],
+        "._create_table_request": ["CreateTableRequest"],
+        "._column": ["Column"],
+        "._column_filter": ["FilterOperation", "ColumnFilter"],
+        "._column_order_by": ["ColumnOrderBy"],
+        "._column_type": ["ColumnType"],
+        "._data_frame": ["DataFrame"],
+        "._data_type": ["DataType"],
+        "._delete_tables_partial_success": ["DeleteTablesPartialSuccess"],
+        "._export_table_data_request": ["ExportTableDataRequest", "ExportFormat"],
+        "._modify_tables_partial_success": ["ModifyTablesPartialSuccess"],
+        "._modify_table_request": ["ColumnMetadataPatch", "ModifyTableRequest"],
+        "._modify_tables_request": ["ModifyTablesRequest", "TableMetadataModification"],
+        "._order_by": ["OrderBy"],
+        "._paged_tables": ["PagedTables"],
+        "._paged_table_rows": ["PagedTableRows"],
+        "._query_decimated_data_request": [
+            "DecimationMethod",
+            "DecimationOptions",
+            "QueryDecimatedDataRequest",
+        ],
+        "._query_table_data_request": ["QueryTableDataRequest"],
+        "._query_tables_request": ["QueryTablesRequest"],
+        "._table_metadata": ["TableMetadata"],
+        "._table_rows": ["TableRows"],
+    },
+    aliases={"TableMetdataModification": "TableMetadataModification"},
 )
-from ._query_table_data_request import QueryTableDataRequest
-from ._query_tables_request import QueryTablesRequest
-from ._table_metadata import TableMetadata
-from ._table_rows import TableRows
+__all__ = _exports.names
 
-# Alias to provide backwards compatibility for misnamed class, fixed in 1.0.2
-TableMetdataModification = TableMetadataModification
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -1,3 +1,22 @@
-from ._file_client import FileClient
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._file_client import FileClient
+    from ._async_file_client import AsyncFileClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._file_client": ["FileClient"],
+        "._async_file_client": ["AsyncFileClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -16,7 +16,7 @@ from nisystemlink.clients.core._uplink._methods import (
 )
 from nisystemlink.clients.core.helpers import IteratorFileLike
 from requests.models import Response
-from uplink import Body, Field, params, Part, Path, Query, retry
+from uplink import Body, Field, params, Part, Path, Query
 
 from . import models
 
@@ -30,7 +30,6 @@ def _file_uri_response_handler(response: Response) -> str:
     return parts[-1]
 
 
-@retry(when=retry.when.status(429), stop=retry.stop.after_attempt(5))
 class FileClient(BaseClient):
     def __init__(self, configuration: Optional[core.HttpConfiguration] = None):
         """Initialize an instance.
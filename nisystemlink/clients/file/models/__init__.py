@@ -1,8 +1,30 @@
-from ._file_metadata import FileMetadata
-from ._file_query_order_by import FileQueryOrderBy
-from ._file_query_response import FileQueryResponse
-from ._link import Link
-from ._operations import V1Operations
-from ._update_metadata import UpdateMetadataRequest
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._file_metadata import FileMetadata
+    from ._file_query_order_by import FileQueryOrderBy
+    from ._file_query_response import FileQueryResponse
+    from ._link import Link
+    from ._operations import V1Operations
+    from ._update_metadata import UpdateMetadataRequest
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._file_metadata": ["FileMetadata"],
+        "._file_query_order_by": ["FileQueryOrderBy"],
+        "._file_query_response": ["FileQueryResponse"],
+        "._link": ["Link"],
+        "._operations": ["V1Operations"],
+        "._update_metadata": ["UpdateMetadataRequest"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
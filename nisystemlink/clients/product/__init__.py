@@ -1,3 +1,22 @@
-from ._product_client import ProductClient
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._product_client import ProductClient
+    from ._async_product_client import AsyncProductClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._product_client": ["ProductClient"],
+        "._async_product_client": ["AsyncProductClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
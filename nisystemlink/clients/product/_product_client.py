@@ -88,7 +88,7 @@ class ProductClient(BaseClient):
         """
         ...
 
-    @post("query-products")
+    @post("query-products", idempotent=True)
     def query_products_paged(
         self, query: models.QueryProductsRequest
     ) -> models.PagedProducts:
@@ -108,7 +108,7 @@ class ProductClient(BaseClient):
         ...
 
     @returns.json  # type: ignore
-    @post("query-product-values")
+    @post("query-product-values", idempotent=True)
     def query_product_values(
         self, query: models.QueryProductValuesRequest
     ) -> List[str]:
@@ -1,11 +1,36 @@
-from ._product import Product
-from ._create_products_partial_success import CreateProductsPartialSuccess
-from ._delete_products_partial_success import DeleteProductsPartialSuccess
-from ._paged_products import PagedProducts
-from ._query_products_request import (
-    QueryProductsRequest,
-    ProductField,
-    QueryProductValuesRequest,
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._product import Product
+    from ._create_products_partial_success import CreateProductsPartialSuccess
+    from ._delete_products_partial_success import DeleteProductsPartialSuccess
+    from ._paged_products import PagedProducts
+    from ._query_products_request import (
+        QueryProductsRequest,
+        ProductField,
+        QueryProductValuesRequest,
+    )
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._product": ["Product"],
+        "._create_products_partial_success": ["CreateProductsPartialSuccess"],
+        "._delete_products_partial_success": ["DeleteProductsPartialSuccess"],
+        "._paged_products": ["PagedProducts"],
+        "._query_products_request": [
+            "QueryProductsRequest",
+            "ProductField",
+            "QueryProductValuesRequest",
+        ],
+    },
 )
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -1,3 +1,20 @@
-from ._file_utilities import get_products_linked_to_file
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._file_utilities import get_products_linked_to_file
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._file_utilities": ["get_products_linked_to_file"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
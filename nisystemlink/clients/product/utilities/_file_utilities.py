@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Optional
 
+from nisystemlink.clients.core.helpers import Paginator
 from nisystemlink.clients.product._product_client import ProductClient
 from nisystemlink.clients.product.models._paged_products import PagedProducts
 from nisystemlink.clients.product.models._product import Product
@@ -21,10 +22,15 @@ def get_products_linked_to_file(client: ProductClient, file_id: str) -> List[Pro
     query_request = QueryProductsRequest(
         filter=f'fileIds.Contains("{file_id}")', take=100
     )
-    response: PagedProducts = client.query_products_paged(query_request)
-    products = response.products
-    while response.continuation_token:
-        query_request.continuation_token = response.continuation_token
-        response = client.query_products_paged(query_request)
-        products.extend(response.products)
-    return products
+
+    def query(continuation_token: Optional[str]) -> PagedProducts:
+        # Leave the field unset for the first page, so that it isn't sent as null
+        if continuation_token is not None:
+            query_request.continuation_token = continuation_token
+        return client.query_products_paged(query_request)
+
+    return list(Paginator(query, _get_products))
+
+
+def _get_products(page: PagedProducts) -> List[Product]:
+    return page.products
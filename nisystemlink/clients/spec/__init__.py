@@ -1,3 +1,22 @@
-from ._spec_client import SpecClient
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._spec_client import SpecClient
+    from ._async_spec_client import AsyncSpecClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._spec_client": ["SpecClient"],
+        "._async_spec_client": ["AsyncSpecClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
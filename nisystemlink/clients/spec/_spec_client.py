@@ -77,7 +77,7 @@ class SpecClient(BaseClient):
         """
         ...
 
-    @post("query-specs")
+    @post("query-specs", idempotent=True)
     def query_specs(
         self, query: models.QuerySpecificationsRequest
     ) -> models.QuerySpecifications:
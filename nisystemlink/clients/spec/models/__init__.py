@@ -1,33 +1,80 @@
-from ._api_info import Operation, V1Operations
-from ._condition import (
-    Condition,
-    ConditionRange,
-    ConditionType,
-    NumericConditionValue,
-    StringConditionValue,
-)
-from ._create_specs_request import (
-    CreatedSpecification,
-    CreateSpecificationsPartialSuccess,
-    CreateSpecificationsRequest,
-)
-from ._delete_specs_request import DeleteSpecificationsPartialSuccess
-from ._query_specs import QuerySpecificationsRequest, QuerySpecifications
-from ._specification import (
-    Specification,
-    SpecificationCreation,
-    SpecificationDefinition,
-    SpecificationLimit,
-    SpecificationServerManaged,
-    SpecificationType,
-    SpecificationUpdated,
-    SpecificationUserManaged,
-    SpecificationWithHistory,
-)
-from ._update_specs_request import (
-    UpdatedSpecification,
-    UpdateSpecificationsPartialSuccess,
-    UpdateSpecificationsRequest,
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._api_info import Operation, V1Operations
+    from ._condition import (
+        Condition,
+        ConditionRange,
+        ConditionType,
+        NumericConditionValue,
+        StringConditionValue,
+    )
+    from ._create_specs_request import (
+        CreatedSpecification,
+        CreateSpecificationsPartialSuccess,
+        CreateSpecificationsRequest,
+    )
+    from ._delete_specs_request import DeleteSpecificationsPartialSuccess
+    from ._query_specs import QuerySpecificationsRequest, QuerySpecifications
+    from ._specification import (
+        Specification,
+        SpecificationCreation,
+        SpecificationDefinition,
+        SpecificationLimit,
+        SpecificationServerManaged,
+        SpecificationType,
+        SpecificationUpdated,
+        SpecificationUserManaged,
+        SpecificationWithHistory,
+    )
+    from ._update_specs_request import (
+        UpdatedSpecification,
+        UpdateSpecificationsPartialSuccess,
+        UpdateSpecificationsRequest,
+    )
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._api_info": ["Operation", "V1Operations"],
+        "._condition": [
+            "Condition",
+            "ConditionRange",
+            "ConditionType",
+            "NumericConditionValue",
+            "StringConditionValue",
+        ],
+        "._create_specs_request": [
+            "CreatedSpecification",
+            "CreateSpecificationsPartialSuccess",
+            "CreateSpecificationsRequest",
+        ],
+        "._delete_specs_request": ["DeleteSpecificationsPartialSuccess"],
+        "._query_specs": ["QuerySpecificationsRequest", "QuerySpecifications"],
+        "._specification": [
+            "Specification",
+            "SpecificationCreation",
+            "SpecificationDefinition",
+            "SpecificationLimit",
+            "SpecificationServerManaged",
+            "SpecificationType",
+            "SpecificationUpdated",
+            "SpecificationUserManaged",
+            "SpecificationWithHistory",
+        ],
+        "._update_specs_request": [
+            "UpdatedSpecification",
+            "UpdateSpecificationsPartialSuccess",
+            "UpdateSpecificationsRequest",
+        ],
+    },
 )
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
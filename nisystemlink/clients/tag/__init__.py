@@ -1,21 +1,64 @@
 # -*- coding: utf-8 -*-
 
-from ._data_type import DataType
-from ._retention_type import RetentionType
-from ._tag_data import TagData
-from ._tag_with_aggregates import TagWithAggregates
-from ._async_tag_query_result_collection import AsyncTagQueryResultCollection
-from ._itag_reader import ITagReader
-from ._itag_writer import ITagWriter
-from ._buffered_tag_writer import BufferedTagWriter
-from ._tag_value_reader import TagValueReader
-from ._tag_value_writer import TagValueWriter
-from ._tag_update_fields import TagUpdateFields
-from ._tag_data_update import TagDataUpdate
-from ._tag_path_utilities import TagPathUtilities
-from ._tag_query_result_collection import TagQueryResultCollection
-from ._tag_subscription import TagSubscription
-from ._tag_selection import TagSelection
-from ._tag_manager import TagManager
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._data_type import DataType
+    from ._retention_type import RetentionType
+    from ._tag_data import TagData
+    from ._tag_with_aggregates import TagWithAggregates
+    from ._async_tag_query_result_collection import AsyncTagQueryResultCollection
+    from ._itag_reader import ITagReader
+    from ._itag_writer import ITagWriter
+    from ._buffered_tag_writer import BufferedTagWriter
+    from ._tag_value_reader import TagValueReader
+    from ._tag_value_writer import TagValueWriter
+    from ._tag_update_fields import TagUpdateFields
+    from ._tag_data_update import TagDataUpdate
+    from ._tag_path_utilities import TagPathUtilities
+    from ._tag_query_result_collection import TagQueryResultCollection
+    from ._adaptive_update_interval import AdaptiveUpdateInterval
+    from ._dispatch_overflow import DispatchOverflow
+    from ._queued_dispatch import QueuedDispatch
+    from ._tag_subscription import TagSubscription
+    from ._threaded_tag_subscription import ThreadedTagSubscription
+    from ._async_tag_subscription import AsyncTagSubscription
+    from ._tag_selection import TagSelection
+    from ._tag_manager import TagManager
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._data_type": ["DataType"],
+        "._retention_type": ["RetentionType"],
+        "._tag_data": ["TagData"],
+        "._tag_with_aggregates": ["TagWithAggregates"],
+        "._async_tag_query_result_collection": ["AsyncTagQueryResultCollection"],
+        "._itag_reader": ["ITagReader"],
+        "._itag_writer": ["ITagWriter"],
+        "._buffered_tag_writer": ["BufferedTagWriter"],
+        "._tag_value_reader": ["TagValueReader"],
+        "._tag_value_writer": ["TagValueWriter"],
+        "._tag_update_fields": ["TagUpdateFields"],
+        "._tag_data_update": ["TagDataUpdate"],
+        "._tag_path_utilities": ["TagPathUtilities"],
+        "._tag_query_result_collection": ["TagQueryResultCollection"],
+        "._adaptive_update_interval": ["AdaptiveUpdateInterval"],
+        "._dispatch_overflow": ["DispatchOverflow"],
+        "._queued_dispatch": ["QueuedDispatch"],
+        "._tag_subscription": ["TagSubscription"],
+        "._threaded_tag_subscription": ["ThreadedTagSubscription"],
+        "._async_tag_subscription": ["AsyncTagSubscription"],
+        "._tag_selection": ["TagSelection"],
+        "._tag_manager": ["TagManager"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of AdaptiveUpdateInterval."""
+
+import datetime
+
+
+class AdaptiveUpdateInterval:
+    """Configures a :class:`TagSubscription` to poll the server for updates at an
+    interval that adapts to how often its tags change.
+
+    Polling starts at :attr:`minimum`. Each poll that receives updates divides the
+    interval by :attr:`factor`, down to :attr:`minimum`. Each poll that receives no
+    updates, or fails, multiplies the interval by :attr:`factor`, up to
+    :attr:`maximum`. So busy tags are seen promptly, and quiet tags don't cost a request
+    every :attr:`minimum`.
+
+    Example::
+
+        subscription = selection.create_subscription(
+            update_interval=AdaptiveUpdateInterval(
+                datetime.timedelta(milliseconds=500), datetime.timedelta(seconds=30)
+            )
+        )
+    """
+
+    def __init__(
+        self,
+        minimum: datetime.timedelta,
+        maximum: datetime.timedelta,
+        factor: float = 2.0,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            minimum: The shortest interval between polls.
+            maximum: The longest interval between polls.
+            factor: How much to lengthen the interval after a poll receives no updates,
+                or to shorten it after a poll receives updates.
+
+        Raises:
+            ValueError: if ``minimum`` isn't positive, ``maximum`` is less than
+                ``minimum``, or ``factor`` isn't greater than 1.
+        """
+        if minimum.total_seconds() <= 0:
+            raise ValueError("minimum must be positive")
+        if maximum < minimum:
+            raise ValueError("maximum cannot be less than minimum")
+        if not factor > 1:
+            raise ValueError("factor must be greater than 1")
+        self._minimum = minimum
+        self._maximum = maximum
+        self._factor = factor
+
+    @property
+    def minimum(self) -> datetime.timedelta:  # noqa: D401
+        """The shortest interval between polls."""
+        return self._minimum
+
+    @property
+    def maximum(self) -> datetime.timedelta:  # noqa: D401
+        """The longest interval between polls."""
+        return self._maximum
+
+    @property
+    def factor(self) -> float:  # noqa: D401
+        """How much the interval is lengthened after a poll receives no updates, or
+        shortened after a poll receives updates.
+        """
+        return self._factor
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AdaptiveUpdateInterval):
+            return NotImplemented
+        return (self._minimum, self._maximum, self._factor) == (
+            other._minimum,
+            other._maximum,
+            other._factor,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._minimum, self._maximum, self._factor))
+
+    def __repr__(self) -> str:
+        return "AdaptiveUpdateInterval(minimum={!r}, maximum={!r}, factor={!r})".format(
+            self._minimum, self._maximum, self._factor
+        )
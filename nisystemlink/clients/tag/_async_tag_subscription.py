@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of AsyncTagSubscription."""
+
+import abc
+import asyncio
+import datetime
+import traceback
+from typing import Iterable, List, Optional, Tuple, Union
+
+from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.tag._core._pending_changes import _PendingChanges
+from nisystemlink.clients.tag._core._polling_schedule import _PollingSchedule
+
+_TagChange = Tuple["tbase.TagData", Optional["tbase.TagValueReader"]]
+
+
+class AsyncTagSubscription(tbase.TagSubscription):
+    """Represents a subscription for changes to one or more tags' values that runs on an
+    asyncio event loop.
+
+    Updates are queried and heartbeats are sent by tasks on the event loop that created
+    the subscription, rather than by threads, and the :attr:`tag_changed` event is
+    raised on that loop. Each change can also be received by iterating over the
+    subscription with ``async for``, which stops once the subscription is closed.
+    Changes are kept until they're read, up to the limit of the subscription's
+    :class:`QueuedDispatch`, which also picks the changes that are dropped or coalesced
+    when they aren't read quickly enough.
+
+    Use :meth:`close_async()` (or the ``async with`` statement) to close the
+    subscription, which cancels its tasks and waits for the subscription to be deleted
+    from the server. :meth:`close()` may be called from any thread, and deletes the
+    subscription from the server in the background.
+
+    Example::
+
+        async with await selection.create_subscription_async() as subscription:
+            async for tag, reader in subscription:
+                print("{} changed".format(tag.path))
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        update_interval: Union[datetime.timedelta, "tbase.AdaptiveUpdateInterval"],
+        heartbeat_interval: Optional[datetime.timedelta] = None,
+        dispatch: Optional["tbase.QueuedDispatch"] = None,
+    ) -> None:
+        """Initialize the instance.
+
+        Derived types must call :meth:`_initialize_async()` after construction, on the
+        event loop that will run the subscription.
+
+        Args:
+            paths: The tag path queries to include in the subscription.
+            update_interval: How often to query the server for updates, or an
+                :class:`AdaptiveUpdateInterval` to adapt how often to query to how often
+                the tags change.
+            heartbeat_interval: How often to send a heartbeat to keep the subscription
+                alive, or None to use the default interval.
+            dispatch: How to bound and coalesce the changes that are kept until they're
+                iterated over, or None to keep up to 1000 changes, dropping the oldest.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+        """
+        # The event is raised on the event loop, rather than queued for worker threads
+        super().__init__(paths)
+        self._polling = _PollingSchedule(update_interval)
+        if heartbeat_interval is not None:
+            self._heartbeat_interval = heartbeat_interval.total_seconds()
+        else:
+            self._heartbeat_interval = self._HEARTBEAT_INTERVAL_MILLISECONDS / 1000
+        self._changes = _PendingChanges(
+            dispatch if dispatch is not None else tbase.QueuedDispatch(coalesce=False)
+        )
+        # Set when a change is kept, or when the subscription is closed
+        self._changed = asyncio.Event()
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._tasks = []  # type: List[asyncio.Future[None]]
+        self._closing = None  # type: Optional[asyncio.Future[None]]
+        self._error = None  # type: Optional[BaseException]
+
+    @property
+    def update_interval(self) -> datetime.timedelta:  # noqa: D401
+        """The interval until the subscription next queries the server for updates."""
+        return self._polling.interval
+
+    @property
+    def empty_poll_ratio(self) -> float:  # noqa: D401
+        """The share of the subscription's recent queries for updates, from 0 to 1,
+        that received no updates or failed.
+        """
+        return self._polling.empty_poll_ratio
+
+    @property
+    def dropped_update_count(self) -> int:  # noqa: D401
+        """The number of changes that were dropped because too many changes were
+        waiting to be iterated over.
+        """
+        return self._changes.dropped_count
+
+    @property
+    def coalesced_update_count(self) -> int:  # noqa: D401
+        """The number of changes that replaced a change to the same tag that was
+        waiting to be iterated over.
+        """
+        return self._changes.coalesced_count
+
+    async def _initialize_async(self) -> None:
+        """Asynchronously create the subscription and start the tasks that query for
+        updates and keep the subscription alive.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        self._loop = asyncio.get_event_loop()
+        try:
+            await self._create_subscription_on_server_async(self._paths)
+        except BaseException:
+            # Don't leave behind a subscription that was created before the failure or
+            # cancellation
+            await self._close_internal_async()
+            raise
+        for coroutine in (self._poll_for_updates(), self._send_heartbeats()):
+            task = asyncio.ensure_future(coroutine)
+            task.add_done_callback(self._task_done)
+            self._tasks.append(task)
+
+    @abc.abstractmethod
+    async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
+        """Asynchronously create the subscription on the server.
+
+        Implementations should retrieve and throw away the first set of updates before
+        returning.
+
+        Args:
+            paths: The tag path queries to include in the subscription.
+
+        Returns:
+            A task representing the asynchronous operation.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def _query_updates_async(self) -> int:
+        """Asynchronously query the server for updates, and call
+        :meth:`_on_tag_changed()` for each changed tag.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            number of changed tags.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def _send_heartbeat_async(self) -> None:
+        """Asynchronously send a heartbeat for the subscription to keep it active.
+
+        Returns:
+            A task representing the asynchronous operation.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def _close_internal_async(self) -> None:
+        """Asynchronously clean up server resources associated with the subscription.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        ...
+
+    async def _poll_for_updates(self) -> None:
+        while True:
+            await asyncio.sleep(self._polling.interval.total_seconds())
+            update_count = 0
+            try:
+                update_count = await self._query_updates_async()
+            except core.ApiException:
+                # Ignore, we'll try again later
+                pass
+            except Exception:
+                # The server may be unreachable for a while; keep polling
+                traceback.print_exc()
+            self._polling.record(update_count)
+
+    async def _send_heartbeats(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                await self._send_heartbeat_async()
+            except core.ApiException:
+                try:
+                    await self._create_subscription_on_server_async(self._paths)
+                except core.ApiException:
+                    # Ignore, we'll try again later
+                    pass
+                except Exception:
+                    traceback.print_exc()
+            except Exception:
+                traceback.print_exc()
+
+    def _task_done(self, task: "asyncio.Future[None]") -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+
+        # Don't keep the other task running, or the subscription alive on the server,
+        # once either task has stopped
+        if self._error is None:
+            self._error = task.exception()
+        self._closed = True
+        self._begin_close()
+
+    def _begin_close(self) -> "asyncio.Future[None]":
+        if self._closing is None:
+            for task in self._tasks:
+                task.cancel()
+            self._closing = asyncio.ensure_future(self._finish_close())
+            self._changed.set()
+        return self._closing
+
+    async def _finish_close(self) -> None:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._close_internal_async()
+
+    def _on_tag_changed(
+        self, tag: tbase.TagData, value: Optional[tbase.TagValueReader]
+    ) -> None:
+        """Raise the :attr:`tag_changed` event, and keep the change for iteration.
+
+        Args:
+            tag: The tag that was changed.
+            value: The new value and any associated information, or None if the tag has
+                an unknown data type.
+        """
+        super()._on_tag_changed(tag, value)
+        if not self._closed:
+            self._changes.add(tag, value)
+            self._changed.set()
+
+    def close(self) -> None:
+        """Close the subscription, cancel its tasks, and delete it from the server in
+        the background on its event loop.
+
+        May be called from any thread. Further tag writes will not trigger new events.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        if self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._begin_close)
+        except RuntimeError:
+            # The event loop is closed, so the tasks aren't running, and the server
+            # expires the subscription once it stops receiving heartbeats
+            pass
+
+    async def close_async(self) -> None:
+        """Asynchronously close server resources associated with the subscription, and
+        cancel its tasks.
+
+        Further tag writes will not trigger new events.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        self._closed = True
+        if self._loop is not None:
+            await self._begin_close()
+
+    def __aiter__(self) -> "AsyncTagSubscription":
+        return self
+
+    async def __anext__(self) -> _TagChange:
+        """Wait for the next change to one of the subscription's tags.
+
+        Returns:
+            The tag that was changed, and its new value and any associated information,
+            or None if the tag has an unknown data type.
+
+        Raises:
+            StopAsyncIteration: if the subscription has been closed, and every change
+                kept before then has been read.
+        """
+        while True:
+            if self._changes:
+                return self._changes.pop()
+            if self._closed:
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            self._changed.clear()
+            await self._changed.wait()
+
+    async def __aenter__(self) -> "AsyncTagSubscription":
+        return self
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of _DispatchQueue."""
+
+import threading
+import traceback
+from typing import Callable, Optional
+
+from nisystemlink.clients import tag as tbase
+
+from ._pending_changes import _PendingChanges
+from ._worker_pool import _WorkerPool
+
+_workers = _WorkerPool("TagSubscription dispatch")
+
+
+class _DispatchQueue:
+    """Queues the changes to a subscription's tags, and passes them to a handler on
+    the shared worker pool, one at a time and in order.
+
+    Each worker runs one change before moving on, so that a subscription with a slow
+    handler or many changes doesn't keep the workers from the others.
+    """
+
+    def __init__(
+        self,
+        dispatch: "tbase.QueuedDispatch",
+        handler: Callable[["tbase.TagData", Optional["tbase.TagValueReader"]], None],
+    ) -> None:
+        self._handler = handler
+        self._lock = threading.Lock()
+        self._pending = _PendingChanges(dispatch)
+        self._running = False
+        self._closed = False
+
+    @property
+    def dropped_count(self) -> int:
+        """The number of changes dropped because the queue was full."""  # noqa: D401
+        return self._pending.dropped_count
+
+    @property
+    def coalesced_count(self) -> int:
+        """The number of changes replaced by a later change to the same tag."""  # noqa: D401
+        return self._pending.coalesced_count
+
+    def put(
+        self, tag: "tbase.TagData", reader: Optional["tbase.TagValueReader"]
+    ) -> None:
+        """Queue a change, to be passed to the handler on a worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.add(tag, reader)
+            if self._running:
+                return
+            self._running = True
+        _workers.submit(self._run_next)
+
+    def close(self) -> None:
+        """Drop the queued changes, and don't queue any more.
+
+        A change that was taken from the queue before this was called is still passed to
+        the handler, so the handler may be running, or about to run, when this returns.
+        It isn't called for any other change.
+        """
+        with self._lock:
+            self._closed = True
+            self._pending.clear()
+
+    def _run_next(self) -> None:
+        with self._lock:
+            if self._closed or not self._pending:
+                self._running = False
+                return
+            tag, reader = self._pending.pop()
+        try:
+            self._handler(tag, reader)
+        except Exception:
+            traceback.print_exc()
+        _workers.submit(self._run_next)
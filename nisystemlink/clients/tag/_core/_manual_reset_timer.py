@@ -3,10 +3,8 @@
 """Implementation of ManualResetTimer."""
 
 import datetime
-import threading
-import traceback
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Type
+from typing import Any, Optional, Type
 
 import events
 from nisystemlink.clients.core._internal._classproperty_support import (
@@ -14,12 +12,21 @@ from nisystemlink.clients.core._internal._classproperty_support import (
 )
 from typing_extensions import final, Literal
 
+from ._timer_scheduler import _ScheduledTimer, _scheduler
+
 
 @final
 class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
     """Represents a timer for periodic background operations such that :meth:`start()`
     must be called to restart the timer each time the :attr:`elapsed` event is raised.
 
+    Every timer is counted down by one scheduler thread, and :attr:`elapsed` is raised
+    on a small pool of threads shared by all timers, so a process can have many
+    timers without a thread for each. The pool grows when every thread in it is
+    blocked, so that slow handlers don't hold up the other timers. Handlers of
+    :attr:`elapsed` are never called for the same timer on more than one thread at
+    once.
+
     Attributes:
         elapsed: An event that is triggered when the timer has elapsed.
 
@@ -51,8 +58,7 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
             obj = cls.__new__(ManualResetTimer)
             super(ManualResetTimer, obj).__init__()  # but call the base constructor
 
-            obj._thread = None
-            obj._running = []  # used as mutable boolean; empty is False
+            obj._timer = None
 
             cls.__null_timer_impl = obj
         return cls.__null_timer_impl
@@ -73,22 +79,9 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
         if interval_secs <= 0:
             raise ValueError("interval cannot be <= 0")
 
-        # Note: This _running flag means that the *thread* is running, not the timer
-        self._running = [None]  # used as mutable boolean; non-empty is True
-        self._timer_start = threading.Event()
-        self._timer_cancel = threading.Event()
-        self._thread = threading.Thread(
-            target=self._run,
-            args=[
-                self._running,
-                interval_secs,
-                self._timer_start,
-                self._timer_cancel,
-                self.elapsed,
-            ],
-        )  # type: Optional[threading.Thread]
-        self._thread.daemon = True
-        self._thread.start()
+        self._timer = _ScheduledTimer(
+            interval_secs, self.elapsed
+        )  # type: Optional[_ScheduledTimer]
 
     @property
     def can_start(self) -> bool:  # noqa: D401
@@ -97,35 +90,41 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
         A timer that isn't configured will never raise :attr:`elapsed`, even when
         :meth:`start()` is called.
         """
-        return self._thread is not None
+        return self._timer is not None
+
+    @property
+    def interval(self) -> Optional[datetime.timedelta]:  # noqa: D401
+        """The amount of time after calling :meth:`start()` before :attr:`elapsed` is
+        raised, or None if the timer isn't configured.
+
+        Setting the interval takes effect the next time the timer is started, and has
+        no effect on a timer that isn't configured.
+
+        Raises:
+            ValueError: if set to a value less than or equal to zero.
+        """
+        if self._timer is None:
+            return None
+        return datetime.timedelta(seconds=self._timer.interval)
+
+    @interval.setter
+    def interval(self, value: Optional[datetime.timedelta]) -> None:
+        if value is None or value.total_seconds() <= 0:
+            raise ValueError("interval cannot be <= 0")
+        if self._timer is not None:
+            self._timer.interval = value.total_seconds()
 
     def start(self) -> None:
-        """Start the timer."""
-        if self._running:
-            self._timer_cancel.clear()
-            self._timer_start.set()
+        """Start the timer. Has no effect if the timer has already been started and
+        hasn't elapsed yet.
+        """
+        if self._timer is not None:
+            _scheduler.start(self._timer)
 
     def stop(self) -> None:
         """Stop the timer."""
-        if self._running:
-            self._timer_cancel.set()
-
-    @staticmethod
-    def _run(
-        running: List[None],
-        interval: int,
-        timer_start: threading.Event,
-        timer_cancel: threading.Event,
-        elapsed: Callable[[], None],
-    ) -> None:
-        while running:
-            timer_start.wait()
-            timer_start.clear()
-            if running and not timer_cancel.wait(interval):
-                try:
-                    elapsed()
-                except Exception:
-                    traceback.print_exc()
+        if self._timer is not None:
+            _scheduler.stop(self._timer)
 
     def __enter__(self) -> "ManualResetTimer":
         return self
@@ -160,13 +159,6 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
         for handler in list(self.elapsed):
             self.elapsed -= handler
 
-        # Stop the thread
-        if self._running:
-            self._running.clear()  # set our "mutable boolean" to False
-            self._thread = None
-            self._timer_cancel.set()
-            self._timer_start.set()
-
     # Work around https://github.com/pyeve/events/issues/17
     def __getattr__(self, name: str) -> Any:
         if name in self.__events__:
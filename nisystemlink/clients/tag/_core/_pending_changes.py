@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of _PendingChanges."""
+
+import collections
+import itertools
+from typing import Hashable, Optional, Tuple
+
+from nisystemlink.clients import tag as tbase
+
+_Change = Tuple["tbase.TagData", Optional["tbase.TagValueReader"]]
+
+
+class _PendingChanges:
+    """The changes to a subscription's tags that are waiting to be delivered, in order,
+    bounded and coalesced as configured by a :class:`QueuedDispatch`.
+
+    Not thread-safe; callers that share an instance between threads must lock it.
+    """
+
+    def __init__(self, dispatch: "tbase.QueuedDispatch") -> None:
+        self._dispatch = dispatch
+        self._changes = (
+            collections.OrderedDict()
+        )  # type: collections.OrderedDict[Hashable, _Change]
+        self._sequence = itertools.count()
+        self.dropped_count = 0
+        self.coalesced_count = 0
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def add(
+        self, tag: "tbase.TagData", reader: Optional["tbase.TagValueReader"]
+    ) -> None:
+        """Add a change, replacing a pending change to the same tag when coalescing,
+        and applying the overflow policy when full.
+        """
+        dispatch = self._dispatch
+        key = tag.path if dispatch.coalesce else next(self._sequence)  # type: Hashable
+        if key in self._changes:
+            # The latest value wins, keeping the place of the change it replaces
+            self._changes[key] = (tag, reader)
+            self.coalesced_count += 1
+            return
+        if len(self._changes) >= dispatch.max_pending:
+            self.dropped_count += 1
+            if dispatch.overflow == tbase.DispatchOverflow.DROP_NEWEST:
+                return
+            self._changes.popitem(last=False)
+        self._changes[key] = (tag, reader)
+
+    def pop(self) -> _Change:
+        """Remove and return the oldest change.
+
+        Raises:
+            KeyError: if there are no pending changes.
+        """
+        return self._changes.popitem(last=False)[1]
+
+    def clear(self) -> None:
+        """Drop every pending change."""
+        self._changes.clear()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of _PollingSchedule."""
+
+import collections
+import datetime
+from typing import Deque, Optional, Union
+
+from nisystemlink.clients import tag as tbase
+
+# The number of most recent polls that the empty poll ratio is computed over
+_RECENT_POLLS = 100
+
+
+class _PollingSchedule:
+    """Tracks the results of a subscription's polls for updates, and picks the
+    interval until its next poll.
+
+    Only the thread or task that polls should record results, but the properties may be
+    read from anywhere.
+    """
+
+    def __init__(
+        self, interval: Union[datetime.timedelta, "tbase.AdaptiveUpdateInterval"]
+    ) -> None:
+        if isinstance(interval, datetime.timedelta):
+            self._adaptive = None  # type: Optional[tbase.AdaptiveUpdateInterval]
+            self._interval = interval
+        else:
+            self._adaptive = interval
+            self._interval = interval.minimum
+        self._recent = collections.deque(maxlen=_RECENT_POLLS)  # type: Deque[bool]
+        self._recent_empty = 0
+
+    @property
+    def interval(self) -> datetime.timedelta:  # noqa: D401
+        """The interval until the next poll."""
+        return self._interval
+
+    @property
+    def empty_poll_ratio(self) -> float:  # noqa: D401
+        """The share of the recent polls, from 0 to 1, that received no updates or
+        failed, or 0 if there haven't been any polls.
+        """
+        recent = len(self._recent)
+        return self._recent_empty / recent if recent else 0.0
+
+    def record(self, update_count: int) -> bool:
+        """Record the result of a poll.
+
+        Args:
+            update_count: The number of updates received, or 0 if the poll failed.
+
+        Returns:
+            Whether :attr:`interval` changed.
+        """
+        empty = update_count == 0
+        if len(self._recent) == self._recent.maxlen and self._recent[0]:
+            self._recent_empty -= 1
+        self._recent.append(empty)
+        self._recent_empty += empty
+
+        adaptive = self._adaptive
+        if adaptive is None:
+            return False
+        if empty:
+            interval = min(self._interval * adaptive.factor, adaptive.maximum)
+        else:
+            interval = max(self._interval / adaptive.factor, adaptive.minimum)
+        changed = interval != self._interval
+        self._interval = interval
+        return changed
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the scheduler shared by every ManualResetTimer."""
+
+import functools
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from typing import Callable, List, Optional, Tuple
+
+from ._worker_pool import _WorkerPool
+
+
+class _ScheduledTimer:
+    """The state of one timer. Its fields are guarded by the lock of the scheduler."""
+
+    __slots__ = ("interval", "elapsed", "generation", "scheduled", "running", "again")
+
+    def __init__(self, interval: float, elapsed: Callable[[], None]) -> None:
+        self.interval = interval
+        self.elapsed = elapsed
+        # Incremented to cancel the entries of the timer that are already in the heap
+        self.generation = 0
+        self.scheduled = False
+        self.running = False
+        # Whether the timer elapsed again while its elapsed event was being run
+        self.again = False
+
+
+class _TimerScheduler:
+    """Counts down every started timer on one thread, and runs their elapsed events on
+    a shared pool of worker threads.
+
+    The elapsed event of a timer is never run on more than one thread at once. If the
+    timer elapses again while its event is being run, the event is run again once it
+    returns.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._heap = []  # type: List[Tuple[float, int, _ScheduledTimer, int]]
+        self._sequence = itertools.count()
+        self._thread = None  # type: Optional[threading.Thread]
+        self._workers = _WorkerPool("ManualResetTimer worker")
+
+    def start(self, timer: _ScheduledTimer) -> None:
+        """Start counting down a timer, unless it's already counting down."""
+        with self._condition:
+            if timer.scheduled:
+                return
+            timer.scheduled = True
+            timer.generation += 1
+            entry = (
+                time.monotonic() + timer.interval,
+                next(self._sequence),
+                timer,
+                timer.generation,
+            )
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ManualResetTimer scheduler", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0] is entry:
+                # The scheduler is waiting for a later deadline
+                self._condition.notify()
+
+    def stop(self, timer: _ScheduledTimer) -> None:
+        """Stop counting down a timer, and don't run its elapsed event again."""
+        with self._condition:
+            timer.scheduled = False
+            timer.again = False
+            timer.generation += 1
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, timer, generation = heapq.heappop(self._heap)
+                    if generation != timer.generation:
+                        continue  # stopped
+                    timer.scheduled = False
+                    if timer.running:
+                        timer.again = True
+                    else:
+                        timer.running = True
+                        self._workers.submit(functools.partial(self._fire, timer))
+                self._condition.wait(self._heap[0][0] - now if self._heap else None)
+
+    def _fire(self, timer: _ScheduledTimer) -> None:
+        while True:
+            try:
+                timer.elapsed()
+            except Exception:
+                traceback.print_exc()
+            with self._condition:
+                if not timer.again:
+                    timer.running = False
+                    return
+                timer.again = False
+
+
+_scheduler = _TimerScheduler()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of the worker thread pools shared by timers and subscriptions."""
+
+import queue
+import threading
+import time
+import traceback
+from typing import Callable, Dict
+
+# The most threads that run functions at once, unless they stall
+_MAX_WORKERS = 8
+# How long a worker thread waits for another function to run before exiting
+_WORKER_IDLE_SECONDS = 30.0
+# How long every worker must have been running the same function before another thread
+# is started, so that functions blocked on an unresponsive server don't hold up the others
+_WORKER_STALL_SECONDS = 1.0
+
+
+class _WorkerPool:
+    """Runs functions on daemon threads, which are started when they're needed and
+    exit once they've been idle for a while.
+
+    Up to ``max_workers`` threads are started for functions submitted while the others
+    are busy. Past that, functions wait for a thread to become free, unless every
+    thread has been running the same function for ``stall_seconds``, as when they are
+    all blocked on requests to an unresponsive server. Then another thread is started
+    for them, so that a few slow functions never hold up all the others.
+
+    Daemon threads are used, as the timers' own threads were, so that a function that's
+    blocked doesn't keep the interpreter from exiting.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = _MAX_WORKERS,
+        idle_seconds: float = _WORKER_IDLE_SECONDS,
+        stall_seconds: float = _WORKER_STALL_SECONDS,
+    ) -> None:
+        self._name = name
+        self._max_workers = max_workers
+        self._idle_seconds = idle_seconds
+        self._stall_seconds = stall_seconds
+        self._queue = queue.SimpleQueue()  # type: queue.SimpleQueue[Callable[[], None]]
+        self._idle = threading.Semaphore(0)
+        self._lock = threading.Lock()
+        self._workers = 0
+        # When each busy worker started running its function, by thread ID
+        self._busy_since = {}  # type: Dict[int, float]
+        self._watching = False
+
+    def submit(self, fn: Callable[[], None]) -> None:
+        self._queue.put(fn)
+        if self._idle.acquire(blocking=False):
+            return
+        with self._lock:
+            if self._workers < self._max_workers or self._stalled():
+                self._workers += 1
+                target = self._work
+            elif not self._watching:
+                self._watching = True
+                target = self._watch
+            else:
+                return
+        threading.Thread(target=target, name=self._name, daemon=True).start()
+
+    def _stalled(self) -> bool:
+        """Whether every worker has been busy for the stall time. Must be called with
+        the lock held.
+        """
+        if not self._busy_since or len(self._busy_since) < self._workers:
+            return False  # A worker is idle, or about to take the next function
+        latest = max(self._busy_since.values())
+        return time.monotonic() - latest >= self._stall_seconds
+
+    def _watch(self) -> None:
+        # Runs while functions wait for a thread, starting another worker each time
+        # every worker stalls
+        while True:
+            time.sleep(self._stall_seconds)
+            with self._lock:
+                if self._queue.empty():
+                    self._watching = False
+                    return
+                if not self._stalled():
+                    continue
+                self._workers += 1
+            threading.Thread(target=self._work, name=self._name, daemon=True).start()
+
+    def _work(self) -> None:
+        ident = threading.get_ident()
+        while True:
+            try:
+                fn = self._queue.get(timeout=self._idle_seconds)
+            except queue.Empty:
+                # Exit, unless a function was just submitted for this worker to run
+                if self._idle.acquire(blocking=False):
+                    with self._lock:
+                        self._workers -= 1
+                    return
+                continue
+            with self._lock:
+                self._busy_since[ident] = time.monotonic()
+            try:
+                fn()
+            except Exception:
+                # Keep the worker, which the pool still counts, for the next function
+                traceback.print_exc()
+            finally:
+                with self._lock:
+                    del self._busy_since[ident]
+            self._idle.release()
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of DispatchOverflow."""
+
+import enum
+
+
+class DispatchOverflow(enum.Enum):
+    """Represents what a :class:`QueuedDispatch` does with a tag change when its queue
+    is full.
+    """
+
+    DROP_OLDEST = 1
+    """Drop the change that has been queued the longest to make room for the new one."""
+
+    DROP_NEWEST = 2
+    """Drop the new change, leaving the queue as it was."""
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of AsyncHttpTagSubscription."""
+
+import datetime
+from typing import Iterable, List, Optional, Union
+
+from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._http._http_tag_subscription import (
+    _read_updates,
+    _UpdateInterval,
+    HttpTagSubscription,
+)
+from typing_extensions import final
+
+
+@final
+class AsyncHttpTagSubscription(tbase.AsyncTagSubscription):
+    __MAGIC = object()
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError(
+            "type 'AsyncHttpTagSubscription' is not an acceptable base type"
+        )
+
+    @classmethod
+    async def create_async(
+        cls,
+        client: HttpClient,
+        paths: Iterable[str],
+        update_interval: _UpdateInterval = None,
+        heartbeat_interval: Optional[datetime.timedelta] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> "AsyncHttpTagSubscription":
+        """Asynchronously create an :class:`AsyncHttpTagSubscription` on the running
+        event loop.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            paths: The tag path queries to include in the subscription.
+            update_interval: How often to poll for updates on the server, or an
+                :class:`AdaptiveUpdateInterval` to adapt how often to poll to how often
+                the tags change, or None to use the default interval.
+            heartbeat_interval: How often to send a heartbeat to keep the subscription
+                alive for testing purposes, or None to use the default interval.
+            dispatch: How to bound and coalesce the changes that are kept until they're
+                iterated over, or None to use the default.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            created subscription.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+            ApiException: if the API call fails.
+        """
+        if update_interval is None:
+            update_interval = datetime.timedelta(
+                milliseconds=HttpTagSubscription._DEFAULT_POLLING_INTERVAL_MILLISECONDS
+            )
+        subscription = AsyncHttpTagSubscription(
+            cls.__MAGIC, client, paths, update_interval, heartbeat_interval, dispatch
+        )
+        await subscription._initialize_async()
+        return subscription
+
+    def __init__(
+        self,
+        magic: object,
+        client: HttpClient,
+        paths: Iterable[str],
+        update_interval: Union[datetime.timedelta, tbase.AdaptiveUpdateInterval],
+        heartbeat_interval: Optional[datetime.timedelta] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> None:
+        assert (
+            magic is self.__MAGIC
+        ), "Do not construct an AsyncHttpTagSubscription directly. Use create_async() instead."
+        super().__init__(paths, update_interval, heartbeat_interval, dispatch)
+        self._api = client.at_uri("/nitag/v2/subscriptions")
+        self._token = None  # type: Optional[str]
+
+    async def _close_internal_async(self) -> None:
+        if self._token is None:
+            return
+
+        try:
+            await self._api.as_async.delete("/{id}", params={"id": self._token})
+            self._token = None
+        except core.ApiException:
+            pass
+
+    async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
+        response, http_response = await self._api.as_async.post(
+            "", data={"updatesOnly": True, "tags": paths}
+        )
+
+        if response is None or response.get("subscriptionId") is None:
+            raise tbase.TagManager.invalid_response(http_response)
+
+        token = response["subscriptionId"]
+
+        # Throw away the current values of every tag, which the subscription service
+        # sends first, so that only real changes are exposed.
+        try:
+            await self._api.as_async.get("/{id}/values/current", params={"id": token})
+        finally:
+            self._token = token
+
+    async def _send_heartbeat_async(self) -> None:
+        assert self._token is not None
+        await self._api.as_async.put("/{id}/heartbeat", params={"id": self._token})
+
+    async def _query_updates_async(self) -> int:
+        token = self._token
+        if token is None:
+            return 0
+
+        response, _ = await self._api.as_async.get(
+            "/{id}/values/current", params={"id": token}
+        )
+        update_count = 0
+        for tag, reader in _read_updates(response):
+            update_count += 1
+            self._on_tag_changed(tag, reader)
+        return update_count
@@ -3,16 +3,31 @@
 """Implementation of HttpTagSelection."""
 
 import datetime
-from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient, HttpResponse
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.core.helpers import AsyncJsonArrayStream, JsonArrayStream
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
-from nisystemlink.clients.tag._http._http_tag_subscription import HttpTagSubscription
+from nisystemlink.clients.tag._http._async_http_tag_subscription import (
+    AsyncHttpTagSubscription,
+)
+from nisystemlink.clients.tag._http._multiplexed_http_tag_subscription import (
+    MultiplexedHttpTagSubscription,
+)
 from typing_extensions import final
 
 
@@ -161,25 +176,27 @@ class HttpTagSelection(tbase.TagSelection):
             pass
 
     def _create_subscription_internal(
-        self, update_interval: Optional[datetime.timedelta] = None
+        self,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> tbase.TagSubscription:
-        update_timer = None  # type: Optional[ManualResetTimer]
-        if update_interval is not None:
-            update_timer = ManualResetTimer(update_interval)
         paths = set(self.paths).union(self.metadata.keys())
-        return HttpTagSubscription.create(
-            self._client, paths, update_timer, heartbeat_timer=None
+        return MultiplexedHttpTagSubscription.create(
+            self._client, paths, update_interval, dispatch
         )
 
     async def _create_subscription_internal_async(
-        self, update_interval: Optional[datetime.timedelta] = None
-    ) -> tbase.TagSubscription:
-        update_timer = None  # type: Optional[ManualResetTimer]
-        if update_interval is not None:
-            update_timer = ManualResetTimer(update_interval)
+        self,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> tbase.AsyncTagSubscription:
         paths = set(self.paths).union(self.metadata.keys())
-        return await HttpTagSubscription.create_async(
-            self._client, paths, update_timer, heartbeat_timer=None
+        return await AsyncHttpTagSubscription.create_async(
+            self._client, paths, update_interval, dispatch=dispatch
         )
 
     def _delete_tags_from_server_internal(self) -> None:
@@ -217,20 +234,32 @@ class HttpTagSelection(tbase.TagSelection):
         return [tbase.TagData.from_json_dict(t) for t in response]
 
     def _read_tag_values(self) -> List[Optional[SerializedTagWithAggregates]]:
-        def fn(token: str) -> Tuple[Any, HttpResponse]:
-            return self._api.get("/{id}/values", params={"id": token})
-
-        response, http_response = self._ensure_selection_and_call(fn)
-        return self._handle_read_tags_values(response, http_response)
+        # Stream the values, so they're decoded as they're received rather than after
+        # buffering a response that can hold thousands of them
+        def fn(token: str) -> Tuple[JsonArrayStream, HttpResponse]:
+            return self._api.stream_get("/{id}/values", params={"id": token})
+
+        values, http_response = self._ensure_selection_and_call(fn)
+        with values:
+            result = [self._handle_read_tag_value(t, http_response) for t in values]
+        if values.remainder is None:
+            raise tbase.TagManager.invalid_response(http_response)
+        return result
 
     async def _read_tag_values_async(
         self,
     ) -> List[Optional[SerializedTagWithAggregates]]:
-        def fn(token: str) -> Awaitable[Tuple[Any, HttpResponse]]:
-            return self._api.as_async.get("/{id}/values", params={"id": token})
-
-        response, http_response = await self._ensure_selection_and_call_async(fn)
-        return self._handle_read_tags_values(response, http_response)
+        def fn(token: str) -> Awaitable[Tuple[AsyncJsonArrayStream, HttpResponse]]:
+            return self._api.as_async.stream_get("/{id}/values", params={"id": token})
+
+        values, http_response = await self._ensure_selection_and_call_async(fn)
+        async with values:
+            result = [
+                self._handle_read_tag_value(t, http_response) async for t in values
+            ]
+        if values.remainder is None:
+            raise tbase.TagManager.invalid_response(http_response)
+        return result
 
     def _handle_read_tags_values(
         self,
@@ -238,48 +267,47 @@ class HttpTagSelection(tbase.TagSelection):
         http_response: HttpResponse,
         paths: Optional[List[str]] = None,
     ) -> List[Optional[SerializedTagWithAggregates]]:
-        if response is None or any(t is None for t in response):
+        if response is None:
             raise tbase.TagManager.invalid_response(http_response)
 
-        result = []  # type: List[Optional[SerializedTagWithAggregates]]
-        for i, t in enumerate(response):
-            path = paths[i] if paths else t.get("path")
-            if path is None:
-                raise tbase.TagManager.invalid_response(http_response)
+        return [
+            self._handle_read_tag_value(t, http_response, paths[i] if paths else None)
+            for i, t in enumerate(response)
+        ]
 
-            if not t.get("current"):
-                result.append(None)
-                continue
-
-            v = t["current"].get("value", {})
-            value = v.get("value")
-            data_type = v.get("type")
-            aggregates = t.get("aggregates") or {}
-            timestamp = None  # type: Optional[datetime.datetime]
-            if t["current"].get("timestamp"):
-                timestamp = TimestampUtilities.str_to_datetime(
-                    t["current"]["timestamp"]
-                )
-            if value is None or data_type is None:
-                raise tbase.TagManager.invalid_response(http_response)
+    def _handle_read_tag_value(
+        self, t: Any, http_response: HttpResponse, path: Optional[str] = None
+    ) -> Optional[SerializedTagWithAggregates]:
+        if t is None:
+            raise tbase.TagManager.invalid_response(http_response)
 
-            result.append(
-                SerializedTagWithAggregates(
-                    path,
-                    tbase.DataType.from_api_name(data_type),
-                    value,
-                    timestamp,
-                    aggregates.get("count"),
-                    aggregates.get("min"),
-                    aggregates.get("max"),
-                    (
-                        float(aggregates["avg"])
-                        if aggregates.get("avg") is not None
-                        else None
-                    ),
-                )
-            )
-        return result
+        path = path or t.get("path")
+        if path is None:
+            raise tbase.TagManager.invalid_response(http_response)
+
+        if not t.get("current"):
+            return None
+
+        v = t["current"].get("value", {})
+        value = v.get("value")
+        data_type = v.get("type")
+        aggregates = t.get("aggregates") or {}
+        timestamp = None  # type: Optional[datetime.datetime]
+        if t["current"].get("timestamp"):
+            timestamp = TimestampUtilities.str_to_datetime(t["current"]["timestamp"])
+        if value is None or data_type is None:
+            raise tbase.TagManager.invalid_response(http_response)
+
+        return SerializedTagWithAggregates(
+            path,
+            tbase.DataType.from_api_name(data_type),
+            value,
+            timestamp,
+            aggregates.get("count"),
+            aggregates.get("min"),
+            aggregates.get("max"),
+            float(aggregates["avg"]) if aggregates.get("avg") is not None else None,
+        )
 
     def _read_tag_metadata_and_values(
         self,
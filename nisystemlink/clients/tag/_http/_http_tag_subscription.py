@@ -4,12 +4,13 @@
 
 import datetime
 import weakref
-from typing import Iterable, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._core._polling_schedule import _PollingSchedule
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
@@ -18,9 +19,11 @@ from nisystemlink.clients.tag._core._serialized_tag_with_aggregates_reader impor
 )
 from typing_extensions import final
 
+_UpdateInterval = Union[datetime.timedelta, "tbase.AdaptiveUpdateInterval", None]
+
 
 @final
-class HttpTagSubscription(tbase.TagSubscription):
+class HttpTagSubscription(tbase.ThreadedTagSubscription):
     _DEFAULT_POLLING_INTERVAL_MILLISECONDS = 5000.0
 
     __MAGIC = object()
@@ -35,6 +38,8 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: Optional[ManualResetTimer] = None,
         heartbeat_timer: Optional[ManualResetTimer] = None,
+        update_interval: _UpdateInterval = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> "HttpTagSubscription":
         """Create an :class:`HttpTagSubscription` with a custom heartbeat timer for testing purposes.
 
@@ -45,6 +50,11 @@ class HttpTagSubscription(tbase.TagSubscription):
                 a default timer.
             heartbeat_timer: A timer for sending a heartbeat to keep the subscription
                 alive, or None to use a default timer.
+            update_interval: How often to poll for updates on the server, or an
+                :class:`AdaptiveUpdateInterval` to adapt how often to poll to how often
+                the tags change, or None to use the default interval.
+            dispatch: How to queue changes and raise :attr:`tag_changed` for them on
+                worker threads, or None to raise it on the thread that polls.
 
         Returns:
             The created subscription.
@@ -54,7 +64,13 @@ class HttpTagSubscription(tbase.TagSubscription):
             ApiException: if the API call fails.
         """
         subscription = HttpTagSubscription(
-            cls.__MAGIC, client, paths, update_timer, heartbeat_timer
+            cls.__MAGIC,
+            client,
+            paths,
+            update_timer,
+            heartbeat_timer,
+            update_interval,
+            dispatch,
         )
         subscription._initialize()
         return subscription
@@ -66,6 +82,8 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: Optional[ManualResetTimer] = None,
         heartbeat_timer: Optional[ManualResetTimer] = None,
+        update_interval: _UpdateInterval = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> "HttpTagSubscription":
         """Asynchronously create an :class:`HttpTagSubscription` with a custom heartbeat timer for testing purposes.
 
@@ -76,6 +94,11 @@ class HttpTagSubscription(tbase.TagSubscription):
                 a default timer.
             heartbeat_timer: A timer for sending a heartbeat to keep the subscription
                 alive, or None to use a default timer.
+            update_interval: How often to poll for updates on the server, or an
+                :class:`AdaptiveUpdateInterval` to adapt how often to poll to how often
+                the tags change, or None to use the default interval.
+            dispatch: How to queue changes and raise :attr:`tag_changed` for them on
+                worker threads, or None to raise it on the thread that polls.
 
         Returns:
             A task representing the asynchronous operation. On completion, contains the
@@ -86,7 +109,13 @@ class HttpTagSubscription(tbase.TagSubscription):
             ApiException: if the API call fails.
         """
         subscription = HttpTagSubscription(
-            cls.__MAGIC, client, paths, update_timer, heartbeat_timer
+            cls.__MAGIC,
+            client,
+            paths,
+            update_timer,
+            heartbeat_timer,
+            update_interval,
+            dispatch,
         )
         await subscription._initialize_async()
         return subscription
@@ -98,20 +127,23 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: Optional[ManualResetTimer] = None,
         heartbeat_timer: Optional[ManualResetTimer] = None,
+        update_interval: _UpdateInterval = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> None:
         assert (
             magic is self.__MAGIC
         ), "Do not construct an HttpTagSubscription directly. Use create() instead."
-        super().__init__(paths, heartbeat_timer)
+        super().__init__(paths, heartbeat_timer, dispatch)
         self._api = client.at_uri("/nitag/v2/subscriptions")
+        if update_interval is None:
+            update_interval = datetime.timedelta(
+                milliseconds=self._DEFAULT_POLLING_INTERVAL_MILLISECONDS
+            )
+        self._polling = _PollingSchedule(update_interval)
         if update_timer is not None:
             self._update_timer = update_timer
         else:
-            self._update_timer = ManualResetTimer(
-                datetime.timedelta(
-                    milliseconds=self._DEFAULT_POLLING_INTERVAL_MILLISECONDS
-                )
-            )
+            self._update_timer = ManualResetTimer(self._polling.interval)
             # _exit_stack is instantiated in the base class
             self._exit_stack.enter_context(self._update_timer)
 
@@ -126,6 +158,18 @@ class HttpTagSubscription(tbase.TagSubscription):
         self._update_timer.elapsed += self._update_timer_handler
         self._token = None  # type: Optional[str]
 
+    @property
+    def update_interval(self) -> datetime.timedelta:  # noqa: D401
+        """The interval until the subscription next polls the server for updates."""
+        return self._polling.interval
+
+    @property
+    def empty_poll_ratio(self) -> float:  # noqa: D401
+        """The share of the subscription's recent polls for updates, from 0 to 1, that
+        received no updates or failed.
+        """
+        return self._polling.empty_poll_ratio
+
     # Base class implementation is sufficient:
     #   def __enter__(self):
     #   async def __aenter__(self):
@@ -197,6 +241,7 @@ class HttpTagSubscription(tbase.TagSubscription):
         self._api.put("/{id}/heartbeat", params={"id": self._token})
 
     def _update_timer_elapsed(self) -> None:
+        update_count = 0
         try:
             token = self._token
             if token is None:
@@ -209,56 +254,76 @@ class HttpTagSubscription(tbase.TagSubscription):
             except core.ApiException:
                 return
 
-            if response is None:
-                return
-
-            subscriptions = response.get("subscriptionUpdates")
-            if subscriptions is None:
-                return
-
-            for subscription in subscriptions:
-                if subscription is None:
-                    continue
-
-                updates = subscription.get("updates")
-                if updates is None:
-                    continue
-
-                for update in updates:
-                    if update is None:
-                        continue
-
-                    tag = update.get("tag")
-                    timestamp = update.get("timestamp")
-                    if tag is None or timestamp is None:
-                        continue
-
-                    tag = tbase.TagData.from_json_dict(tag)
-                    try:
-                        tag.validate_path()
-                    except ValueError:
-                        continue
-                    aggregates = update.get("aggregates") or {}
-                    if tag.data_type == tbase.DataType.UNKNOWN:
-                        self._on_tag_changed(tag, None)
-                    else:
-                        value = SerializedTagWithAggregates(
-                            tag.path,
-                            tag.data_type,
-                            update.get("value"),
-                            TimestampUtilities.str_to_datetime(timestamp),
-                            aggregates.get("count"),
-                            aggregates.get("min"),
-                            aggregates.get("max"),
-                            (
-                                float(aggregates["avg"])
-                                if aggregates.get("avg") is not None
-                                else None
-                            ),
-                        )
-                        reader = tbase.TagValueReader(
-                            SerializedTagWithAggregatesReader(value), tag
-                        )  # type: tbase.TagValueReader
-                        self._on_tag_changed(tag, reader)
+            for tag, reader in _read_updates(response):
+                update_count += 1
+                self._on_tag_changed(tag, reader)
         finally:
+            if self._polling.record(update_count):
+                self._update_timer.interval = self._polling.interval
             self._update_timer.start()
+
+
+def _read_updates(
+    response: Any,
+) -> Iterator[Tuple[tbase.TagData, Optional[tbase.TagValueReader]]]:
+    """Read the changed tags from a response to a query for a subscription's updates,
+    skipping any updates that are invalid.
+
+    Args:
+        response: The response from the server.
+
+    Returns:
+        The changed tags, and their new values, or None for each tag with an unknown
+        data type.
+    """
+    if response is None:
+        return
+
+    subscriptions = response.get("subscriptionUpdates")
+    if subscriptions is None:
+        return
+
+    for subscription in subscriptions:
+        if subscription is None:
+            continue
+
+        updates = subscription.get("updates")
+        if updates is None:
+            continue
+
+        for update in updates:
+            if update is None:
+                continue
+
+            tag = update.get("tag")
+            timestamp = update.get("timestamp")
+            if tag is None or timestamp is None:
+                continue
+
+            tag = tbase.TagData.from_json_dict(tag)
+            try:
+                tag.validate_path()
+            except ValueError:
+                continue
+            aggregates = update.get("aggregates") or {}
+            if tag.data_type == tbase.DataType.UNKNOWN:
+                yield tag, None
+            else:
+                value = SerializedTagWithAggregates(
+                    tag.path,
+                    tag.data_type,
+                    update.get("value"),
+                    TimestampUtilities.str_to_datetime(timestamp),
+                    aggregates.get("count"),
+                    aggregates.get("min"),
+                    aggregates.get("max"),
+                    (
+                        float(aggregates["avg"])
+                        if aggregates.get("avg") is not None
+                        else None
+                    ),
+                )
+                reader = tbase.TagValueReader(
+                    SerializedTagWithAggregatesReader(value), tag
+                )  # type: tbase.TagValueReader
+                yield tag, reader
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of MultiplexedHttpTagSubscription."""
+
+import datetime
+from typing import Iterable, List, Optional
+
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._http._http_tag_subscription import _UpdateInterval
+from nisystemlink.clients.tag._http._tag_subscription_multiplexer import (
+    _Subscriber,
+    TagSubscriptionMultiplexer,
+)
+from typing_extensions import final
+
+
+@final
+class MultiplexedHttpTagSubscription(tbase.ThreadedTagSubscription):
+    """A subscription whose updates are polled, and whose heartbeats are sent, by the
+    :class:`TagSubscriptionMultiplexer` that it shares with the other subscriptions of
+    its HTTP client.
+
+    Its :attr:`tag_changed` event is always raised on worker threads, so that a slow
+    handler doesn't delay the polling, or the events of the other subscriptions.
+    """
+
+    __MAGIC = object()
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError(
+            "type 'MultiplexedHttpTagSubscription' is not an acceptable base type"
+        )
+
+    @classmethod
+    def create(
+        cls,
+        client: HttpClient,
+        paths: Iterable[str],
+        update_interval: _UpdateInterval = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> "MultiplexedHttpTagSubscription":
+        """Create a :class:`MultiplexedHttpTagSubscription`.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            paths: The tag path queries to include in the subscription.
+            update_interval: How often to poll for updates on the server, or an
+                :class:`AdaptiveUpdateInterval` to adapt how often to poll to how often
+                the tags change, or None to use the default interval.
+            dispatch: How to queue changes and raise :attr:`tag_changed` for them on
+                worker threads, or None to queue up to 1000 changes, dropping the
+                oldest.
+
+        Returns:
+            The created subscription.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+            ApiException: if the API call fails.
+        """
+        subscription = MultiplexedHttpTagSubscription(
+            cls.__MAGIC, client, paths, update_interval, dispatch
+        )
+        subscription._initialize()
+        return subscription
+
+    def __init__(
+        self,
+        magic: object,
+        client: HttpClient,
+        paths: Iterable[str],
+        update_interval: _UpdateInterval = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> None:
+        assert (
+            magic is self.__MAGIC
+        ), "Do not construct a MultiplexedHttpTagSubscription directly. Use create() instead."
+        # The multiplexer sends the heartbeats. Its polling thread is shared, so it
+        # only queues each change, rather than raising the event
+        super().__init__(
+            paths,
+            ManualResetTimer.null_timer,
+            dispatch if dispatch is not None else tbase.QueuedDispatch(coalesce=False),
+        )
+        self._client = client
+        self._update_interval = update_interval
+        self._multiplexer = None  # type: Optional[TagSubscriptionMultiplexer]
+        self._subscriber = None  # type: Optional[_Subscriber]
+
+    @property
+    def update_interval(self) -> Optional[datetime.timedelta]:  # noqa: D401
+        """The interval until the subscription next polls the server for updates."""
+        if self._multiplexer is None:
+            return None
+        return self._multiplexer.update_interval
+
+    @property
+    def empty_poll_ratio(self) -> Optional[float]:  # noqa: D401
+        """The share of the subscription's recent polls for updates, from 0 to 1, that
+        received no updates or failed.
+
+        Polls are shared with the other subscriptions of the HTTP client that have the
+        same update interval, so this includes polls that received updates only for
+        them.
+        """
+        if self._multiplexer is None:
+            return None
+        return self._multiplexer.empty_poll_ratio
+
+    def _create_subscription_on_server(self, paths: List[str]) -> None:
+        self._multiplexer, self._subscriber = TagSubscriptionMultiplexer.subscribe(
+            self._client, self, paths, self._update_interval
+        )
+
+    async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
+        raise NotImplementedError(
+            "A MultiplexedHttpTagSubscription must be created with create()"
+        )
+
+    def _send_heartbeat(self) -> None:
+        # The multiplexer sends the heartbeats
+        pass
+
+    def _detach(self) -> List[str]:
+        multiplexer, subscriber = self._multiplexer, self._subscriber
+        if multiplexer is None or subscriber is None:
+            return []
+        self._subscriber = None
+        return multiplexer.unsubscribe(subscriber)
+
+    def _close_internal(self) -> None:
+        tokens = self._detach()
+        if self._multiplexer is not None:
+            self._multiplexer.delete(tokens)
+            self._multiplexer.shrink()
+
+    async def _close_internal_async(self) -> None:
+        # The multiplexer shrinks its server subscription before its next poll, rather
+        # than blocking the event loop
+        tokens = self._detach()
+        if self._multiplexer is not None:
+            await self._multiplexer.delete_async(tokens)
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of TagSubscriptionMultiplexer."""
+
+import datetime
+import re
+import threading
+import traceback
+import weakref
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._core._polling_schedule import _PollingSchedule
+from nisystemlink.clients.tag._http._http_tag_subscription import (
+    _read_updates,
+    _UpdateInterval,
+    HttpTagSubscription,
+)
+
+if TYPE_CHECKING:
+    from nisystemlink.clients.tag._http._multiplexed_http_tag_subscription import (
+        MultiplexedHttpTagSubscription,
+    )
+
+# Guards the registry of multiplexers
+_lock = threading.Lock()
+_multiplexers = (
+    {}
+)  # type: Dict[Tuple[HttpClient, _UpdateInterval], TagSubscriptionMultiplexer]
+
+
+def _compile_query(query: str) -> Pattern[str]:
+    """Compile a tag path query, in which ``*`` matches any characters."""
+    return re.compile(".*".join(re.escape(part) for part in query.split("*")), re.S)
+
+
+class _PathQueries:
+    """A set of tag path queries, and the tag paths that they match."""
+
+    def __init__(self, queries: Iterable[str]) -> None:
+        self.queries = set(queries)
+        self.paths = {q for q in self.queries if "*" not in q}
+        self.patterns = [_compile_query(q) for q in self.queries if "*" in q]
+
+    def matches(self, path: str) -> bool:
+        """Whether a tag path, or a query without wildcards, matches the queries."""
+        return path in self.paths or any(p.fullmatch(path) for p in self.patterns)
+
+    def covers(self, query: str) -> bool:
+        """Whether the tags matched by a query are all matched by the queries."""
+        return query in self.queries or ("*" not in query and self.matches(query))
+
+
+class _ServerSubscription:
+    """A subscription on the server, and the tag path queries it includes."""
+
+    def __init__(self, queries: List[str], token: str) -> None:
+        self.queries = _PathQueries(queries)
+        self.token = token
+
+
+class _Subscriber:
+    """A subscription that receives the updates of a multiplexer, and the tag path
+    queries it includes.
+    """
+
+    def __init__(
+        self, subscription: "MultiplexedHttpTagSubscription", paths: Iterable[str]
+    ) -> None:
+        self.subscription = weakref.ref(subscription)
+        self.queries = _PathQueries(paths)
+
+
+class TagSubscriptionMultiplexer:
+    """Shares a subscription on the server, and the polling and heartbeats that keep
+    it up to date and alive, between every :class:`MultiplexedHttpTagSubscription` of
+    an HTTP client with the same update interval.
+
+    The server subscription includes the tag path queries of every subscriber. When a
+    subscriber's queries aren't all covered by it, a server subscription for the
+    combined queries replaces it, and when a subscriber leaves, a server subscription
+    for the remaining queries replaces it. Each poll queries the server subscription
+    once, and routes each update to the subscribers whose queries match the tag's
+    path, which queue it for their own worker thread dispatch.
+    """
+
+    @classmethod
+    def subscribe(
+        cls,
+        client: HttpClient,
+        subscription: "MultiplexedHttpTagSubscription",
+        paths: Iterable[str],
+        update_interval: _UpdateInterval,
+    ) -> Tuple["TagSubscriptionMultiplexer", _Subscriber]:
+        """Route the updates to the tags matched by ``paths`` to a subscription.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            subscription: The subscription to raise the :attr:`tag_changed` event of.
+            paths: The tag path queries to include in the subscription.
+            update_interval: How often to poll for updates on the server, or None to
+                use the default interval. Only subscriptions with equal intervals share
+                a multiplexer.
+
+        Returns:
+            The multiplexer, and the subscriber to pass to :meth:`unsubscribe()`.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        if update_interval is None:
+            update_interval = datetime.timedelta(
+                milliseconds=HttpTagSubscription._DEFAULT_POLLING_INTERVAL_MILLISECONDS
+            )
+        key = (client, update_interval)  # type: Tuple[HttpClient, _UpdateInterval]
+        subscriber = _Subscriber(subscription, paths)
+        while True:
+            with _lock:
+                multiplexer = _multiplexers.get(key)
+                if multiplexer is None:
+                    multiplexer = _multiplexers[key] = cls(client, update_interval)
+            with multiplexer._lock:
+                # A multiplexer closed by its last subscriber is replaced in the
+                # registry, so look again
+                if not multiplexer._closed:
+                    multiplexer._subscribers.append(subscriber)
+                    multiplexer._update_routes()
+                    break
+
+        try:
+            multiplexer._merge()
+        except BaseException:
+            multiplexer.delete(multiplexer.unsubscribe(subscriber))
+            raise
+        # Stop routing updates to a subscription that's garbage collected without
+        # being closed. The server subscription shrinks before the next poll.
+        weakref.finalize(subscription, multiplexer.unsubscribe, subscriber)
+        return multiplexer, subscriber
+
+    def __init__(
+        self,
+        client: HttpClient,
+        update_interval: Union[datetime.timedelta, tbase.AdaptiveUpdateInterval],
+    ) -> None:
+        self._key = (
+            client,
+            update_interval,
+        )  # type: Tuple[HttpClient, _UpdateInterval]
+        self._api = client.at_uri("/nitag/v2/subscriptions")
+        # Guards the subscribers, their routes and the server subscription
+        self._lock = threading.Lock()
+        self._polling = _PollingSchedule(update_interval)
+        self._subscribers = []  # type: List[_Subscriber]
+        # The subscribers of each tag path without wildcards, and the subscribers that
+        # have queries with wildcards
+        self._routes = {}  # type: Dict[str, List[_Subscriber]]
+        self._wildcard_subscribers = []  # type: List[_Subscriber]
+        self._server = None  # type: Optional[_ServerSubscription]
+        # Whether a subscriber has left since the server subscription was created
+        self._shrink_needed = False
+        self._closed = False
+        # Held while replacing the server subscription, so that two subscribers don't
+        # replace it at once
+        self._create_lock = threading.Lock()
+        self._update_timer = ManualResetTimer(self._polling.interval)
+        self._update_timer.elapsed += self._update_timer_elapsed
+        self._heartbeat_timer = ManualResetTimer(
+            datetime.timedelta(
+                milliseconds=tbase.TagSubscription._HEARTBEAT_INTERVAL_MILLISECONDS
+            )
+        )
+        self._heartbeat_timer.elapsed += self._heartbeat_timer_elapsed
+
+    @property
+    def update_interval(self) -> datetime.timedelta:  # noqa: D401
+        """The interval until the multiplexer next polls the server for updates."""
+        return self._polling.interval
+
+    @property
+    def empty_poll_ratio(self) -> float:  # noqa: D401
+        """The share of the multiplexer's recent polls for updates, from 0 to 1, that
+        received no updates or failed.
+        """
+        return self._polling.empty_poll_ratio
+
+    @property
+    def server_subscription_count(self) -> int:  # noqa: D401
+        """The number of subscriptions on the server that the multiplexer polls."""
+        with self._lock:
+            return 0 if self._server is None else 1
+
+    def unsubscribe(self, subscriber: _Subscriber) -> List[str]:
+        """Stop routing updates to a subscriber.
+
+        The server subscription is replaced with a smaller one by :meth:`shrink()`, or
+        before the next poll. Once there are no subscribers, the multiplexer is closed.
+
+        Args:
+            subscriber: The subscriber returned by :meth:`subscribe()`.
+
+        Returns:
+            The IDs of the server subscriptions to delete.
+        """
+        with self._lock:
+            if subscriber not in self._subscribers:
+                return []
+            self._subscribers.remove(subscriber)
+            self._update_routes()
+            if self._subscribers:
+                self._shrink_needed = True
+                return []
+            self._closed = True
+            self._update_timer.stop()
+            self._heartbeat_timer.stop()
+            server, self._server = self._server, None
+        with _lock:
+            if _multiplexers.get(self._key) is self:
+                del _multiplexers[self._key]
+        return [server.token] if server is not None else []
+
+    def shrink(self) -> None:
+        """Replace the server subscription with one for only the queries of the
+        remaining subscribers, if any have left since it was created.
+
+        If the API call fails, the multiplexer tries again before its next poll.
+        """
+        with self._lock:
+            if not self._shrink_needed:
+                return
+        try:
+            self._merge()
+        except core.ApiException:
+            with self._lock:
+                self._shrink_needed = True
+
+    def delete(self, tokens: List[str]) -> None:
+        """Delete subscriptions on the server, ignoring any errors.
+
+        Args:
+            tokens: The IDs of the server subscriptions to delete.
+        """
+        for token in tokens:
+            try:
+                self._api.delete("/{id}", params={"id": token})
+            except core.ApiException:
+                pass
+
+    async def delete_async(self, tokens: List[str]) -> None:
+        """Asynchronously delete subscriptions on the server, ignoring any errors.
+
+        Args:
+            tokens: The IDs of the server subscriptions to delete.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        for token in tokens:
+            try:
+                await self._api.as_async.delete("/{id}", params={"id": token})
+            except core.ApiException:
+                pass
+
+    def _update_routes(self) -> None:
+        """Index the subscribers by the tag paths they include. Must be called with the
+        lock held.
+        """
+        routes = {}  # type: Dict[str, List[_Subscriber]]
+        for subscriber in self._subscribers:
+            for path in subscriber.queries.paths:
+                routes.setdefault(path, []).append(subscriber)
+        self._routes = routes
+        self._wildcard_subscribers = [
+            s for s in self._subscribers if s.queries.patterns
+        ]
+
+    def _needed_queries(self) -> Set[str]:
+        """The queries of every subscriber, leaving out the paths that a wildcard
+        query matches. Must be called with the lock held.
+        """
+        queries = set()  # type: Set[str]
+        for subscriber in self._subscribers:
+            queries.update(subscriber.queries.queries)
+        patterns = _PathQueries(q for q in queries if "*" in q)
+        return {q for q in queries if "*" in q or not patterns.matches(q)}
+
+    def _merge(self) -> None:
+        """Replace the server subscription with one for the queries of every
+        subscriber, unless it already includes exactly those queries, or covers them
+        and no subscriber has left.
+        """
+        with self._create_lock:
+            with self._lock:
+                old = self._server
+                queries = self._needed_queries()
+                shrink, self._shrink_needed = self._shrink_needed, False
+                if self._closed or (
+                    old is not None
+                    and (
+                        old.queries.queries == queries
+                        or (not shrink and all(old.queries.covers(q) for q in queries))
+                    )
+                ):
+                    return
+                if not queries:
+                    # Every remaining subscriber has an empty set of queries
+                    self._server = None
+            if not queries:
+                self.delete([old.token] if old is not None else [])
+                return
+
+            try:
+                server = _ServerSubscription(
+                    sorted(queries), self._create_on_server(sorted(queries))
+                )
+            except BaseException:
+                with self._lock:
+                    self._shrink_needed = self._shrink_needed or shrink
+                raise
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self._server = server
+                    self._update_timer.start()
+                    self._heartbeat_timer.start()
+            if closed:
+                self.delete([server.token])
+                return
+            if old is not None:
+                # Route the changes made before the new server subscription started
+                # tracking them, and then stop polling the old one
+                self._poll(old)
+                self.delete([old.token])
+
+    def _create_on_server(self, queries: List[str]) -> str:
+        response, http_response = self._api.post(
+            "", data={"updatesOnly": True, "tags": queries}
+        )
+
+        if response is None or response.get("subscriptionId") is None:
+            raise tbase.TagManager.invalid_response(http_response)
+
+        token = response["subscriptionId"]
+
+        # Throw away the current values of every tag, which the subscription service
+        # sends first, so that only real changes are exposed.
+        try:
+            self._api.get("/{id}/values/current", params={"id": token})
+        except BaseException:
+            # Don't leave the subscription on the server until it expires
+            self.delete([token])
+            raise
+        return token
+
+    def _update_timer_elapsed(self) -> None:
+        update_count = 0
+        try:
+            self.shrink()
+            with self._lock:
+                server = self._server
+            if server is not None:
+                update_count = self._poll(server)
+        finally:
+            with self._lock:
+                if self._polling.record(update_count):
+                    self._update_timer.interval = self._polling.interval
+                if not self._closed:
+                    self._update_timer.start()
+
+    def _poll(self, server: _ServerSubscription) -> int:
+        """Query a server subscription for updates, and route them to the subscribers.
+
+        Returns:
+            The number of changed tags, or 0 if the API call fails.
+        """
+        try:
+            response, _ = self._api.get(
+                "/{id}/values/current", params={"id": server.token}
+            )
+        except core.ApiException:
+            return 0
+
+        update_count = 0
+        for tag, reader in _read_updates(response):
+            update_count += 1
+            self._route(tag, reader)
+        return update_count
+
+    def _route(
+        self,
+        tag: tbase.TagData,
+        reader: Optional[tbase.TagValueReader],
+    ) -> None:
+        """Queue a changed tag for each subscriber whose queries match its path.
+
+        Each subscriber raises its :attr:`tag_changed` event on worker threads, so a
+        slow handler doesn't hold up the poll.
+        """
+        with self._lock:
+            subscribers = self._routes.get(tag.path, []) + [
+                s
+                for s in self._wildcard_subscribers
+                if s not in self._routes.get(tag.path, ())
+                and s.queries.matches(tag.path)
+            ]
+        for subscriber in subscribers:
+            subscription = subscriber.subscription()
+            if subscription is None:
+                continue
+            try:
+                subscription._on_tag_changed(tag, reader)
+            except Exception:
+                traceback.print_exc()
+
+    def _heartbeat_timer_elapsed(self) -> None:
+        with self._lock:
+            server = self._server
+        try:
+            if server is not None:
+                try:
+                    self._api.put("/{id}/heartbeat", params={"id": server.token})
+                except core.ApiException:
+                    self._recreate_on_server(server)
+        finally:
+            with self._lock:
+                if not self._closed:
+                    self._heartbeat_timer.start()
+
+    def _recreate_on_server(self, server: _ServerSubscription) -> None:
+        with self._create_lock:
+            try:
+                token = self._create_on_server(sorted(server.queries.queries))
+            except core.ApiException:
+                # Ignore, we'll try again later
+                return
+
+            with self._lock:
+                needed = server is self._server
+                if needed:
+                    server.token = token
+            if not needed:
+                self.delete([token])
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of QueuedDispatch."""
+
+from typing import Optional
+
+from nisystemlink.clients import tag as tbase
+
+
+class QueuedDispatch:
+    """Configures a :class:`TagSubscription` to raise its
+    :attr:`~TagSubscription.tag_changed` event on a pool of worker threads, rather than
+    on the thread that polls the server for updates.
+
+    Changes are queued, and the event is raised for them one at a time, in order, so a
+    slow handler delays only the subscription's own events and never its polling. The
+    queue holds at most :attr:`max_pending` changes, and :attr:`overflow` picks which
+    change is dropped when it's full. When :attr:`coalesce` is True, a change to a tag
+    that already has a change queued replaces it, so that only the latest value of the
+    tag is delivered. The subscription counts the changes that are dropped or
+    coalesced.
+
+    Example::
+
+        subscription = selection.create_subscription(
+            dispatch=QueuedDispatch(max_pending=100)
+        )
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 1000,
+        overflow: Optional["tbase.DispatchOverflow"] = None,
+        coalesce: bool = True,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            max_pending: The most changes to queue.
+            overflow: What to do with a change when the queue is full, or None to drop
+                the oldest change.
+            coalesce: Whether a change to a tag replaces any change to the same tag
+                that's still queued.
+
+        Raises:
+            ValueError: if ``max_pending`` is less than 1.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self._max_pending = max_pending
+        self._overflow = (
+            overflow if overflow is not None else tbase.DispatchOverflow.DROP_OLDEST
+        )
+        self._coalesce = coalesce
+
+    @property
+    def max_pending(self) -> int:  # noqa: D401
+        """The most changes to queue."""
+        return self._max_pending
+
+    @property
+    def overflow(self) -> "tbase.DispatchOverflow":  # noqa: D401
+        """What to do with a change when the queue is full."""
+        return self._overflow
+
+    @property
+    def coalesce(self) -> bool:  # noqa: D401
+        """Whether a change to a tag replaces any change to the same tag that's still
+        queued.
+        """
+        return self._coalesce
+
+    def __repr__(self) -> str:
+        return "QueuedDispatch(max_pending={!r}, overflow={!r}, coalesce={!r})".format(
+            self._max_pending, self._overflow, self._coalesce
+        )
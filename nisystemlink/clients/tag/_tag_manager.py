@@ -65,6 +65,25 @@ class TagManager(tbase.ITagReader):
         self._http_client = HttpClient(configuration)
         self._api = self._http_client.at_uri("/nitag/v2")
 
+    def close(self) -> None:
+        """Close the connections used by the manager's methods that aren't async.
+
+        Use :meth:`aclose()` to close the connections used by asynchronous methods.
+        The manager can still be used after it is closed, in which case new connections
+        are opened.
+        """
+        self._http_client.close()
+
+    async def aclose(self) -> None:
+        """Close the connections used by asynchronous methods called on the running
+        event loop.
+
+        Connections used on an event loop are also closed when the loop is shut down,
+        such as when :func:`asyncio.run()` returns. The manager can still be used after
+        it is closed, in which case new connections are opened.
+        """
+        await self._http_client.aclose()
+
     def create_selection(self, tags: List[tbase.TagData]) -> tbase.TagSelection:
         """Create an :class:`TagSelection` that initially contains the given ``tags``
         without retrieving any additional data from the server.
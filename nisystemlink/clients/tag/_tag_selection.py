@@ -118,13 +118,22 @@ class TagSelection(tbase.ITagReader):
 
     @abc.abstractmethod
     def _create_subscription_internal(
-        self, update_interval: Optional[datetime.timedelta] = None
+        self,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> tbase.TagSubscription:
         """Subscribe to receive events when tags in the selection are written to using the specified update interval.
 
         Args:
             update_interval: How often to receive tag update notifications from the
-                server, or None to use the default.
+                server, or an :class:`AdaptiveUpdateInterval` to adapt how often to
+                poll the server to how often the tags change, or None to use the
+                default.
+            dispatch: How to queue changes and raise the subscription's
+                :attr:`~TagSubscription.tag_changed` event on worker threads, or None
+                to use the subscription's default.
 
         Returns:
             The created subscription.
@@ -136,14 +145,22 @@ class TagSelection(tbase.ITagReader):
 
     @abc.abstractmethod
     async def _create_subscription_internal_async(
-        self, update_interval: Optional[datetime.timedelta] = None
-    ) -> tbase.TagSubscription:
+        self,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> tbase.AsyncTagSubscription:
         """Asynchronously subscribe to receive events when tags in the selection are
         written to using the specified update interval.
 
         Args:
             update_interval: How often to receive tag update notifications from the
-                server, or None to use the default.
+                server, or an :class:`AdaptiveUpdateInterval` to adapt how often to
+                poll the server to how often the tags change, or None to use the
+                default.
+            dispatch: How to bound and coalesce the changes kept for iterating over
+                the subscription, or None to use the default.
 
         Returns:
             A task representing the asynchronous operation. On success, contains the
@@ -369,7 +386,12 @@ class TagSelection(tbase.ITagReader):
             self._values.clear()
 
     def create_subscription(
-        self, *, update_interval: Optional[datetime.timedelta] = None
+        self,
+        *,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> tbase.TagSubscription:
         """Subscribe to receive events when tags in the selection are written to.
 
@@ -389,7 +411,15 @@ class TagSelection(tbase.ITagReader):
 
         Args:
             update_interval: How often to receive tag updates notifications from the
-                server. Default is ``datetime.timedelta(seconds=30)``.
+                server, or an :class:`AdaptiveUpdateInterval` to adapt how often to
+                poll the server to how often the tags change. Default is
+                ``datetime.timedelta(seconds=30)``.
+            dispatch: A :class:`QueuedDispatch` to queue the changes, coalescing
+                changes to the same tag, and raise the subscription's
+                :attr:`~TagSubscription.tag_changed` event for them on worker threads,
+                so that slow handlers never delay polling. By default, the event is
+                raised on worker threads for up to 1000 queued changes, dropping the
+                oldest and not coalescing.
 
         Returns:
             The created subscription.
@@ -402,26 +432,41 @@ class TagSelection(tbase.ITagReader):
         if self._closed:
             raise ReferenceError("TagSelection")
 
-        if update_interval is not None and update_interval.total_seconds() < 0:
+        if (
+            isinstance(update_interval, datetime.timedelta)
+            and update_interval.total_seconds() < 0
+        ):
             raise ValueError("update_interval cannot be negative")
 
-        return self._create_subscription_internal(update_interval)
+        return self._create_subscription_internal(update_interval, dispatch)
 
     def create_subscription_async(
-        self, *, update_interval: Optional[datetime.timedelta] = None
-    ) -> Awaitable[tbase.TagSubscription]:
+        self,
+        *,
+        update_interval: Union[
+            datetime.timedelta, tbase.AdaptiveUpdateInterval, None
+        ] = None,
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> Awaitable[tbase.AsyncTagSubscription]:
         """Asynchronously subscribe to receive events when tags in the selection are written to.
 
         Updates will be queried from the server using the specified or default update
-        interval.
+        interval, by a task on the running event loop. Iterate over the subscription
+        with ``async for`` to receive each change.
 
         Closing, adding tags, or removing tags from the selection will not affect
         previously created subscriptions.
 
         Args:
             update_interval: How often to receive tag updates notifications from the
-                server. Depending on the :class:`TagManager` implementation in use, this
-                may involve polling the server or have a minimum value.
+                server, or an :class:`AdaptiveUpdateInterval` to adapt how often to
+                poll the server to how often the tags change. Depending on the
+                :class:`TagManager` implementation in use, this may involve polling the
+                server or have a minimum value.
+            dispatch: A :class:`QueuedDispatch` to bound the changes that are kept
+                until they're iterated over, and to pick which are dropped or
+                coalesced. By default, up to 1000 changes are kept, and the oldest is
+                dropped when there are more.
 
         Returns:
             A task representing the asynchronous operation. On success, contains the
@@ -436,12 +481,15 @@ class TagSelection(tbase.ITagReader):
             f.set_exception(ReferenceError("TagSelection"))
             return f
 
-        if update_interval and update_interval.total_seconds() < 0:
+        if (
+            isinstance(update_interval, datetime.timedelta)
+            and update_interval.total_seconds() < 0
+        ):
             f = asyncio.get_event_loop().create_future()
             f.set_exception(ValueError("update_interval cannot be negative"))
             return f
 
-        return self._create_subscription_internal_async(update_interval)
+        return self._create_subscription_internal_async(update_interval, dispatch)
 
     def delete_tags_from_server(self) -> None:
         """Delete all tags in the selection from the server.
@@ -5,13 +5,12 @@
 import abc
 import contextlib
 import datetime
-import weakref
 from types import TracebackType
-from typing import Iterable, List, Optional, Type
+from typing import Iterable, Optional, Type
 
 import events
-from nisystemlink.clients import core, tag as tbase
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._dispatch_queue import _DispatchQueue
 
 
 class TagSubscription(events.Events, abc.ABC):
@@ -40,6 +39,10 @@ class TagSubscription(events.Events, abc.ABC):
                         print(" - new value: {}".format(value.value))
 
                 subscription.tag_changed += my_callback
+
+            The event is raised on the thread that receives the changes from the
+            server, unless the subscription was created with a
+            :class:`QueuedDispatch`.
     """
 
     __events__ = ["tag_changed"]
@@ -49,21 +52,23 @@ class TagSubscription(events.Events, abc.ABC):
     tag_changed = None  # type: events._EventSlot
     del tag_changed
 
+    _closed = False  # type: bool
+    """Whether the subscription has been closed, or has failed and stopped."""
+
     _HEARTBEAT_INTERVAL_MILLISECONDS = 30000.0
     """Send a heartbeat every 30 seconds based on a server-side expiration of 60 seconds."""
 
     def __init__(
-        self, paths: Iterable[str], heartbeat_timer: Optional[ManualResetTimer]
+        self,
+        paths: Iterable[str],
+        dispatch: Optional[tbase.QueuedDispatch] = None,
     ) -> None:
         """Initialize the instance.
 
-        Derived types must call :meth:`_initialize()` or :meth:`_initialize_async()`
-        after construction.
-
         Args:
             paths: The tag path queries to include in the subscription.
-            heartbeat_timer: A timer for sending a heartbeat to keep the subscription
-                alive for testing purposes, or None to use a default timer.
+            dispatch: How to queue changes and raise :attr:`tag_changed` for them on
+                worker threads, or None to raise it on the thread that receives them.
 
         Raises:
             ValueError: if ``paths`` is None.
@@ -73,121 +78,61 @@ class TagSubscription(events.Events, abc.ABC):
 
         super().__init__()
         self._paths = list(paths)
-        if heartbeat_timer is not None:
-            self._heartbeat_timer = heartbeat_timer
-        else:
-            self._heartbeat_timer = ManualResetTimer(
-                datetime.timedelta(milliseconds=self._HEARTBEAT_INTERVAL_MILLISECONDS)
-            )
         self._exit_stack = contextlib.ExitStack()
-        self._exit_stack.enter_context(self._heartbeat_timer)
-
-        callback_ref = weakref.WeakMethod(self._heartbeat_timer_elapsed)  # type: ignore
-
-        def callback() -> None:
-            actual_callback = callback_ref()  # type: ignore
-            if actual_callback:
-                actual_callback()
-
-        self._heartbeat_timer_handler = callback
-        self._heartbeat_timer.elapsed += self._heartbeat_timer_handler
-        self._closed = False
+        self._dispatch_queue = (
+            _DispatchQueue(dispatch, self.tag_changed) if dispatch is not None else None
+        )
 
     def __del__(self) -> None:
         self._exit_stack.close()
 
-    def _initialize(self) -> None:
-        """Create and initialize the subscription.
-
-        Derived types must call this method or :meth:`_initialize_async()` after
-        construction to create and keep the subscription alive.
-
-        Raises:
-            ApiException: if the API call fails.
-        """
-        self._create_subscription_on_server(self._paths)
-        self._heartbeat_timer.start()
-
-    async def _initialize_async(self) -> None:
-        """Asynchronously create and initializes the subscription.
-
-        Derived types must call this method or :meth:`_initialize()` after construction
-        to create and keep the subscription alive.
+    @property
+    def update_interval(self) -> Optional[datetime.timedelta]:  # noqa: D401
+        """The interval until the subscription next queries the server for updates, or
+        None if the subscription doesn't poll the server.
 
-        Raises:
-            ApiException: if the API call fails.
+        When the subscription was created with an :class:`AdaptiveUpdateInterval`,
+        this changes as the subscription adapts to how often its tags change.
         """
-        await self._create_subscription_on_server_async(self._paths)
-        self._heartbeat_timer.start()
-
-    @abc.abstractmethod
-    def _create_subscription_on_server(self, paths: List[str]) -> None:
-        """Create the subscription on the server.
-
-        Implementations should retrieve and throw away the first set of updates before
-        returning.
-
-        Args:
-            paths: The tag path queries to include in the subscription.
+        return None
 
-        Raises:
-            ApiException: if the API call fails.
+    @property
+    def empty_poll_ratio(self) -> Optional[float]:  # noqa: D401
+        """The share of the subscription's recent queries for updates, from 0 to 1,
+        that received no updates or failed, or None if the subscription doesn't poll
+        the server.
         """
-        ...
-
-    @abc.abstractmethod
-    async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
-        """Asynchronously create the subscription on the server.
-
-        Implementations should retrieve and throw away the first set of updates before
-        returning.
-
-        Args:
-            paths: The tag path queries to include in the subscription.
-
-        Returns:
-            A task representing the asynchronous operation.
+        return None
 
-        Raises:
-            ApiException: if the API call fails.
+    @property
+    def dropped_update_count(self) -> int:  # noqa: D401
+        """The number of changes that were dropped because the queue of the
+        subscription's :class:`QueuedDispatch` was full, or 0 if it doesn't queue
+        changes.
         """
-        ...
-
-    @abc.abstractmethod
-    def _send_heartbeat(self) -> None:
-        """Send a heartbeat for the subscription to keep it active.
-
-        Raises:
-            ApiException: if the API call fails.
+        if self._dispatch_queue is None:
+            return 0
+        return self._dispatch_queue.dropped_count
+
+    @property
+    def coalesced_update_count(self) -> int:  # noqa: D401
+        """The number of changes that replaced a queued change to the same tag, so
+        that the replaced change wasn't delivered, or 0 if the subscription doesn't
+        queue changes.
         """
-        ...
-
-    @abc.abstractmethod
-    def _close_internal(self) -> None:
-        """Clean up server resources associated with the subscription."""
-        ...
+        if self._dispatch_queue is None:
+            return 0
+        return self._dispatch_queue.coalesced_count
 
     @abc.abstractmethod
-    async def _close_internal_async(self) -> None:
-        """Asynchronously clean up server resources associated with the subscription.
-
-        Returns:
-            A task representing the asynchronous operation.
-        """
-        ...
-
     def close(self) -> None:
         """Close server resources associated with the subscription.
 
         Further tag writes will not trigger new events.
         """
-        if self._closed:
-            return
-
-        self._close_internal()
-        self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
-        self._closed = True
+        ...
 
+    @abc.abstractmethod
     async def close_async(self) -> None:
         """Asynchronously close server resources associated with the subscription.
 
@@ -196,12 +141,7 @@ class TagSubscription(events.Events, abc.ABC):
         Returns:
             A task representing the asynchronous operation.
         """
-        if self._closed:
-            return
-
-        await self._close_internal_async()
-        self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
-        self._closed = True
+        ...
 
     def __enter__(self) -> "TagSubscription":
         return self
@@ -246,23 +186,15 @@ class TagSubscription(events.Events, abc.ABC):
     def _on_tag_changed(
         self, tag: tbase.TagData, value: Optional[tbase.TagValueReader]
     ) -> None:
-        """Raise the :attr:`tag_changed` event.
+        """Raise the :attr:`tag_changed` event, or queue the change to raise it on a
+        worker thread.
 
         Args:
             tag: The tag that was changed.
             value: The new value and any associated information, or None if the tag has
                 an unknown data type.
         """
-        self.tag_changed(tag, value)
-
-    def _heartbeat_timer_elapsed(self) -> None:
-        try:
-            self._send_heartbeat()
-        except core.ApiException:
-            try:
-                self._create_subscription_on_server(self._paths)
-            except core.ApiException:
-                # Ignore, we'll try again later
-                pass
-
-        self._heartbeat_timer.start()
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.put(tag, value)
+        else:
+            self.tag_changed(tag, value)
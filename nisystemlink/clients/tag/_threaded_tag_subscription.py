@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of ThreadedTagSubscription."""
+
+import abc
+import datetime
+import weakref
+from typing import Iterable, List, Optional
+
+from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+
+
+class ThreadedTagSubscription(tbase.TagSubscription):
+    """Represents a subscription for changes to one or more tags' values whose
+    heartbeats are sent, and whose updates are received, on background threads.
+
+    Unlike an :class:`AsyncTagSubscription`, it isn't tied to an event loop, and
+    :meth:`close()` deletes the subscription from the server before returning.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        heartbeat_timer: Optional[ManualResetTimer],
+        dispatch: Optional[tbase.QueuedDispatch] = None,
+    ) -> None:
+        """Initialize the instance.
+
+        Derived types must call :meth:`_initialize()` or :meth:`_initialize_async()`
+        after construction.
+
+        Args:
+            paths: The tag path queries to include in the subscription.
+            heartbeat_timer: A timer for sending a heartbeat to keep the subscription
+                alive for testing purposes, or None to use a default timer.
+            dispatch: How to queue changes and raise :attr:`tag_changed` for them on
+                worker threads, or None to raise it on the thread that receives them.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+        """
+        super().__init__(paths, dispatch)
+        if heartbeat_timer is not None:
+            self._heartbeat_timer = heartbeat_timer
+        else:
+            self._heartbeat_timer = ManualResetTimer(
+                datetime.timedelta(milliseconds=self._HEARTBEAT_INTERVAL_MILLISECONDS)
+            )
+        self._exit_stack.enter_context(self._heartbeat_timer)
+
+        callback_ref = weakref.WeakMethod(self._heartbeat_timer_elapsed)  # type: ignore
+
+        def callback() -> None:
+            actual_callback = callback_ref()  # type: ignore
+            if actual_callback:
+                actual_callback()
+
+        self._heartbeat_timer_handler = callback
+        self._heartbeat_timer.elapsed += self._heartbeat_timer_handler
+
+    def _initialize(self) -> None:
+        """Create and initialize the subscription.
+
+        Derived types must call this method or :meth:`_initialize_async()` after
+        construction to create and keep the subscription alive.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        self._create_subscription_on_server(self._paths)
+        self._heartbeat_timer.start()
+
+    async def _initialize_async(self) -> None:
+        """Asynchronously create and initializes the subscription.
+
+        Derived types must call this method or :meth:`_initialize()` after construction
+        to create and keep the subscription alive.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        await self._create_subscription_on_server_async(self._paths)
+        self._heartbeat_timer.start()
+
+    @abc.abstractmethod
+    def _create_subscription_on_server(self, paths: List[str]) -> None:
+        """Create the subscription on the server.
+
+        Implementations should retrieve and throw away the first set of updates before
+        returning.
+
+        Args:
+            paths: The tag path queries to include in the subscription.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
+        """Asynchronously create the subscription on the server.
+
+        Implementations should retrieve and throw away the first set of updates before
+        returning.
+
+        Args:
+            paths: The tag path queries to include in the subscription.
+
+        Returns:
+            A task representing the asynchronous operation.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    def _send_heartbeat(self) -> None:
+        """Send a heartbeat for the subscription to keep it active.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
+    @abc.abstractmethod
+    def _close_internal(self) -> None:
+        """Clean up server resources associated with the subscription."""
+        ...
+
+    @abc.abstractmethod
+    async def _close_internal_async(self) -> None:
+        """Asynchronously clean up server resources associated with the subscription.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        ...
+
+    def close(self) -> None:
+        """Close server resources associated with the subscription.
+
+        Further tag writes will not trigger new events.
+        """
+        if self._closed:
+            return
+
+        self._close_internal()
+        self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.close()
+        self._closed = True
+
+    async def close_async(self) -> None:
+        """Asynchronously close server resources associated with the subscription.
+
+        Further tag writes will not trigger new events.
+
+        Returns:
+            A task representing the asynchronous operation.
+        """
+        if self._closed:
+            return
+
+        await self._close_internal_async()
+        self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
+        if self._dispatch_queue is not None:
+            self._dispatch_queue.close()
+        self._closed = True
+
+    def _heartbeat_timer_elapsed(self) -> None:
+        try:
+            self._send_heartbeat()
+        except core.ApiException:
+            try:
+                self._create_subscription_on_server(self._paths)
+            except core.ApiException:
+                # Ignore, we'll try again later
+                pass
+
+        self._heartbeat_timer.start()
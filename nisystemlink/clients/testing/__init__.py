@@ -0,0 +1,20 @@
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._stand_in_server import ServedRequest, StandInServer
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._stand_in_server": ["ServedRequest", "StandInServer"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
+
+# flake8: noqa
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+
+"""The ``/nidataframe/v1`` service of :class:`StandInServer`."""
+
+import csv
+import io
+import itertools
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ._routing import _Handler, _now, _page, _Request, _Response, _Router
+
+_BASE = "/nidataframe/v1"
+_DEFAULT_TAKE = 1000
+_DEFAULT_INTERVALS = 1000
+_NUMERIC_TYPES = ("FLOAT32", "FLOAT64", "INT32", "INT64")
+
+_TABLE_ORDER = {
+    "CREATED_AT": "createdAt",
+    "METADATA_MODIFIED_AT": "metadataModifiedAt",
+    "NAME": "name",
+    "NUMBER_OF_ROWS": "rowCount",
+    "ROWS_MODIFIED_AT": "rowsModifiedAt",
+}
+
+_COMPARISONS = {
+    "EQUALS": operator.eq,
+    "NOT_EQUALS": operator.ne,
+    "LESS_THAN": operator.lt,
+    "LESS_THAN_EQUALS": operator.le,
+    "GREATER_THAN": operator.gt,
+    "GREATER_THAN_EQUALS": operator.ge,
+}  # type: Dict[str, Callable[[Any, Any], bool]]
+
+
+def _no_such_table(id: str) -> _Response:
+    return _Response.error(
+        404,
+        "DataFrame.TableNotFound",
+        "No table exists with the ID {}.".format(id),
+        code=-251302,
+    )
+
+
+def _invalid(message: str) -> _Response:
+    return _Response.error(400, "DataFrame.InvalidRequest", message, code=-251041)
+
+
+def _to_sortable(data_type: str, value: Optional[str]) -> Any:
+    """Convert a cell to a value that compares the way the column's data type does."""
+    if value is None:
+        return None
+    if data_type in _NUMERIC_TYPES:
+        return float(value)
+    if data_type == "BOOL":
+        return value.lower() == "true"
+    return value
+
+
+class _Table:
+    """A table's metadata and rows, each row a list of cells in column order."""
+
+    def __init__(self, id: str, request: Dict[str, Any]) -> None:
+        now = _now()
+        self.metadata = {
+            "columns": [
+                {
+                    "name": c["name"],
+                    "dataType": c["dataType"],
+                    "columnType": c.get("columnType") or "NORMAL",
+                    "properties": c.get("properties") or {},
+                }
+                for c in request["columns"]
+            ],
+            "createdAt": now,
+            "id": id,
+            "metadataModifiedAt": now,
+            "metadataRevision": 1,
+            "name": request.get("name") or id,
+            "properties": request.get("properties") or {},
+            "rowCount": 0,
+            "rowsModifiedAt": now,
+            "supportsAppend": True,
+            "workspace": request.get("workspace") or "",
+        }  # type: Dict[str, Any]
+        self.rows = []  # type: List[List[Optional[str]]]
+
+    @property
+    def column_names(self) -> List[str]:
+        return [c["name"] for c in self.metadata["columns"]]
+
+    def data_type(self, column: str) -> str:
+        return next(
+            c["dataType"] for c in self.metadata["columns"] if c["name"] == column
+        )
+
+    def modify(self, changes: Dict[str, Any], replace: bool = False) -> None:
+        for key in ("name", "workspace"):
+            if changes.get(key) is not None:
+                self.metadata[key] = changes[key]
+        if replace:
+            self.metadata["properties"] = {}
+        _apply_properties(self.metadata["properties"], changes.get("properties"))
+        for column_changes in changes.get("columns") or []:
+            for column in self.metadata["columns"]:
+                if column["name"] == column_changes["name"]:
+                    _apply_properties(
+                        column["properties"], column_changes.get("properties")
+                    )
+        self.metadata["metadataRevision"] += 1
+        self.metadata["metadataModifiedAt"] = _now()
+
+
+def _apply_properties(
+    properties: Dict[str, str], changes: Optional[Dict[str, Optional[str]]]
+) -> None:
+    """Set properties, removing those set to None."""
+    for key, value in (changes or {}).items():
+        if value is None:
+            properties.pop(key, None)
+        else:
+            properties[key] = value
+
+
+class _DataFrameService:
+    """Keeps tables and their rows, which are stored as the strings they're sent as."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tables = OrderedDict()  # type: OrderedDict[str, _Table]
+        self._ids = itertools.count(1)
+
+    def register(self, router: _Router) -> None:
+        routes = [
+            ("GET", "", self._api_info),
+            ("GET", "/tables", self._list_tables),
+            ("POST", "/tables", self._create_table),
+            ("POST", "/query-tables", self._query_tables),
+            ("POST", "/delete-tables", self._delete_tables),
+            ("POST", "/modify-tables", self._modify_tables),
+            ("GET", "/tables/{id}", self._get_table),
+            ("PATCH", "/tables/{id}", self._modify_table),
+            ("DELETE", "/tables/{id}", self._delete_table),
+            ("GET", "/tables/{id}/data", self._get_data),
+            ("POST", "/tables/{id}/data", self._append_data),
+            ("POST", "/tables/{id}/query-data", self._query_data),
+            ("POST", "/tables/{id}/query-decimated-data", self._query_decimated),
+            ("POST", "/tables/{id}/export-data", self._export_data),
+        ]  # type: List[Tuple[str, str, _Handler]]
+        for method, route, handler in routes:
+            router.add(method, _BASE + route, handler, self._lock)
+
+    def _api_info(self, request: _Request) -> _Response:
+        operation = {"available": True, "version": 1}
+        names = [
+            "createTables",
+            "deleteTables",
+            "modifyMetadata",
+            "listTables",
+            "readData",
+            "writeData",
+        ]
+        return _Response.json({"operations": {name: operation for name in names}})
+
+    # Tables
+
+    def _list_tables(self, request: _Request) -> _Response:
+        ids = request.list_param("id")
+        workspaces = request.list_param("workspace")
+        tables = [
+            t.metadata
+            for t in self._tables.values()
+            if (not ids or t.metadata["id"] in ids)
+            and (not workspaces or t.metadata["workspace"] in workspaces)
+        ]
+        return self._page_tables(
+            tables,
+            request.param("orderBy"),
+            request.param("orderByDescending") == "true",
+            request.param("continuationToken"),
+            request.int_param("take", _DEFAULT_TAKE),
+        )
+
+    def _query_tables(self, request: _Request) -> _Response:
+        # The Dynamic LINQ filter isn't evaluated, so every table matches
+        query = request.json()
+        return self._page_tables(
+            [t.metadata for t in self._tables.values()],
+            query.get("orderBy"),
+            bool(query.get("orderByDescending")),
+            query.get("continuationToken"),
+            query.get("take") or _DEFAULT_TAKE,
+        )
+
+    def _page_tables(
+        self,
+        tables: List[Dict[str, Any]],
+        order_by: Optional[str],
+        descending: bool,
+        token: Optional[str],
+        take: int,
+    ) -> _Response:
+        if order_by in _TABLE_ORDER:
+            key = _TABLE_ORDER[order_by]  # type: ignore
+            tables = sorted(tables, key=lambda t: t[key], reverse=descending)
+        page, next_token = _page(tables, token, take)
+        return _Response.json({"tables": page, "continuationToken": next_token})
+
+    def _create_table(self, request: _Request) -> _Response:
+        body = request.json()
+        if not body.get("columns"):
+            return _invalid("A table must have at least one column.")
+        id = "{:024x}".format(next(self._ids))
+        self._tables[id] = _Table(id, body)
+        return _Response.json({"id": id}, 201)
+
+    def _get_table(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        return _Response.json(table.metadata) if table else _no_such_table(id)
+
+    def _modify_table(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        table.modify(request.json())
+        return _Response.empty()
+
+    def _modify_tables(self, request: _Request) -> _Response:
+        body = request.json()
+        for changes in body["tables"]:
+            table = self._tables.get(changes["id"])
+            if table is None:
+                return _no_such_table(changes["id"])
+            table.modify(changes, bool(body.get("replace")))
+        return _Response.empty()
+
+    def _delete_table(self, request: _Request, id: str) -> _Response:
+        if self._tables.pop(id, None) is None:
+            return _no_such_table(id)
+        return _Response.empty()
+
+    def _delete_tables(self, request: _Request) -> _Response:
+        for id in request.json()["ids"]:
+            self._tables.pop(id, None)
+        return _Response.empty()
+
+    # Data
+
+    def _append_data(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        body = request.json()
+        if not table.metadata["supportsAppend"]:
+            return _invalid("The table {} doesn't support appending data.".format(id))
+        frame = body.get("frame")
+        if frame:
+            names = table.column_names
+            positions = [names.index(c) for c in frame.get("columns") or names]
+            for row in frame["data"]:
+                cells = [None] * len(names)  # type: List[Optional[str]]
+                for position, cell in zip(positions, row):
+                    cells[position] = cell
+                table.rows.append(cells)
+            table.metadata["rowCount"] = len(table.rows)
+            table.metadata["rowsModifiedAt"] = _now()
+        if body.get("endOfData"):
+            table.metadata["supportsAppend"] = False
+        return _Response.empty()
+
+    def _get_data(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        order_by = [
+            {"column": c, "descending": request.param("orderByDescending") == "true"}
+            for c in request.list_param("orderBy")
+        ]
+        return self._read(
+            table,
+            {
+                "columns": request.list_param("columns"),
+                "orderBy": order_by,
+                "take": request.int_param("take", 500),
+                "continuationToken": request.param("continuationToken"),
+            },
+        )
+
+    def _query_data(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        return self._read(table, request.json())
+
+    def _read(self, table: _Table, query: Dict[str, Any]) -> _Response:
+        rows = self._select(table, query)
+        page, token = _page(
+            rows, query.get("continuationToken"), query.get("take") or 500
+        )
+        columns = query.get("columns") or table.column_names
+        return _Response.json(
+            {
+                "frame": {
+                    "columns": columns,
+                    "data": self._project(table, page, columns),
+                },
+                "totalRowCount": len(rows),
+                "continuationToken": token,
+            }
+        )
+
+    def _query_decimated(self, request: _Request, id: str) -> _Response:
+        # Every decimation method is approximated by evenly spaced rows
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        query = request.json()
+        rows = self._select(table, query)
+        intervals = (query.get("decimation") or {}).get("intervals")
+        count = min(len(rows), 2 * (intervals or _DEFAULT_INTERVALS))
+        if count < len(rows):
+            step = (len(rows) - 1) / max(count - 1, 1)
+            rows = [rows[round(i * step)] for i in range(count)]
+        columns = query.get("columns") or table.column_names
+        return _Response.json(
+            {"frame": {"columns": columns, "data": self._project(table, rows, columns)}}
+        )
+
+    def _export_data(self, request: _Request, id: str) -> _Response:
+        table = self._tables.get(id)
+        if table is None:
+            return _no_such_table(id)
+        query = request.json()
+        columns = query.get("columns") or table.column_names
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\r\n")
+        writer.writerow(columns)
+        writer.writerows(self._project(table, self._select(table, query), columns))
+        return _Response(200, output.getvalue().encode(), {"Content-Type": "text/csv"})
+
+    def _select(
+        self, table: _Table, query: Dict[str, Any]
+    ) -> List[List[Optional[str]]]:
+        """Get the rows of a table that match a query's filters, in its order."""
+        names = table.column_names
+        rows = table.rows
+        for column_filter in query.get("filters") or []:
+            position = names.index(column_filter["column"])
+            matches = _get_filter(
+                table.data_type(column_filter["column"]), column_filter
+            )
+            rows = [row for row in rows if matches(row[position])]
+        for order in reversed(query.get("orderBy") or []):
+            position = names.index(order["column"])
+            data_type = table.data_type(order["column"])
+            # Nulls sort ahead of every value
+            rows = sorted(
+                rows,
+                key=lambda row: (
+                    row[position] is not None,
+                    _to_sortable(data_type, row[position]),
+                ),
+                reverse=bool(order.get("descending")),
+            )
+        return rows
+
+    def _project(
+        self, table: _Table, rows: List[List[Optional[str]]], columns: List[str]
+    ) -> List[List[Optional[str]]]:
+        positions = [table.column_names.index(c) for c in columns]
+        return [[row[p] for p in positions] for row in rows]
+
+
+def _get_filter(
+    data_type: str, column_filter: Dict[str, Any]
+) -> Callable[[Optional[str]], bool]:
+    """Get a function that tests whether a cell matches a column filter."""
+    operation = column_filter["operation"]
+    value = column_filter.get("value")
+    if operation in ("CONTAINS", "NOT_CONTAINS"):
+        negate = operation == "NOT_CONTAINS"
+        text = value or ""
+        return lambda cell: (cell is not None and text in cell) != negate
+    compare = _COMPARISONS[operation]
+    if value is None:
+        return lambda cell: compare(cell, None)
+    expected = _to_sortable(data_type, value)
+    return lambda cell: cell is not None and compare(
+        _to_sortable(data_type, cell), expected
+    )
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""The ``/nifile/v1`` service of :class:`StandInServer`."""
+
+import email.parser
+import email.policy
+import itertools
+import json
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._routing import _Handler, _now, _Request, _Response, _Router
+
+_BASE = "/nifile/v1"
+_FILES = "/service-groups/Default"
+_DEFAULT_TAKE = 1000
+
+
+def _no_such_file(id: str) -> _Response:
+    return _Response.error(
+        404, "FileService.NotFound", "No file exists with the ID {}.".format(id)
+    )
+
+
+def _parse_multipart(request: _Request) -> Dict[str, bytes]:
+    """Get the parts of a ``multipart/form-data`` body by name."""
+    header = "Content-Type: {}\r\n\r\n".format(request.headers["content-type"])
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        header.encode() + request.body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(
+            decode=True
+        )
+        for part in message.iter_parts()  # type: ignore
+    }
+
+
+class _FileService:
+    """Keeps files and their metadata in the ``Default`` service group."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+        self._data = {}  # type: Dict[str, bytes]
+        self._ids = itertools.count(1)
+
+    def register(self, router: _Router) -> None:
+        routes = [
+            ("GET", "", self._api_info),
+            ("GET", _FILES + "/files", self._get_files),
+            ("POST", _FILES + "/upload-files", self._upload_file),
+            ("POST", _FILES + "/delete-files", self._delete_files),
+            ("GET", _FILES + "/files/{id}/data", self._download_file),
+            ("DELETE", _FILES + "/files/{id}", self._delete_file),
+            ("POST", _FILES + "/files/{id}/update-metadata", self._update_metadata),
+        ]  # type: List[Tuple[str, str, _Handler]]
+        for method, route, handler in routes:
+            router.add(method, _BASE + route, handler, self._lock)
+
+    def _api_info(self, request: _Request) -> _Response:
+        operation = {"available": True, "version": 1}
+        names = [
+            "deleteFiles",
+            "downloadData",
+            "listFiles",
+            "queryFiles",
+            "updateMetadata",
+            "uploadFiles",
+        ]
+        return _Response.json({"operations": {name: operation for name in names}})
+
+    def _get_files(self, request: _Request) -> _Response:
+        ids = request.list_param("id")
+        files = [f for f in self._files.values() if not ids or f["id"] in ids]
+        order_by = request.param("orderBy")
+        if order_by:
+            files = sorted(
+                files,
+                key=operator.itemgetter(order_by),
+                reverse=request.param("orderByDescending") == "true",
+            )
+        skip = request.int_param("skip", 0)
+        take = request.int_param("take", 0) or _DEFAULT_TAKE
+        return _Response.json(
+            {
+                "_links": {},
+                "availableFiles": files[skip : skip + take],
+                "totalCount": len(files),
+            }
+        )
+
+    def _upload_file(self, request: _Request) -> _Response:
+        parts = _parse_multipart(request)
+        if "file" not in parts:
+            return _Response.error(
+                400, "FileService.InvalidRequest", "No file was uploaded."
+            )
+        id = (parts.get("id") or b"").decode() or "{:024x}".format(next(self._ids))
+        metadata = json.loads(parts["metadata"]) if parts.get("metadata") else {}
+        data = parts["file"]
+        now = _now()
+        self._data[id] = data
+        self._files[id] = {
+            "_links": {},
+            "created": now,
+            "id": id,
+            "path": id,
+            "properties": dict(metadata, Name=metadata.get("Name", id)),
+            "metaDataRevision": 1,
+            "serviceGroup": "Default",
+            "size": len(data),
+            "size64": len(data),
+            "workspace": request.param("workspace") or "",
+            "lastUpdatedTimestamp": now,
+        }
+        return _Response.json({"uri": "{}{}/files/{}".format(_BASE, _FILES, id)}, 201)
+
+    def _download_file(self, request: _Request, id: str) -> _Response:
+        data = self._data.get(id)  # type: Optional[bytes]
+        if data is None:
+            return _no_such_file(id)
+        return _Response(200, data, {"Content-Type": "application/octet-stream"})
+
+    def _delete_file(self, request: _Request, id: str) -> _Response:
+        if self._files.pop(id, None) is None:
+            return _no_such_file(id)
+        del self._data[id]
+        return _Response.empty()
+
+    def _delete_files(self, request: _Request) -> _Response:
+        for id in request.json()["ids"]:
+            if self._files.pop(id, None) is not None:
+                del self._data[id]
+        return _Response.empty()
+
+    def _update_metadata(self, request: _Request, id: str) -> _Response:
+        metadata = self._files.get(id)
+        if metadata is None:
+            return _no_such_file(id)
+        update = request.json()
+        expected = update.get("expectedRevision")
+        if expected is not None and expected != metadata["metaDataRevision"]:
+            return _Response.error(
+                409,
+                "FileService.RevisionMismatch",
+                "The file {} is at revision {}.".format(
+                    id, metadata["metaDataRevision"]
+                ),
+            )
+        if update.get("replaceExisting"):
+            metadata["properties"] = {}
+        metadata["properties"].update(update.get("properties") or {})
+        if update.get("workspace"):
+            metadata["workspace"] = update["workspace"]
+        metadata["metaDataRevision"] += 1
+        metadata["lastUpdatedTimestamp"] = _now()
+        return _Response.empty(200)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""The products of the ``/nitestmonitor/v2`` service of :class:`StandInServer`."""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._routing import _Handler, _now, _page, _Request, _Response, _Router
+
+_BASE = "/nitestmonitor/v2"
+_DEFAULT_TAKE = 100
+
+
+def _no_such_product(id: str) -> _Response:
+    return _Response.error(
+        404,
+        "TestMonitor.ProductNotFound",
+        "No product exists with the ID {}.".format(id),
+    )
+
+
+class _ProductService:
+    """Keeps products. Results and steps aren't implemented."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._products = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+        self._ids = itertools.count(1)
+
+    def register(self, router: _Router) -> None:
+        routes = [
+            ("GET", "/products", self._get_products),
+            ("POST", "/products", self._create_products),
+            ("GET", "/products/{id}", self._get_product),
+            ("DELETE", "/products/{id}", self._delete_product),
+            ("POST", "/query-products", self._query_products),
+            ("POST", "/update-products", self._update_products),
+            ("POST", "/delete-products", self._delete_products),
+        ]  # type: List[Tuple[str, str, _Handler]]
+        for method, route, handler in routes:
+            router.add(method, _BASE + route, handler, self._lock)
+
+    def _create_products(self, request: _Request) -> _Response:
+        created = []
+        for product in request.json()["products"]:
+            id = "{:024x}".format(next(self._ids))
+            self._products[id] = dict(product, id=id, updatedAt=_now())
+            created.append(self._products[id])
+        return _Response.json({"products": created}, 201)
+
+    def _get_products(self, request: _Request) -> _Response:
+        return self._page_products(
+            list(self._products.values()),
+            request.param("continuationToken"),
+            request.int_param("take", _DEFAULT_TAKE),
+            request.param("returnCount") in ("true", "True"),
+        )
+
+    def _query_products(self, request: _Request) -> _Response:
+        # The Dynamic LINQ filter isn't evaluated, so every product matches
+        query = request.json()
+        products = list(self._products.values())
+        if query.get("orderBy"):
+            first, *rest = query["orderBy"].lower().split("_")
+            key = first + "".join(word.capitalize() for word in rest)
+            products.sort(
+                key=lambda p: p.get(key) or "", reverse=bool(query.get("descending"))
+            )
+        return self._page_products(
+            products,
+            query.get("continuationToken"),
+            query.get("take") or _DEFAULT_TAKE,
+            bool(query.get("returnCount")),
+        )
+
+    def _page_products(
+        self,
+        products: List[Dict[str, Any]],
+        token: Optional[str],
+        take: int,
+        return_count: bool,
+    ) -> _Response:
+        page, next_token = _page(products, token, take)
+        return _Response.json(
+            {
+                "products": page,
+                "continuationToken": next_token,
+                "totalCount": len(products) if return_count else None,
+            }
+        )
+
+    def _get_product(self, request: _Request, id: str) -> _Response:
+        product = self._products.get(id)
+        return _Response.json(product) if product else _no_such_product(id)
+
+    def _update_products(self, request: _Request) -> _Response:
+        body = request.json()
+        updated = []
+        failed = []
+        for product in body["products"]:
+            existing = self._products.get(product.get("id") or "")
+            if existing is None:
+                failed.append(product)
+                continue
+            if body.get("replace"):
+                existing.clear()
+                existing.update(product)
+            else:
+                for key in ("keywords", "fileIds"):
+                    if key in product:
+                        product[key] = sorted(
+                            set(existing.get(key) or []) | set(product[key] or [])
+                        )
+                if "properties" in product:
+                    product["properties"] = dict(
+                        existing.get("properties") or {}, **product["properties"]
+                    )
+                existing.update(product)
+            existing["updatedAt"] = _now()
+            updated.append(existing)
+        response = {"products": updated}  # type: Dict[str, Any]
+        if failed:
+            response["failed"] = failed
+            response["error"] = {
+                "name": "TestMonitor.PartialSuccess",
+                "code": -251041,
+                "message": "{} products don't exist.".format(len(failed)),
+                "args": [],
+                "innerErrors": [],
+            }
+        return _Response.json(response)
+
+    def _delete_product(self, request: _Request, id: str) -> _Response:
+        if self._products.pop(id, None) is None:
+            return _no_such_product(id)
+        return _Response.empty()
+
+    def _delete_products(self, request: _Request) -> _Response:
+        ids = request.json()["ids"]
+        deleted = [id for id in ids if self._products.pop(id, None) is not None]
+        if len(deleted) == len(ids):
+            return _Response.empty()
+        return _Response.json(
+            {
+                "ids": deleted,
+                "failed": [id for id in ids if id not in deleted],
+                "error": {
+                    "name": "TestMonitor.PartialSuccess",
+                    "code": -251041,
+                    "message": "Some products don't exist.",
+                    "args": [],
+                    "innerErrors": [],
+                },
+            }
+        )
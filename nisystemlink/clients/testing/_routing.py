@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""Requests, responses and routing shared by the services of :class:`StandInServer`."""
+
+import datetime
+import json
+import re
+import threading
+import urllib.parse
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Tuple
+
+from nisystemlink.clients.core._internal._timestamp_utilities import (
+    TimestampUtilities,
+)
+
+
+class _Request:
+    """A request received by the stand-in server."""
+
+    def __init__(
+        self,
+        method: str,
+        target: str,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> None:
+        split = urllib.parse.urlsplit(target)
+        self.method = method
+        self.path = split.path
+        self.query = urllib.parse.parse_qs(
+            split.query, keep_blank_values=True
+        )  # type: Dict[str, List[str]]
+        self.headers = headers  # Names are lowercase
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Get the first value of a query parameter."""
+        values = self.query.get(name)
+        return values[0] if values else default
+
+    def int_param(self, name: str, default: int) -> int:
+        value = self.param(name)
+        return int(value) if value else default
+
+    def list_param(self, name: str) -> List[str]:
+        """Get the values of a query parameter given either repeatedly or comma-separated."""
+        return [v for value in self.query.get(name, []) for v in value.split(",") if v]
+
+
+class _Response:
+    """A response sent by the stand-in server."""
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        if body and "Content-Type" not in self.headers:
+            self.headers["Content-Type"] = "application/json"
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200) -> "_Response":
+        return cls(status, json.dumps(data, separators=(",", ":")).encode())
+
+    @classmethod
+    def empty(cls, status: int = 204) -> "_Response":
+        return cls(status)
+
+    @classmethod
+    def error(
+        cls, status: int, name: str, message: str, code: int = -251041
+    ) -> "_Response":
+        """Create an error response with a body in the form of :class:`ApiError`."""
+        return cls.json(
+            {
+                "error": {
+                    "name": name,
+                    "code": code,
+                    "message": message,
+                    "args": [],
+                    "innerErrors": [],
+                }
+            },
+            status,
+        )
+
+
+_Handler = Callable[..., _Response]
+
+
+class _Router:
+    """Finds the handler for a request from route templates such as
+    ``/nitag/v2/tags/{path}``, in which each ``{name}`` matches one path segment.
+
+    ``HEAD`` requests are routed to the handler for ``GET``.
+    """
+
+    def __init__(self) -> None:
+        self._routes = (
+            []
+        )  # type: List[Tuple[str, str, Pattern[str], _Handler, threading.Lock]]
+
+    def add(
+        self, method: str, template: str, handler: _Handler, lock: threading.Lock
+    ) -> None:
+        """Add a route.
+
+        Args:
+            method: The HTTP method of the route.
+            template: The path template of the route.
+            handler: The function that handles requests to the route.
+            lock: The lock to hold while handling a request, which guards the state of
+                the service that the handler belongs to. Services have their own locks,
+                so that requests to different services are handled concurrently.
+        """
+        pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(template))
+        self._routes.append(
+            (method, template, re.compile(pattern + "/?"), handler, lock)
+        )
+
+    def route(
+        self, request: _Request
+    ) -> Tuple[Optional[str], Optional[Callable[[], _Response]]]:
+        """Find the route of a request.
+
+        Returns:
+            The template of the route, or None if no route matches the path, and a
+            function that handles the request, or None if the route doesn't support
+            the request's method.
+        """
+        template = None
+        request_method = "GET" if request.method == "HEAD" else request.method
+        for method, route_template, pattern, handler, lock in self._routes:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            template = route_template
+            if method == request_method:
+                params = {
+                    k: urllib.parse.unquote(v) for k, v in match.groupdict().items()
+                }
+                return template, _bind(handler, request, params, lock)
+        return template, None
+
+
+def _bind(
+    handler: _Handler,
+    request: _Request,
+    params: Dict[str, str],
+    lock: threading.Lock,
+) -> Callable[[], _Response]:
+    def handle() -> _Response:
+        with lock:
+            return handler(request, **params)
+
+    return handle
+
+
+def _page(items: List[Any], request_token: Optional[str], take: int) -> Tuple[
+    List[Any],
+    Optional[str],
+]:
+    """Get a page of items and the continuation token for the next page, which is the
+    index of the next item.
+    """
+    start = int(request_token) if request_token else 0
+    end = start + max(take, 0)
+    return items[start:end], (str(end) if end < len(items) else None)
+
+
+def _now() -> str:
+    """Get the current time in the format used by SystemLink."""
+    return TimestampUtilities.datetime_to_str(
+        datetime.datetime.now(datetime.timezone.utc)
+    )
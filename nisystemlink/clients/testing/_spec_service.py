@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+"""The ``/nispec/v1`` service of :class:`StandInServer`."""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from ._routing import _Handler, _now, _page, _Request, _Response, _Router
+
+_BASE = "/nispec/v1"
+_DEFAULT_TAKE = 1000
+_USER = "stand-in"
+
+
+def _to_camel_case(name: str) -> str:
+    """Convert a projection such as ``PRODUCT_ID`` to the field ``productId``."""
+    first, *rest = name.lower().split("_")
+    return first + "".join(word.capitalize() for word in rest)
+
+
+def _partial_success(message: str) -> Dict[str, Any]:
+    return {
+        "name": "Spec.PartialSuccess",
+        "code": -251041,
+        "message": message,
+        "args": [],
+        "innerErrors": [],
+    }
+
+
+class _SpecService:
+    """Keeps specifications, with their versions and history."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._specs = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+        self._ids = itertools.count(1)
+
+    def register(self, router: _Router) -> None:
+        routes = [
+            ("GET", "", self._api_info),
+            ("POST", "/specs", self._create_specs),
+            ("POST", "/query-specs", self._query_specs),
+            ("POST", "/update-specs", self._update_specs),
+            ("POST", "/delete-specs", self._delete_specs),
+        ]  # type: List[Tuple[str, str, _Handler]]
+        for method, route, handler in routes:
+            router.add(method, _BASE + route, handler, self._lock)
+
+    def _api_info(self, request: _Request) -> _Response:
+        operation = {"available": True, "version": 1}
+        names = [
+            "createSpecifications",
+            "querySpecifications",
+            "updateSpecifications",
+            "deleteSpecifications",
+        ]
+        return _Response.json({"operations": {name: operation for name in names}})
+
+    def _create_specs(self, request: _Request) -> _Response:
+        created = []
+        failed = []
+        for spec in request.json().get("specs") or []:
+            key = (spec["productId"], spec["specId"], spec.get("workspace"))
+            if any(
+                (s["productId"], s["specId"], s.get("workspace")) == key
+                for s in self._specs.values()
+            ):
+                failed.append(spec)
+                continue
+            id = "{:024x}".format(next(self._ids))
+            self._specs[id] = dict(
+                spec, id=id, version=0, createdAt=_now(), createdBy=_USER
+            )
+            created.append(
+                {
+                    k: self._specs[id].get(k)
+                    for k in (
+                        "id",
+                        "productId",
+                        "specId",
+                        "workspace",
+                        "version",
+                        "createdAt",
+                        "createdBy",
+                    )
+                }
+            )
+        response = {"createdSpecs": created}  # type: Dict[str, Any]
+        if failed:
+            response["failedSpecs"] = failed
+            response["error"] = _partial_success(
+                "{} specifications already exist.".format(len(failed))
+            )
+        return _Response.json(response, 201 if not failed else 200)
+
+    def _query_specs(self, request: _Request) -> _Response:
+        # The Dynamic LINQ filter isn't evaluated, so every spec of the products matches
+        query = request.json()
+        specs = [
+            s for s in self._specs.values() if s["productId"] in query["productIds"]
+        ]  # type: List[Dict[str, Any]]
+        if query.get("orderBy"):
+            key = _to_camel_case(query["orderBy"])
+            specs = sorted(
+                specs,
+                key=lambda s: s[key],
+                reverse=bool(query.get("orderByDescending")),
+            )
+        page, token = _page(
+            specs, query.get("continuationToken"), query.get("take") or _DEFAULT_TAKE
+        )
+        if query.get("projection"):
+            fields = [_to_camel_case(p) for p in query["projection"]]
+            page = [{k: s.get(k) for k in fields} for s in page]
+        return _Response.json({"specs": page, "continuationToken": token})
+
+    def _update_specs(self, request: _Request) -> _Response:
+        updated = []
+        failed = []
+        for spec in request.json().get("specs") or []:
+            existing = self._specs.get(spec["id"])
+            if existing is None or existing["version"] != spec["version"]:
+                failed.append(spec)
+                continue
+            existing.update(
+                spec, version=spec["version"] + 1, updatedAt=_now(), updatedBy=_USER
+            )
+            updated.append(
+                {
+                    k: existing.get(k)
+                    for k in (
+                        "id",
+                        "productId",
+                        "specId",
+                        "workspace",
+                        "version",
+                        "updatedAt",
+                        "updatedBy",
+                    )
+                }
+            )
+        response = {"updatedSpecs": updated}  # type: Dict[str, Any]
+        if failed:
+            response["failedSpecs"] = failed
+            response["error"] = _partial_success(
+                "{} specifications don't exist or aren't at the given version.".format(
+                    len(failed)
+                )
+            )
+        return _Response.json(response)
+
+    def _delete_specs(self, request: _Request) -> _Response:
+        ids = request.json()["ids"]
+        deleted = [id for id in ids if self._specs.pop(id, None) is not None]
+        if len(deleted) == len(ids):
+            return _Response.empty()
+        failed = [id for id in ids if id not in deleted]
+        return _Response.json(
+            {
+                "deletedSpecIds": deleted,
+                "failedSpecIds": failed,
+                "error": _partial_success(
+                    "{} specifications don't exist.".format(len(failed))
+                ),
+            }
+        )
@@ -0,0 +1,446 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of StandInServer."""
+
+import gzip
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._rate_limiter import _TokenBucket
+
+from ._dataframe_service import _DataFrameService
+from ._file_service import _FileService
+from ._product_service import _ProductService
+from ._routing import _Request, _Response, _Router
+from ._spec_service import _SpecService
+from ._tag_service import _TagService
+
+_API_KEY = "stand-in-api-key"
+
+
+class ServedRequest:
+    """Describes a request that a :class:`StandInServer` has answered."""
+
+    def __init__(
+        self, method: str, path: str, route: Optional[str], status_code: int
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            method: The HTTP method of the request, such as ``"GET"``.
+            path: The path of the request, without the query string.
+            route: The path template that matched the request, such as
+                ``"/nitag/v2/tags/{path}"``, or None if none matched.
+            status_code: The status code of the response.
+        """
+        self._method = method
+        self._path = path
+        self._route = route
+        self._status_code = status_code
+
+    @property
+    def method(self) -> str:  # noqa: D401
+        """The HTTP method of the request, such as ``"GET"``."""
+        return self._method
+
+    @property
+    def path(self) -> str:  # noqa: D401
+        """The path of the request, without the query string."""
+        return self._path
+
+    @property
+    def route(self) -> Optional[str]:  # noqa: D401
+        """The path template that matched the request, or None if none matched."""
+        return self._route
+
+    @property
+    def status_code(self) -> int:  # noqa: D401
+        """The status code of the response."""
+        return self._status_code
+
+    def __repr__(self) -> str:
+        return "ServedRequest({} {} -> {})".format(
+            self._method, self._path, self._status_code
+        )
+
+
+class _ScriptedFault:
+    def __init__(self, count: int, status_code: int, path_prefix: Optional[str]):
+        self.remaining = count
+        self.status_code = status_code
+        self.path_prefix = path_prefix
+
+
+class StandInServer:
+    """A local, in-memory stand-in for a SystemLink server, for testing and
+    benchmarking clients without a network or a real server.
+
+    The server runs on a background thread, listening on a loopback port, and
+    implements enough of the Tag (``/nitag/v2``), DataFrame (``/nidataframe/v1``),
+    File (``/nifile/v1``) and Specification (``/nispec/v1``) services, and the products
+    of the Test Monitor (``/nitestmonitor/v2``) service, for the clients in this package
+    to work against it: paging and continuation tokens, tag selections and
+    subscriptions, file uploads and table data queries. Filter expressions in Dynamic
+    LINQ are not evaluated. Each connection is served on its own thread. Requests to
+    different services are handled concurrently, and requests to the same service one
+    at a time.
+
+    To make the results of tests and benchmarks realistic, the server can add latency
+    to each response, limit the rate of requests with ``429 Too Many Requests``
+    responses, and fail a random or scripted share of requests. Random choices are made
+    with a seeded generator, so a run can be repeated.
+
+    Example::
+
+        with StandInServer(latency_milliseconds=20) as server:
+            client = DataFrameClient(server.create_configuration())
+            ...
+    """
+
+    def __init__(
+        self,
+        latency_milliseconds: float = 0.0,
+        latency_jitter_milliseconds: float = 0.0,
+        max_requests_per_second: Optional[float] = None,
+        error_rate: float = 0.0,
+        error_status_code: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize a server. It doesn't listen for requests until it's started.
+
+        Args:
+            latency_milliseconds: The time to wait before sending each response.
+            latency_jitter_milliseconds: The most time to randomly add to or subtract
+                from ``latency_milliseconds`` for each response.
+            max_requests_per_second: The rate of requests above which requests are
+                answered with ``429 Too Many Requests``, or None to answer every
+                request.
+            error_rate: The share of requests, from 0 to 1, to answer with
+                ``error_status_code`` instead of handling them.
+            error_status_code: The status code of responses to requests chosen to fail
+                by ``error_rate``.
+            seed: The seed of the generator for latency jitter and errors, or None to
+                seed it randomly.
+
+        Raises:
+            ValueError: if a latency, rate or share is out of range.
+        """
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._router = _Router()
+        _TagService().register(self._router)
+        _DataFrameService().register(self._router)
+        _FileService().register(self._router)
+        _SpecService().register(self._router)
+        _ProductService().register(self._router)
+        self._faults = []  # type: List[_ScriptedFault]
+        self._served = []  # type: List[ServedRequest]
+        self._http_server = None  # type: Optional[_HttpServer]
+        self._thread = None  # type: Optional[threading.Thread]
+        self._bucket = None  # type: Optional[_TokenBucket]
+
+        self.latency_milliseconds = latency_milliseconds
+        self.latency_jitter_milliseconds = latency_jitter_milliseconds
+        self.max_requests_per_second = max_requests_per_second
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start listening for requests on a free loopback port."""
+        if self._http_server is not None:
+            return
+        self._http_server = _HttpServer(self)
+        self._thread = threading.Thread(
+            target=self._http_server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="StandInServer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop listening for requests. The data the server holds is kept."""
+        if self._http_server is None:
+            return
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        self._http_server = None
+        self._thread = None
+
+    @property
+    def uri(self) -> str:  # noqa: D401
+        """The URI of the server, such as ``"http://127.0.0.1:49152"``.
+
+        Raises:
+            RuntimeError: if the server isn't started.
+        """
+        if self._http_server is None:
+            raise RuntimeError("The server isn't started")
+        return "http://127.0.0.1:{}".format(self._http_server.server_port)
+
+    def create_configuration(self) -> core.HttpConfiguration:
+        """Create a configuration for clients to connect to the server.
+
+        Raises:
+            RuntimeError: if the server isn't started.
+        """
+        return core.HttpConfiguration(self.uri, api_key=_API_KEY)
+
+    @property
+    def latency_milliseconds(self) -> float:  # noqa: D401
+        """The time to wait before sending each response."""
+        return self._latency_ms
+
+    @latency_milliseconds.setter
+    def latency_milliseconds(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("latency_milliseconds cannot be negative")
+        self._latency_ms = value
+
+    @property
+    def latency_jitter_milliseconds(self) -> float:  # noqa: D401
+        """The most time to randomly add to or subtract from
+        :attr:`latency_milliseconds` for each response.
+        """
+        return self._jitter_ms
+
+    @latency_jitter_milliseconds.setter
+    def latency_jitter_milliseconds(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("latency_jitter_milliseconds cannot be negative")
+        self._jitter_ms = value
+
+    @property
+    def max_requests_per_second(self) -> Optional[float]:  # noqa: D401
+        """The rate of requests above which requests are answered with ``429 Too Many
+        Requests`` and a ``Retry-After`` header, or None to answer every request.
+        Bursts of up to one second's worth of requests are allowed.
+        """
+        return self._max_requests_per_second
+
+    @max_requests_per_second.setter
+    def max_requests_per_second(self, value: Optional[float]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        with self._lock:
+            self._max_requests_per_second = value
+            self._bucket = _TokenBucket(value, value) if value else None
+
+    @property
+    def error_rate(self) -> float:  # noqa: D401
+        """The share of requests, from 0 to 1, to answer with
+        :attr:`error_status_code` instead of handling them.
+        """
+        return self._error_rate
+
+    @error_rate.setter
+    def error_rate(self, value: float) -> None:
+        if not 0 <= value <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self._error_rate = value
+
+    @property
+    def error_status_code(self) -> int:  # noqa: D401
+        """The status code of responses to requests chosen to fail by
+        :attr:`error_rate`.
+        """
+        return self._error_status_code
+
+    @error_status_code.setter
+    def error_status_code(self, value: int) -> None:
+        self._error_status_code = value
+
+    def fail_next(
+        self, count: int = 1, status_code: int = 503, path_prefix: Optional[str] = None
+    ) -> None:
+        """Answer the next requests with an error instead of handling them.
+
+        Args:
+            count: The number of requests to fail.
+            status_code: The status code to answer them with.
+            path_prefix: Only fail requests whose path starts with this, such as
+                ``"/nitag/v2/subscriptions"``, or None to fail any request.
+        """
+        with self._lock:
+            self._faults.append(_ScriptedFault(count, status_code, path_prefix))
+
+    @property
+    def requests(self) -> List[ServedRequest]:  # noqa: D401
+        """The requests the server has answered, oldest first."""
+        with self._lock:
+            return list(self._served)
+
+    def clear_requests(self) -> None:
+        """Forget the requests the server has answered."""
+        with self._lock:
+            self._served.clear()
+
+    def _serve(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> _Response:
+        request = _Request(method, target, headers, body)
+        route, handler = self._router.route(request)
+        with self._lock:
+            response = self._get_fault(request)
+        if response is None:
+            # Handlers hold the lock of their own service, not the server's
+            response = _handle(request, route, handler)
+        with self._lock:
+            self._served.append(
+                ServedRequest(method, request.path, route, response.status)
+            )
+            delay = self._latency_ms + self._random.uniform(
+                -self._jitter_ms, self._jitter_ms
+            )
+
+        if delay > 0:
+            time.sleep(delay / 1000)
+        return response
+
+    def _get_fault(self, request: _Request) -> Optional[_Response]:
+        """Get the error response to answer a request with instead of handling it, if
+        any. Must be called with the lock held.
+        """
+        for fault in self._faults:
+            if fault.path_prefix is None or request.path.startswith(fault.path_prefix):
+                fault.remaining -= 1
+                if fault.remaining <= 0:
+                    self._faults.remove(fault)
+                return _Response.error(
+                    fault.status_code, "StandIn.ScriptedFault", "Scripted fault."
+                )
+
+        if self._bucket is not None:
+            wait_time = self._bucket.get_wait_time(time.monotonic(), 1)
+            if wait_time > 0:
+                response = _Response.error(
+                    429, "StandIn.Throttled", "Too many requests."
+                )
+                response.headers["Retry-After"] = "{:.3f}".format(wait_time)
+                return response
+            self._bucket.take(1)
+
+        if self._error_rate and self._random.random() < self._error_rate:
+            return _Response.error(
+                self._error_status_code, "StandIn.InjectedError", "Injected error."
+            )
+        return None
+
+
+def _handle(
+    request: _Request,
+    route: Optional[str],
+    handler: Optional[Callable[[], _Response]],
+) -> _Response:
+    if route is None:
+        return _Response.error(
+            404, "NotFound", "No route matches {}.".format(request.path)
+        )
+    if handler is None:
+        return _Response.error(
+            405, "MethodNotAllowed", "{} isn't allowed.".format(request.method)
+        )
+    return handler()
+
+
+class _HttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, stand_in: StandInServer) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.stand_in = stand_in
+        self._connections = set()  # type: Set[socket.socket]
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._connections_lock:
+            self._connections.add(request)
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: Any) -> None:
+        with self._connections_lock:
+            self._connections.discard(request)
+        super().shutdown_request(request)
+
+    def server_close(self) -> None:
+        # Keep-alive connections would otherwise be served until the client closes them
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle's algorithm would delay
+    disable_nagle_algorithm = True
+    server: _HttpServer
+
+    def do_GET(self) -> None:
+        self._respond()
+
+    def do_HEAD(self) -> None:
+        self._respond()
+
+    def do_POST(self) -> None:
+        self._respond()
+
+    def do_PUT(self) -> None:
+        self._respond()
+
+    def do_PATCH(self) -> None:
+        self._respond()
+
+    def do_DELETE(self) -> None:
+        self._respond()
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                chunk = self.rfile.read(size + 2)[:size]
+                if size == 0:
+                    break
+                chunks.append(chunk)
+            body = b"".join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _respond(self) -> None:
+        body = self._read_body()
+        response = self.server.stand_in._serve(
+            self.command,
+            self.path,
+            {name.lower(): value for name, value in self.headers.items()},
+            body,
+        )
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
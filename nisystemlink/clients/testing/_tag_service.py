@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+"""The ``/nitag/v2`` service of :class:`StandInServer`."""
+
+import fnmatch
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from ._routing import _Handler, _now, _Request, _Response, _Router
+
+_BASE = "/nitag/v2"
+_DEFAULT_TAKE = 100
+_NUMERIC_TYPES = ("DOUBLE", "INT", "U_INT64")
+
+
+def _no_such_tag(path: str) -> _Response:
+    return _Response.error(
+        404, "Tag.NoSuchTag", "No tag exists with the path {}.".format(path)
+    )
+
+
+def _no_such_selection(id: str) -> _Response:
+    return _Response.error(
+        404, "Tag.NoSuchSelection", "No selection exists with the ID {}.".format(id)
+    )
+
+
+def _no_such_subscription(id: str) -> _Response:
+    return _Response.error(
+        404,
+        "Tag.NoSuchSubscription",
+        "No subscription exists with the ID {}.".format(id),
+    )
+
+
+def _matches_any(path: str, patterns: List[str]) -> bool:
+    """Whether a tag path matches any of a list of paths that may contain ``*``."""
+    return any(
+        fnmatch.fnmatchcase(path, pattern.replace("[", "[[]")) for pattern in patterns
+    )
+
+
+class _TagService:
+    """Keeps tags, their current values and aggregates, selections and subscriptions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tags = OrderedDict()  # type: OrderedDict[str, Dict[str, Any]]
+        self._values = {}  # type: Dict[str, Dict[str, Any]]
+        self._aggregates = {}  # type: Dict[str, Dict[str, Any]]
+        self._selections = {}  # type: Dict[str, List[str]]
+        self._subscriptions = {}  # type: Dict[str, List[str]]
+        self._subscription_updates = {}  # type: Dict[str, List[Dict[str, Any]]]
+        self._ids = itertools.count(1)
+
+    def register(self, router: _Router) -> None:
+        routes = [
+            ("GET", "/tags", self._query_tags),
+            ("POST", "/tags", self._create_tag),
+            ("GET", "/tags/{path}", self._get_tag),
+            ("DELETE", "/tags/{path}", self._delete_tag),
+            ("GET", "/tags/{path}/values", self._get_values),
+            ("GET", "/tags/{path}/values/current", self._get_current_value),
+            ("GET", "/tags/{path}/values/current/value", self._get_value),
+            ("POST", "/update-tags", self._update_tags),
+            ("POST", "/update-current-values", self._update_values),
+            ("POST", "/selections", self._create_selection),
+            ("GET", "/selections/{id}", self._get_selection),
+            ("PUT", "/selections/{id}", self._update_selection),
+            ("DELETE", "/selections/{id}", self._delete_selection),
+            ("GET", "/selections/{id}/tags", self._get_selection_tags),
+            ("DELETE", "/selections/{id}/tags", self._delete_selection_tags),
+            ("GET", "/selections/{id}/values", self._get_selection_values),
+            (
+                "GET",
+                "/selections/{id}/tags-with-values",
+                self._get_selection_tags_with_values,
+            ),
+            (
+                "POST",
+                "/selections/{id}/reset-aggregates",
+                self._reset_selection_aggregates,
+            ),
+            ("POST", "/subscriptions", self._create_subscription),
+            ("DELETE", "/subscriptions/{id}", self._delete_subscription),
+            ("PUT", "/subscriptions/{id}/heartbeat", self._heartbeat),
+            ("GET", "/subscriptions/{id}/values/current", self._get_updates),
+        ]  # type: List[Tuple[str, str, _Handler]]
+        for method, route, handler in routes:
+            router.add(method, _BASE + route, handler, self._lock)
+
+    def _new_id(self) -> str:
+        return "{:024x}".format(next(self._ids))
+
+    def _find(self, patterns: List[str]) -> List[Dict[str, Any]]:
+        return [t for p, t in self._tags.items() if _matches_any(p, patterns)]
+
+    def _get_current(self, path: str) -> Dict[str, Any]:
+        """Get a tag's value, in the form returned by ``/values``."""
+        return {
+            "path": path,
+            "current": self._values.get(path),
+            "aggregates": self._aggregates.get(path),
+        }
+
+    # Tags
+
+    def _query_tags(self, request: _Request) -> _Response:
+        paths = request.list_param("path") or ["*"]
+        keywords = request.list_param("keywords")
+        properties = [p.split("=", 1) for p in request.list_param("properties")]
+        tags = [
+            t
+            for t in self._find(paths)
+            if all(k in (t.get("keywords") or []) for k in keywords)
+            and all((t.get("properties") or {}).get(k) == v for k, v in properties)
+        ]
+        skip = request.int_param("skip", 0)
+        take = request.int_param("take", _DEFAULT_TAKE)
+        return _Response.json(
+            {"tags": tags[skip : skip + take], "totalCount": len(tags)}
+        )
+
+    def _create_tag(self, request: _Request) -> _Response:
+        self._put_tag(request.json(), merge=False)
+        return _Response.empty(201)
+
+    def _put_tag(self, tag: Dict[str, Any], merge: bool) -> None:
+        path = tag["path"]
+        existing = self._tags.get(path)
+        if merge and existing is not None:
+            existing["keywords"] = sorted(
+                set(existing.get("keywords") or []) | set(tag.get("keywords") or [])
+            )
+            properties = dict(existing.get("properties") or {})
+            properties.update(tag.get("properties") or {})
+            existing["properties"] = properties
+            if "collectAggregates" in tag:
+                existing["collectAggregates"] = tag["collectAggregates"]
+            return
+        if existing is not None and existing["type"] != tag.get("type"):
+            self._values.pop(path, None)
+            self._aggregates.pop(path, None)
+        self._tags[path] = {
+            "path": path,
+            "type": tag.get("type", "UNKNOWN"),
+            "keywords": list(tag.get("keywords") or []),
+            "properties": dict(tag.get("properties") or {}),
+            "collectAggregates": bool(tag.get("collectAggregates")),
+        }
+
+    def _get_tag(self, request: _Request, path: str) -> _Response:
+        tag = self._tags.get(path)
+        return _Response.json(tag) if tag is not None else _no_such_tag(path)
+
+    def _delete_tag(self, request: _Request, path: str) -> _Response:
+        if self._tags.pop(path, None) is None:
+            return _no_such_tag(path)
+        self._values.pop(path, None)
+        self._aggregates.pop(path, None)
+        return _Response.empty()
+
+    def _update_tags(self, request: _Request) -> _Response:
+        body = request.json()
+        for tag in body["tags"]:
+            self._put_tag(tag, bool(body.get("merge")))
+        return _Response.empty(200)
+
+    # Values
+
+    def _get_values(self, request: _Request, path: str) -> _Response:
+        if path not in self._tags:
+            return _no_such_tag(path)
+        return _Response.json(self._get_current(path))
+
+    def _get_current_value(self, request: _Request, path: str) -> _Response:
+        if path not in self._tags:
+            return _no_such_tag(path)
+        return _Response.json(self._values.get(path) or {"value": None})
+
+    def _get_value(self, request: _Request, path: str) -> _Response:
+        if path not in self._tags:
+            return _no_such_tag(path)
+        current = self._values.get(path)
+        return _Response.json(current["value"]) if current else _Response.empty(200)
+
+    def _update_values(self, request: _Request) -> _Response:
+        for tag_updates in request.json():
+            for update in tag_updates["updates"]:
+                self._write(tag_updates["path"], update)
+        return _Response.empty(202)
+
+    def _write(self, path: str, update: Dict[str, Any]) -> None:
+        value = update["value"]
+        tag = self._tags.get(path)
+        if tag is None or tag["type"] == "UNKNOWN":
+            self._put_tag({"path": path, "type": value["type"]}, merge=False)
+            tag = self._tags[path]
+        current = {"value": value, "timestamp": update.get("timestamp") or _now()}
+        self._values[path] = current
+        if tag["collectAggregates"]:
+            self._aggregate(path, tag["type"], value["value"])
+
+        notification = {
+            "tag": tag,
+            "value": value["value"],
+            "timestamp": current["timestamp"],
+            "aggregates": self._aggregates.get(path),
+        }
+        for id, patterns in self._subscriptions.items():
+            if _matches_any(path, patterns):
+                self._subscription_updates[id].append(notification)
+
+    def _aggregate(self, path: str, data_type: str, value: str) -> None:
+        aggregates = self._aggregates.setdefault(path, {"count": 0})
+        aggregates["count"] += 1
+        if data_type not in _NUMERIC_TYPES:
+            return
+        number = float(value)
+        for key, pick in (("min", min), ("max", max)):
+            if key not in aggregates or pick(number, float(aggregates[key])) == number:
+                aggregates[key] = value
+        total = aggregates.get("_sum", 0.0) + number
+        aggregates["_sum"] = total
+        aggregates["avg"] = total / aggregates["count"]
+
+    # Selections
+
+    def _create_selection(self, request: _Request) -> _Response:
+        id = self._new_id()
+        self._selections[id] = list(request.json()["searchPaths"])
+        return _Response.json({"id": id, "searchPaths": self._selections[id]}, 201)
+
+    def _get_selection(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        return _Response.json({"id": id, "searchPaths": self._selections[id]})
+
+    def _update_selection(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        self._selections[id] = list(request.json()["searchPaths"])
+        return _Response.json({"id": id, "searchPaths": self._selections[id]})
+
+    def _delete_selection(self, request: _Request, id: str) -> _Response:
+        if self._selections.pop(id, None) is None:
+            return _no_such_selection(id)
+        return _Response.empty()
+
+    def _get_selection_tags(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        return _Response.json(self._find(self._selections[id]))
+
+    def _delete_selection_tags(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        for tag in self._find(self._selections[id]):
+            self._delete_tag(request, tag["path"])
+        return _Response.empty()
+
+    def _get_selection_values(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        return _Response.json(
+            [self._get_current(t["path"]) for t in self._find(self._selections[id])]
+        )
+
+    def _get_selection_tags_with_values(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        tags_with_values = []
+        for tag in self._find(self._selections[id]):
+            current = self._get_current(tag["path"])
+            del current["path"]
+            current["tag"] = tag
+            tags_with_values.append(current)
+        return _Response.json({"tagsWithValues": tags_with_values})
+
+    def _reset_selection_aggregates(self, request: _Request, id: str) -> _Response:
+        if id not in self._selections:
+            return _no_such_selection(id)
+        for tag in self._find(self._selections[id]):
+            self._aggregates.pop(tag["path"], None)
+        return _Response.empty()
+
+    # Subscriptions
+
+    def _create_subscription(self, request: _Request) -> _Response:
+        id = self._new_id()
+        self._subscriptions[id] = list(request.json()["tags"])
+        self._subscription_updates[id] = []
+        return _Response.json({"subscriptionId": id}, 201)
+
+    def _delete_subscription(self, request: _Request, id: str) -> _Response:
+        if self._subscriptions.pop(id, None) is None:
+            return _no_such_subscription(id)
+        del self._subscription_updates[id]
+        return _Response.empty()
+
+    def _heartbeat(self, request: _Request, id: str) -> _Response:
+        if id not in self._subscriptions:
+            return _no_such_subscription(id)
+        return _Response.empty()
+
+    def _get_updates(self, request: _Request, id: str) -> _Response:
+        if id not in self._subscriptions:
+            return _no_such_subscription(id)
+        updates = self._subscription_updates[id]
+        self._subscription_updates[id] = []
+        return _Response.json(
+            {"subscriptionUpdates": [{"subscriptionId": id, "updates": updates}]}
+        )
@@ -1,3 +1,20 @@
-from ._test_monitor_client import TestMonitorClient
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._test_monitor_client import TestMonitorClient
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._test_monitor_client": ["TestMonitorClient"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
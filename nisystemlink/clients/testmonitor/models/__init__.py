@@ -1,3 +1,20 @@
-from ._api_info import Operation, V2Operations, ApiInfo
+from typing import TYPE_CHECKING
+
+from nisystemlink.clients.core._lazy_exports import _LazyExports
+
+if TYPE_CHECKING:
+    from ._api_info import Operation, V2Operations, ApiInfo
+
+_exports = _LazyExports(
+    __name__,
+    {
+        "._api_info": ["Operation", "V2Operations", "ApiInfo"],
+    },
+)
+__all__ = _exports.names
+
+if not TYPE_CHECKING:
+    __getattr__ = _exports.getattr
+    __dir__ = _exports.dir
 
 # flake8: noqa
@@ -0,0 +1,92 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+import pytest  # type: ignore
+
+
+class LocalServer(ThreadingHTTPServer):
+    """An HTTP/1.1 server that answers requests with canned responses.
+
+    Requests are answered with the next status code in :attr:`status_codes`, or 200
+    once it's empty. If :attr:`etag` is set, responses have that ETag, and requests
+    with a matching If-None-Match header are answered with 304.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.delay_seconds = 0.0
+        self.etag = None  # type: Optional[str]
+        self.status_codes = []  # type: List[int]
+        self.requests = []  # type: List[Tuple[str, str, bytes]]
+        self.request_headers = []  # type: List[Dict[str, str]]
+
+    @property
+    def uri(self) -> str:
+        return "http://127.0.0.1:{}".format(self.server_port)
+
+    @property
+    def paths(self) -> List[str]:
+        return [path for _, path, _ in self.requests]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: LocalServer
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def do_PUT(self):
+        self._respond()
+
+    def do_PATCH(self):
+        self._respond()
+
+    def do_DELETE(self):
+        self._respond()
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.server.requests.append((self.command, self.path, self.rfile.read(length)))
+        self.server.request_headers.append(dict(self.headers))
+        time.sleep(self.server.delay_seconds)
+        status = self.server.status_codes.pop(0) if self.server.status_codes else 200
+        etag = self.server.etag
+        if status == 200 and etag and self.headers.get("If-None-Match") == etag:
+            status = 304
+        if status >= 300:
+            body = b""
+        elif "upload-files" in self.path:
+            body = b'{"uri": "/nifile/v1/service-groups/Default/files/abc"}'
+        elif self.path.startswith("/nifile"):
+            body = b'{"_links": {}, "availableFiles": [], "totalCount": 0}'
+        else:
+            body = b'{"tables": []}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Fixture to serve HTTP/1.1 keep-alive responses from a local server."""
+    server = LocalServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,121 @@
+import json
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.core._uplink._base_client import _handle_http_status
+from nisystemlink.clients.dataframe import AsyncDataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    DataFrame,
+    ExportFormat,
+    ExportTableDataRequest,
+)
+from requests import Response
+
+
+def _create_client(handler) -> AsyncDataFrameClient:
+    client = AsyncDataFrameClient(HttpConfiguration("http://localhost", "key"))
+    client._http_client._transport = httpx.MockTransport(handler)
+    return client
+
+
+class TestAsyncBaseClient:
+    @pytest.mark.asyncio
+    async def test__get_request__response_parsed_into_model(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "tables": [],
+                    "continuationToken": "next",
+                },
+            )
+
+        async with _create_client(handler) as client:
+            response = await client.list_tables(take=5, id=["a", "b"])
+
+        assert response.continuation_token == "next"
+        assert response.tables == []
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert requests[0].url.path == "/nidataframe/v1/tables"
+        assert requests[0].url.params.get_list("id") == ["a", "b"]
+        assert requests[0].headers["x-ni-api-key"] == "key"
+
+    @pytest.mark.asyncio
+    async def test__post_request__model_sent_as_json(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(204)
+
+        async with _create_client(handler) as client:
+            result = await client.append_table_data(
+                "table",
+                AppendTableDataRequest(
+                    frame=DataFrame(data=[["1", "2"]]), end_of_data=True
+                ),
+            )
+
+        assert result is None
+        assert requests[0].url.path == "/nidataframe/v1/tables/table/data"
+        assert requests[0].headers["content-type"] == "application/json"
+        assert json.loads(requests[0].content) == {
+            "frame": {"data": [["1", "2"]]},
+            "endOfData": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test__error_response__raises_api_exception(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404, json={"error": {"name": "NotFound", "message": "Missing"}}
+            )
+
+        async with _create_client(handler) as client:
+            with pytest.raises(ApiException) as ex:
+                await client.get_table_metadata("missing")
+
+        assert ex.value.http_status_code == 404
+        assert ex.value.error is not None
+        assert ex.value.error.name == "NotFound"
+
+    @pytest.mark.asyncio
+    async def test__non_json_error_response__raises_api_exception(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(502, content=b"<html>Bad Gateway</html>")
+
+        async with _create_client(handler) as client:
+            with pytest.raises(ApiException) as ex:
+                await client.get_table_metadata("missing")
+
+        assert ex.value.http_status_code == 502
+        assert "Bad Gateway" in str(ex.value)
+
+    def test__non_json_requests_error_response__raises_api_exception(self):
+        response = Response()
+        response.status_code = 502
+        response.reason = "Bad Gateway"
+        response._content = b"<html>Bad Gateway</html>"
+
+        with pytest.raises(ApiException) as ex:
+            _handle_http_status.handle_response(None, response)
+
+        assert ex.value.http_status_code == 502
+
+    @pytest.mark.asyncio
+    async def test__file_like_response__content_readable(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"a,b\r\n1,2\r\n")
+
+        async with _create_client(handler) as client:
+            data = await client.export_table_data(
+                "table", ExportTableDataRequest(response_format=ExportFormat.CSV)
+            )
+
+        assert data.read() == b"a,b\r\n1,2\r\n"
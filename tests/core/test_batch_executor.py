@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import BatchExecutor, Deadline, HttpConfiguration
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+
+
+def _create_configuration(uri: str, max_connections: int = 10) -> HttpConfiguration:
+    configuration = HttpConfiguration(uri, "key")
+    configuration.max_connections_per_host = max_connections
+    return configuration
+
+
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def __exit__(self, *args) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+class TestBatchExecutor:
+    def test__calls__results_in_order(self, local_server):
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        results = BatchExecutor(client).map(
+            lambda take: client.list_tables(take=take), range(1, 21)
+        )
+
+        assert len(results) == 20
+        assert all(page.tables == [] for page in results.values())
+        assert sorted(path for path in local_server.paths) == sorted(
+            "/nidataframe/v1/tables?take={}".format(i) for i in range(1, 21)
+        )
+        assert results.latency.count == 20
+        assert results.duration_milliseconds > 0
+
+    def test__call_fails__error_returned_for_that_call(self):
+        client = DataFrameClient(_create_configuration("http://localhost"))
+
+        def call(i: int) -> int:
+            if i == 2:
+                raise ValueError(i)
+            return i * 10
+
+        results = BatchExecutor(client).map(call, range(4))
+
+        assert [r.value for r in results] == [0, 10, None, 30]
+        assert isinstance(results[2].error, ValueError)
+        assert len(results.errors) == 1
+        with pytest.raises(ValueError):
+            results.values()
+
+    def test__max_concurrency__capped_at_connections(self):
+        client = DataFrameClient(_create_configuration("http://localhost", 3))
+        tracker = _ConcurrencyTracker()
+
+        def call(i: int) -> int:
+            with tracker:
+                time.sleep(0.01)
+            return i
+
+        executor = BatchExecutor(client, max_concurrency=50)
+        results = executor.map(call, range(30))
+
+        assert executor.max_concurrency == 3
+        assert results.concurrency == 3
+        assert tracker.max_in_flight == 3
+
+    def test__max_concurrency__below_connections_kept(self):
+        client = DataFrameClient(_create_configuration("http://localhost", 10))
+
+        assert BatchExecutor(client, max_concurrency=4).max_concurrency == 4
+        assert BatchExecutor(client).max_concurrency == 10
+
+    def test__deadline__applies_to_calls(self):
+        client = DataFrameClient(_create_configuration("http://localhost"))
+
+        with Deadline(timeout_milliseconds=1000) as deadline:
+            results = BatchExecutor(client).run([Deadline.current] * 3)
+
+        assert results.values() == [deadline] * 3
+
+    def test__no_calls__empty_results(self):
+        client = DataFrameClient(_create_configuration("http://localhost"))
+
+        assert BatchExecutor(client).run([]) == []
+
+    def test__invalid_max_concurrency__raises(self):
+        client = DataFrameClient(_create_configuration("http://localhost"))
+
+        with pytest.raises(ValueError):
+            BatchExecutor(client, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test__run_async_with_synchronous_client__raises(self):
+        client = DataFrameClient(_create_configuration("http://localhost"))
+
+        with pytest.raises(TypeError):
+            await BatchExecutor(client).run_async([])
+
+
+class TestBatchExecutorAsync:
+    @pytest.mark.asyncio
+    async def test__calls__results_in_order_within_limit(self):
+        tracker = _ConcurrencyTracker()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            with tracker:
+                await asyncio.sleep(0.01)
+            if request.url.params["take"] == "3":
+                return httpx.Response(404)
+            return httpx.Response(200, json={"tables": []})
+
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost", 4)
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            results = await BatchExecutor(client, max_concurrency=8).map_async(
+                lambda take: client.list_tables(take=take), range(20)
+            )
+
+        assert tracker.max_in_flight == 4
+        assert results.concurrency == 4
+        assert [r.error is None for r in results] == [i != 3 for i in range(20)]
+        assert results[0].value.tables == []
+
+    @pytest.mark.asyncio
+    async def test__run_with_asyncio_client__raises(self):
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost")
+        ) as client:
+            with pytest.raises(TypeError):
+                BatchExecutor(client).run([])
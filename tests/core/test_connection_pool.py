@@ -0,0 +1,149 @@
+import gc
+import threading
+import time
+import weakref
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ConnectionPool, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.file import FileClient
+
+
+class TestConnectionPool:
+    def test__equivalent_configurations__share_pool(self):
+        first = DataFrameClient(HttpConfiguration("http://localhost", "key"))
+        second = FileClient(HttpConfiguration("http://localhost", "key"))
+
+        assert first.connection_pool is second.connection_pool
+
+    def test__different_credentials__do_not_share_pool(self):
+        first = DataFrameClient(HttpConfiguration("http://localhost", "key"))
+        second = DataFrameClient(HttpConfiguration("http://localhost", "other"))
+
+        assert first.connection_pool is not second.connection_pool
+
+    def test__different_pool_settings__do_not_share_pool(self):
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.max_connections_per_host = 3
+
+        pool = ConnectionPool.for_configuration(configuration)
+
+        assert (
+            pool
+            is not DataFrameClient(
+                HttpConfiguration("http://localhost", "key")
+            ).connection_pool
+        )
+        assert pool.max_connections_per_host == 3
+
+    def test__closed_pool__replaced(self):
+        configuration = HttpConfiguration("http://localhost", "key")
+        pool = ConnectionPool.for_configuration(configuration)
+
+        pool.close()
+
+        assert ConnectionPool.for_configuration(configuration) is not pool
+
+    def test__last_client_gone__pool_released(self):
+        client = DataFrameClient(HttpConfiguration("http://localhost", "unused"))
+        pool = weakref.ref(client.connection_pool)
+
+        del client
+        gc.collect()
+
+        assert pool() is None
+
+    def test__invalid_max_connections__raises(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(max_connections_per_host=0)
+
+    def test__sequential_requests__connection_reused(self, local_server):
+        pool = ConnectionPool()
+
+        for _ in range(3):
+            pool.session.get(local_server.uri).raise_for_status()
+
+        stats = pool.stats
+        assert stats.created == 1
+        assert stats.reused == 2
+        assert stats.idle == 1
+        assert stats.in_use == 0
+
+    def test__clients_with_same_configuration__reuse_connection(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        data_frame_client = DataFrameClient(configuration)
+        file_client = FileClient(configuration)
+
+        data_frame_client.list_tables()
+        file_client.get_files()
+
+        stats = data_frame_client.connection_pool.stats
+        assert stats.created == 1
+        assert stats.reused == 1
+
+    def test__idle_timeout_elapsed__idle_connections_evicted(self, local_server):
+        pool = ConnectionPool(idle_timeout_milliseconds=10)
+        pool.session.get(local_server.uri).raise_for_status()
+
+        time.sleep(0.05)
+
+        stats = pool.stats
+        assert stats.idle == 0
+        assert stats.created == 1
+        pool.session.get(local_server.uri).raise_for_status()
+        assert pool.stats.created == 2
+
+    def test__idle_timeout_elapsed_during_request__request_not_interrupted(
+        self, local_server
+    ):
+        pool = ConnectionPool(idle_timeout_milliseconds=100)
+        local_server.delay_seconds = 0.3
+        responses = []
+
+        def send():
+            responses.append(pool.session.get(local_server.uri))
+
+        threads = [threading.Thread(target=send) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        threads = [threading.Thread(target=send)]
+        threads[0].start()
+        time.sleep(0.15)
+
+        pool.evict_idle_connections()
+        threads[0].join()
+
+        assert [response.status_code for response in responses] == [200] * 3
+        stats = pool.stats
+        assert stats.created == 2
+        assert stats.idle == 1
+
+    def test__keep_alive_disabled__connections_not_reused(self, local_server):
+        pool = ConnectionPool(keep_alive=False)
+
+        for _ in range(2):
+            pool.session.get(local_server.uri).raise_for_status()
+
+        stats = pool.stats
+        assert stats.created == 2
+        assert stats.idle == 0
+
+    def test__concurrent_requests__connections_bounded(self, local_server):
+        pool = ConnectionPool(max_connections_per_host=2)
+
+        def send():
+            for _ in range(5):
+                pool.session.get(local_server.uri).raise_for_status()
+
+        threads = [threading.Thread(target=send) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats
+        assert stats.created <= 2
+        assert stats.created + stats.reused == 30
+        assert stats.in_use == 0
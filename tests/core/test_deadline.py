@@ -0,0 +1,136 @@
+import time
+
+import httpx
+import pytest  # type: ignore
+import requests
+from nisystemlink.clients.core import Deadline, HttpConfiguration, RetryPolicy
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+
+
+def _create_configuration(server_uri: str, timeout_milliseconds: int = 60000):
+    configuration = HttpConfiguration(server_uri, "key")
+    configuration.timeout_milliseconds = timeout_milliseconds
+    configuration.retry_policy = RetryPolicy.no_retries()
+    return configuration
+
+
+class TestDeadline:
+    def test__no_deadline_entered__current_is_none(self):
+        assert Deadline.current() is None
+
+    def test__deadline_entered__current_is_deadline(self):
+        with Deadline(1000) as deadline:
+            assert Deadline.current() is deadline
+            assert 0 < deadline.remaining_milliseconds <= 1000
+            assert not deadline.expired
+
+        assert Deadline.current() is None
+
+    def test__nested_deadline__cannot_extend_outer_deadline(self):
+        with Deadline(100):
+            with Deadline(10000) as inner:
+                assert inner.remaining_milliseconds <= 100
+
+    def test__nested_deadline__can_shorten_outer_deadline(self):
+        with Deadline(10000) as outer:
+            with Deadline(100) as inner:
+                assert inner.remaining_milliseconds <= 100
+                assert Deadline.current() is inner
+            assert Deadline.current() is outer
+            assert outer.remaining_milliseconds > 100
+
+    def test__time_elapsed__expired(self):
+        with Deadline(10) as deadline:
+            time.sleep(0.02)
+
+            assert deadline.expired
+            assert deadline.remaining_milliseconds == 0
+
+    def test__deadline_not_entered__remaining_raises(self):
+        with pytest.raises(RuntimeError):
+            Deadline(1000).remaining_milliseconds
+
+
+class TestClientTimeouts:
+    def test__slow_response__read_timeout_raised(self, local_server):
+        local_server.delay_seconds = 1
+        client = DataFrameClient(_create_configuration(local_server.uri, 100))
+
+        start = time.monotonic()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.list_tables()
+
+        assert time.monotonic() - start < 1
+
+    def test__slow_response__read_timeout_shortened_by_deadline(self, local_server):
+        local_server.delay_seconds = 1
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        start = time.monotonic()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            with Deadline(100):
+                client.list_tables()
+
+        assert time.monotonic() - start < 1
+
+    def test__deadline_expired__raises_without_sending(self, local_server):
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        with Deadline(500):
+            client.list_tables()
+            time.sleep(0.5)
+            with pytest.raises(TimeoutError):
+                client.list_tables()
+
+        assert len(local_server.paths) == 1
+
+    @pytest.mark.asyncio
+    async def test__async_client__timeouts_applied(self):
+        timeouts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(200, json={"tables": []})
+
+        configuration = _create_configuration("http://localhost", 5000)
+        configuration.connect_timeout_milliseconds = 1000
+        async with AsyncDataFrameClient(configuration) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            await client.list_tables()
+            with Deadline(100):
+                await client.list_tables()
+
+        assert timeouts[0]["connect"] == 1
+        assert timeouts[0]["read"] == 5
+        assert timeouts[1]["connect"] <= 0.1
+        assert timeouts[1]["read"] <= 0.1
+
+    @pytest.mark.asyncio
+    async def test__async_client_deadline_expired__raises(self):
+        requests_sent = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_sent.append(request)
+            return httpx.Response(200, json={"tables": []})
+
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost")
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            with Deadline(0):
+                with pytest.raises(TimeoutError):
+                    await client.list_tables()
+
+        assert requests_sent == []
+
+    def test__http_client__timeouts_applied(self, local_server):
+        local_server.delay_seconds = 1
+        client = HttpClient(_create_configuration(local_server.uri, 100))
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.at_uri("/nitag/v2").get("/tags")
+
+        with Deadline(0):
+            with pytest.raises(TimeoutError):
+                client.at_uri("/nitag/v2").get("/tags")
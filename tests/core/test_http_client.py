@@ -0,0 +1,165 @@
+import asyncio
+import threading
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag import TagManager
+
+
+class TestAsyncClients:
+    @pytest.mark.asyncio
+    async def test__requests_on_same_loop__client_reused(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        api = client.at_uri("/nitag/v2").as_async
+
+        await api.get("/tags")
+        first = await client._get_async_client()
+        await asyncio.gather(*(api.get("/tags") for _ in range(5)))
+
+        assert await client._get_async_client() is first
+        assert len(client._aclients) == 1
+        assert len(local_server.requests) == 6
+
+    def test__loop_shut_down__client_closed(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+
+        async def request():
+            await client.at_uri("/nitag/v2").as_async.get("/tags")
+            return await client._get_async_client()
+
+        first = asyncio.run(request())
+        second = asyncio.run(request())
+
+        assert first is not second
+        assert first.is_closed
+        assert second.is_closed
+        assert client._aclients == {}
+
+    def test__concurrent_loops__separate_clients(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        loops = [asyncio.new_event_loop() for _ in range(2)]
+
+        try:
+            clients = [
+                loop.run_until_complete(client._get_async_client()) for loop in loops
+            ]
+
+            assert clients[0] is not clients[1]
+            assert set(client._aclients) == set(loops)
+        finally:
+            for loop in loops:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+    def test__loop_closed_without_shutdown__client_forgotten(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(client._get_async_client())
+        loop.close()
+
+        async def get_clients():
+            await client._get_async_client()
+            return list(client._aclients)
+
+        assert loop not in asyncio.run(get_clients())
+
+    @pytest.mark.asyncio
+    async def test__aclose__client_closed_and_replaced(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        first = await client._get_async_client()
+
+        await client.aclose()
+
+        assert first.is_closed
+        assert client._aclients == {}
+        await client.at_uri("/nitag/v2").as_async.get("/tags")
+        assert await client._get_async_client() is not first
+
+    @pytest.mark.asyncio
+    async def test__tag_manager_aclose__client_closed(self, local_server):
+        manager = TagManager(HttpConfiguration(local_server.uri, "key"))
+        first = await manager._http_client._get_async_client()
+
+        await manager.aclose()
+
+        assert first.is_closed
+
+
+class TestSyncClient:
+    def test__requests_on_many_threads__client_shared(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        api = client.at_uri("/nitag/v2")
+        clients = []
+
+        def request():
+            api.get("/tags")
+            clients.append(client._client)
+
+        threads = [threading.Thread(target=request) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 20
+        assert all(c is clients[0] for c in clients)
+
+    def test__configured_pool__limits_applied(self):
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.max_connections_per_host = 3
+        configuration.keep_alive = False
+
+        pool = HttpClient(configuration)._client._transport._pool
+
+        assert pool._max_connections == 3
+        assert pool._max_keepalive_connections == 0
+
+    def test__close__client_closed_and_replaced(self, local_server):
+        client = HttpClient(HttpConfiguration(local_server.uri, "key"))
+        first = client._client
+
+        client.close()
+
+        assert first.is_closed
+        client.at_uri("/nitag/v2").get("/tags")
+        assert client._client is not first
+
+    def test__tag_manager_close__client_closed(self, local_server):
+        manager = TagManager(HttpConfiguration(local_server.uri, "key"))
+        first = manager._http_client._client
+
+        manager.close()
+
+        assert first.is_closed
+
+
+class TestHttp2:
+    def test__default__http2_disabled(self):
+        configuration = HttpConfiguration("http://localhost", "key")
+
+        pool = HttpClient(configuration)._client._transport._pool
+
+        assert configuration.http2 is False
+        assert pool._http2 is False
+
+    def test__http2_enabled__sync_pool_uses_http2(self):
+        pytest.importorskip("h2")
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.http2 = True
+
+        pool = HttpClient(configuration)._client._transport._pool
+
+        assert pool._http2 is True
+
+    @pytest.mark.asyncio
+    async def test__http2_enabled__async_pool_uses_http2(self):
+        pytest.importorskip("h2")
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.http2 = True
+        client = HttpClient(configuration)
+
+        pool = (await client._get_async_client())._transport._pool
+
+        assert pool._http2 is True
+        await client.aclose()
@@ -0,0 +1,190 @@
+import json
+from typing import Any, AsyncIterator, List
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core.helpers import AsyncJsonArrayStream, JsonArrayStream
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnType,
+    CreateTableRequest,
+    DataFrame,
+    DataType,
+    QueryTableDataRequest,
+)
+from nisystemlink.clients.tag import DataType as TagDataType, TagManager
+from nisystemlink.clients.testing import StandInServer
+
+_DOCUMENT = {
+    "frame": {
+        "columns": ["i", "name"],
+        "data": [["1", "café"], ["22", None], [{"nested": [1, 2]}], [3.5e10]],
+    },
+    "totalRowCount": 4,
+    "continuationToken": None,
+}
+
+
+def _split(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+async def _async_chunks(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def server():
+    """Fixture to run a stand-in server with no latency or errors."""
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+class TestJsonArrayStream:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+    def test__any_chunk_size__items_and_remainder_decoded(self, size):
+        data = json.dumps(_DOCUMENT, indent=2, ensure_ascii=False).encode()
+
+        stream = JsonArrayStream(_split(data, size), ["frame", "data"])
+
+        assert list(stream) == _DOCUMENT["frame"]["data"]  # type: ignore
+        assert stream.remainder == {
+            "frame": {"columns": ["i", "name"], "data": []},
+            "totalRowCount": 4,
+            "continuationToken": None,
+        }
+
+    def test__items_yielded_as_received(self):
+        chunks = iter([b'[{"a": 1}, {"a"', b": 2}]"])
+        stream = JsonArrayStream(chunks)
+
+        assert next(stream) == {"a": 1}
+        assert next(chunks) == b": 2}]"
+
+    def test__number_split_between_chunks__decoded_whole(self):
+        stream = JsonArrayStream([b"[12", b"34]"])
+
+        assert list(stream) == [1234]
+        assert stream.remainder == []
+
+    def test__null_instead_of_array__no_items(self):
+        stream = JsonArrayStream([b'{"values": null}'], ["values"])
+
+        assert list(stream) == []
+        assert stream.remainder == {"values": None}
+
+    @pytest.mark.parametrize(
+        "data", [b"[1, 2", b"[1 2]", b'{"a" 1}', b"[1] 2", b"", b"[tru]"]
+    )
+    def test__invalid_json__raises(self, data):
+        with pytest.raises(json.JSONDecodeError):
+            list(JsonArrayStream(_split(data, 2), ["a"] if b"{" in data else []))
+
+    def test__not_finished__remainder_raises(self):
+        stream = JsonArrayStream([b"[1, 2]"])
+        next(stream)
+
+        with pytest.raises(RuntimeError):
+            stream.remainder
+
+    def test__finished_or_exited__closed_once(self):
+        close = mock.Mock()
+        with JsonArrayStream([b"[1]"], close=close) as stream:
+            list(stream)
+            close.assert_called_once_with()
+
+        close.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test__async_stream__items_and_remainder_decoded(self):
+        data = json.dumps(_DOCUMENT).encode()
+        close = mock.AsyncMock()
+
+        async with AsyncJsonArrayStream(
+            _async_chunks(_split(data, 5)), ["frame", "data"], close
+        ) as stream:
+            items = [item async for item in stream]
+
+        assert items == _DOCUMENT["frame"]["data"]  # type: ignore
+        assert stream.remainder["totalRowCount"] == 4
+        close.assert_awaited_once_with()
+
+
+class TestStreamedResponses:
+    def _create_table(self, client: DataFrameClient, rows: int) -> str:
+        id = client.create_table(
+            CreateTableRequest(
+                columns=[
+                    Column(
+                        name="i", data_type=DataType.Int32, column_type=ColumnType.Index
+                    )
+                ]
+            )
+        )
+        client.append_table_data(
+            id,
+            AppendTableDataRequest(
+                frame=DataFrame(columns=["i"], data=[[str(i)] for i in range(rows)])
+            ),
+        )
+        return id
+
+    def test__stream_table_data__rows_streamed(self, server):
+        client = DataFrameClient(server.create_configuration())
+        id = self._create_table(client, rows=25)
+
+        with client.stream_table_data(id, QueryTableDataRequest(take=10)) as rows:
+            data = list(rows)
+
+        assert data == [[str(i)] for i in range(10)]
+        assert rows.remainder["totalRowCount"] == 25
+        assert rows.remainder["continuationToken"] is not None
+
+    def test__stream_table_data__missing_table_raises(self, server):
+        client = DataFrameClient(server.create_configuration())
+
+        with pytest.raises(ApiException) as exc_info:
+            client.stream_table_data("missing", QueryTableDataRequest())
+
+        assert exc_info.value.http_status_code == 404
+
+    @pytest.mark.asyncio
+    async def test__async_stream_table_data__rows_streamed(self, server):
+        id = self._create_table(DataFrameClient(server.create_configuration()), 5)
+        client = AsyncDataFrameClient(server.create_configuration())
+
+        rows = await client.stream_table_data(id, QueryTableDataRequest())
+        data = [row async for row in rows]
+
+        assert data == [[str(i)] for i in range(5)]
+        assert rows.remainder["continuationToken"] is None
+
+    def test__stream_get__error_raises(self, server):
+        api = HttpClient(server.create_configuration()).at_uri("/nitag/v2")
+
+        with pytest.raises(ApiException) as exc_info:
+            api.stream_get("/selections/{id}/values", params={"id": "missing"})
+
+        assert exc_info.value.http_status_code == 404
+
+    @pytest.mark.asyncio
+    async def test__selection_values__streamed(self, server):
+        manager = TagManager(server.create_configuration())
+        with manager.create_writer(buffer_size=10) as writer:
+            for i in range(5):
+                writer.write("tag{}".format(i), TagDataType.INT32, i)
+
+        values = {}  # type: Any
+        with manager.open_selection(["tag*"]) as selection:
+            selection.refresh_values()
+            values["sync"] = {p: r.read().value for p, r in selection.values.items()}
+            await selection.refresh_values_async()
+            values["async"] = {p: r.read().value for p, r in selection.values.items()}
+
+        expected = {"tag{}".format(i): i for i in range(5)}
+        assert values == {"sync": expected, "async": expected}
@@ -0,0 +1,112 @@
+import json
+from datetime import datetime, timezone
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.core._uplink import _json_body
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    ModifyTableRequest,
+    TableMetadata,
+)
+from nisystemlink.clients.spec.models import (
+    CreateSpecificationsRequest,
+    SpecificationDefinition,
+    SpecificationLimit,
+    SpecificationType,
+)
+
+_MODELS = [
+    AppendTableDataRequest(
+        frame=DataFrame(columns=["a", "b"], data=[["1", None], ["2", "x"]]),
+        end_of_data=True,
+    ),
+    TableMetadata(
+        columns=[
+            Column(name="i", data_type=DataType.Int32, column_type=ColumnType.Index)
+        ],
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=timezone.utc),
+        id="id",
+        metadata_modified_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        metadata_revision=1,
+        name="table",
+        properties={"key": "value"},
+        row_count=2,
+        rows_modified_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        supports_append=True,
+        workspace="workspace",
+    ),
+    ModifyTableRequest(name=None, properties={"removed": None}),
+]
+
+
+def _spec(limit: SpecificationLimit) -> SpecificationDefinition:
+    return SpecificationDefinition(
+        product_id="product",
+        spec_id="spec",
+        type=SpecificationType.PARAMETRIC,
+        limit=limit,
+    )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Fixture to encode with each available JSON backend."""
+    if request.param == "json":
+        monkeypatch.setattr(_json_body, "orjson", None)
+    elif _json_body.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestJsonBody:
+    @pytest.mark.parametrize("model", _MODELS)
+    def test__model__encoded_like_pydantic(self, backend, model):
+        encoded = _json_body.dumps(model)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(
+            model.json(by_alias=True, exclude_unset=True)
+        )
+
+    def test__models_nested_in_containers__encoded(self, backend):
+        encoded = _json_body.dumps({"models": [_MODELS[2]], "replace": True})
+
+        assert json.loads(encoded) == {
+            "models": [{"name": None, "properties": {"removed": None}}],
+            "replace": True,
+        }
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test__non_finite_float__raises(self, backend, value):
+        with pytest.raises(ValueError):
+            _json_body.dumps({"values": [1.0, value, None]})
+
+    def test__non_finite_float_in_model__raises(self, backend):
+        limit = SpecificationLimit(min=1.0, max=float("nan"))
+
+        with pytest.raises(ValueError):
+            _json_body.dumps(CreateSpecificationsRequest(specs=[_spec(limit)]))
+
+    def test__null_without_non_finite_float__encoded(self, backend):
+        encoded = _json_body.dumps({"value": None, "nullable": 1.5})
+
+        assert json.loads(encoded) == {"value": None, "nullable": 1.5}
+
+    def test__client__sends_encoded_bytes(self, local_server):
+        client = DataFrameClient(HttpConfiguration(local_server.uri, "key"))
+
+        client.append_table_data("table", _MODELS[0])
+
+        method, path, body = local_server.requests[0]
+        assert method == "POST"
+        assert path == "/nidataframe/v1/tables/table/data"
+        assert json.loads(body) == {
+            "frame": {"columns": ["a", "b"], "data": [["1", None], ["2", "x"]]},
+            "endOfData": True,
+        }
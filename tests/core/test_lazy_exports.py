@@ -0,0 +1,117 @@
+import ast
+import importlib
+import pathlib
+import subprocess
+import sys
+from typing import Dict, List
+
+import pytest  # type: ignore
+
+_PACKAGES = [
+    "nisystemlink.clients.core",
+    "nisystemlink.clients.core.helpers",
+    "nisystemlink.clients.artifact",
+    "nisystemlink.clients.artifact.models",
+    "nisystemlink.clients.dataframe",
+    "nisystemlink.clients.dataframe.models",
+    "nisystemlink.clients.file",
+    "nisystemlink.clients.file.models",
+    "nisystemlink.clients.product",
+    "nisystemlink.clients.product.models",
+    "nisystemlink.clients.product.utilities",
+    "nisystemlink.clients.spec",
+    "nisystemlink.clients.spec.models",
+    "nisystemlink.clients.tag",
+    "nisystemlink.clients.testing",
+    "nisystemlink.clients.testmonitor",
+    "nisystemlink.clients.testmonitor.models",
+]
+
+_REPO_ROOT = pathlib.Path(__file__).parents[2]
+
+
+def _get_type_checking_names(package: str) -> List[str]:
+    """Get the names a package imports for type checkers."""
+    path = _REPO_ROOT.joinpath(*package.split("."), "__init__.py")
+    tree = ast.parse(path.read_text())
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    names = []  # type: List[str]
+    for node in block.body:
+        if isinstance(node, ast.ImportFrom):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.Assign):
+            names.extend(target.id for target in node.targets)  # type: ignore
+    return names
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test__exports__match_type_checking_imports(self, package):
+        module = importlib.import_module(package)
+
+        assert sorted(module.__all__) == sorted(_get_type_checking_names(package))
+
+    @pytest.mark.parametrize("package", _PACKAGES)
+    def test__exports__resolved_and_listed(self, package):
+        module = importlib.import_module(package)
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+
+    def test__alias__same_as_exported_name(self):
+        from nisystemlink.clients.dataframe import models
+
+        assert models.TableMetdataModification is models.TableMetadataModification
+
+    def test__unknown_name__raises_attribute_error(self):
+        from nisystemlink.clients import tag
+
+        with pytest.raises(AttributeError):
+            tag.NotAName  # type: ignore
+
+    def test__star_import__imports_every_name(self):
+        namespace = {}  # type: Dict[str, object]
+
+        exec("from nisystemlink.clients.core import *", namespace)
+
+        assert "HttpConfiguration" in namespace
+        assert "BatchExecutor" in namespace
+
+
+class TestImportTime:
+    def test__import_packages__no_third_party_libraries_imported(self):
+        statement = "import sys; import {}; print(sorted(set(sys.modules) & {{{}}}))"
+        libraries = ["aenum", "events", "httpx", "pydantic", "requests", "uplink"]
+
+        result = _run_python(
+            "-c",
+            statement.format(
+                ", ".join(_PACKAGES), ", ".join(repr(lib) for lib in libraries)
+            ),
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test__import_tag_manager__uplink_and_requests_not_imported(self):
+        result = _run_python(
+            "-c",
+            "import sys; from nisystemlink.clients.tag import TagManager; "
+            "print(sorted(set(sys.modules) & {'requests', 'uplink'}))",
+        )
+
+        assert result.stdout.strip() == "[]"
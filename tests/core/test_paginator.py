@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import time
+from typing import List, Optional
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import Deadline
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+from nisystemlink.clients.core.helpers import AsyncPaginator, Paginator
+
+
+class _Page(WithPaging):
+    items: List[int]
+
+
+class _Service:
+    """Serves ``pages`` pages of ``page_size`` consecutive integers."""
+
+    def __init__(self, pages: int, page_size: int = 3, delay: float = 0) -> None:
+        self.pages = pages
+        self.page_size = page_size
+        self.delay = delay
+        self.tokens = []  # type: List[Optional[str]]
+        self.fail_at = None  # type: Optional[int]
+
+    def _page(self, token: Optional[str]) -> _Page:
+        self.tokens.append(token)
+        index = int(token) if token else 0
+        if index == self.fail_at:
+            raise RuntimeError("page {}".format(index))
+        start = index * self.page_size
+        return _Page(
+            items=list(range(start, start + self.page_size)),
+            continuation_token=str(index + 1) if index + 1 < self.pages else None,
+        )
+
+    def fetch(self, token: Optional[str]) -> _Page:
+        time.sleep(self.delay)
+        return self._page(token)
+
+    async def fetch_async(self, token: Optional[str]) -> _Page:
+        await asyncio.sleep(self.delay)
+        return self._page(token)
+
+
+def _get_items(page: _Page) -> List[int]:
+    return page.items
+
+
+class TestPaginator:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test__all_pages__items_in_order(self, prefetch):
+        service = _Service(pages=4)
+
+        items = list(Paginator(service.fetch, _get_items, prefetch=prefetch))
+
+        assert items == list(range(12))
+        assert service.tokens == [None, "1", "2", "3"]
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test__max_items__stops_fetching(self, prefetch):
+        service = _Service(pages=10)
+
+        items = list(
+            Paginator(service.fetch, _get_items, prefetch=prefetch, max_items=5)
+        )
+
+        assert items == [0, 1, 2, 3, 4]
+        assert service.tokens == [None, "1"]
+
+    def test__pages__yielded_with_tokens(self):
+        service = _Service(pages=3)
+
+        pages = list(Paginator(service.fetch, _get_items).pages())
+
+        assert [page.continuation_token for page in pages] == ["1", "2", None]
+
+    def test__continuation_token__resumed(self):
+        service = _Service(pages=3)
+
+        items = list(Paginator(service.fetch, _get_items, continuation_token="2"))
+
+        assert items == [6, 7, 8]
+
+    def test__fetch_fails__error_raised_after_earlier_pages(self):
+        service = _Service(pages=4)
+        service.fail_at = 2
+        items = []
+
+        with pytest.raises(RuntimeError, match="page 2"):
+            for item in Paginator(service.fetch, _get_items):
+                items.append(item)
+
+        assert items == list(range(6))
+
+    def test__prefetch__bounded_ahead_of_caller(self):
+        service = _Service(pages=100)
+        pages = Paginator(service.fetch, _get_items, prefetch=2).pages()
+
+        next(pages)
+        time.sleep(0.1)
+
+        # The page returned, and the two buffered, plus one waiting to be buffered
+        assert len(service.tokens) <= 4
+        pages.close()
+
+    def test__iteration_stopped__worker_stops(self):
+        service = _Service(pages=1000)
+        threads = threading.active_count()
+
+        for item in Paginator(service.fetch, _get_items):
+            if item == 3:
+                break
+        time.sleep(0.1)
+
+        assert threading.active_count() == threads
+        assert len(service.tokens) < 10
+
+    def test__prefetch__overlaps_fetching_and_processing(self):
+        service = _Service(pages=5, delay=0.05)
+
+        start = time.perf_counter()
+        for _ in Paginator(service.fetch, _get_items).pages():
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        # Sequential fetching and processing would take 0.5 s
+        assert elapsed < 0.45
+
+    def test__deadline__applies_to_prefetching(self):
+        deadlines = []
+
+        def fetch(token):
+            deadlines.append(Deadline.current())
+            return _Page(items=[1], continuation_token=None)
+
+        with Deadline(timeout_milliseconds=1000) as deadline:
+            list(Paginator(fetch, _get_items))
+
+        assert deadlines == [deadline]
+
+    def test__negative_prefetch__raises(self):
+        with pytest.raises(ValueError):
+            Paginator(_Service(1).fetch, _get_items, prefetch=-1)
+
+
+class TestAsyncPaginator:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test__all_pages__items_in_order(self, prefetch):
+        service = _Service(pages=4)
+
+        items = [
+            item
+            async for item in AsyncPaginator(
+                service.fetch_async, _get_items, prefetch=prefetch
+            )
+        ]
+
+        assert items == list(range(12))
+        assert service.tokens == [None, "1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test__max_items__stops_fetching(self):
+        service = _Service(pages=10)
+
+        items = [
+            item
+            async for item in AsyncPaginator(
+                service.fetch_async, _get_items, max_items=4
+            )
+        ]
+
+        assert items == [0, 1, 2, 3]
+        assert service.tokens == [None, "1"]
+
+    @pytest.mark.asyncio
+    async def test__fetch_fails__error_raised(self):
+        service = _Service(pages=4)
+        service.fail_at = 1
+
+        with pytest.raises(RuntimeError, match="page 1"):
+            async for _ in AsyncPaginator(service.fetch_async, _get_items).pages():
+                pass
+
+    @pytest.mark.asyncio
+    async def test__prefetch__overlaps_fetching_and_processing(self):
+        service = _Service(pages=5, delay=0.05)
+
+        start = time.perf_counter()
+        async for _ in AsyncPaginator(service.fetch_async, _get_items).pages():
+            await asyncio.sleep(0.05)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45
@@ -0,0 +1,180 @@
+import json
+import threading
+import time
+from unittest import mock
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import (
+    Deadline,
+    HttpConfiguration,
+    RateLimiter,
+    RetryPolicy,
+)
+from nisystemlink.clients.core._internal import _http_client
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._rate_limiter import _find_rate_limiter
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+from nisystemlink.clients.testing import StandInServer
+
+
+def _timed(func, count: int) -> float:
+    start = time.monotonic()
+    for _ in range(count):
+        func()
+    return time.monotonic() - start
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"requests_per_second": 0},
+            {"bytes_per_second": -1},
+            {"requests_per_second": 1, "burst_requests": 0},
+        ],
+    )
+    def test__invalid_rate__raises(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+    def test__within_burst__not_delayed(self):
+        limiter = RateLimiter(requests_per_second=1, burst_requests=5)
+
+        assert _timed(limiter.acquire, 5) < 0.5
+
+    def test__burst_exhausted__delayed_to_rate(self):
+        limiter = RateLimiter(requests_per_second=20, burst_requests=1)
+
+        elapsed = _timed(limiter.acquire, 4)
+
+        assert elapsed >= 0.14
+        assert limiter.wait_time_milliseconds > 0
+
+    def test__bytes_exceed_rate__delayed(self):
+        limiter = RateLimiter(bytes_per_second=10000)
+        limiter.acquire(10000)
+
+        assert _timed(lambda: limiter.acquire(2000), 1) >= 0.18
+
+    def test__concurrent_callers__share_rate(self):
+        limiter = RateLimiter(requests_per_second=50, burst_requests=1)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(6)]
+
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test__wait_exceeds_deadline__raises(self):
+        limiter = RateLimiter(requests_per_second=1, burst_requests=1)
+        limiter.acquire()
+
+        with Deadline(100):
+            with pytest.raises(TimeoutError):
+                limiter.acquire()
+
+    @pytest.mark.asyncio
+    async def test__acquire_async__delayed_to_rate(self):
+        limiter = RateLimiter(requests_per_second=20, burst_requests=1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire_async()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test__nested_base_paths__longest_match_used(self):
+        service = RateLimiter(requests_per_second=1)
+        endpoint = RateLimiter(requests_per_second=1)
+        limiters = {"/nitag/v2": service, "/nitag/v2/update-current-values": endpoint}
+
+        assert _find_rate_limiter(limiters, "/nitag/v2/tags") is service
+        assert (
+            _find_rate_limiter(limiters, "/nitag/v2/update-current-values") is endpoint
+        )
+        assert _find_rate_limiter(limiters, "/nitag/v2x") is None
+        assert _find_rate_limiter(limiters, "/nidataframe/v1/tables") is None
+
+    def test__rate_limiter_removed__not_in_configuration(self):
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.set_rate_limiter("/nitag/v2", RateLimiter(requests_per_second=1))
+
+        configuration.set_rate_limiter("/nitag/v2", None)
+
+        assert configuration.rate_limiters == {}
+
+
+class TestClientRateLimits:
+    def test__client__requests_delayed_to_rate(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.set_rate_limiter(
+            "/nidataframe/v1", RateLimiter(requests_per_second=20, burst_requests=1)
+        )
+        client = DataFrameClient(configuration)
+
+        assert _timed(client.list_tables, 3) >= 0.09
+        assert len(local_server.requests) == 3
+
+    def test__client__other_services_not_delayed(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.set_rate_limiter(
+            "/nitag/v2", RateLimiter(requests_per_second=1, burst_requests=1)
+        )
+        client = DataFrameClient(configuration)
+
+        assert _timed(client.list_tables, 3) < 0.5
+
+    @pytest.mark.asyncio
+    async def test__async_client__bytes_delayed_to_rate(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(204)
+
+        configuration = HttpConfiguration("http://localhost", "key")
+        configuration.set_rate_limiter(
+            "/nidataframe/v1", RateLimiter(bytes_per_second=1000, burst_bytes=1)
+        )
+        request = AppendTableDataRequest(frame=DataFrame(data=[["1" * 40]]))
+
+        async with AsyncDataFrameClient(configuration) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            start = time.monotonic()
+            for _ in range(3):
+                await client.append_table_data("table", request)
+
+        assert time.monotonic() - start >= 0.1
+
+    def test__http_client__requests_delayed_to_rate(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.set_rate_limiter(
+            "/nitag/v2", RateLimiter(requests_per_second=20, burst_requests=1)
+        )
+        client = HttpClient(configuration).at_uri("/nitag/v2")
+
+        assert _timed(lambda: client.get("/tags"), 3) >= 0.09
+
+    def test__http_client_request_retried__body_encoded_once(self):
+        with StandInServer(seed=0) as server:
+            configuration = server.create_configuration()
+            configuration.retry_policy = RetryPolicy(
+                initial_delay_milliseconds=1, max_delay_milliseconds=1
+            )
+            configuration.set_rate_limiter(
+                "/nitag/v2", RateLimiter(bytes_per_second=1e6)
+            )
+            client = HttpClient(configuration).at_uri("/nitag/v2")
+            server.fail_next(count=2, status_code=503)
+            data = [
+                {"path": "a", "updates": [{"value": {"type": "INT", "value": "1"}}]}
+            ]
+
+            # The stand-in server encodes its responses with the same module
+            with mock.patch.object(_http_client, "json", wraps=json) as encoder:
+                client.post("/update-current-values", data=data)
+
+            assert [r.status_code for r in server.requests] == [503, 503, 202]
+        assert encoder.dumps.call_count == 1
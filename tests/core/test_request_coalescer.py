@@ -0,0 +1,158 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration, RequestCoalescer
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import QueryTablesRequest
+
+
+def _create_configuration(uri: str, coalescer: RequestCoalescer) -> HttpConfiguration:
+    configuration = HttpConfiguration(uri, "key")
+    configuration.request_coalescer = coalescer
+    return configuration
+
+
+def _call_at_once(count, call):
+    barrier = threading.Barrier(count)
+
+    def wait_and_call(_):
+        barrier.wait()
+        return call()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=count) as pool:
+        futures = [pool.submit(wait_and_call, i) for i in range(count)]
+        return [future.result() for future in futures]
+
+
+class TestClientRequestCoalescer:
+    def test__identical_requests_in_flight__sent_once(self, local_server):
+        local_server.delay_seconds = 0.3
+        coalescer = RequestCoalescer()
+        client = DataFrameClient(_create_configuration(local_server.uri, coalescer))
+
+        results = _call_at_once(5, lambda: client.list_tables(take=1))
+
+        assert len(local_server.requests) == 1
+        assert coalescer.sent == 1
+        assert coalescer.coalesced == 4
+        assert all(result == results[0] for result in results)
+
+    def test__different_query__sent_separately(self, local_server):
+        local_server.delay_seconds = 0.3
+        coalescer = RequestCoalescer()
+        client = DataFrameClient(_create_configuration(local_server.uri, coalescer))
+        takes = iter(range(1, 5))
+        lock = threading.Lock()
+
+        def list_tables():
+            with lock:
+                take = next(takes)
+            return client.list_tables(take=take)
+
+        _call_at_once(4, list_tables)
+
+        assert len(local_server.requests) == 4
+        assert coalescer.coalesced == 0
+
+    def test__post_requests__not_coalesced(self, local_server):
+        local_server.delay_seconds = 0.3
+        coalescer = RequestCoalescer()
+        client = DataFrameClient(_create_configuration(local_server.uri, coalescer))
+
+        _call_at_once(3, lambda: client.query_tables(QueryTablesRequest(filter="")))
+
+        assert len(local_server.requests) == 3
+        assert coalescer.sent == 0
+
+    def test__request_fails__error_raised_for_every_caller(self, local_server):
+        local_server.delay_seconds = 0.3
+        local_server.status_codes = [404]
+        coalescer = RequestCoalescer()
+        client = DataFrameClient(_create_configuration(local_server.uri, coalescer))
+
+        def list_tables():
+            with pytest.raises(ApiException) as ex:
+                client.list_tables()
+            return ex.value.http_status_code
+
+        assert _call_at_once(3, list_tables) == [404, 404, 404]
+        assert len(local_server.requests) == 1
+
+    def test__requests_after_completion__sent_again(self, local_server):
+        coalescer = RequestCoalescer()
+        client = DataFrameClient(_create_configuration(local_server.uri, coalescer))
+
+        client.list_tables()
+        client.list_tables()
+
+        assert len(local_server.requests) == 2
+        assert coalescer.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test__async_identical_requests_in_flight__sent_once(self, local_server):
+        local_server.delay_seconds = 0.2
+        coalescer = RequestCoalescer()
+        async with AsyncDataFrameClient(
+            _create_configuration(local_server.uri, coalescer)
+        ) as client:
+            results = await asyncio.gather(
+                *(client.list_tables(take=1) for _ in range(5))
+            )
+
+        assert len(local_server.requests) == 1
+        assert coalescer.coalesced == 4
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test__async_first_caller_cancelled__others_get_response(
+        self, local_server
+    ):
+        local_server.delay_seconds = 0.2
+        coalescer = RequestCoalescer()
+        async with AsyncDataFrameClient(
+            _create_configuration(local_server.uri, coalescer)
+        ) as client:
+            first = asyncio.ensure_future(client.list_tables())
+            await asyncio.sleep(0.05)
+            second = asyncio.ensure_future(client.list_tables())
+            await asyncio.sleep(0.05)
+            first.cancel()
+
+            result = await second
+
+        assert result.tables == []
+        assert len(local_server.requests) == 1
+
+
+class TestHttpClientRequestCoalescer:
+    def test__identical_requests_in_flight__sent_once(self, local_server):
+        local_server.delay_seconds = 0.3
+        coalescer = RequestCoalescer()
+        client = HttpClient(_create_configuration(local_server.uri, coalescer)).at_uri(
+            "/nidataframe/v1"
+        )
+
+        results = _call_at_once(4, lambda: client.get("/tables", params={"take": "1"}))
+
+        assert len(local_server.requests) == 1
+        assert coalescer.coalesced == 3
+        data = [data for data, _ in results]
+        assert data == [{"tables": []}] * 4
+        assert data[0] is not data[1]
+
+    @pytest.mark.asyncio
+    async def test__async_identical_requests_in_flight__sent_once(self, local_server):
+        local_server.delay_seconds = 0.2
+        coalescer = RequestCoalescer()
+        http_client = HttpClient(_create_configuration(local_server.uri, coalescer))
+        client = http_client.at_uri("/nidataframe/v1").as_async
+
+        results = await asyncio.gather(*(client.get("/tables") for _ in range(3)))
+        await http_client.aclose()
+
+        assert len(local_server.requests) == 1
+        assert coalescer.coalesced == 2
+        assert [data for data, _ in results] == [{"tables": []}] * 3
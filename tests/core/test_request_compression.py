@@ -0,0 +1,155 @@
+import gzip
+import json
+import os
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration, RequestMetrics, RetryPolicy
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._request_compression import _compress_body
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+
+_ROWS = [[str(i), "station-{}".format(i % 4), "PASSED"] for i in range(1000)]
+
+
+def _create_configuration(uri: str, threshold) -> HttpConfiguration:
+    configuration = HttpConfiguration(uri, "key")
+    configuration.retry_policy = RetryPolicy(initial_delay_milliseconds=1)
+    configuration.request_compression_threshold_bytes = threshold
+    return configuration
+
+
+class TestCompressBody:
+    def test__disabled__not_compressed(self):
+        assert _compress_body(b"x" * 1000, None) is None
+
+    def test__below_threshold__not_compressed(self):
+        assert _compress_body(b"x" * 999, 1000) is None
+
+    def test__at_threshold__gzipped(self):
+        compressed = _compress_body(b"x" * 1000, 1000)
+
+        assert compressed is not None
+        assert compressed.is_compressed
+        assert compressed.uncompressed_size == 1000
+        assert gzip.decompress(compressed.data) == b"x" * 1000
+
+    def test__incompressible__original_kept(self):
+        body = os.urandom(100)
+
+        compressed = _compress_body(body, 0)
+
+        assert compressed is not None
+        assert not compressed.is_compressed
+        assert compressed.data == body
+
+
+class TestClientCompression:
+    def test__large_body__sent_gzipped(self, local_server):
+        metrics = RequestMetrics()
+        configuration = _create_configuration(local_server.uri, 1024)
+        configuration.add_request_observer(metrics)
+        client = DataFrameClient(configuration)
+
+        client.append_table_data(
+            "abc", AppendTableDataRequest(frame=DataFrame(data=_ROWS))
+        )
+
+        [(_, _, body)] = local_server.requests
+        [headers] = local_server.request_headers
+        assert headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(body)) == {"frame": {"data": _ROWS}}
+        [route] = metrics.get_metrics()
+        assert route.bytes_sent == len(body)
+        assert route.bytes_saved_by_compression > 5 * len(body)
+        assert route.compression_milliseconds > 0
+
+    def test__small_body__sent_uncompressed(self, local_server):
+        client = DataFrameClient(_create_configuration(local_server.uri, 1024))
+
+        client.append_table_data(
+            "abc", AppendTableDataRequest(frame=DataFrame(data=[["1"]]))
+        )
+
+        [(_, _, body)] = local_server.requests
+        [headers] = local_server.request_headers
+        assert "Content-Encoding" not in headers
+        assert body == b'{"frame":{"data":[["1"]]}}'
+
+    def test__disabled__sent_uncompressed(self, local_server):
+        client = DataFrameClient(_create_configuration(local_server.uri, None))
+
+        client.append_table_data(
+            "abc", AppendTableDataRequest(frame=DataFrame(data=_ROWS))
+        )
+
+        [headers] = local_server.request_headers
+        assert "Content-Encoding" not in headers
+
+    def test__request_retried__same_body_resent(self, local_server):
+        local_server.status_codes = [503]
+        client = DataFrameClient(_create_configuration(local_server.uri, 0))
+
+        client.append_table_data(
+            "abc", AppendTableDataRequest(frame=DataFrame(data=_ROWS))
+        )
+
+        first, second = [body for _, _, body in local_server.requests]
+        assert first == second
+        assert json.loads(gzip.decompress(second)) == {"frame": {"data": _ROWS}}
+
+    @pytest.mark.asyncio
+    async def test__async_client__sent_gzipped(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost", 0)
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            await client.append_table_data(
+                "abc", AppendTableDataRequest(frame=DataFrame(data=_ROWS))
+            )
+
+        [request] = requests
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == {
+            "frame": {"data": _ROWS}
+        }
+
+
+class TestHttpClientCompression:
+    def test__large_body__sent_gzipped(self, local_server):
+        metrics = RequestMetrics()
+        configuration = _create_configuration(local_server.uri, 1024)
+        configuration.add_request_observer(metrics)
+        client = HttpClient(configuration)
+        data = [{"path": "tag{}".format(i), "value": "1.5"} for i in range(100)]
+
+        client.at_uri("/nitag/v2").post("/update-current-values", data=data)
+
+        [(_, _, body)] = local_server.requests
+        [headers] = local_server.request_headers
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Content-Type"] == "application/json"
+        assert json.loads(gzip.decompress(body)) == data
+        [route] = metrics.get_metrics()
+        assert route.bytes_sent == len(body)
+        assert route.bytes_saved_by_compression > 0
+
+    @pytest.mark.asyncio
+    async def test__async_small_body__sent_uncompressed(self, local_server):
+        client = HttpClient(_create_configuration(local_server.uri, 1024))
+
+        await client.at_uri("/nitag/v2").as_async.post(
+            "/update-current-values", data=[{"path": "a"}]
+        )
+
+        [(_, _, body)] = local_server.requests
+        [headers] = local_server.request_headers
+        assert "Content-Encoding" not in headers
+        assert json.loads(body) == [{"path": "a"}]
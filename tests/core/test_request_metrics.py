@@ -0,0 +1,244 @@
+import json
+import random
+from typing import List
+from unittest import mock
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import (
+    ApiException,
+    CompletedRequest,
+    HttpConfiguration,
+    LatencyHistogram,
+    RequestMetrics,
+    RequestObserver,
+    RetryPolicy,
+)
+from nisystemlink.clients.core._internal import _http_client
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import AppendTableDataRequest, DataFrame
+
+
+class _Recorder(RequestObserver):
+    def __init__(self) -> None:
+        self.requests = []  # type: List[CompletedRequest]
+
+    def request_completed(self, request: CompletedRequest) -> None:
+        self.requests.append(request)
+
+
+def _create_configuration(uri: str, observer: RequestObserver) -> HttpConfiguration:
+    configuration = HttpConfiguration(uri, "key")
+    configuration.retry_policy = RetryPolicy(initial_delay_milliseconds=1)
+    configuration.add_request_observer(observer)
+    return configuration
+
+
+class TestLatencyHistogram:
+    def test__empty__no_percentiles(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(50) is None
+        assert histogram.mean_milliseconds is None
+
+    @pytest.mark.parametrize("significant_figures", [1, 2, 3])
+    def test__values_recorded__percentiles_within_precision(self, significant_figures):
+        histogram = LatencyHistogram(significant_figures)
+        values = sorted(random.Random(0).lognormvariate(3, 2) for _ in range(10000))
+        for value in values:
+            histogram.record(value)
+
+        for percentile in (1, 50, 90, 99, 99.9, 100):
+            expected = values[max(int(len(values) * percentile / 100) - 1, 0)]
+            actual = histogram.percentile(percentile)
+            assert actual == pytest.approx(
+                expected, rel=10**-significant_figures, abs=0.002
+            )
+        assert histogram.count == len(values)
+        assert histogram.max_milliseconds == pytest.approx(values[-1], abs=0.001)
+
+    def test__wide_range__bounded_bucket_count(self):
+        histogram = LatencyHistogram(2)
+        for exponent in range(-3, 7):
+            for _ in range(1000):
+                histogram.record(10**exponent)
+
+        assert len(histogram.buckets()) == 10
+
+    def test__merged__counts_combined(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(1)
+        second.record(100)
+
+        first.merge(second)
+
+        assert first.count == 2
+        assert first.min_milliseconds == 1
+        assert first.max_milliseconds == 100
+
+    @pytest.mark.parametrize("significant_figures", [0, 6])
+    def test__invalid_significant_figures__raises(self, significant_figures):
+        with pytest.raises(ValueError):
+            LatencyHistogram(significant_figures)
+
+
+class TestClientInstrumentation:
+    def test__client_request__reported_with_route(self, local_server):
+        recorder = _Recorder()
+        client = DataFrameClient(_create_configuration(local_server.uri, recorder))
+
+        client.append_table_data(
+            "abc", AppendTableDataRequest(frame=DataFrame(data=[["1"]]))
+        )
+
+        [request] = recorder.requests
+        assert request.method == "POST"
+        assert request.route == "/nidataframe/v1/tables/{id}/data"
+        assert request.url.endswith("/nidataframe/v1/tables/abc/data")
+        assert request.status_code == 200
+        assert request.bytes_sent == len(b'{"frame":{"data":[["1"]]}}')
+        assert request.bytes_received == len(b'{"tables": []}')
+        assert request.retries == 0
+        assert request.error is None
+        assert request.duration_milliseconds >= request.last_attempt_milliseconds > 0
+
+    def test__request_retried__reported_once(self, local_server):
+        local_server.status_codes = [503, 503]
+        recorder = _Recorder()
+        client = DataFrameClient(_create_configuration(local_server.uri, recorder))
+
+        client.list_tables()
+
+        [request] = recorder.requests
+        assert request.retries == 2
+        assert request.status_code == 200
+        assert request.wait_milliseconds > 0
+
+    def test__error_status__reported(self, local_server):
+        local_server.status_codes = [404]
+        recorder = _Recorder()
+        client = DataFrameClient(_create_configuration(local_server.uri, recorder))
+
+        with pytest.raises(ApiException):
+            client.get_table_metadata("abc")
+
+        [request] = recorder.requests
+        assert request.status_code == 404
+        assert request.route == "/nidataframe/v1/tables/{id}"
+
+    def test__connection_refused__error_reported(self):
+        recorder = _Recorder()
+        configuration = _create_configuration("http://localhost:1", recorder)
+        configuration.retry_policy = RetryPolicy.no_retries()
+        client = DataFrameClient(configuration)
+
+        with pytest.raises(Exception):
+            client.list_tables()
+
+        [request] = recorder.requests
+        assert request.status_code is None
+        assert request.error is not None
+
+    def test__global_observer__reported(self, local_server):
+        recorder = _Recorder()
+        client = DataFrameClient(HttpConfiguration(local_server.uri, "key"))
+
+        RequestObserver.add_global(recorder)
+        try:
+            client.list_tables()
+        finally:
+            RequestObserver.remove_global(recorder)
+        client.list_tables()
+
+        assert [request.route for request in recorder.requests] == [
+            "/nidataframe/v1/tables"
+        ]
+
+    @pytest.mark.asyncio
+    async def test__async_client_request__reported(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"tables": []})
+
+        recorder = _Recorder()
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost", recorder)
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            await client.list_tables()
+
+        [request] = recorder.requests
+        assert request.route == "/nidataframe/v1/tables"
+        assert request.bytes_received == len(b'{"tables": []}')
+
+    def test__http_client_request__reported_with_route(self, local_server):
+        local_server.status_codes = [503]
+        recorder = _Recorder()
+        client = HttpClient(_create_configuration(local_server.uri, recorder))
+
+        client.at_uri("/nitag/v2").get("/tags/{path}", params={"path": "a/b"})
+
+        [request] = recorder.requests
+        assert request.route == "/nitag/v2/tags/{path}"
+        assert request.url.endswith("/nitag/v2/tags/a%2Fb")
+        assert request.retries == 1
+        assert request.bytes_received == len(b'{"tables": []}')
+
+    @pytest.mark.asyncio
+    async def test__async_http_client_request__reported(self, local_server):
+        recorder = _Recorder()
+        client = HttpClient(_create_configuration(local_server.uri, recorder))
+
+        await client.at_uri("/nitag/v2").as_async.post(
+            "/update-current-values", data=[{"path": "a"}]
+        )
+
+        [request] = recorder.requests
+        assert request.method == "POST"
+        assert request.route == "/nitag/v2/update-current-values"
+        assert request.bytes_sent == len(b'[{"path": "a"}]')
+
+    def test__http_client_request_reported__body_encoded_once(self, local_server):
+        recorder = _Recorder()
+        client = HttpClient(_create_configuration(local_server.uri, recorder))
+
+        with mock.patch.object(_http_client, "json", wraps=json) as encoder:
+            client.at_uri("/nitag/v2").post(
+                "/update-current-values", data=[{"path": "a"}]
+            )
+
+        assert encoder.dumps.call_count == 1
+        assert recorder.requests[0].bytes_sent == len(b'[{"path": "a"}]')
+
+
+class TestRequestMetrics:
+    def test__requests__grouped_by_route_and_status(self, local_server):
+        local_server.status_codes = [404]
+        metrics = RequestMetrics()
+        client = DataFrameClient(_create_configuration(local_server.uri, metrics))
+
+        with pytest.raises(ApiException):
+            client.get_table_metadata("a")
+        client.list_tables()
+        client.list_tables()
+
+        routes = {(m.method, m.route, m.status_code): m for m in metrics.get_metrics()}
+        assert set(routes) == {
+            ("GET", "/nidataframe/v1/tables/{id}", 404),
+            ("GET", "/nidataframe/v1/tables", 200),
+        }
+        tables = routes[("GET", "/nidataframe/v1/tables", 200)]
+        assert tables.count == 2
+        assert tables.bytes_received == 2 * len(b'{"tables": []}')
+        assert tables.latency.percentile(100) > 0
+
+    def test__reset__metrics_discarded(self):
+        metrics = RequestMetrics()
+        metrics.request_completed(
+            CompletedRequest("GET", "/route", "http://host/route", 200, 0, 0, 0, 1, 1)
+        )
+
+        metrics.reset()
+
+        assert metrics.get_metrics() == []
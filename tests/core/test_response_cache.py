@@ -0,0 +1,324 @@
+from typing import Tuple
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration, ResponseCache
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    CreateTableRequest,
+    DataType,
+    ModifyTablesRequest,
+    QueryTablesRequest,
+    TableMetadataModification,
+)
+from nisystemlink.clients.testing import StandInServer
+
+
+def _create_configuration(uri: str, cache: ResponseCache) -> HttpConfiguration:
+    configuration = HttpConfiguration(uri, "key")
+    configuration.response_cache = cache
+    return configuration
+
+
+@pytest.fixture
+def stand_in_server():
+    """Fixture to run a stand-in server with no latency or errors."""
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+def _create_table_client(server: StandInServer) -> Tuple[DataFrameClient, str]:
+    configuration = server.create_configuration()
+    configuration.response_cache = ResponseCache()
+    configuration.response_cache.set_ttl("/nidataframe/v1", 60000)
+    configuration.response_cache.set_ttl("/nidataframe/v1/tables/{id}", 60000)
+    client = DataFrameClient(configuration)
+    id = client.create_table(
+        CreateTableRequest(
+            name="before", columns=[Column(name="index", data_type=DataType.Int32)]
+        )
+    )
+    return client, id
+
+
+class TestResponseCache:
+    def test__most_specific_route__ttl_applied(self):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables/{id}", 1000)
+        cache.set_ttl("/nidataframe/v1/tables/{id}/data", 0)
+        cache.set_ttl("/nidataframe/v1/{collection}/{id}/data", 5000)
+
+        assert cache._get_ttl("/nidataframe/v1/tables/abc") == 1
+        assert cache._get_ttl("/nidataframe/v1/tables/abc/data") == 0
+        assert cache._get_ttl("/nidataframe/v1/tables") is None
+
+    def test__ttl_removed__route_not_cached(self):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 1000)
+
+        cache.set_ttl("/nidataframe/v1/tables", None)
+
+        assert cache._lookup("GET", "http://host/nidataframe/v1/tables", {}) is None
+
+    def test__invalid_max_entries__raises(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestClientResponseCache:
+    def test__fresh_response__not_sent_again(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        first = client.list_tables(take=1)
+        second = client.list_tables(take=1)
+
+        assert first == second
+        assert first is not second
+        assert len(local_server.requests) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test__different_query__cached_separately(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        client.list_tables(take=1)
+        client.list_tables(take=2)
+        client.list_tables(take=1)
+
+        assert len(local_server.requests) == 2
+        assert len(cache) == 2
+
+    def test__route_without_ttl__not_cached(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables/{id}", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        client.list_tables()
+        client.list_tables()
+
+        assert len(local_server.requests) == 2
+        assert cache.misses == 0
+
+    def test__stale_response_with_etag__revalidated(self, local_server):
+        local_server.etag = '"v1"'
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 0)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        client.list_tables()
+        response = client.list_tables()
+
+        assert response.tables == []
+        assert len(local_server.requests) == 2
+        assert "If-None-Match" not in local_server.request_headers[0]
+        assert local_server.request_headers[1]["If-None-Match"] == '"v1"'
+        assert cache.revalidations == 1
+
+    def test__stale_response_without_validators__sent_again(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 0)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        client.list_tables()
+        client.list_tables()
+
+        assert "If-None-Match" not in local_server.request_headers[1]
+        assert cache.revalidations == 0
+
+    @pytest.mark.asyncio
+    async def test__resource_modified__related_responses_discarded(self):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/data"):
+                return httpx.Response(
+                    200, json={"frame": {"data": []}, "totalRowCount": 0}
+                )
+            return httpx.Response(200, json={"tables": []})
+
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        cache.set_ttl("/nidataframe/v1/tables/{id}/data", 60000)
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost", cache)
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            await client.list_tables()
+            await client.get_table_data("abc")
+            await client.get_table_data("xyz")
+
+            await client.delete_table("abc")
+            await client.list_tables()
+            await client.get_table_data("abc")
+            await client.get_table_data("xyz")
+
+        assert paths[3:] == [
+            "/nidataframe/v1/tables/abc",
+            "/nidataframe/v1/tables",
+            "/nidataframe/v1/tables/abc/data",
+        ]
+
+    def test__query__responses_kept(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+        client.list_tables()
+
+        client.query_tables(QueryTablesRequest(filter="", take=1))
+        client.list_tables()
+
+        assert len(local_server.requests) == 2
+
+    def test__tables_deleted__cached_table_discarded(self, stand_in_server):
+        client, id = _create_table_client(stand_in_server)
+        client.api_info()
+        client.get_table_metadata(id)
+
+        client.delete_tables([id])
+
+        with pytest.raises(ApiException):
+            client.get_table_metadata(id)
+        stand_in_server.clear_requests()
+        client.api_info()
+        assert stand_in_server.requests == []
+
+    def test__tables_modified__cached_table_discarded(self, stand_in_server):
+        client, id = _create_table_client(stand_in_server)
+        client.get_table_metadata(id)
+
+        client.modify_tables(
+            ModifyTablesRequest(tables=[TableMetadataModification(id=id, name="after")])
+        )
+
+        assert client.get_table_metadata(id).name == "after"
+
+    def test__max_entries__least_recently_used_discarded(self, local_server):
+        cache = ResponseCache(max_entries=2)
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        client.list_tables(take=1)
+        client.list_tables(take=2)
+        client.list_tables(take=1)
+        client.list_tables(take=3)
+        client.list_tables(take=1)
+        client.list_tables(take=2)
+
+        assert [path.split("=")[1] for path in local_server.paths] == [
+            "1",
+            "2",
+            "3",
+            "2",
+        ]
+
+    def test__invalidate__responses_discarded(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+        client.list_tables()
+
+        cache.invalidate()
+        client.list_tables()
+
+        assert len(local_server.requests) == 2
+
+    def test__error_response__not_cached(self, local_server):
+        local_server.status_codes = [404]
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        client = DataFrameClient(_create_configuration(local_server.uri, cache))
+
+        with pytest.raises(Exception):
+            client.list_tables()
+        client.list_tables()
+
+        assert len(local_server.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test__async_client__fresh_response_not_sent_again(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"tables": []})
+
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1/tables", 60000)
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost", cache)
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            await client.list_tables()
+            response = await client.list_tables()
+
+        assert response.tables == []
+        assert len(requests) == 1
+
+
+class TestHttpClientResponseCache:
+    def test__fresh_response__not_sent_again(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nitag/v2/selections/{id}/tags", 60000)
+        api = HttpClient(_create_configuration(local_server.uri, cache)).at_uri(
+            "/nitag/v2"
+        )
+
+        first, _ = api.get("/selections/{id}/tags", params={"id": "a"})
+        second, _ = api.get("/selections/{id}/tags", params={"id": "a"})
+        api.get("/selections/{id}/tags", params={"id": "b"})
+
+        assert first == second == {"tables": []}
+        assert local_server.paths == [
+            "/nitag/v2/selections/a/tags",
+            "/nitag/v2/selections/b/tags",
+        ]
+
+    def test__resource_modified__service_root_kept(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nidataframe/v1", 60000)
+        api = HttpClient(_create_configuration(local_server.uri, cache)).at_uri(
+            "/nidataframe/v1"
+        )
+        api.get("")
+
+        api.delete("/tables/abc")
+        api.get("")
+
+        assert len(local_server.requests) == 2
+
+    def test__selection_deleted__tags_discarded(self, local_server):
+        cache = ResponseCache()
+        cache.set_ttl("/nitag/v2/selections/{id}/tags", 60000)
+        api = HttpClient(_create_configuration(local_server.uri, cache)).at_uri(
+            "/nitag/v2"
+        )
+        api.get("/selections/{id}/tags", params={"id": "a"})
+
+        api.delete("/selections/{id}", params={"id": "a"})
+        api.get("/selections/{id}/tags", params={"id": "a"})
+
+        assert len(local_server.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test__async_stale_response__revalidated(self, local_server):
+        local_server.etag = '"v1"'
+        cache = ResponseCache()
+        cache.set_ttl("/nitag/v2/tags", 0)
+        api = HttpClient(_create_configuration(local_server.uri, cache)).at_uri(
+            "/nitag/v2"
+        )
+
+        await api.as_async.get("/tags")
+        data, response = await api.as_async.get("/tags")
+
+        assert data == {"tables": []}
+        assert response.status_code == 200
+        assert local_server.request_headers[1]["If-None-Match"] == '"v1"'
+        assert cache.revalidations == 1
@@ -0,0 +1,242 @@
+import email.utils
+import io
+import time
+
+import httpx
+import pytest  # type: ignore
+import requests
+from nisystemlink.clients.core import (
+    ApiException,
+    Deadline,
+    HttpConfiguration,
+    RetryPolicy,
+)
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    CreateTableRequest,
+    DataType,
+    QueryTablesRequest,
+)
+from nisystemlink.clients.file import FileClient
+
+
+def _create_policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("initial_delay_milliseconds", 1)
+    kwargs.setdefault("max_delay_milliseconds", 1)
+    return RetryPolicy(**kwargs)
+
+
+def _create_configuration(server_uri: str, **kwargs) -> HttpConfiguration:
+    configuration = HttpConfiguration(server_uri, "key")
+    configuration.retry_policy = _create_policy(**kwargs)
+    return configuration
+
+
+class TestRetryPolicy:
+    def test__invalid_max_attempts__raises(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+    def test__retryable_status_for_get__retried(self, status_code):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_response("GET", None, status_code, None)
+
+    @pytest.mark.parametrize("status_code", [400, 404, 500])
+    def test__other_status__not_retried(self, status_code):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_response("GET", None, status_code, None) is None
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test__unprocessed_status_for_post__retried(self, status_code):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_response("POST", None, status_code, None)
+
+    def test__bad_gateway_for_post__retried_only_if_idempotent(self):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_response("POST", None, 502, None) is None
+        assert state.get_delay_after_response("POST", True, 502, None)
+
+    def test__max_attempts_made__not_retried(self):
+        state = _create_policy(max_attempts=3)._start()
+
+        assert state.get_delay_after_response("GET", None, 503, None)
+        assert state.get_delay_after_response("GET", None, 503, None)
+        assert state.get_delay_after_response("GET", None, 503, None) is None
+
+    def test__delays__jittered_within_bounds(self):
+        policy = RetryPolicy(
+            max_attempts=50, initial_delay_milliseconds=10, max_delay_milliseconds=200
+        )
+        state = policy._start()
+
+        delays = [state._next_delay(None) for _ in range(40)]
+
+        assert all(d is not None and 0.01 <= d <= 0.2 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test__retry_after_seconds__delays_at_least_that_long(self):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_response("GET", None, 429, "2") >= 2
+
+    def test__retry_after_date__delays_until_then(self):
+        state = _create_policy()._start()
+        retry_at = email.utils.formatdate(time.time() + 10, usegmt=True)
+
+        delay = state.get_delay_after_response("GET", None, 503, retry_at)
+
+        assert 8 < delay <= 10
+
+    def test__retry_after_exceeds_max_retry_time__not_retried(self):
+        state = _create_policy(max_retry_time_milliseconds=1000)._start()
+
+        assert state.get_delay_after_response("GET", None, 429, "5") is None
+
+    def test__retry_after_exceeds_deadline__not_retried(self):
+        state = _create_policy()._start()
+
+        with Deadline(1000):
+            assert state.get_delay_after_response("GET", None, 429, "5") is None
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ConnectError("refused"),
+            httpx.ConnectTimeout("timed out"),
+            requests.exceptions.ConnectTimeout(),
+        ],
+    )
+    def test__connect_error__retried_for_any_method(self, error):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_error("POST", None, error)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ReadError("reset"),
+            httpx.RemoteProtocolError("closed"),
+            requests.exceptions.ConnectionError(ConnectionResetError()),
+        ],
+    )
+    def test__connection_dropped__retried_only_if_idempotent(self, error):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_error("POST", None, error) is None
+        assert state.get_delay_after_error("POST", True, error)
+        assert state.get_delay_after_error("GET", None, error)
+
+    def test__other_error__not_retried(self):
+        state = _create_policy()._start()
+
+        assert state.get_delay_after_error("GET", None, ValueError()) is None
+
+
+class TestClientRetries:
+    def test__get_throttled__retried(self, local_server):
+        local_server.status_codes = [429, 503]
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        assert client.list_tables().tables == []
+        assert len(local_server.requests) == 3
+
+    def test__idempotent_post_failed__retried(self, local_server):
+        local_server.status_codes = [502]
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        client.query_tables(QueryTablesRequest(filter="", take=1))
+
+        assert len(local_server.requests) == 2
+
+    def test__post_failed__not_retried(self, local_server):
+        local_server.status_codes = [502]
+        client = DataFrameClient(_create_configuration(local_server.uri))
+
+        with pytest.raises(ApiException):
+            client.create_table(
+                CreateTableRequest(columns=[Column(name="a", data_type=DataType.Int32)])
+            )
+
+        assert len(local_server.requests) == 1
+
+    def test__attempts_exhausted__last_error_raised(self, local_server):
+        local_server.status_codes = [503] * 3
+        client = DataFrameClient(
+            _create_configuration(local_server.uri, max_attempts=3)
+        )
+
+        with pytest.raises(ApiException) as ex:
+            client.list_tables()
+
+        assert ex.value.http_status_code == 503
+        assert len(local_server.requests) == 3
+
+    def test__upload_throttled__whole_file_sent_again(self, local_server):
+        local_server.status_codes = [429]
+        client = FileClient(_create_configuration(local_server.uri))
+
+        file_id = client.upload_file(io.BytesIO(b"file contents"))
+
+        assert file_id == "abc"
+        assert len(local_server.requests) == 2
+        assert b"file contents" in local_server.requests[1][2]
+
+    def test__no_retries__not_retried(self, local_server):
+        local_server.status_codes = [503]
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.retry_policy = RetryPolicy.no_retries()
+        client = DataFrameClient(configuration)
+
+        with pytest.raises(ApiException):
+            client.list_tables()
+
+        assert len(local_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test__async_client_throttled__retried(self):
+        status_codes = [429, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status_codes.pop(0), json={"tables": []})
+
+        async with AsyncDataFrameClient(
+            _create_configuration("http://localhost")
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            response = await client.list_tables()
+
+        assert response.tables == []
+        assert status_codes == []
+
+    def test__http_client_throttled__retried(self, local_server):
+        local_server.status_codes = [429, 503]
+        client = HttpClient(_create_configuration(local_server.uri))
+
+        client.at_uri("/nitag/v2").post("/tags", data={})
+
+        assert len(local_server.requests) == 3
+
+    def test__http_client_post_failed__not_retried(self, local_server):
+        local_server.status_codes = [502]
+        client = HttpClient(_create_configuration(local_server.uri))
+
+        with pytest.raises(ApiException):
+            client.at_uri("/nitag/v2").post("/tags", data={})
+
+        assert len(local_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test__async_http_client_throttled__retried(self, local_server):
+        local_server.status_codes = [503]
+        client = HttpClient(_create_configuration(local_server.uri))
+
+        await client.at_uri("/nitag/v2").as_async.get("/tags")
+
+        assert len(local_server.requests) == 2
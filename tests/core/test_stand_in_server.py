@@ -0,0 +1,389 @@
+import datetime
+import io
+import time
+from typing import List
+
+import pytest  # type: ignore
+import requests
+from nisystemlink.clients.core import ApiException, RetryPolicy
+from nisystemlink.clients.core.helpers import AsyncPaginator, Paginator
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    CreateTableRequest,
+    DataFrame,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+from nisystemlink.clients.file import FileClient
+from nisystemlink.clients.product import ProductClient
+from nisystemlink.clients.product.models import (
+    Product,
+    ProductField,
+    QueryProductsRequest,
+)
+from nisystemlink.clients.spec import SpecClient
+from nisystemlink.clients.spec.models import (
+    CreateSpecificationsRequest,
+    QuerySpecificationsRequest,
+    SpecificationDefinition,
+    SpecificationType,
+    UpdateSpecificationsRequest,
+)
+from nisystemlink.clients.tag import DataType as TagDataType, TagData, TagManager
+from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._http._http_tag_subscription import HttpTagSubscription
+from nisystemlink.clients.testing import StandInServer
+
+
+@pytest.fixture
+def server():
+    """Fixture to run a stand-in server with no latency or errors."""
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+def _create_table(client: DataFrameClient, rows: int) -> str:
+    id = client.create_table(
+        CreateTableRequest(
+            columns=[
+                Column(
+                    name="i", data_type=DataType.Int32, column_type=ColumnType.Index
+                ),
+                Column(name="v", data_type=DataType.Float64),
+            ]
+        )
+    )
+    client.append_table_data(
+        id,
+        AppendTableDataRequest(
+            frame=DataFrame(
+                columns=["i", "v"], data=[[str(i), str(i / 2)] for i in range(rows)]
+            )
+        ),
+    )
+    return id
+
+
+class TestStandInServer:
+    def test__not_started__no_uri(self):
+        with pytest.raises(RuntimeError):
+            StandInServer().uri
+
+    def test__invalid_settings__raises(self):
+        with pytest.raises(ValueError):
+            StandInServer(latency_milliseconds=-1)
+        with pytest.raises(ValueError):
+            StandInServer(error_rate=1.5)
+        with pytest.raises(ValueError):
+            StandInServer(max_requests_per_second=0)
+
+    def test__unknown_path__not_found(self, server):
+        response = requests.get(server.uri + "/nitag/v2/nothing")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["name"] == "NotFound"
+
+    def test__unsupported_method__not_allowed(self, server):
+        response = requests.put(server.uri + "/nidataframe/v1/tables")
+
+        assert response.status_code == 405
+
+    def test__head__answered_like_get_without_body(self, server):
+        get = requests.get(server.uri + "/nidataframe/v1/tables")
+
+        response = requests.head(server.uri + "/nidataframe/v1/tables")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Length"] == get.headers["Content-Length"]
+        assert response.content == b""
+        assert server.requests[-1].method == "HEAD"
+
+    def test__requests__recorded_with_route(self, server):
+        client = DataFrameClient(server.create_configuration())
+
+        client.get_table_metadata(_create_table(client, rows=1))
+
+        assert [(r.method, r.route, r.status_code) for r in server.requests] == [
+            ("POST", "/nidataframe/v1/tables", 201),
+            ("POST", "/nidataframe/v1/tables/{id}/data", 204),
+            ("GET", "/nidataframe/v1/tables/{id}", 200),
+        ]
+        server.clear_requests()
+        assert server.requests == []
+
+
+class TestStandInDataFrameService:
+    def test__table_data__paged_with_continuation_tokens(self, server):
+        client = DataFrameClient(server.create_configuration())
+        id = _create_table(client, rows=25)
+
+        rows = list(
+            Paginator(
+                lambda token: client.get_table_data(
+                    id, take=10, continuation_token=token
+                ),
+                lambda page: page.frame.data,
+            )
+        )
+
+        assert rows == [[str(i), str(i / 2)] for i in range(25)]
+        assert client.get_table_metadata(id).row_count == 25
+
+    def test__query_data__filtered_and_ordered(self, server):
+        client = DataFrameClient(server.create_configuration())
+        id = _create_table(client, rows=25)
+
+        page = client.query_table_data(
+            id,
+            QueryTableDataRequest(
+                columns=["i"],
+                filters=[
+                    ColumnFilter(
+                        column="v", operation=FilterOperation.GreaterThan, value="10"
+                    )
+                ],
+                order_by=[ColumnOrderBy(column="v", descending=True)],
+            ),
+        )
+
+        assert page.frame.data == [["24"], ["23"], ["22"], ["21"]]
+        assert page.total_row_count == 4
+        assert page.continuation_token is None
+
+    @pytest.mark.asyncio
+    async def test__async_client__tables_paged(self, server):
+        client = AsyncDataFrameClient(server.create_configuration())
+        request = CreateTableRequest(
+            columns=[
+                Column(name="i", data_type=DataType.Int32, column_type=ColumnType.Index)
+            ]
+        )
+        ids = [await client.create_table(request) for _ in range(5)]
+
+        tables = [
+            table.id
+            async for table in AsyncPaginator(
+                lambda token: client.list_tables(take=2, continuation_token=token),
+                lambda page: page.tables,
+            )
+        ]
+
+        assert tables == ids
+
+    def test__missing_table__api_exception(self, server):
+        client = DataFrameClient(server.create_configuration())
+
+        with pytest.raises(ApiException) as exc_info:
+            client.get_table_metadata("missing")
+
+        assert exc_info.value.http_status_code == 404
+        assert exc_info.value.error is not None
+        assert exc_info.value.error.name == "DataFrame.TableNotFound"
+
+
+class TestStandInTagService:
+    def test__write_and_read__value_and_aggregates(self, server):
+        manager = TagManager(server.create_configuration())
+        tag = TagData("group.tag", TagDataType.DOUBLE)
+        tag.collect_aggregates = True
+        manager.update([tag])
+
+        with manager.create_writer(buffer_size=1) as writer:
+            writer.write("group.tag", TagDataType.DOUBLE, 1.5)
+            writer.write("group.tag", TagDataType.DOUBLE, 3.5)
+        value = manager.read("group.tag", include_aggregates=True)
+
+        assert value is not None
+        assert (value.value, value.count, value.min, value.max, value.mean) == (
+            3.5,
+            2,
+            1.5,
+            3.5,
+            2.5,
+        )
+
+    def test__query__matches_wildcards(self, server):
+        manager = TagManager(server.create_configuration())
+        manager.update(
+            [
+                TagData("group.a", TagDataType.INT32),
+                TagData("group.b", TagDataType.STRING),
+                TagData("other", TagDataType.BOOLEAN),
+            ]
+        )
+
+        result = manager.query(["group.*"])
+
+        assert result.total_count == 2
+        assert sorted(t.path for page in result for t in page) == ["group.a", "group.b"]
+
+    def test__selection__reads_values(self, server):
+        manager = TagManager(server.create_configuration())
+        with manager.create_writer(buffer_size=1) as writer:
+            writer.write("group.a", TagDataType.INT32, 1)
+            writer.write("group.b", TagDataType.STRING, "text")
+
+        with manager.open_selection(["group.*"]) as selection:
+            values = {
+                path: reader.read().value  # type: ignore
+                for path, reader in selection.values.items()
+            }
+
+        assert values == {"group.a": 1, "group.b": "text"}
+
+    def test__subscription__receives_updates(self, server):
+        manager = TagManager(server.create_configuration())
+        received = []  # type: List[object]
+        with ManualResetTimer(
+            datetime.timedelta(milliseconds=10)
+        ) as timer, HttpTagSubscription.create(
+            manager._http_client, ["group.*"], timer
+        ) as subscription:
+            subscription.tag_changed += lambda tag, reader: received.append(
+                reader.read().value
+            )
+            with manager.create_writer(buffer_size=1) as writer:
+                writer.write("group.a", TagDataType.INT32, 1)
+                writer.write("group.a", TagDataType.INT32, 2)
+                writer.write("ungrouped", TagDataType.INT32, 3)
+
+            deadline = time.monotonic() + 5
+            while len(received) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert received == [1, 2]
+
+
+class TestStandInFileSpecAndProductServices:
+    def test__upload_file__downloaded_and_listed(self, server):
+        client = FileClient(server.create_configuration())
+
+        id = client.upload_file(io.BytesIO(b"contents"), metadata={"Name": "a.txt"})
+
+        assert client.download_file(id).read() == b"contents"
+        files = client.get_files(ids=[id])
+        assert files.total_count == 1
+        assert files.available_files[0].properties == {"Name": "a.txt"}
+
+    def test__specs__created_queried_and_updated(self, server):
+        client = SpecClient(server.create_configuration())
+        created = client.create_specs(
+            CreateSpecificationsRequest(
+                specs=[
+                    SpecificationDefinition(
+                        product_id="product",
+                        spec_id="spec{}".format(i),
+                        type=SpecificationType.PARAMETRIC,
+                    )
+                    for i in range(3)
+                ]
+            )
+        )
+
+        page = client.query_specs(
+            QuerySpecificationsRequest(product_ids=["product"], take=2)
+        )
+        spec = page.specs[0]  # type: ignore
+        spec.name = "renamed"
+        updated = client.update_specs(UpdateSpecificationsRequest(specs=[spec]))
+
+        assert len(created.created_specs or []) == 3
+        assert [s.spec_id for s in page.specs or []] == ["spec0", "spec1"]
+        assert page.continuation_token is not None
+        assert updated is not None
+        assert [s.version for s in updated.updated_specs or []] == [1]
+
+    def test__products__queried_in_pages(self, server):
+        client = ProductClient(server.create_configuration())
+        client.create_products([Product(part_number=str(i)) for i in range(5)])
+
+        products = list(
+            Paginator(
+                lambda token: client.query_products_paged(
+                    QueryProductsRequest(
+                        order_by=ProductField.PART_NUMBER,
+                        descending=True,
+                        take=2,
+                        continuation_token=token,
+                    )
+                ),
+                lambda page: page.products,
+            )
+        )
+
+        assert [p.part_number for p in products] == ["4", "3", "2", "1", "0"]
+
+
+class TestStandInFaults:
+    def test__latency__responses_delayed(self, server):
+        client = DataFrameClient(server.create_configuration())
+        client.api_info()
+        server.latency_milliseconds = 50
+
+        start = time.perf_counter()
+        client.api_info()
+
+        assert time.perf_counter() - start >= 0.05
+
+    def test__scripted_fault__fails_matching_requests_only(self, server):
+        configuration = server.create_configuration()
+        configuration.retry_policy = RetryPolicy(max_attempts=1)
+        client = DataFrameClient(configuration)
+        server.fail_next(status_code=500, path_prefix="/nidataframe/v1/tables")
+
+        client.api_info()
+        with pytest.raises(ApiException) as exc_info:
+            client.list_tables()
+        client.list_tables()
+
+        assert exc_info.value.http_status_code == 500
+
+    def test__scripted_fault__retried_by_client(self, server):
+        configuration = server.create_configuration()
+        configuration.retry_policy = RetryPolicy(
+            initial_delay_milliseconds=1, max_delay_milliseconds=1
+        )
+        client = DataFrameClient(configuration)
+        server.fail_next(count=2, status_code=503)
+
+        client.list_tables()
+
+        assert [r.status_code for r in server.requests] == [503, 503, 200]
+
+    def test__throttled__retried_after_delay(self, server):
+        client = DataFrameClient(server.create_configuration())
+        server.max_requests_per_second = 10
+
+        for _ in range(15):
+            client.api_info()
+
+        statuses = [r.status_code for r in server.requests]
+        assert statuses.count(200) == 15
+        assert 429 in statuses
+
+    def test__throttled__retry_after_sent(self, server):
+        server.max_requests_per_second = 1
+        requests.get(server.uri + "/nidataframe/v1")
+
+        response = requests.get(server.uri + "/nidataframe/v1")
+
+        assert response.status_code == 429
+        assert 0 < float(response.headers["Retry-After"]) <= 1
+
+    def test__error_rate__seeded_errors_repeat(self):
+        def run() -> List[int]:
+            with StandInServer(error_rate=0.5, seed=7) as server:
+                for _ in range(20):
+                    requests.get(server.uri + "/nidataframe/v1")
+                return [r.status_code for r in server.requests]
+
+        statuses = run()
+
+        assert statuses == run()
+        assert {200, 503} == set(statuses)
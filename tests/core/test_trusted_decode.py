@@ -0,0 +1,160 @@
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import HttpConfiguration, TrustedDecode
+from nisystemlink.clients.core._uplink._construct import construct_obj_as
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+from nisystemlink.clients.dataframe import AsyncDataFrameClient, DataFrameClient
+from nisystemlink.clients.dataframe.models import PagedTableRows, PagedTables
+from nisystemlink.clients.file.models import FileQueryResponse
+from nisystemlink.clients.spec.models import QuerySpecifications
+from pydantic import parse_obj_as
+
+_TABLE = {
+    "columns": [
+        {"name": "index", "dataType": "INT32", "columnType": "INDEX"},
+        {"name": "value", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+    ],
+    "createdAt": "2024-01-02T03:04:05.600Z",
+    "id": "table",
+    "metadataModifiedAt": "2024-01-02T03:04:05Z",
+    "metadataRevision": 1,
+    "name": "table",
+    "properties": {"key": "value"},
+    "rowCount": 2,
+    "rowsModifiedAt": "2024-01-02T03:04:05Z",
+    "supportsAppend": True,
+    "workspace": "workspace",
+}
+
+_SPEC = {
+    "id": "id",
+    "productId": "product",
+    "specId": "spec",
+    "type": "PARAMETRIC",
+    "version": 1,
+    "limit": {"min": 1.2, "max": 1.5},
+    "conditions": [
+        {
+            "name": "Temperature",
+            "value": {
+                "conditionType": "NUMERIC",
+                "range": [{"min": -25.0, "step": 20.0, "max": 85.0}],
+                "unit": "C",
+            },
+        },
+        {"name": "Mode", "value": {"conditionType": "STRING", "discrete": ["a"]}},
+    ],
+    "keywords": ["keyword"],
+    "createdAt": "2024-01-02T03:04:05Z",
+}  # type: Dict[str, Any]
+
+_RESPONSES = [
+    (PagedTables, {"tables": [_TABLE], "continuationToken": "token"}),
+    (
+        PagedTableRows,
+        {
+            "frame": {"columns": ["index", "value"], "data": [["1", None], ["2", "x"]]},
+            "totalRowCount": 2,
+            "continuationToken": None,
+        },
+    ),
+    (QuerySpecifications, {"specs": [_SPEC, {**_SPEC, "conditions": None}]}),
+    (
+        FileQueryResponse,
+        {
+            "_links": {"self": {"href": "/nifile/v1/files"}},
+            "availableFiles": [],
+            "totalCount": 0,
+        },
+    ),
+]
+
+
+class _Node(JsonModel):
+    name: str
+    children: Optional[List["_Node"]] = None
+    weights: Dict[str, float] = {}
+
+
+_Node.update_forward_refs()
+
+
+class TestConstructObjAs:
+    @pytest.mark.parametrize("model, data", _RESPONSES)
+    def test__response__same_as_validated(self, model, data):
+        assert construct_obj_as(model, data) == parse_obj_as(model, data)
+
+    @pytest.mark.parametrize("model, data", _RESPONSES)
+    def test__response__fields_set_same_as_validated(self, model, data):
+        constructed = construct_obj_as(model, data)
+
+        assert constructed.json(exclude_unset=True) == parse_obj_as(model, data).json(
+            exclude_unset=True
+        )
+
+    def test__plain_lists__used_as_received(self):
+        data = [["1", None], ["2", "x"]]
+
+        rows = construct_obj_as(
+            PagedTableRows, {"frame": {"data": data}, "totalRowCount": 2}
+        )
+
+        assert rows.frame.data is data
+
+    def test__self_referencing_model__constructed(self):
+        data = {"name": "root", "children": [{"name": "leaf", "weights": {"a": 1}}]}
+
+        assert construct_obj_as(_Node, data) == parse_obj_as(_Node, data)
+
+    def test__optional_union__none_kept(self):
+        assert construct_obj_as(Optional[PagedTables], None) is None
+
+
+class TestClientTrustedDecode:
+    def test__trusted_decode_configured__values_not_validated(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.trusted_decode = True
+        client = DataFrameClient(configuration)
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(
+                "nisystemlink.clients.core._uplink._base_client.parse_obj_as", None
+            )
+            tables = client.list_tables()
+
+        assert tables == PagedTables(tables=[])
+
+    def test__trusted_decode_block__overrides_configuration(self, local_server):
+        configuration = HttpConfiguration(local_server.uri, "key")
+        configuration.trusted_decode = True
+        client = DataFrameClient(configuration)
+
+        with TrustedDecode(enabled=False):
+            with pytest.MonkeyPatch.context() as patch:
+                patch.setattr(
+                    "nisystemlink.clients.core._uplink._base_client.construct_obj_as",
+                    None,
+                )
+                tables = client.list_tables()
+
+        assert tables == PagedTables(tables=[])
+
+    @pytest.mark.asyncio
+    async def test__async_client_in_trusted_decode_block__not_validated(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            # A row count that doesn't validate as an int is passed through
+            return httpx.Response(
+                200, json={"frame": {"data": [[1]]}, "totalRowCount": "many"}
+            )
+
+        async with AsyncDataFrameClient(
+            HttpConfiguration("http://localhost", "key")
+        ) as client:
+            client._http_client._transport = httpx.MockTransport(handler)
+            with TrustedDecode():
+                rows = await client.get_table_data("table")
+
+        assert rows.total_row_count == "many"
+        assert rows.frame.data == [[1]]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import pytest  # type: ignore
+import pytest_asyncio  # type: ignore
+from nisystemlink.clients.core import ApiException
+from nisystemlink.clients.dataframe import AsyncDataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnType,
+    CreateTableRequest,
+    DataFrame,
+    DataType,
+)
+
+
+@pytest_asyncio.fixture
+async def client(enterprise_config):
+    """Fixture to create an AsyncDataFrameClient instance."""
+    async with AsyncDataFrameClient(enterprise_config) as client:
+        yield client
+
+
+@pytest.mark.enterprise
+@pytest.mark.integration
+class TestAsyncDataFrame:
+    @pytest.mark.asyncio
+    async def test__api_info__returns(self, client: AsyncDataFrameClient):
+        response = await client.api_info()
+
+        assert len(response.dict()) != 0
+
+    @pytest.mark.asyncio
+    async def test__get_table_invalid_id__raises(self, client: AsyncDataFrameClient):
+        with pytest.raises(ApiException, match="invalid table ID"):
+            await client.get_table_metadata("invalid_id")
+
+    @pytest.mark.asyncio
+    async def test__append_and_read_data__round_trips(
+        self, client: AsyncDataFrameClient
+    ):
+        id = await client.create_table(
+            CreateTableRequest(
+                columns=[
+                    Column(
+                        name="index",
+                        data_type=DataType.Int32,
+                        column_type=ColumnType.Index,
+                    ),
+                    Column(name="value", data_type=DataType.String),
+                ],
+                name="Python API async test table (delete me)",
+            )
+        )
+        try:
+            await client.append_table_data(
+                id,
+                AppendTableDataRequest(
+                    frame=DataFrame(data=[["1", "a"], ["2", "b"]]), end_of_data=True
+                ),
+            )
+
+            response = await client.get_table_data(id, order_by=["index"])
+
+            assert response.frame.data == [["1", "a"], ["2", "b"]]
+            assert response.total_row_count == 2
+        finally:
+            await client.delete_table(id)
@@ -0,0 +1,125 @@
+import queue
+import threading
+from datetime import timedelta
+from typing import Any, List, Tuple
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._dispatch_queue import _DispatchQueue
+from nisystemlink.clients.testing import StandInServer
+
+
+class _BlockingHandler:
+    """Records the changes it's called with, and blocks on the first until released."""
+
+    def __init__(self) -> None:
+        self.changes = queue.Queue()  # type: queue.Queue[Tuple[str, Any]]
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, tag: tbase.TagData, reader: Any) -> None:
+        self.started.set()
+        assert self.release.wait(timeout=10)
+        self.changes.put((tag.path, reader))
+
+    def take(self, count: int) -> List[Tuple[str, Any]]:
+        return [self.changes.get(timeout=10) for _ in range(count)]
+
+
+def _start(dispatch):
+    handler = _BlockingHandler()
+    uut = _DispatchQueue(dispatch, handler)
+    uut.put(tbase.TagData("first"), 0)
+    assert handler.started.wait(timeout=10)
+    return uut, handler
+
+
+class TestDispatchQueue:
+    def test__changes_to_same_tag_queued__latest_value_wins(self):
+        uut, handler = _start(tbase.QueuedDispatch())
+
+        for path, value in [("a", 1), ("b", 1), ("a", 2), ("a", 3)]:
+            uut.put(tbase.TagData(path), value)
+        handler.release.set()
+
+        assert handler.take(3) == [("first", 0), ("a", 3), ("b", 1)]
+        assert (uut.coalesced_count, uut.dropped_count) == (2, 0)
+
+    @pytest.mark.parametrize(
+        "overflow, expected",
+        [
+            (tbase.DispatchOverflow.DROP_OLDEST, [2, 3]),
+            (tbase.DispatchOverflow.DROP_NEWEST, [1, 2]),
+        ],
+    )
+    def test__queue_full__overflow_policy_applied(self, overflow, expected):
+        uut, handler = _start(
+            tbase.QueuedDispatch(max_pending=2, overflow=overflow, coalesce=False)
+        )
+
+        for value in [1, 2, 3]:
+            uut.put(tbase.TagData("a"), value)
+        handler.release.set()
+
+        assert handler.take(3) == [("first", 0)] + [("a", v) for v in expected]
+        assert (uut.coalesced_count, uut.dropped_count) == (0, 1)
+
+    def test__closed__queued_changes_dropped(self):
+        uut, handler = _start(tbase.QueuedDispatch())
+        uut.put(tbase.TagData("a"), 1)
+
+        uut.close()
+        uut.put(tbase.TagData("b"), 1)
+        handler.release.set()
+
+        assert handler.take(1) == [("first", 0)]
+        with pytest.raises(queue.Empty):
+            handler.changes.get(timeout=0.1)
+
+    def test__handler_raises__later_changes_still_dispatched(self):
+        changes = queue.Queue()  # type: queue.Queue[str]
+
+        def handler(tag: tbase.TagData, reader: Any) -> None:
+            changes.put(tag.path)
+            raise RuntimeError()
+
+        uut = _DispatchQueue(tbase.QueuedDispatch(), handler)
+        uut.put(tbase.TagData("a"), None)
+        uut.put(tbase.TagData("b"), None)
+
+        assert [changes.get(timeout=10) for _ in range(2)] == ["a", "b"]
+
+    @pytest.mark.parametrize("max_pending", [0, -1])
+    def test__invalid_max_pending__raises(self, max_pending):
+        with pytest.raises(ValueError):
+            tbase.QueuedDispatch(max_pending=max_pending)
+
+
+class TestQueuedSubscription:
+    def test__handler_blocked__polling_continues_and_updates_coalesced(self):
+        with StandInServer(seed=0) as server:
+            manager = tbase.TagManager(server.create_configuration())
+            handler = _BlockingHandler()
+            with manager.create_writer(buffer_size=1) as writer:
+                writer.write("tag", tbase.DataType.INT32, 0)
+            with manager.open_selection(["tag"]) as selection:
+                subscription = selection.create_subscription(
+                    update_interval=timedelta(milliseconds=10),
+                    dispatch=tbase.QueuedDispatch(),
+                )
+                subscription.tag_changed += handler
+                with subscription, manager.create_writer(buffer_size=1) as writer:
+                    writer.write("tag", tbase.DataType.INT32, 1)
+                    assert handler.started.wait(timeout=10)
+                    for value in range(2, 6):
+                        writer.write("tag", tbase.DataType.INT32, value)
+                    for _ in range(500):
+                        if subscription.coalesced_update_count == 3:
+                            break
+                        handler.release.wait(timeout=0.01)
+                    handler.release.set()
+                    changes = handler.take(2)
+
+        assert [reader.read().value for _, reader in changes] == [1, 5]
+        assert subscription.coalesced_update_count == 3
+        assert subscription.dropped_update_count == 0
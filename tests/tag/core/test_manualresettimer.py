@@ -1,7 +1,9 @@
 import datetime
+import threading
 import time
 
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._core._worker_pool import _MAX_WORKERS
 
 
 class TestManualResetTimer:
@@ -23,3 +25,90 @@ class TestManualResetTimer:
             time.sleep(0.280)
 
             assert 2 <= len(data) <= 3
+
+    def test__interval_changed__takes_effect_on_next_start(self):
+        fired = threading.Event()
+        with ManualResetTimer(datetime.timedelta(hours=1)) as uut:
+            uut.elapsed += fired.set
+            uut.interval = datetime.timedelta(milliseconds=10)
+            uut.start()
+
+            assert fired.wait(timeout=5)
+            assert uut.interval == datetime.timedelta(milliseconds=10)
+        assert ManualResetTimer.null_timer.interval is None
+
+    def test__many_timers__share_scheduler_thread(self):
+        interval = datetime.timedelta(milliseconds=20)
+        fired = threading.Semaphore(0)
+        threads_before = threading.active_count()
+        timers = [ManualResetTimer(interval) for _ in range(50)]
+        for timer in timers:
+            timer.elapsed += fired.release
+            timer.start()
+
+        assert all(fired.acquire(timeout=5) for _ in timers)
+        # The scheduler, the workers, and the thread that watches them for stalls
+        assert threading.active_count() - threads_before <= 2 + _MAX_WORKERS
+
+    def test__started_while_counting_down__elapses_once(self):
+        data = []
+        with ManualResetTimer(datetime.timedelta(milliseconds=50)) as uut:
+            uut.elapsed += lambda: data.append(None)
+
+            uut.start()
+            uut.start()
+            time.sleep(0.2)
+
+        assert len(data) == 1
+
+    def test__stopped__does_not_elapse(self):
+        data = []
+        with ManualResetTimer(datetime.timedelta(milliseconds=50)) as uut:
+            uut.elapsed += lambda: data.append(None)
+
+            uut.start()
+            uut.stop()
+            time.sleep(0.2)
+
+        assert data == []
+
+    def test__elapses_while_handler_runs__handlers_not_concurrent(self):
+        active = []
+        overlapped = []
+        with ManualResetTimer(datetime.timedelta(milliseconds=5)) as uut:
+
+            def callback():
+                overlapped.append(bool(active))
+                active.append(None)
+                uut.start()
+                time.sleep(0.02)
+                active.pop()
+
+            uut.elapsed += callback
+            uut.start()
+            time.sleep(0.2)
+            uut.stop()
+            time.sleep(0.05)
+
+        assert len(overlapped) >= 3
+        assert not any(overlapped)
+
+    def test__every_worker_blocked__other_timers_still_elapse(self):
+        interval = datetime.timedelta(milliseconds=10)
+        release = threading.Event()
+        fired = threading.Event()
+        blocked = [ManualResetTimer(interval) for _ in range(_MAX_WORKERS)]
+        try:
+            for timer in blocked:
+                timer.elapsed += lambda: release.wait(timeout=10)
+                timer.start()
+            with ManualResetTimer(interval) as uut:
+                uut.elapsed += fired.set
+                time.sleep(0.05)
+                uut.start()
+
+                assert fired.wait(timeout=5)
+        finally:
+            release.set()
+            for timer in blocked:
+                timer.stop()
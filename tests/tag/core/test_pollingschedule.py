@@ -0,0 +1,47 @@
+import datetime
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._polling_schedule import (
+    _PollingSchedule,
+    _RECENT_POLLS,
+)
+
+_SECOND = datetime.timedelta(seconds=1)
+
+
+class TestPollingSchedule:
+    def test__fixed_interval__interval_never_changes(self):
+        uut = _PollingSchedule(_SECOND)
+
+        assert [uut.record(n) for n in (0, 3, 0)] == [False, False, False]
+        assert uut.interval == _SECOND
+
+    def test__adaptive_interval__backs_off_and_speeds_up_within_bounds(self):
+        uut = _PollingSchedule(tbase.AdaptiveUpdateInterval(_SECOND, 5 * _SECOND))
+        intervals = []
+        for update_count in (0, 0, 0, 0, 1, 1, 1, 1):
+            uut.record(update_count)
+            intervals.append(uut.interval.total_seconds())
+
+        assert intervals == [2, 4, 5, 5, 2.5, 1.25, 1, 1]
+
+    def test__polls_recorded__empty_poll_ratio_of_recent_polls(self):
+        uut = _PollingSchedule(_SECOND)
+        assert uut.empty_poll_ratio == 0
+
+        for update_count in (0, 2, 0, 1):
+            uut.record(update_count)
+        assert uut.empty_poll_ratio == 0.5
+
+        for _ in range(_RECENT_POLLS):
+            uut.record(1)
+        assert uut.empty_poll_ratio == 0
+
+    @pytest.mark.parametrize(
+        "minimum, maximum, factor",
+        [(0 * _SECOND, _SECOND, 2), (2 * _SECOND, _SECOND, 2), (_SECOND, _SECOND, 1)],
+    )
+    def test__invalid_adaptive_interval__raises(self, minimum, maximum, factor):
+        with pytest.raises(ValueError):
+            tbase.AdaptiveUpdateInterval(minimum, maximum, factor)
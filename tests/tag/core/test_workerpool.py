@@ -0,0 +1,61 @@
+import threading
+
+from nisystemlink.clients.tag._core._worker_pool import _WorkerPool
+
+
+class TestWorkerPool:
+    def test__functions_submitted__run(self):
+        uut = _WorkerPool("test", max_workers=2)
+        ran = threading.Semaphore(0)
+
+        for _ in range(10):
+            uut.submit(ran.release)
+
+        assert all(ran.acquire(timeout=5) for _ in range(10))
+
+    def test__workers_busy__threads_bounded(self):
+        uut = _WorkerPool("test", max_workers=2, stall_seconds=60)
+        release = threading.Event()
+        running = threading.Semaphore(0)
+        threads_before = threading.active_count()
+
+        def block():
+            running.release()
+            release.wait(timeout=10)
+
+        for _ in range(5):
+            uut.submit(block)
+        assert all(running.acquire(timeout=5) for _ in range(2))
+        threads = threading.active_count() - threads_before
+        release.set()
+
+        # Two workers, and the thread that watches them for stalls
+        assert threads <= 3
+        assert all(running.acquire(timeout=5) for _ in range(3))
+
+    def test__every_worker_stalled__another_started(self):
+        uut = _WorkerPool("test", max_workers=2, stall_seconds=0.05)
+        release = threading.Event()
+        ran = threading.Event()
+        try:
+            for _ in range(2):
+                uut.submit(lambda: release.wait(timeout=10))
+
+            uut.submit(ran.set)
+
+            assert ran.wait(timeout=5)
+        finally:
+            release.set()
+
+    def test__function_raises__worker_kept(self):
+        uut = _WorkerPool("test", max_workers=1, stall_seconds=60)
+        ran = threading.Event()
+
+        def fail():
+            raise RuntimeError()
+
+        uut.submit(fail)
+        uut.submit(ran.set)
+
+        assert ran.wait(timeout=5)
+        assert uut._workers == 1
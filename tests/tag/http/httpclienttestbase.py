@@ -1,4 +1,5 @@
 import asyncio
+import json
 from unittest import mock
 
 from nisystemlink.clients.core._internal._http_client import (
@@ -6,6 +7,7 @@ from nisystemlink.clients.core._internal._http_client import (
     _HttpClientAtUri,
     HttpClient,
 )
+from nisystemlink.clients.core.helpers import AsyncJsonArrayStream, JsonArrayStream
 
 
 class HttpClientTestBase:
@@ -50,8 +52,7 @@ class MockHttpClient(HttpClient):
     def _client(self):
         raise NotImplementedError()
 
-    @property
-    def _async_client(self):
+    async def _get_async_client(self):
         raise NotImplementedError()
 
 
@@ -74,6 +75,10 @@ class MockHttpClientAtUri(_HttpClientAtUri):
             assert not self.__is_async, "Non-async method called in async test"
         return self._client.all_requests(method, *args, **kwargs)
 
+    def _stream(self, method, uri, params=None, path=()):
+        data, response = self._request(method, uri, params=params)
+        return JsonArrayStream([json.dumps(data).encode()], path), response
+
 
 class MockAsyncHttpClientAtUri(_AsyncHttpClientAtUri):
     def __init__(self, client, uri, is_async):
@@ -85,3 +90,11 @@ class MockAsyncHttpClientAtUri(_AsyncHttpClientAtUri):
     async def _request(self, *args, **kwargs):
         assert self.__is_async, "async method called in non-async test"
         return self._client.all_requests(*args, **kwargs)
+
+    async def _stream(self, method, uri, params=None, path=()):
+        data, response = await self._request(method, uri, params=params)
+        return AsyncJsonArrayStream(_chunks(json.dumps(data).encode()), path), response
+
+
+async def _chunks(data):
+    yield data
@@ -0,0 +1,280 @@
+import asyncio
+import threading
+from datetime import timedelta
+from typing import Any, List
+from unittest import mock
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._http._async_http_tag_subscription import (
+    AsyncHttpTagSubscription,
+)
+from nisystemlink.clients.testing import StandInServer
+
+_INTERVAL = timedelta(milliseconds=10)
+
+
+@pytest.fixture
+def server():
+    """Fixture to run a stand-in server with no latency or errors."""
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+def _write(server: StandInServer, values: List[int]) -> None:
+    with tbase.TagManager(server.create_configuration()).create_writer(
+        buffer_size=1
+    ) as writer:
+        for value in values:
+            writer.write("tag", tbase.DataType.INT32, value)
+
+
+async def _next(subscription: tbase.AsyncTagSubscription) -> Any:
+    return await asyncio.wait_for(subscription.__anext__(), timeout=10)
+
+
+async def _wait_for_delete(server: StandInServer) -> None:
+    for _ in range(500):
+        if any(r.method == "DELETE" for r in server.requests):
+            return
+        await asyncio.sleep(_INTERVAL.total_seconds())
+    raise AssertionError("The subscription wasn't deleted")
+
+
+class _Fatal(BaseException):
+    pass
+
+
+class TestAsyncHttpTagSubscription:
+    @pytest.mark.asyncio
+    async def test__tags_written__changes_iterated_and_tag_changed_raised(self, server):
+        client = HttpClient(server.create_configuration())
+        _write(server, [0])
+        subscription = await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], _INTERVAL
+        )
+        handler = mock.Mock()
+        subscription.tag_changed += handler
+
+        async with subscription:
+            _write(server, [1, 2])
+            changes = [await _next(subscription), await _next(subscription)]
+
+        assert [(tag.path, reader.read().value) for tag, reader in changes] == [
+            ("tag", 1),
+            ("tag", 2),
+        ]
+        assert handler.call_args_list == [mock.call(*change) for change in changes]
+        assert [change async for change in subscription] == []
+
+    @pytest.mark.asyncio
+    async def test__subscription_runs__no_threads_started(self, server):
+        client = HttpClient(server.create_configuration())
+        await client.at_uri("/nitag/v2").as_async.get("/tags")
+        # The stand-in server starts a thread for each connection on its own thread
+        started_by = []  # type: List[threading.Thread]
+        original_start = threading.Thread.start
+
+        def start(thread: threading.Thread) -> None:
+            started_by.append(threading.current_thread())
+            original_start(thread)
+
+        with mock.patch.object(threading.Thread, "start", start):
+            async with await AsyncHttpTagSubscription.create_async(
+                client, ["tag"], _INTERVAL, heartbeat_interval=_INTERVAL
+            ) as subscription:
+                await asyncio.sleep(_INTERVAL.total_seconds() * 5)
+                await client.at_uri("/nitag/v2").as_async.post(
+                    "/update-current-values",
+                    data=[
+                        {
+                            "path": "tag",
+                            "updates": [{"value": {"type": "INT", "value": "3"}}],
+                        }
+                    ],
+                )
+                tag, reader = await _next(subscription)
+
+        assert threading.current_thread() not in started_by
+        assert reader.read().value == 3
+
+    @pytest.mark.asyncio
+    async def test__iterating_task_cancelled__subscription_deleted_on_exit(
+        self, server
+    ):
+        client = HttpClient(server.create_configuration())
+        created = asyncio.Event()
+
+        async def iterate():
+            async with await AsyncHttpTagSubscription.create_async(
+                client, ["tag"], _INTERVAL
+            ) as subscription:
+                created.set()
+                async for _ in subscription:
+                    pass
+
+        task = asyncio.ensure_future(iterate())
+        await asyncio.wait_for(created.wait(), timeout=10)
+        await asyncio.sleep(_INTERVAL.total_seconds() * 5)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert [r.method for r in server.requests if r.route is not None][-1] == (
+            "DELETE"
+        )
+
+    @pytest.mark.asyncio
+    async def test__close_async__tasks_cancelled_and_iteration_stopped(self, server):
+        client = HttpClient(server.create_configuration())
+        subscription = await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], _INTERVAL
+        )
+        iteration = asyncio.ensure_future(_next(subscription))
+        await asyncio.sleep(0)
+
+        await subscription.close_async()
+
+        with pytest.raises(StopAsyncIteration):
+            await iteration
+        assert all(task.cancelled() for task in subscription._tasks)
+        server.clear_requests()
+        await asyncio.sleep(_INTERVAL.total_seconds() * 5)
+        assert server.requests == []
+
+    @pytest.mark.asyncio
+    async def test__heartbeat_fails__subscription_recreated(self, server):
+        client = HttpClient(server.create_configuration())
+        async with await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], timedelta(hours=1), heartbeat_interval=_INTERVAL
+        ) as subscription:
+            token = subscription._token
+            server.fail_next(
+                status_code=404,
+                path_prefix="/nitag/v2/subscriptions/{}/heartbeat".format(token),
+            )
+            for _ in range(500):
+                if subscription._token != token:
+                    break
+                await asyncio.sleep(_INTERVAL.total_seconds())
+
+            assert subscription._token != token
+
+    @pytest.mark.asyncio
+    async def test__create_subscription_async__asyncio_subscription_returned(
+        self, server
+    ):
+        manager = tbase.TagManager(server.create_configuration())
+        _write(server, [0])
+
+        with manager.open_selection(["tag"]) as selection:
+            async with await selection.create_subscription_async(
+                update_interval=_INTERVAL
+            ) as subscription:
+                _write(server, [5])
+                tag, reader = await _next(subscription)
+
+        assert isinstance(subscription, tbase.AsyncTagSubscription)
+        assert (tag.path, reader.read().value) == ("tag", 5)
+
+    @pytest.mark.asyncio
+    async def test__adaptive_update_interval__backs_off_while_quiet(self, server):
+        client = HttpClient(server.create_configuration())
+        adaptive = tbase.AdaptiveUpdateInterval(_INTERVAL, 4 * _INTERVAL)
+
+        async with await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], adaptive
+        ) as subscription:
+            for _ in range(500):
+                if subscription.update_interval == adaptive.maximum:
+                    break
+                await asyncio.sleep(_INTERVAL.total_seconds())
+            assert subscription.update_interval == adaptive.maximum
+            assert subscription.empty_poll_ratio == 1
+
+            _write(server, [1])
+            await _next(subscription)
+
+            assert subscription.update_interval == 2 * _INTERVAL
+
+    @pytest.mark.asyncio
+    async def test__server_unreachable__polling_continues(self, server):
+        client = HttpClient(server.create_configuration())
+        subscription = await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], _INTERVAL
+        )
+        query_updates = subscription._query_updates_async
+        failures = [httpx.ConnectError("unreachable"), TimeoutError()]
+
+        async def query_updates_async() -> int:
+            if failures:
+                raise failures.pop(0)
+            return await query_updates()
+
+        async with subscription:
+            with mock.patch.object(
+                subscription, "_query_updates_async", query_updates_async
+            ):
+                _write(server, [7])
+                tag, reader = await _next(subscription)
+
+        assert failures == []
+        assert reader.read().value == 7
+
+    @pytest.mark.asyncio
+    async def test__task_dies__subscription_deleted_and_iteration_raises(self, server):
+        client = HttpClient(server.create_configuration())
+        subscription = await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], _INTERVAL, heartbeat_interval=_INTERVAL
+        )
+
+        with mock.patch.object(
+            subscription, "_query_updates_async", side_effect=_Fatal
+        ):
+            with pytest.raises(_Fatal):
+                await _next(subscription)
+        await _wait_for_delete(server)
+
+        assert all(task.done() for task in subscription._tasks)
+        server.clear_requests()
+        await asyncio.sleep(_INTERVAL.total_seconds() * 5)
+        assert server.requests == []
+
+    @pytest.mark.asyncio
+    async def test__changes_not_iterated__kept_changes_bounded(self, server):
+        client = HttpClient(server.create_configuration())
+        async with await AsyncHttpTagSubscription.create_async(
+            client,
+            ["tag"],
+            timedelta(hours=1),
+            dispatch=tbase.QueuedDispatch(max_pending=2, coalesce=False),
+        ) as subscription:
+            for value in range(5):
+                subscription._on_tag_changed(tbase.TagData("tag"), value)
+            changes = [await _next(subscription), await _next(subscription)]
+
+        assert [reader for _, reader in changes] == [3, 4]
+        assert subscription.dropped_update_count == 3
+        assert subscription.coalesced_update_count == 0
+
+    @pytest.mark.asyncio
+    async def test__close_from_another_thread__deleted_without_blocking_loop(
+        self, server
+    ):
+        client = HttpClient(server.create_configuration())
+        subscription = await AsyncHttpTagSubscription.create_async(
+            client, ["tag"], _INTERVAL
+        )
+        iteration = asyncio.ensure_future(_next(subscription))
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(target=subscription.close)
+        thread.start()
+        thread.join()
+
+        with pytest.raises(StopAsyncIteration):
+            await iteration
+        await _wait_for_delete(server)
+        assert subscription._token is None
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 from unittest import mock
 
@@ -204,6 +204,46 @@ class TestHttpTagSubscription(HttpClientTestBase):
             assert path in updates
             check_args(u, *updates[path])
 
+    def test__adaptive_update_interval__timer_interval_follows_updates(self):
+        token = "test subscription"
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        timer = mock.Mock(ManualResetTimer, wraps=ManualResetTimer.null_timer)
+        type(timer).elapsed = events.events._EventSlot("elapsed")
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(token, {"subscriptionUpdates": []})
+        )
+        uut = HttpTagSubscription.create(
+            self._client,
+            [],
+            timer,
+            ManualResetTimer.null_timer,
+            tbase.AdaptiveUpdateInterval(timedelta(seconds=1), timedelta(seconds=3)),
+        )
+        assert uut.update_interval == timedelta(seconds=1)
+
+        timer.elapsed()
+        timer.elapsed()
+        assert timer.interval == uut.update_interval == timedelta(seconds=3)
+
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                token,
+                {
+                    "subscriptionUpdates": [
+                        {
+                            "subscriptionId": token,
+                            "updates": self._one_update_of_each_type(timestamp_str),
+                        }
+                    ]
+                },
+            )
+        )
+        timer.elapsed()
+
+        assert timer.interval == uut.update_interval == timedelta(seconds=1.5)
+        assert uut.empty_poll_ratio == pytest.approx(2 / 3)
+        assert timer.start.call_count == 4
+
     def test__updates_received_on_create__tag_changed_event_doesnt_see_those_updates(
         self,
     ):
@@ -0,0 +1,220 @@
+import gc
+import queue
+import threading
+from datetime import timedelta
+from typing import Any, List, Tuple
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.core import ApiException
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._http import _tag_subscription_multiplexer
+from nisystemlink.clients.tag._http._multiplexed_http_tag_subscription import (
+    MultiplexedHttpTagSubscription,
+)
+from nisystemlink.clients.testing import StandInServer
+
+_INTERVAL = timedelta(milliseconds=20)
+
+
+@pytest.fixture
+def server():
+    """Fixture to run a stand-in server with no latency or errors."""
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+def _write(server: StandInServer, values: List[Tuple[str, int]]) -> None:
+    with tbase.TagManager(server.create_configuration()).create_writer(
+        buffer_size=len(values)
+    ) as writer:
+        for path, value in values:
+            writer.write(path, tbase.DataType.INT32, value)
+
+
+def _subscribe(
+    client: HttpClient, paths: List[str], interval: Any = _INTERVAL
+) -> Tuple[MultiplexedHttpTagSubscription, "queue.Queue[Tuple[str, Any]]"]:
+    changes = queue.Queue()  # type: queue.Queue[Tuple[str, Any]]
+    subscription = MultiplexedHttpTagSubscription.create(client, paths, interval)
+    subscription.tag_changed += lambda tag, reader: changes.put(
+        (tag.path, reader.read().value)
+    )
+    return subscription, changes
+
+
+def _count(server: StandInServer, method: str, route_suffix: str) -> int:
+    return sum(
+        1
+        for r in server.requests
+        if r.method == method and (r.route or "").endswith(route_suffix)
+    )
+
+
+class TestTagSubscriptionMultiplexer:
+    def test__overlapping_subscriptions__merged_server_subscription_routes_by_path(
+        self, server
+    ):
+        client = HttpClient(server.create_configuration())
+        _write(server, [("a1", 0), ("a2", 0), ("b", 0)])
+        wildcard, wildcard_changes = _subscribe(client, ["a*"])
+        single, single_changes = _subscribe(client, ["a1"])
+        other, other_changes = _subscribe(client, ["a2", "b"])
+
+        _write(server, [("a1", 1), ("a2", 2), ("b", 3)])
+
+        assert {wildcard_changes.get(timeout=10) for _ in range(2)} == {
+            ("a1", 1),
+            ("a2", 2),
+        }
+        assert single_changes.get(timeout=10) == ("a1", 1)
+        assert {other_changes.get(timeout=10) for _ in range(2)} == {
+            ("a2", 2),
+            ("b", 3),
+        }
+        multiplexer = wildcard._multiplexer
+        assert multiplexer is single._multiplexer is other._multiplexer
+        # "a1" and "a2" are covered by "a*", but "b" isn't, so a server subscription
+        # for "a*" and "b" replaced the one for "a*"
+        assert _count(server, "POST", "/subscriptions") == 2
+        assert _count(server, "DELETE", "/subscriptions/{id}") == 1
+        assert multiplexer is not None and multiplexer._server is not None
+        assert multiplexer._server.queries.queries == {"a*", "b"}
+        for subscription in (wildcard, single, other):
+            subscription.close()
+        assert single_changes.empty() and other_changes.empty()
+
+    def test__subscriber_closes__server_subscription_shrinks(self, server):
+        client = HttpClient(server.create_configuration())
+        first, _ = _subscribe(client, ["a"])
+        second, second_changes = _subscribe(client, ["b"])
+        multiplexer = first._multiplexer
+        assert multiplexer is not None and multiplexer._server is not None
+        assert multiplexer.server_subscription_count == 1
+        assert multiplexer._server.queries.queries == {"a", "b"}
+
+        first.close()
+
+        assert multiplexer.server_subscription_count == 1
+        assert multiplexer._server.queries.queries == {"b"}
+        assert _count(server, "POST", "/subscriptions") == 3
+        assert _count(server, "DELETE", "/subscriptions/{id}") == 2
+        _write(server, [("a", 1), ("b", 2)])
+        assert second_changes.get(timeout=10) == ("b", 2)
+
+        second.close()
+
+        assert _count(server, "DELETE", "/subscriptions/{id}") == 3
+        assert _tag_subscription_multiplexer._multiplexers == {}
+
+    def test__subscriber_garbage_collected__server_subscription_shrinks_before_poll(
+        self, server
+    ):
+        client = HttpClient(server.create_configuration())
+        kept, _ = _subscribe(client, ["a"], timedelta(hours=1))
+        _subscribe(client, ["b"], timedelta(hours=1))
+        gc.collect()
+        multiplexer = kept._multiplexer
+        assert multiplexer is not None and multiplexer._server is not None
+
+        multiplexer._update_timer_elapsed()
+
+        assert multiplexer._server.queries.queries == {"a"}
+        assert _count(server, "DELETE", "/subscriptions/{id}") == 2
+        kept.close()
+
+    def test__subscriber_added__changes_before_merge_routed(self, server):
+        client = HttpClient(server.create_configuration())
+        subscription, changes = _subscribe(client, ["a"], timedelta(hours=1))
+        _write(server, [("a", 1)])
+
+        other, _ = _subscribe(client, ["b"], timedelta(hours=1))
+
+        assert changes.get(timeout=10) == ("a", 1)
+        subscription.close()
+        other.close()
+
+    def test__slow_handler__other_subscriptions_not_delayed(self, server):
+        client = HttpClient(server.create_configuration())
+        release = threading.Event()
+        slow, slow_changes = _subscribe(client, ["tag"])
+        slow.tag_changed += lambda tag, reader: release.wait(10)
+        fast, fast_changes = _subscribe(client, ["tag"])
+
+        _write(server, [("tag", 1)])
+        assert slow_changes.get(timeout=10) == ("tag", 1)
+        _write(server, [("tag", 2)])
+
+        assert fast_changes.get(timeout=10) == ("tag", 1)
+        assert fast_changes.get(timeout=10) == ("tag", 2)
+        assert slow_changes.empty()
+        release.set()
+        assert slow_changes.get(timeout=10) == ("tag", 2)
+        slow.close()
+        fast.close()
+
+    def test__many_subscriptions__polled_once_per_interval(self, server):
+        client = HttpClient(server.create_configuration())
+        subscriptions = [_subscribe(client, ["tag"]) for _ in range(20)]
+        _write(server, [("tag", 0)])
+        for _, changes in subscriptions:
+            assert changes.get(timeout=10) == ("tag", 0)
+
+        for subscription, _ in subscriptions:
+            subscription.close()
+
+        polls = _count(server, "GET", "/subscriptions/{id}/values/current")
+        assert _count(server, "POST", "/subscriptions") == 1
+        assert polls < 20 * 2
+
+    def test__different_update_intervals__not_shared(self, server):
+        client = HttpClient(server.create_configuration())
+        adaptive = tbase.AdaptiveUpdateInterval(_INTERVAL, 10 * _INTERVAL)
+
+        with MultiplexedHttpTagSubscription.create(
+            client, ["tag"], _INTERVAL
+        ) as fixed, MultiplexedHttpTagSubscription.create(
+            client, ["tag"], adaptive
+        ) as first, MultiplexedHttpTagSubscription.create(
+            client, ["tag"], tbase.AdaptiveUpdateInterval(_INTERVAL, 10 * _INTERVAL)
+        ) as second:
+            assert fixed._multiplexer is not first._multiplexer
+            assert first._multiplexer is second._multiplexer
+
+    def test__subscription_garbage_collected__stops_receiving_updates(self, server):
+        client = HttpClient(server.create_configuration())
+        kept, kept_changes = _subscribe(client, ["tag"])
+        _subscribe(client, ["other"])
+        gc.collect()
+
+        assert kept._multiplexer is not None
+        assert len(kept._multiplexer._subscribers) == 1
+        kept.close()
+
+    def test__heartbeat_fails__server_subscription_recreated(self, server):
+        client = HttpClient(server.create_configuration())
+        subscription, changes = _subscribe(client, ["tag"], timedelta(hours=1))
+        multiplexer = subscription._multiplexer
+        assert multiplexer is not None
+        server.fail_next(status_code=404, path_prefix="/nitag/v2/subscriptions/")
+
+        multiplexer._heartbeat_timer_elapsed()
+        _write(server, [("tag", 7)])
+        multiplexer._update_timer_elapsed()
+
+        assert _count(server, "POST", "/subscriptions") == 2
+        assert changes.get(timeout=10) == ("tag", 7)
+        subscription.close()
+
+    def test__discarding_current_values_fails__server_subscription_deleted(
+        self, server
+    ):
+        client = HttpClient(server.create_configuration())
+        server.fail_next(status_code=404, path_prefix="/nitag/v2/subscriptions/")
+
+        with pytest.raises(ApiException):
+            _subscribe(client, ["tag"])
+
+        assert _count(server, "POST", "/subscriptions") == 1
+        assert _count(server, "DELETE", "/subscriptions/{id}") == 1
+        assert _tag_subscription_multiplexer._multiplexers == {}
@@ -224,8 +224,8 @@ class TestTagSelection:
             )
 
         assert selection.mock_create_subscription_internal.call_args_list == [
-            mock.call(None),
-            mock.call(update_interval),
+            mock.call(None, None),
+            mock.call(update_interval, None),
         ]
 
     @pytest.mark.asyncio
@@ -248,8 +248,8 @@ class TestTagSelection:
             )
 
         assert selection.mock_create_subscription_internal_async.call_args_list == [
-            mock.call(None),
-            mock.call(update_interval),
+            mock.call(None, None),
+            mock.call(update_interval, None),
         ]
 
     def test__delete_tags_from_server__collections_cleared_after_delete(self):